@@ -4,8 +4,10 @@ Celery 인스턴스 설정
 import logging
 from datetime import datetime, timezone, timedelta
 from celery import Celery
+from celery.signals import worker_ready
 
 from app.config import get_settings
+from app.services.job_workspace import sweep_stale_workspaces
 
 settings = get_settings()
 
@@ -42,5 +44,14 @@ celery_app.conf.update(
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30분 타임아웃
-    worker_prefetch_multiplier=1,  # 한 번에 1개 작업만
+    worker_prefetch_multiplier=1,  # 프로세스당 1개 작업만 선점 (긴 작업이 한 워커에 몰리지 않도록)
 )
+
+if settings.CELERY_WORKER_CONCURRENCY > 0:
+    celery_app.conf.worker_concurrency = settings.CELERY_WORKER_CONCURRENCY
+
+
+@worker_ready.connect
+def _sweep_stale_workspaces(**kwargs):
+    """워커 시작 시 강제 종료된 작업이 남긴 작업 디렉토리 정리"""
+    sweep_stale_workspaces(settings.STALE_WORKSPACE_MAX_AGE_HOURS * 3600)
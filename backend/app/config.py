@@ -67,8 +67,55 @@ class Settings(BaseSettings):
                 f"Please check your .env.production file."
             )
 
+    # Whisper 인식 결과 캐시 (오디오 내용 해시 기준, 재시도/중복 업로드 시 Groq 호출 생략)
+    TRANSCRIPTION_CACHE_ENABLED: bool = True
+    TRANSCRIPTION_CACHE_DIR: str = ""  # 로컬 캐시 디렉토리 (비어 있으면 {tmp}/qt_transcription_cache)
+    TRANSCRIPTION_CACHE_R2: bool = True  # R2 transcriptions/ 공유 캐시 사용
+
+    # 치환 사전 워커 캐시 (Redis 버전 키 확인, 사전 API 쓰기 시 버전 증가)
+    DICTIONARY_CACHE_MAX_AGE_SECONDS: float = 600.0  # 버전이 같아도 다시 조회하는 주기 (0 = 무제한)
+
+    # STT 입력 음성 정규화 (작업당 1회 16kHz 모노 Opus로 변환 → Groq 업로드 크기 감소)
+    STT_AUDIO_NORMALIZE: bool = True
+    STT_AUDIO_BITRATE: str = "32k"  # Opus 비트레이트
+    STT_AUDIO_LOUDNORM: bool = False  # 라우드니스 정규화 (작게 녹음된 파일용)
+    STT_AUDIO_TRIM_TRAILING_SILENCE: bool = False  # 끝부분 무음 제거 (영상 길이도 함께 줄어듦)
+
+    # 긴 녹음 분할 인식 (무음 경계로 나눠 청크 동시 인식)
+    STT_LONG_AUDIO_SECONDS: float = 600.0  # 이보다 긴 오디오는 분할 인식 (0 = 사용 안 함)
+    STT_CHUNK_SECONDS: float = 300.0  # 목표 청크 길이 (이후 첫 무음에서 자름)
+    STT_CHUNK_MAX_SECONDS: float = 420.0  # 무음이 없을 때 강제 분할 길이
+    STT_CHUNK_OVERLAP_SECONDS: float = 2.0  # 청크 앞뒤 겹침 (경계 단어 보존)
+    STT_CHUNK_CONCURRENCY: int = 4  # 동시 Groq 요청 수
+
     # Pexels API (배경 영상 검색)
     PEXELS_API_KEY: str = ""  # Free tier: 200 requests/hour
+    CUT_SEARCH_CONCURRENCY: int = 4  # 컷별 Pexels 검색/Vision 검증 동시 실행 수
+    PEXELS_CACHE_ENABLED: bool = True  # 검색 응답 Redis 캐시 (워커 공유)
+    PEXELS_CACHE_TTL_HOURS: int = 24  # 응답 보관 시간
+    PEXELS_CACHE_MAX_ENTRIES: int = 2000  # 최대 보관 페이지 수 (초과 시 오래된 것부터 제거)
+    CLIP_CACHE_DIR: str = ""  # 다운로드 클립 캐시 디렉토리 (비어 있으면 {tmp}/qt_clip_cache)
+    CLIP_CACHE_MAX_GB: float = 5.0  # 클립 캐시 용량 예산 (LRU 제거)
+    ASSET_CACHE_DIR: str = ""  # R2/정적 자산(BGM, 배경, 베이스 영상) 캐시 디렉토리 (비어 있으면 {tmp}/qt_asset_cache)
+    ASSET_CACHE_MAX_GB: float = 2.0  # 자산 캐시 용량 예산 (LRU 제거)
+    ASSET_CACHE_MAX_AGE_SECONDS: float = 300.0  # URL 자산을 재검증 없이 쓰는 시간 (R2 객체는 항상 ETag 재검증)
+    DOWNLOAD_RETRIES: int = 3  # 스트리밍 다운로드 중단 시 이어받기 재시도 횟수
+    DOWNLOAD_MAX_MB: int = 2048  # 다운로드 1건 최대 크기 (초과 시 중단)
+
+    # 구간 전처리 병렬화 (VideoClipProcessor)
+    SEGMENT_DOWNLOAD_CONCURRENCY: int = 4  # 동시 클립 다운로드 수
+    SEGMENT_ENCODE_CONCURRENCY: int = 0  # 동시 구간 인코딩 수 (0 = CPU 코어 수 / 2)
+    SUBTITLE_CHUNK_SECONDS: float = 30.0  # 자막 합성 청크 길이 (키프레임에서 분할, 2청크 미만이면 한 번에 합성)
+    SUBTITLE_CHUNK_WORKERS: int = 0  # 동시 청크 합성 수 (0 = CPU 코어 수 / 2)
+    PREVIEW_RENDER: bool = True  # True = 최종 렌더 전에 540p 초안을 먼저 업로드 (SINGLE_PASS_RENDER 필요)
+    FINAL_RENDER_NICE: int = 10  # 미리보기 이후 최종 렌더의 FFmpeg nice 값 (다른 작업의 초안을 먼저 처리)
+    SUBTITLE_PATCH_MAX_RATIO: float = 0.3  # 자막 수정 시 재인코딩 구간이 전체의 이 비율 이하면 부분 합성 (초과 시 전체 재생성)
+    SINGLE_PASS_RENDER: bool = True  # True = 클립/자막/인트로/아웃트로/오디오를 FFmpeg 1회로 인코딩 (render_graph)
+
+    # Gemini Vision 판정 캐시 (Pexels 영상 ID 기준)
+    VISION_CACHE_BACKEND: str = "redis"  # "redis" / "supabase" / "sqlite" / "none"
+    VISION_CACHE_TTL_DAYS: int = 90  # Redis 판정 보관 기간
+    VISION_CACHE_SQLITE_PATH: str = "vision_verdicts.sqlite3"  # sqlite 백엔드 (로컬 개발용)
 
     # Cloudflare R2
     R2_ACCOUNT_ID: str = ""
@@ -76,6 +123,12 @@ class Settings(BaseSettings):
     R2_SECRET_ACCESS_KEY: str = ""
     R2_BUCKET_NAME: str = "qt-videos"
     R2_PUBLIC_URL: str = ""  # R2 Public bucket URL 또는 Custom Domain (예: https://pub-xxx.r2.dev)
+    R2_MULTIPART_THRESHOLD_MB: int = 32  # 이 크기 이상이면 멀티파트 업로드
+    R2_MULTIPART_PART_MB: int = 16  # 멀티파트 파트 크기 (최소 5MB)
+    R2_UPLOAD_CONCURRENCY: int = 4  # 파일 하나당 동시 전송 파트 수
+    R2_PART_RETRIES: int = 3  # 파트별 업로드 시도 횟수
+    R2_DEDUPE_INDEX_PATH: str = ""  # 콘텐츠 주소 업로드 로컬 인덱스 (비어 있으면 {tmp}/qt_r2_digests.txt)
+    R2_DEDUPE_INDEX_MAX: int = 5000  # 인덱스 최대 키 수 (초과 시 오래된 것부터 제거)
 
     @property
     def R2_ENDPOINT_URL(self) -> str:
@@ -97,6 +150,13 @@ class Settings(BaseSettings):
             return self.REDIS_URL
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
+    # Celery 워커 (작업별 격리 디렉토리 사용 → 노드당 여러 작업 동시 실행 가능)
+    CELERY_WORKER_CONCURRENCY: int = 0  # 0 = Celery 기본값 (--concurrency 옵션 / CPU 수)
+    STALE_WORKSPACE_MAX_AGE_HOURS: int = 2  # 워커 시작 시 이보다 오래된 작업 디렉토리 삭제
+
+    # Batch 처리
+    BATCH_FANOUT_ENABLED: bool = True  # True = 파일별 태스크를 group/chord로 분산, False = 한 워커에서 순차 처리
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -3,6 +3,7 @@
 """
 from functools import lru_cache
 
+import redis
 from supabase import Client, create_client
 
 from app.config import get_settings
@@ -22,3 +23,18 @@ def get_supabase() -> Client:
             settings.SUPABASE_KEY
         )
     return _supabase_client
+
+
+# Redis 클라이언트 (싱글톤) - 워커 간 공유 상태/캐시용
+_redis_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    """Redis 클라이언트 싱글톤 (Celery 브로커와 같은 인스턴스 사용)"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.get_redis_url(),
+            decode_responses=True
+        )
+    return _redis_client
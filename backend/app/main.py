@@ -19,9 +19,15 @@ from pydantic import BaseModel
 import httpx
 
 from app.config import get_settings
+from app.services.downloader import download_async, open_stream
 from app.services.storage import R2Storage
 from app.services.thumbnail import get_thumbnail_generator
-from app.tasks import batch_process_videos_task, process_video_task, regenerate_video_task
+from app.tasks import (
+    batch_process_videos_task,
+    patch_subtitles_task,
+    process_video_task,
+    regenerate_video_task,
+)
 from app.utils.srt_utils import generate_srt, parse_srt, validate_subtitles
 from app.utils.thumbnail_utils import extract_thumbnail_from_url, validate_image_file
 from app.routers.stt import router as stt_router
@@ -456,7 +462,8 @@ async def upload_videos(
             generation_mode,  # 생성 방식
             valid_subtitle_length,  # 자막 길이
             should_generate_edit_pack,  # Edit Pack 생성 여부
-            valid_video_tone  # v2.2: 영상 톤
+            valid_video_tone,  # v2.2: 영상 톤
+            video_ids  # 위에서 생성한 videos 레코드 재사용
         )
 
     return {
@@ -493,6 +500,9 @@ async def get_video_status(task_id: str):
         meta = task.info or {}
         response["progress"] = meta.get("progress", 0)
         response["step"] = meta.get("step", "처리 중...")
+        # 최종 렌더 전 미리보기 초안 (단일 패스 렌더 + PREVIEW_RENDER)
+        if meta.get("preview_url"):
+            response["preview_url"] = meta["preview_url"]
 
     elif task.status == "SUCCESS":
         # 완료된 결과
@@ -783,22 +793,19 @@ async def download_video_file(
     encoded_filename = quote(filename.encode('utf-8'))
     
     try:
-        # 외부 URL에서 파일 스트리밍
-        async with httpx.AsyncClient() as client:
-            response = await client.get(file_url, follow_redirects=True)
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=502, detail="파일 다운로드 실패")
-            
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    # RFC 5987/RFC 8187: 양쪽 모두 제공 (브라우저 호환성)
-                    "Content-Disposition": f'attachment; filename="{ascii_filename}"; filename*=UTF-8\'\'{encoded_filename}',
-                    "Content-Length": str(len(response.content))
-                }
-            )
+        # 외부 URL에서 파일 스트리밍 (메모리에 모으지 않고 청크 단위 전달)
+        response, body = await open_stream(file_url, timeout=60.0)
+
+        headers = {
+            # RFC 5987/RFC 8187: 양쪽 모두 제공 (브라우저 호환성)
+            "Content-Disposition": f'attachment; filename="{ascii_filename}"; filename*=UTF-8\'\'{encoded_filename}',
+        }
+        if response.headers.get("content-length"):
+            headers["Content-Length"] = response.headers["content-length"]
+
+        return StreamingResponse(body, media_type=content_type, headers=headers)
+    except httpx.HTTPStatusError:
+        raise HTTPException(status_code=502, detail="파일 다운로드 실패")
     except httpx.RequestError as e:
         logger.error(f"Download error: {e}")
         raise HTTPException(status_code=502, detail="파일 다운로드 중 오류가 발생했습니다.")
@@ -865,18 +872,12 @@ async def stream_video(
                     headers={"Content-Range": f"bytes */{file_size}"}
                 )
 
-            # Range 헤더로 부분 요청
-            headers = {"Range": f"bytes={start}-{end}"}
-            response = await client.get(file_url, headers=headers, follow_redirects=True)
-
-            if response.status_code not in [200, 206]:
+            # Range 헤더로 부분 요청 (청크 단위로 스트리밍 - 메모리 효율성)
+            try:
+                response, stream_chunks = await open_stream(file_url, headers={"Range": f"bytes={start}-{end}"})
+            except httpx.HTTPStatusError:
                 raise HTTPException(status_code=502, detail="파일 스트리밍 실패")
 
-            # 청크 단위로 스트리밍 (메모리 효율성)
-            async def stream_chunks():
-                async for chunk in response.aiter_bytes(chunk_size=8192):
-                    yield chunk
-
             # 206 Partial Content 또는 200 OK 응답
             status_code = 206 if range else 200
             content_length = end - start + 1
@@ -896,7 +897,7 @@ async def stream_video(
                 response_headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
 
             return StreamingResponse(
-                stream_chunks(),
+                stream_chunks,
                 status_code=status_code,
                 headers=response_headers,
                 media_type="video/mp4"
@@ -1198,12 +1199,18 @@ async def get_subtitles(video_id: str):
 async def update_subtitles(
     video_id: str,
     subtitles: list[dict] = [],
-    church_id: str = Query(...)
+    church_id: str = Query(...),
+    patch_video: bool = Query(False, description="True면 바뀐 자막 구간만 영상에 다시 합성")
 ):
-    """자막 수정"""
+    """
+    자막 수정
+
+    patch_video=True면 기존 최종 영상에서 자막이 바뀐 구간만 재인코딩한다
+    (부분 합성이 불가능하면 작업 안에서 전체 재생성으로 전환).
+    """
     # 권한 확인
     video = supabase.table("videos") \
-        .select("id, church_id") \
+        .select("id, church_id, srt_file_path") \
         .eq("id", video_id) \
         .execute()
 
@@ -1222,16 +1229,30 @@ async def update_subtitles(
         # SRT 파일 생성
         srt_content = generate_srt(subtitles)
 
-        # R2에 업로드
+        # R2에 업로드 (부분 합성 시 비교할 이전 SRT를 먼저 읽어둠)
+        # 최초 생성 시 SRT는 콘텐츠 주소 키로 올라가므로 고정 키가 아닌 현재 srt_file_path에서 읽음
         srt_key = f"subtitles/{video_id}/subtitles.srt"
+        previous_srt_path = video.data[0].get("srt_file_path")
+        previous_srt = r2.download_text(previous_srt_path) if patch_video and previous_srt_path else None
         srt_url = r2.upload_text(srt_content, srt_key, content_type="text/plain")
 
         # DB 업데이트
+        update_data = {"srt_file_path": srt_url}
+        if patch_video:
+            update_data["status"] = "processing"
         supabase.table("videos") \
-            .update({"srt_file_path": srt_url}) \
+            .update(update_data) \
             .eq("id", video_id) \
             .execute()
 
+        if patch_video:
+            task = patch_subtitles_task.delay(
+                video_id=video_id,
+                church_id=church_id,
+                previous_srt=previous_srt or ""
+            )
+            return {"success": True, "srt_url": srt_url, "task_id": str(task.id), "status": "processing"}
+
         return {"success": True, "srt_url": srt_url}
 
     except Exception as e:
@@ -1586,17 +1607,17 @@ async def generate_qt_thumbnail_custom(request: QTThumbnailRequest):
         is_video = any(bg_url.lower().endswith(ext) for ext in ['.mp4', '.mov', '.avi', '.webm'])
 
         # 배경 파일 다운로드
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(bg_url, follow_redirects=True)
-            if response.status_code != 200:
-                logger.error(f"배경 다운로드 실패: status={response.status_code}, url={bg_url}")
-                raise HTTPException(status_code=400, detail=f"배경 이미지를 다운로드할 수 없습니다. (status: {response.status_code})")
-
-            # 임시 파일로 저장
-            suffix = ".mp4" if is_video else ".jpg"
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                tmp.write(response.content)
-                downloaded_path = tmp.name
+        # 임시 파일로 저장 (청크 단위 기록)
+        suffix = ".mp4" if is_video else ".jpg"
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            downloaded_path = tmp.name
+        try:
+            await download_async(bg_url, downloaded_path, timeout=60.0)
+        except httpx.HTTPStatusError as e:
+            os.remove(downloaded_path)
+            status = e.response.status_code
+            logger.error(f"배경 다운로드 실패: status={status}, url={bg_url}")
+            raise HTTPException(status_code=400, detail=f"배경 이미지를 다운로드할 수 없습니다. (status: {status})")
 
         # 비디오인 경우 첫 프레임 추출
         if is_video:
@@ -2148,21 +2169,19 @@ async def proxy_image(url: str = Query(..., description="이미지 URL")):
         if not any(domain in parsed.netloc for domain in allowed_domains if domain):
             raise HTTPException(status_code=403, detail="허용되지 않은 도메인입니다")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30.0)
-            response.raise_for_status()
+        response, body = await open_stream(url, timeout=30.0)
 
-            # Content-Type 가져오기
-            content_type = response.headers.get("content-type", "image/jpeg")
+        # Content-Type 가져오기
+        content_type = response.headers.get("content-type", "image/jpeg")
 
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    "Cache-Control": "public, max-age=86400",  # 1일 캐시
-                    "Access-Control-Allow-Origin": "*"
-                }
-            )
+        return StreamingResponse(
+            body,
+            media_type=content_type,
+            headers={
+                "Cache-Control": "public, max-age=86400",  # 1일 캐시
+                "Access-Control-Allow-Origin": "*"
+            }
+        )
     except httpx.HTTPError as e:
         logger.error(f"이미지 프록시 실패: {e}")
         raise HTTPException(status_code=502, detail="이미지를 가져올 수 없습니다")
@@ -7,6 +7,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
+from app.services.dictionary_cache import bump_dictionary_version, church_scope
 from app.services.dictionary_service import get_dictionary_service
 from app.routers.auth import get_current_user
 from app.services.auth_service import UserProfile
@@ -128,6 +129,7 @@ async def add_dictionary_entry(
     if not result:
         raise HTTPException(status_code=500, detail="사전 항목 추가에 실패했습니다.")
 
+    bump_dictionary_version(church_scope(church_id))
     return result
 
 
@@ -164,6 +166,7 @@ async def update_dictionary_entry(
     if not result:
         raise HTTPException(status_code=404, detail="항목을 찾을 수 없습니다.")
 
+    bump_dictionary_version(church_scope(church_id))
     return result
 
 
@@ -193,6 +196,7 @@ async def delete_dictionary_entry(
     if not success:
         raise HTTPException(status_code=500, detail="삭제에 실패했습니다.")
 
+    bump_dictionary_version(church_scope(church_id))
     return {"success": True, "entry_id": entry_id}
 
 
@@ -221,6 +225,8 @@ async def bulk_import_dictionary(
         church_id=church_id,
         entries=[e.model_dump() for e in request.entries]
     )
+    if count:
+        bump_dictionary_version(church_scope(church_id))
 
     return {
         "success": True,
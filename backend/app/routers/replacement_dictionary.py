@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from app.database import get_supabase
 from app.routers.auth import get_current_user
 from app.services.auth_service import UserProfile
+from app.services.dictionary_cache import bump_dictionary_version, church_scope
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/dictionary", tags=["replacement-dictionary"])
@@ -122,6 +123,7 @@ async def add_replacement_entry(
             "replacement": entry.replacement.strip(),
             "use_count": 1
         }, on_conflict="church_id,original").execute()
+        bump_dictionary_version(church_scope(church_id))
 
         return result.data[0] if result.data else None
 
@@ -202,6 +204,11 @@ async def add_replacement_entries_batch(
         logger.exception(f"Failed to batch add replacement entries: {e}")
         raise HTTPException(status_code=500, detail="일괄 추가에 실패했습니다.")
 
+    finally:
+        # 중간에 실패해도 이미 반영된 항목이 있으면 워커 캐시 무효화
+        if added or updated:
+            bump_dictionary_version(church_scope(church_id))
+
 
 @router.delete("/{church_id}/{entry_id}")
 async def delete_replacement_entry(
@@ -234,6 +241,7 @@ async def delete_replacement_entry(
             .delete() \
             .eq("id", entry_id) \
             .execute()
+        bump_dictionary_version(church_scope(church_id))
 
         return {"success": True, "entry_id": entry_id}
 
@@ -262,6 +270,7 @@ async def clear_replacement_dictionary(
             .delete() \
             .eq("church_id", church_id) \
             .execute()
+        bump_dictionary_version(church_scope(church_id))
 
         return {"success": True, "church_id": church_id}
 
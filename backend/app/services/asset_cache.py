@@ -0,0 +1,214 @@
+"""
+R2/정적 자산 read-through 디스크 캐시 (워커 로컬, LRU)
+
+BGM, 썸네일 배경 이미지, 재생성 시 베이스 영상 등은 몇십 개의 같은 파일이
+작업마다 반복해서 다운로드된다. 원본 주소(URL 또는 R2 키) 단위로 로컬에 보관하고
+ETag/Last-Modified 조건부 요청으로 재검증해 바뀌지 않았으면 로컬 파일을 쓴다.
+
+- read-through: get(source, loader) - 없거나 오래됐으면 loader로 받아 캐시에 저장
+- 재검증: max_age 초 이내에 확인한 항목은 요청 없이 사용, 지나면 조건부 요청 (304 → 그대로 사용)
+- 동시 요청 합치기: 같은 항목은 파일 락(fcntl)으로 한 번만 받음 (같은 노드의 다른 워커 포함)
+- 용량 예산 초과 시 가장 오래 사용하지 않은 파일부터 제거 (mtime = 마지막 사용 시각)
+
+Usage:
+    cache = get_asset_cache()
+    cache.fetch_url(bgm_url, "/tmp/job/bgm.mp3")
+
+    # loader(partial_path, validators) → 새 검증자 dict 또는 None (변경 없음)
+    path = cache.get("r2://bucket/key", loader, max_age=0)
+"""
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlparse
+
+from app.services.clip_cache import link_or_copy
+from app.services.downloader import get_downloader
+
+logger = logging.getLogger(__name__)
+
+
+# loader(partial_path, {"etag": ..., "last_modified": ...}) → 새 검증자 또는 None (304)
+Loader = Callable[[str, dict], Optional[dict]]
+
+# 락 파일 수 (키 해시로 분산, 파일 수 고정)
+LOCK_STRIPES = 64
+
+
+class AssetCache:
+    """원본 주소 단위 read-through LRU 디스크 캐시"""
+
+    TEMP_PREFIX = ".partial-"
+    LOCK_PREFIX = ".lock-"
+    META_SUFFIX = ".meta"
+
+    def __init__(self, cache_dir: str, max_bytes: int, max_age: float = 300.0):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (하드링크를 위해 작업 디렉토리와 같은 파일시스템 권장)
+            max_bytes: 용량 예산 (바이트)
+            max_age: 재검증 없이 사용하는 시간 (초)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._evict_lock = threading.Lock()
+
+    @staticmethod
+    def key_for(source: str) -> str:
+        """원본 주소 → 캐시 파일명 (확장자 유지: FFmpeg 포맷 판별용)"""
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:32]
+        ext = os.path.splitext(urlparse(source).path)[1].lower()[:8]
+        return f"{digest}{ext}"
+
+    def get(self, source: str, loader: Loader, max_age: Optional[float] = None) -> Path:
+        """
+        캐시 파일 경로 (없거나 재검증 결과 바뀌었으면 loader로 새로 받음)
+
+        Args:
+            source: 원본 주소 (캐시 키)
+            loader: partial 경로에 내용을 기록하는 함수
+            max_age: 이 요청의 재검증 주기 (0 = 항상 조건부 요청)
+
+        Returns:
+            캐시 파일 경로 (다른 작업이 교체할 수 있으므로 읽기 전용으로 링크/복사해 사용)
+        """
+        max_age = self.max_age if max_age is None else max_age
+        key = self.key_for(source)
+        path = self.cache_dir / key
+        meta_path = self.cache_dir / f"{key}{self.META_SUFFIX}"
+
+        with self._locked(key):
+            meta = self._read_meta(meta_path) if path.exists() else None
+            if meta and time.time() - meta.get("checked_at", 0) < max_age:
+                logger.debug(f"[AssetCache] HIT {key}")
+                self._touch(path)
+                return path
+
+            partial = self.cache_dir / f"{self.TEMP_PREFIX}{uuid.uuid4().hex}"
+            try:
+                validators = {k: meta[k] for k in ("etag", "last_modified") if meta and meta.get(k)}
+                fresh = loader(str(partial), validators)
+                if fresh is None:
+                    if meta is None:
+                        raise RuntimeError(f"Loader reported not-modified without cached copy: {source}")
+                    logger.debug(f"[AssetCache] REVALIDATED {key}")
+                    meta["checked_at"] = time.time()
+                else:
+                    logger.info(f"[AssetCache] {'REFRESH' if meta else 'MISS'} {source[:80]}")
+                    os.replace(partial, path)
+                    meta = {**fresh, "source": source, "checked_at": time.time()}
+                self._write_meta(meta_path, meta)
+                self._touch(path)
+            finally:
+                if partial.exists():
+                    partial.unlink()
+
+        self.evict()
+        return path
+
+    def fetch_url(self, url: str, dest: str, max_age: Optional[float] = None) -> str:
+        """HTTP(S) URL → dest (캐시 경유, 하드링크/복사)"""
+        def loader(partial: str, validators: dict) -> Optional[dict]:
+            return get_downloader().download_if_modified(url, partial, **validators)
+
+        return str(link_or_copy(self.get(url, loader, max_age), Path(dest)))
+
+    def evict(self) -> int:
+        """
+        용량 예산 초과 시 오래 사용하지 않은 파일부터 제거
+
+        Returns:
+            제거한 파일 수
+        """
+        with self._evict_lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.iterdir():
+                name = path.name
+                if name.startswith((self.TEMP_PREFIX, self.LOCK_PREFIX)) or name.endswith(self.META_SUFFIX):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    (self.cache_dir / f"{path.name}{self.META_SUFFIX}").unlink(missing_ok=True)
+                    total -= size
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+
+            if removed:
+                logger.info(f"[AssetCache] Evicted {removed} files (now {total / 1024 / 1024:.0f}MB)")
+            return removed
+
+    @contextmanager
+    def _locked(self, key: str) -> Iterator[None]:
+        """같은 키의 동시 다운로드 합치기 (프로세스/스레드 공통 파일 락)"""
+        stripe = int(key[:8], 16) % LOCK_STRIPES
+        with open(self.cache_dir / f"{self.LOCK_PREFIX}{stripe:02d}", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> Optional[dict]:
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_meta(meta_path: Path, meta: dict) -> None:
+        partial = meta_path.with_name(f"{meta_path.name}.{uuid.uuid4().hex}")
+        partial.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(partial, meta_path)
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+
+# 싱글톤
+_asset_cache: AssetCache | None = None
+
+
+def get_asset_cache() -> AssetCache:
+    """AssetCache 싱글톤 (ASSET_CACHE_DIR / ASSET_CACHE_MAX_GB / ASSET_CACHE_MAX_AGE_SECONDS 설정)"""
+    global _asset_cache
+    if _asset_cache is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        cache_dir = settings.ASSET_CACHE_DIR or os.path.join(tempfile.gettempdir(), "qt_asset_cache")
+        _asset_cache = AssetCache(
+            cache_dir,
+            max_bytes=int(settings.ASSET_CACHE_MAX_GB * 1024 ** 3),
+            max_age=settings.ASSET_CACHE_MAX_AGE_SECONDS
+        )
+        logger.info(f"[AssetCache] Initialized: {cache_dir} ({settings.ASSET_CACHE_MAX_GB}GB)")
+    return _asset_cache
@@ -0,0 +1,156 @@
+"""
+긴 녹음 분할 인식 (무음 경계 분할 + 단어 타임스탬프 이어붙이기)
+
+20~40분짜리 QT 녹음을 Groq 요청 하나로 보내면 느리고 크기 제한에 걸리기도 한다.
+로컬에서 무음 구간을 찾아 그 근처에서 자르고, 청크마다 앞뒤로 겹침을 둬서
+경계에 걸친 단어도 어느 한 청크에서는 온전히 인식되게 한다.
+
+- plan_chunks: 목표 길이 근처의 무음 중앙을 경계로 선택 (무음이 없으면 최대 길이에서 자름)
+- 각 청크는 [경계 - overlap, 다음 경계 + overlap] 구간을 인식
+- stitch: 청크 오프셋을 더해 원본 시간으로 되돌리고, 단어 중앙이 자기 담당 구간
+  [경계, 다음 경계) 안에 있는 것만 남겨 겹침 구간 중복 제거
+
+Usage:
+    silences = parse_silences(ffmpeg_stderr)
+    chunks = plan_chunks(duration, silences, target=300, max_len=420, overlap=2)
+    results = [(chunk, transcribe(chunk.start, chunk.end)) for chunk in chunks]
+    words, segments, text = stitch(results)
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+_SILENCE_START = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """인식 단위 청크"""
+    index: int
+    start: float       # 추출 시작 (겹침 포함)
+    end: float         # 추출 끝 (겹침 포함)
+    own_start: float   # 담당 구간 시작 (이어붙일 때 이 구간의 단어만 사용)
+    own_end: float     # 담당 구간 끝
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def parse_silences(stderr: str) -> List[Tuple[float, float]]:
+    """FFmpeg silencedetect 로그 → [(무음 시작, 무음 끝)]"""
+    silences = []
+    start: Optional[float] = None
+    for line in stderr.splitlines():
+        match = _SILENCE_START.search(line)
+        if match:
+            start = max(0.0, float(match.group(1)))
+            continue
+        match = _SILENCE_END.search(line)
+        if match and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    return silences
+
+
+def plan_chunks(
+    duration: float,
+    silences: Sequence[Tuple[float, float]],
+    target: float,
+    max_len: float,
+    overlap: float
+) -> List[AudioChunk]:
+    """
+    무음 경계 기준 청크 계획
+
+    Args:
+        duration: 전체 길이 (초)
+        silences: 무음 구간 목록
+        target: 목표 청크 길이 (이보다 길어진 뒤 처음 나오는 무음에서 자름)
+        max_len: 최대 청크 길이 (무음이 없으면 여기서 강제로 자름)
+        overlap: 청크 앞뒤 겹침 (초)
+
+    Returns:
+        청크 목록 (duration <= max_len이면 1개)
+    """
+    cut_points = sorted((s + e) / 2 for s, e in silences if 0 < (s + e) / 2 < duration)
+
+    boundaries = [0.0]
+    while duration - boundaries[-1] > max_len:
+        last = boundaries[-1]
+        candidates = [p for p in cut_points if last + target <= p <= last + max_len]
+        if not candidates:
+            # 목표 길이 이전이라도 가장 늦은 무음, 그것도 없으면 강제 분할
+            candidates = [p for p in cut_points if last + target / 2 <= p <= last + max_len]
+            boundaries.append(max(candidates) if candidates else last + max_len)
+        else:
+            boundaries.append(min(candidates))
+    boundaries.append(duration)
+
+    return [
+        AudioChunk(
+            index=i,
+            start=max(0.0, own_start - overlap),
+            end=min(duration, own_end + overlap),
+            own_start=own_start,
+            own_end=own_end,
+        )
+        for i, (own_start, own_end) in enumerate(zip(boundaries, boundaries[1:]))
+    ]
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+def _shift(items: Iterable[Any], chunk: AudioChunk, last: bool) -> List[dict]:
+    """청크 기준 시간 → 원본 시간, 담당 구간 밖(겹침) 항목 제외"""
+    kept = []
+    for item in items or []:
+        start = float(_field(item, "start", 0.0)) + chunk.start
+        end = float(_field(item, "end", 0.0)) + chunk.start
+        middle = (start + end) / 2
+        if middle < chunk.own_start or (middle >= chunk.own_end and not last):
+            continue
+        if isinstance(item, dict):
+            plain = dict(item)
+        elif hasattr(item, "model_dump"):
+            plain = item.model_dump()
+        else:
+            plain = dict(vars(item))
+        plain["start"] = round(start, 3)
+        plain["end"] = round(end, 3)
+        kept.append(plain)
+    return kept
+
+
+def stitch(results: Sequence[Tuple[AudioChunk, Any]]) -> Tuple[List[dict], List[dict], str]:
+    """
+    청크별 인식 결과 이어붙이기
+
+    Args:
+        results: [(청크, 청크 인식 결과 - words/segments/text)] (순서 무관)
+
+    Returns:
+        (words, segments, text) - 원본 시간 기준
+    """
+    ordered = sorted(results, key=lambda pair: pair[0].index)
+    words: List[dict] = []
+    segments: List[dict] = []
+    for position, (chunk, transcription) in enumerate(ordered):
+        last = position == len(ordered) - 1
+        words.extend(_shift(_field(transcription, "words"), chunk, last))
+        segments.extend(_shift(_field(transcription, "segments"), chunk, last))
+
+    for segment_id, segment in enumerate(segments):
+        segment["id"] = segment_id
+
+    if segments:
+        text = " ".join(str(s.get("text", "")).strip() for s in segments).strip()
+    else:
+        text = " ".join(str(w.get("word", "")).strip() for w in words).strip()
+    return words, segments, text
@@ -13,6 +13,8 @@ import requests
 
 from app.config import get_settings
 from app.services.mood_analyzer import MoodData
+from app.services.pexels_query_cache import canonicalize_query, get_pexels_response_cache, pick_keyword
+from app.services.vision_verdict_cache import get_vision_verdict_cache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -194,6 +196,12 @@ class PexelsVideoSearch:
             'gemini-2.5-flash'
         )
 
+        # Pexels ID별 Vision 판정 캐시 (워커 공유, blacklist_clips 병합)
+        self.verdict_cache = get_vision_verdict_cache()
+
+        # Pexels 검색 응답 캐시 (워커 공유, 시간당 요청 한도 절약)
+        self.response_cache = get_pexels_response_cache()
+
         logger.info(f"PexelsVideoSearch initialized (video_tone={video_tone})")
 
     def search_by_mood(
@@ -229,7 +237,7 @@ class PexelsVideoSearch:
             if len(verified) >= max_results:
                 break
 
-            is_safe = self._verify_with_gemini_vision(video.image_url)
+            is_safe = self._verify_with_gemini_vision(video.image_url, video_id=video.id)
             if is_safe:
                 video.vision_verified = True
                 verified.append(video)
@@ -350,8 +358,7 @@ class PexelsVideoSearch:
         """
         # QT 묵상 영상 톤 조정 (v2.2 - video_tone 옵션 지원)
         # video_tone: "bright" (기본) / "dark" (어두운 묵상 톤)
-        import random
-
+        # 키워드는 (쿼리, 톤) 기반으로 결정적으로 선택 → 같은 자막은 같은 쿼리 (응답 캐시 적중)
         # 톤 설정은 인스턴스 변수에서 가져옴 (기본: bright)
         video_tone = getattr(self, 'video_tone', 'bright')
 
@@ -376,18 +383,18 @@ class PexelsVideoSearch:
             ]
             for bright_word in bright_keywords_to_remove:
                 modified_query = modified_query.replace(bright_word, "")
-            dark_keyword = random.choice(dark_tone_keywords)
+            dark_keyword = pick_keyword(dark_tone_keywords, query, video_tone)
             modified_query = f"{modified_query} {dark_keyword}"
         else:
             # 밝은 톤 (기본): 기존 동작 유지
-            bright_keyword = random.choice(bright_tone_keywords)
+            bright_keyword = pick_keyword(bright_tone_keywords, query, video_tone)
             modified_query = f"{modified_query} {bright_keyword}"
 
         # v1.6: timelapse 방지 - "slow" 또는 "real time" 키워드 추가
         # Pexels에서 자연 영상 검색 시 timelapse가 상위 노출되는 문제 해결
         anti_timelapse_keywords = ["slow", "gentle", "peaceful", "still", "calm"]
-        anti_timelapse = random.choice(anti_timelapse_keywords)
-        modified_query = f"{modified_query} {anti_timelapse}"
+        anti_timelapse = pick_keyword(anti_timelapse_keywords, query, video_tone, "anti-timelapse")
+        modified_query = canonicalize_query(f"{modified_query} {anti_timelapse}")
 
         logger.info(f"[PexelsSearch] Modified query (tone={video_tone}, anti-timelapse): {modified_query}")
         return modified_query
@@ -415,23 +422,10 @@ class PexelsVideoSearch:
         all_videos_data = []
         try:
             for page in range(1, max_pages + 1):
-                response = requests.get(
-                    self.BASE_URL,
-                    headers={"Authorization": self.pexels_key},
-                    params={
-                        "query": query,
-                        "per_page": 20,
-                        "page": page,
-                        "orientation": "landscape"
-                    },
-                    timeout=10
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Pexels API error: {response.status_code}")
+                data = self._fetch_search_page(query, page=page, per_page=20)
+                if data is None:
                     break
 
-                data = response.json()
                 page_videos = data.get("videos", [])
                 all_videos_data.extend(page_videos)
 
@@ -497,7 +491,7 @@ class PexelsVideoSearch:
 
         def verify_single(video: PexelsVideo) -> Tuple[PexelsVideo, bool]:
             """단일 비디오 검증 (병렬 처리용)"""
-            is_safe = self._verify_with_gemini_vision(video.image_url)
+            is_safe = self._verify_with_gemini_vision(video.image_url, video_id=video.id)
             return (video, is_safe)
 
         # 배치별 병렬 처리 (MAX_CHECKS_PER_QUERY 제한 적용)
@@ -555,19 +549,11 @@ class PexelsVideoSearch:
         all_videos = []
         for priority, query in enumerate(queries, start=1):
             try:
-                response = requests.get(
-                    self.BASE_URL,
-                    headers={"Authorization": self.pexels_key},
-                    params={
-                        "query": query,
-                        "per_page": per_page // 3,  # 각 우선순위별로 나눠서
-                        "orientation": "landscape"
-                    },
-                    timeout=10
+                data = self._fetch_search_page(
+                    query, page=1, per_page=per_page // 3  # 각 우선순위별로 나눠서
                 )
 
-                if response.status_code == 200:
-                    data = response.json()
+                if data is not None:
                     videos = data.get('videos', [])
 
                     for v in videos:
@@ -596,6 +582,48 @@ class PexelsVideoSearch:
 
         return all_videos
 
+    def _fetch_search_page(
+        self,
+        query: str,
+        page: int = 1,
+        per_page: int = 20,
+        orientation: str = "landscape"
+    ) -> Optional[dict]:
+        """
+        Pexels 검색 API 1페이지 조회 (응답 캐시 우선)
+
+        Returns:
+            응답 JSON (videos 포함) 또는 None (API 오류)
+        """
+        query = canonicalize_query(query)
+
+        if self.response_cache is not None:
+            cached = self.response_cache.get(query, page, orientation, per_page)
+            if cached is not None:
+                logger.debug(f"[PexelsSearch] cache hit: '{query}' page {page}")
+                return cached
+
+        response = requests.get(
+            self.BASE_URL,
+            headers={"Authorization": self.pexels_key},
+            params={
+                "query": query,
+                "per_page": per_page,
+                "page": page,
+                "orientation": orientation
+            },
+            timeout=10
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Pexels API error: {response.status_code}")
+            return None
+
+        data = response.json()
+        if self.response_cache is not None:
+            self.response_cache.put(query, page, orientation, per_page, data)
+        return data
+
     def _create_search_queries(
         self,
         mood: Optional[MoodData],
@@ -635,16 +663,26 @@ class PexelsVideoSearch:
             f"{mood.subject}"
         ]
 
-    def _verify_with_gemini_vision(self, thumbnail_url: str) -> bool:
+    def _verify_with_gemini_vision(self, thumbnail_url: str, video_id: Optional[int] = None) -> bool:
         """
         Gemini Vision으로 썸네일 안전성 검증
 
+        video_id가 주어지면 이전 판정(캐시/블랙리스트)을 먼저 조회하고,
+        새 판정은 캐시에 저장한다 (다운로드/호출 실패 폴백은 저장하지 않음).
+
         Args:
             thumbnail_url: 영상 썸네일 URL
+            video_id: Pexels 영상 ID (판정 캐시 키)
 
         Returns:
             True (안전) / False (사람 메인 또는 부적절)
         """
+        if video_id is not None:
+            cached = self.verdict_cache.get_verdict(video_id)
+            if cached is not None:
+                logger.debug(f"[Gemini Vision] cache hit {video_id} → {'ACCEPT' if cached else 'REJECT'}")
+                return cached
+
         try:
             # 이미지 다운로드
             response = requests.get(thumbnail_url, timeout=10)
@@ -930,6 +968,9 @@ Output:"""
                 f"({'✅ PASS' if is_safe else '❌ BLOCKED'})"
             )
 
+            if video_id is not None:
+                self.verdict_cache.put_verdict(video_id, is_safe)
+
             return is_safe
 
         except Exception as e:
@@ -937,7 +978,12 @@ Output:"""
             # 폴백: 실패 시 안전하다고 가정 (False Positive보다 False Negative 선호)
             return True
 
-    def _score_with_gemini_vision(self, thumbnail_url: str, strategy: str = None) -> VisionScore:
+    def _score_with_gemini_vision(
+        self,
+        thumbnail_url: str,
+        strategy: str = None,
+        video_id: Optional[int] = None
+    ) -> VisionScore:
         """
         Gemini Vision으로 썸네일 점수화 검증 (v1.5)
         
@@ -946,10 +992,16 @@ Output:"""
         Args:
             thumbnail_url: 영상 썸네일 URL
             strategy: 현재 검색 전략 (semantic_match 계산용)
+            video_id: Pexels 영상 ID (점수 캐시 키)
             
         Returns:
             VisionScore 객체
         """
+        if video_id is not None:
+            cached = self.verdict_cache.get_score(video_id)
+            if cached is not None:
+                return self._vision_score_from_fields(cached, strategy)
+
         try:
             # 이미지 다운로드
             response = requests.get(thumbnail_url, timeout=10)
@@ -1030,26 +1082,31 @@ Output ONLY the JSON object:"""
                 logger.warning(f"Failed to parse Vision JSON: {response_text[:100]}")
                 # 폴백: 기존 accept/reject 로직 사용
                 is_accept = "ACCEPT" in response_text.upper()
-                return VisionScore(
-                    hard_reject=not is_accept,
-                    reject_reason="json_parse_failed" if not is_accept else ""
-                )
+                fields = {
+                    "hard_reject": not is_accept,
+                    "reject_reason": "json_parse_failed" if not is_accept else ""
+                }
+                if video_id is not None:
+                    self.verdict_cache.put_score(video_id, fields)
+                return self._vision_score_from_fields(fields, strategy)
             
-            # VisionScore 생성
-            score = VisionScore(
-                has_face_closeup=data.get("has_face_closeup", False),
-                has_cityscape=data.get("has_cityscape", False),
-                has_logo_text=data.get("has_logo_text", False),
-                has_modern_objects=data.get("has_modern_objects", False),
-                has_revealing_content=data.get("has_revealing_content", False),
-                scene_tags=data.get("scene_tags", []),
-                mood_tags=data.get("mood_tags", []),
-                semantic_match=self._calculate_semantic_match(data.get("scene_tags", []), strategy),
-                biblical_vibe=data.get("biblical_vibe", 50),
-                visual_quality=data.get("visual_quality", 50),
-                modernness=data.get("modernness", 50),
-                reject_reason=data.get("reject_reason", "")
-            )
+            # VisionScore 생성 (semantic_match는 전략별로 달라지므로 캐시에서 제외)
+            fields = {
+                "has_face_closeup": data.get("has_face_closeup", False),
+                "has_cityscape": data.get("has_cityscape", False),
+                "has_logo_text": data.get("has_logo_text", False),
+                "has_modern_objects": data.get("has_modern_objects", False),
+                "has_revealing_content": data.get("has_revealing_content", False),
+                "scene_tags": data.get("scene_tags", []),
+                "mood_tags": data.get("mood_tags", []),
+                "biblical_vibe": data.get("biblical_vibe", 50),
+                "visual_quality": data.get("visual_quality", 50),
+                "modernness": data.get("modernness", 50),
+                "reject_reason": data.get("reject_reason", "")
+            }
+            if video_id is not None:
+                self.verdict_cache.put_score(video_id, fields)
+            score = self._vision_score_from_fields(fields, strategy)
             
             logger.info(
                 f"[Vision Score] {thumbnail_url[-20:]} → "
@@ -1062,6 +1119,13 @@ Output ONLY the JSON object:"""
         except Exception as e:
             logger.exception(f"Gemini Vision scoring failed: {e}")
             return VisionScore(hard_reject=False, semantic_match=50, biblical_vibe=50)
+
+    def _vision_score_from_fields(self, fields: dict, strategy: str = None) -> VisionScore:
+        """Gemini 응답 필드(캐시 포함) → VisionScore (semantic_match는 현재 전략으로 재계산)"""
+        return VisionScore(
+            **fields,
+            semantic_match=self._calculate_semantic_match(fields.get("scene_tags", []), strategy)
+        )
     
     def _calculate_semantic_match(self, scene_tags: List[str], strategy: str) -> int:
         """
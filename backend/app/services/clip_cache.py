@@ -0,0 +1,164 @@
+"""
+Pexels 클립 디스크 캐시 (워커 로컬, LRU)
+
+런타임에 다운로드한 Pexels 영상을 (영상 ID, 렌디션) 기준으로 보관해
+인기 클립을 작업마다 다시 받지 않는다.
+
+- write-through: 다운로드는 캐시 디렉토리의 임시 파일에 쓰고 완료 후 rename (원자적)
+- 작업 디렉토리에는 하드링크 (다른 파일시스템이면 복사로 폴백)
+- 용량 예산 초과 시 가장 오래 사용하지 않은 파일부터 제거 (mtime = 마지막 사용 시각)
+  → 작업 디렉토리의 하드링크는 캐시에서 지워져도 유지됨
+
+Usage:
+    cache = get_clip_cache()
+    cache.fetch(video_id, url, job_dir / "seg1_src.mp4")
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from app.services.downloader import get_downloader
+
+logger = logging.getLogger(__name__)
+
+
+def link_or_copy(src: Path, dest: Path) -> Path:
+    """src를 dest에 하드링크 (실패 시 복사)"""
+    dest = Path(dest)
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+    return dest
+
+
+class ClipCache:
+    """Pexels 클립 LRU 디스크 캐시"""
+
+    TEMP_PREFIX = ".partial-"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (하드링크를 위해 작업 디렉토리와 같은 파일시스템 권장)
+            max_bytes: 용량 예산 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._evict_lock = threading.Lock()
+
+    def key_for(self, video_id: Optional[int], url: str) -> str:
+        """
+        캐시 파일명: pexels_{id}_{렌디션 해시}.mp4
+
+        같은 영상이라도 렌디션(해상도/fps 파일)이 다르면 별도 항목.
+        """
+        rendition = os.path.basename(urlparse(url).path) or url
+        digest = hashlib.sha1(rendition.encode("utf-8")).hexdigest()[:12]
+        if video_id is None:
+            return f"url_{digest}.mp4"
+        return f"pexels_{video_id}_{digest}.mp4"
+
+    def get(self, video_id: Optional[int], url: str) -> Optional[Path]:
+        """캐시된 클립 경로 (사용 시각 갱신) 또는 None"""
+        path = self.cache_dir / self.key_for(video_id, url)
+        try:
+            os.utime(path)  # LRU: 마지막 사용 시각
+        except FileNotFoundError:
+            return None
+        return path
+
+    def fetch(self, video_id: Optional[int], url: str, dest: Path) -> Path:
+        """
+        캐시에서 dest로 하드링크 (미스면 다운로드 후 캐시에 저장)
+
+        Args:
+            video_id: Pexels 영상 ID
+            url: 영상 파일 URL (렌디션)
+            dest: 작업 디렉토리 내 목적지 경로
+
+        Returns:
+            dest
+        """
+        cached = self.get(video_id, url)
+        if cached is not None:
+            logger.info(f"[ClipCache] HIT {cached.name}")
+            return link_or_copy(cached, dest)
+
+        logger.info(f"[ClipCache] MISS → downloading {url[:50]}...")
+        cached = self._download(url, self.cache_dir / self.key_for(video_id, url))
+        self.evict()
+        return link_or_copy(cached, dest)
+
+    def _download(self, url: str, final_path: Path) -> Path:
+        """임시 파일에 다운로드 후 원자적 rename (동시 다운로드는 마지막 rename이 승리)"""
+        partial = self.cache_dir / f"{self.TEMP_PREFIX}{uuid.uuid4().hex}"
+        try:
+            get_downloader().download(url, str(partial))
+            os.replace(partial, final_path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+        return final_path
+
+    def evict(self) -> int:
+        """
+        용량 예산 초과 시 오래 사용하지 않은 클립부터 제거
+
+        Returns:
+            제거한 파일 수
+        """
+        with self._evict_lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.iterdir():
+                if path.name.startswith(self.TEMP_PREFIX) or not path.is_file():
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+
+            if removed:
+                logger.info(f"[ClipCache] Evicted {removed} clips (now {total / 1024 / 1024:.0f}MB)")
+            return removed
+
+
+# 싱글톤
+_clip_cache: ClipCache | None = None
+
+
+def get_clip_cache() -> ClipCache:
+    """ClipCache 싱글톤 (CLIP_CACHE_DIR / CLIP_CACHE_MAX_GB 설정)"""
+    global _clip_cache
+    if _clip_cache is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        cache_dir = settings.CLIP_CACHE_DIR or os.path.join(tempfile.gettempdir(), "qt_clip_cache")
+        _clip_cache = ClipCache(cache_dir, max_bytes=int(settings.CLIP_CACHE_MAX_GB * 1024 ** 3))
+        logger.info(f"[ClipCache] Initialized: {cache_dir} ({settings.CLIP_CACHE_MAX_GB}GB)")
+    return _clip_cache
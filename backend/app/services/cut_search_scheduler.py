@@ -0,0 +1,245 @@
+"""
+컷별 Pexels 검색 스케줄러 (Concurrent Cut Search)
+
+Stage 3 (Pexels 검색 + Gemini Vision 검증)를 컷 단위로 병렬 실행한다.
+- 동시 실행 수 제한 (max_workers)
+- ClipReservation으로 Pexels ID 선점 → 두 컷이 같은 영상을 가져가지 않음
+- 기존 Fallback 유지: 대체 쿼리 → nature 쿼리 → 이전 컷 영상 재사용
+
+Usage:
+    reservation = ClipReservation(recently_used_ids)
+    scheduler = CutSearchScheduler(pexels_search, reservation, max_workers=4)
+    subtitle_clips = scheduler.search_all(cuts, visual_descriptions)
+"""
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 배치 클립 선점 집합 유지 시간 (초)
+RESERVATION_TTL = 24 * 60 * 60
+
+
+class ClipReservation:
+    """
+    Pexels 영상 ID 선점 관리 (스레드 안전)
+
+    redis_key가 주어지면 (배치) Redis 집합(SADD)으로 워커 간에도 선점을 공유한다.
+    """
+
+    def __init__(
+        self,
+        initial_ids: Optional[Iterable[int]] = None,
+        redis_key: Optional[str] = None,
+        redis_ttl: int = RESERVATION_TTL
+    ):
+        """
+        Args:
+            initial_ids: 처음부터 제외할 ID (최근 사용 클립, 블랙리스트)
+            redis_key: 워커 간 공유 선점 집합 키 (None이면 로컬만)
+            redis_ttl: Redis 선점 집합 유지 시간 (초)
+        """
+        self._used = set(initial_ids or [])
+        self._lock = threading.Lock()
+        self.redis_key = redis_key
+        self.redis_ttl = redis_ttl
+
+    def snapshot(self) -> set:
+        """현재 사용/선점된 ID 복사본 (검색 exclude_ids용)"""
+        with self._lock:
+            return set(self._used)
+
+    def is_used(self, video_id: int) -> bool:
+        with self._lock:
+            return video_id in self._used
+
+    def claim(self, video_id: int) -> bool:
+        """
+        영상 선점
+
+        Returns:
+            True = 선점 성공, False = 이미 사용/선점됨
+        """
+        with self._lock:
+            if video_id in self._used:
+                return False
+            self._used.add(video_id)
+
+        if self.redis_key and not self._claim_shared(video_id):
+            return False
+        return True
+
+    def _claim_shared(self, video_id: int) -> bool:
+        """Redis 집합으로 배치 내 다른 영상과 선점 경쟁"""
+        try:
+            from app.database import get_redis
+
+            redis_client = get_redis()
+            claimed = redis_client.sadd(self.redis_key, video_id)
+            redis_client.expire(self.redis_key, self.redis_ttl)
+            return bool(claimed)
+        except Exception as e:
+            logger.warning(f"[ClipReservation] 공유 선점 실패 (로컬 중복 방지만 적용): {e}")
+            return True
+
+
+class CutSearchScheduler:
+    """컷별 Pexels 검색 병렬 스케줄러"""
+
+    # 대체 쿼리 목록 (중복 발생 시 사용)
+    ALTERNATIVE_QUERIES = [
+        "peaceful mountain landscape nature cinematic",
+        "calm ocean waves sunset serene",
+        "forest trees morning light peaceful",
+        "clouds sky sunset golden hour",
+        "river water flowing nature calm",
+        "desert wilderness ancient landscape",
+        "rain drops window contemplation",
+        "sunrise horizon hope new day"
+    ]
+    NATURE_FALLBACK_QUERY = "peaceful nature landscape calm serene cinematic"
+    MAX_RESULTS = 8  # 5→8로 증가 (중복 제외 후 선택지 확보)
+
+    def __init__(
+        self,
+        pexels_search,
+        reservation: ClipReservation,
+        max_workers: int = 4
+    ):
+        """
+        Args:
+            pexels_search: PexelsVideoSearch
+            reservation: ClipReservation (전역 중복 + 현재 영상 중복 방지)
+            max_workers: 동시에 검색할 컷 수
+        """
+        self.pexels_search = pexels_search
+        self.reservation = reservation
+        self.max_workers = max(1, max_workers)
+        self._alt_query_counter = itertools.count()
+        self._alt_query_lock = threading.Lock()
+
+    def search_all(self, cuts: List, descriptions: List) -> List[dict]:
+        """
+        모든 컷 검색 (병렬) → 컷 순서대로 subtitle_clips 반환
+
+        Args:
+            cuts: SubtitleCut 리스트
+            descriptions: 컷별 VisualDescription 리스트
+
+        Returns:
+            [{'cut', 'description', 'video'}, ...]
+
+        Raises:
+            ValueError: 첫 번째 컷에 사용할 영상이 전혀 없을 때
+        """
+        pairs = list(zip(cuts, descriptions))
+        if not pairs:
+            return []
+
+        logger.info(f"[CutSearch] {len(pairs)}개 컷 병렬 검색 (동시 {self.max_workers}개)")
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pairs))) as executor:
+            videos = list(executor.map(lambda pair: self._search_cut(*pair), pairs))
+
+        # 컷 순서대로 결과 조립 (검색 실패 컷은 이전 컷 영상 재사용)
+        subtitle_clips = []
+        for (cut, desc), video in zip(pairs, videos):
+            if video is None:
+                # Fallback 2: 이전 cut의 영상 재사용 (최후의 수단)
+                if subtitle_clips:
+                    video = subtitle_clips[-1]['video']
+                    logger.warning(
+                        f"  Cut {cut.index+1}: Using previous video (ID {video.id}) as final fallback"
+                    )
+                    # 이전 영상 재사용은 선점하지 않음 (의도적 중복)
+                else:
+                    # 첫 번째 cut인데 실패 → 에러 (이건 거의 불가능)
+                    logger.error(f"  Cut {cut.index+1}: Failed to find any video (first cut)")
+                    raise ValueError(f"Failed to find video for first cut (index {cut.index})")
+
+            subtitle_clips.append({
+                'cut': cut,
+                'description': desc,
+                'video': video
+            })
+
+        return subtitle_clips
+
+    def _search_cut(self, cut, desc):
+        """
+        단일 컷 검색 + 선점 (대체 쿼리 / nature Fallback 포함)
+
+        Returns:
+            선택된 PexelsVideo 또는 None (모든 검색 실패)
+        """
+        duration_needed = int(cut.duration) + 1
+
+        videos = self._search(desc.visual_query, duration_needed)
+
+        if videos:
+            # 중복되지 않은 첫 번째 영상 선점
+            selected_video = self._claim_first(videos)
+
+            # 모든 영상이 이미 사용됨 → 대체 쿼리로 재검색
+            if selected_video is None:
+                logger.warning(
+                    f"  Cut {cut.index+1}: All videos from main query used, trying alternative query"
+                )
+                alt_videos = self._search(self._next_alternative_query(), duration_needed)
+                selected_video = self._claim_first(alt_videos)
+                if selected_video is not None:
+                    logger.info(f"  Cut {cut.index+1}: Found alternative video ID {selected_video.id}")
+
+                # 대체 쿼리도 모두 중복 → 최후의 수단: 첫 번째 재사용
+                if selected_video is None:
+                    selected_video = videos[0]
+                    logger.warning(
+                        f"  Cut {cut.index+1}: No unique videos found, reusing ID {videos[0].id}"
+                    )
+
+            logger.info(
+                f"  Cut {cut.index+1}: Video ID {selected_video.id} "
+                f"({selected_video.duration}s, verified: {selected_video.vision_verified})"
+            )
+            return selected_video
+
+        logger.warning(f"  Cut {cut.index+1}: No videos found (fallback to nature)")
+        # Fallback 1: nature 영상 검색
+        fallback = self._search(self.NATURE_FALLBACK_QUERY, duration_needed)
+        if not fallback:
+            return None
+
+        # 중복되지 않은 nature 영상 선점
+        selected_fallback = self._claim_first(fallback)
+
+        # 모든 nature 영상도 이미 사용됨 → 첫 번째 재사용
+        if selected_fallback is None:
+            selected_fallback = fallback[0]
+            logger.warning(
+                f"  Cut {cut.index+1}: Nature fallback also used, reusing ID {fallback[0].id}"
+            )
+        return selected_fallback
+
+    def _search(self, visual_query: str, duration_needed: int) -> list:
+        return self.pexels_search.search_by_visual_description(
+            visual_query=visual_query,
+            duration_needed=duration_needed,
+            max_results=self.MAX_RESULTS,
+            exclude_ids=self.reservation.snapshot()  # 검색 시점까지 사용/선점된 영상 제외
+        )
+
+    def _claim_first(self, videos: list):
+        """검색 결과 중 선점에 성공한 첫 번째 영상"""
+        for video in videos or []:
+            if self.reservation.claim(video.id):
+                return video
+        return None
+
+    def _next_alternative_query(self) -> str:
+        with self._alt_query_lock:
+            idx = next(self._alt_query_counter)
+        return self.ALTERNATIVE_QUERIES[idx % len(self.ALTERNATIVE_QUERIES)]
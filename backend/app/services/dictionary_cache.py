@@ -0,0 +1,202 @@
+"""
+치환 사전 워커 캐시 (버전 스탬프 기준)
+
+process_video_task마다 global_dictionary(활성 행 전체)와 replacement_dictionary
+(교회별 상위 100개)를 Supabase에서 다시 읽고 매처도 다시 만들었다.
+사전은 자막 수정 시에만 바뀌므로, 워커 메모리에 (버전, 항목, 컴파일된 매처)를 보관하고
+Redis 버전 키만 확인한다 (평상시 DB 왕복 0회, Redis GET 1회).
+
+- 버전 키: qt:dictionary:version:global / qt:dictionary:version:church:{church_id}
+- 사전 API(routers/replacement_dictionary.py, routers/dictionary.py)가 쓰기 후 bump (INCR)
+- Redis 장애 시: max_age 동안만 보관본 사용 후 다시 조회
+- max_age는 관리 도구/SQL로 직접 고친 통합 사전도 언젠가 반영되게 하는 안전장치
+
+Usage:
+    snapshot = get_dictionary_cache().global_dictionary(supabase)
+    text, applied = correction_service.apply_replacement_dictionary(text, snapshot.matcher)
+
+    # 사전 쓰기 후
+    bump_dictionary_version(church_scope(church_id))
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from app.services.replacement_matcher import ReplacementMatcher
+
+logger = logging.getLogger(__name__)
+
+
+GLOBAL_SCOPE = "global"
+
+
+def church_scope(church_id: str) -> str:
+    """교회별 사전 범위 이름"""
+    return f"church:{church_id}"
+
+
+def fetch_global_dictionary(supabase) -> list[dict]:
+    """통합 사전 조회 (apply_replacement_dictionary 형식: use_count = priority)"""
+    result = supabase.table("global_dictionary") \
+        .select("original, replacement, category, priority") \
+        .eq("is_active", True) \
+        .order("priority", desc=True) \
+        .order("category") \
+        .execute()
+
+    return [
+        {"original": e["original"], "replacement": e["replacement"], "use_count": e.get("priority", 0)}
+        for e in (result.data or [])
+    ]
+
+
+def fetch_church_dictionary(supabase, church_id: str) -> list[dict]:
+    """교회별 치환 사전 조회 (사용 빈도 상위 100개)"""
+    result = supabase.table("replacement_dictionary") \
+        .select("original, replacement, use_count") \
+        .eq("church_id", church_id) \
+        .order("use_count", desc=True) \
+        .limit(100) \
+        .execute()
+
+    return result.data or []
+
+
+@dataclass
+class DictionarySnapshot:
+    """특정 버전의 사전 (항목 + 컴파일된 매처)"""
+    scope: str
+    version: Optional[str]  # None = Redis 확인 실패 (max_age 동안만 사용)
+    entries: list
+    matcher: ReplacementMatcher
+    loaded_at: float = field(default_factory=time.time)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class DictionaryCache:
+    """범위(통합/교회)별 사전 스냅샷 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        redis_client,
+        max_age: float = 600.0,
+        max_scopes: int = 64,
+        prefix: str = "qt:dictionary:version"
+    ):
+        """
+        Args:
+            redis_client: 버전 키 저장소 (None이면 max_age만으로 만료)
+            max_age: 버전이 같아도 다시 조회하는 주기 (초, 0 = 무제한)
+            max_scopes: 보관할 사전 수 (교회 수, 최근 사용 순)
+            prefix: 버전 키 접두사
+        """
+        self.redis = redis_client
+        self.max_age = max_age
+        self.max_scopes = max_scopes
+        self.prefix = prefix
+        self._snapshots: "OrderedDict[str, DictionarySnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, scope: str) -> str:
+        return f"{self.prefix}:{scope}"
+
+    def version(self, scope: str) -> Optional[str]:
+        """현재 버전 (키가 없으면 "0", Redis 오류면 None)"""
+        if self.redis is None:
+            return None
+        try:
+            return self.redis.get(self._key(scope)) or "0"
+        except Exception as e:
+            logger.warning(f"[DictionaryCache] 버전 조회 실패 (max_age로 만료): {e}")
+            return None
+
+    def bump(self, scope: str) -> None:
+        """사전이 바뀌었음을 알림 (모든 워커의 보관본 무효화)"""
+        with self._lock:
+            self._snapshots.pop(scope, None)
+        if self.redis is None:
+            return
+        try:
+            self.redis.incr(self._key(scope))
+        except Exception as e:
+            logger.warning(f"[DictionaryCache] 버전 갱신 실패 ({scope}): {e}")
+
+    def get(self, scope: str, loader: Callable[[], list]) -> DictionarySnapshot:
+        """
+        현재 버전의 사전 (버전이 바뀌었거나 오래됐으면 loader로 다시 조회)
+
+        Args:
+            scope: GLOBAL_SCOPE 또는 church_scope(church_id)
+            loader: 항목 목록 조회 함수 (DB)
+        """
+        version = self.version(scope)
+        now = time.time()
+
+        with self._lock:
+            snapshot = self._snapshots.get(scope)
+            if snapshot is not None and self._is_fresh(snapshot, version, now):
+                self._snapshots.move_to_end(scope)
+                return snapshot
+
+        # 조회 중 버전이 올라가도 다음 호출에서 다시 조회됨 (버전은 조회 전에 읽음)
+        entries = loader()
+        snapshot = DictionarySnapshot(
+            scope=scope,
+            version=version,
+            entries=entries,
+            matcher=ReplacementMatcher.from_entries(entries),
+        )
+        with self._lock:
+            self._snapshots[scope] = snapshot
+            self._snapshots.move_to_end(scope)
+            while len(self._snapshots) > self.max_scopes:
+                self._snapshots.popitem(last=False)
+
+        logger.info(f"[DictionaryCache] {scope} v{version} 로드: {len(entries)}개")
+        return snapshot
+
+    def _is_fresh(self, snapshot: DictionarySnapshot, version: Optional[str], now: float) -> bool:
+        """버전이 같고 max_age 이내 (버전 확인 실패 시 max_age만 적용)"""
+        if self.max_age and now - snapshot.loaded_at >= self.max_age:
+            return False
+        return version is None or snapshot.version == version
+
+    def global_dictionary(self, supabase) -> DictionarySnapshot:
+        """통합 사전 스냅샷"""
+        return self.get(GLOBAL_SCOPE, lambda: fetch_global_dictionary(supabase))
+
+    def church_dictionary(self, supabase, church_id: str) -> DictionarySnapshot:
+        """교회별 치환 사전 스냅샷"""
+        return self.get(church_scope(church_id), lambda: fetch_church_dictionary(supabase, church_id))
+
+
+# 싱글톤
+_dictionary_cache: DictionaryCache | None = None
+
+
+def get_dictionary_cache() -> DictionaryCache:
+    """DictionaryCache 싱글톤 (DICTIONARY_CACHE_MAX_AGE_SECONDS 설정)"""
+    global _dictionary_cache
+    if _dictionary_cache is None:
+        from app.config import get_settings
+        from app.database import get_redis
+
+        settings = get_settings()
+        _dictionary_cache = DictionaryCache(
+            get_redis(),
+            max_age=settings.DICTIONARY_CACHE_MAX_AGE_SECONDS
+        )
+    return _dictionary_cache
+
+
+def bump_dictionary_version(scope: str) -> None:
+    """사전 쓰기 API에서 호출 (실패해도 요청은 성공 처리, max_age 후 반영)"""
+    try:
+        get_dictionary_cache().bump(scope)
+    except Exception as e:
+        logger.warning(f"[DictionaryCache] 버전 갱신 실패 ({scope}): {e}")
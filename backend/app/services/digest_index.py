@@ -0,0 +1,93 @@
+"""
+R2 콘텐츠 주소 객체 로컬 인덱스 (워커 로컬)
+
+콘텐츠 주소 업로드(키 = 내용 SHA-256)는 같은 키가 이미 있으면 업로드를 건너뛴다.
+존재 확인(HEAD)도 요청 한 번이므로, 이 워커가 올렸거나 확인한 키를 파일에 기록해
+다음부터는 HEAD 없이 바로 재사용한다.
+
+- 한 줄에 키 하나 (append-only), 프로세스 간 공유 (같은 노드의 워커들)
+- max_entries의 2배를 넘으면 최근 max_entries개만 남기고 다시 씀
+- 인덱스가 틀려도 (R2에서 수동 삭제 등) discard()로 지울 수 있다
+
+Usage:
+    index = DigestIndex("/tmp/qt_r2_digests.txt")
+    if not index.contains(key):
+        ...HEAD/업로드...
+        index.add(key)
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class DigestIndex:
+    """R2에 존재하는 것으로 확인된 콘텐츠 주소 키 집합 (파일 기반)"""
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+        self._lines = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    key = line.strip()
+                    if key:
+                        self._keys.pop(key, None)
+                        self._keys[key] = None
+                        self._lines += 1
+        except OSError as e:
+            logger.warning(f"[DigestIndex] 인덱스 읽기 실패 (빈 인덱스로 시작): {e}")
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._keys) > self.max_entries:
+            self._keys.popitem(last=False)
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._keys
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            if key in self._keys:
+                return
+            self._keys[key] = None
+            self._trim()
+            self._lines += 1
+            try:
+                if self._lines > self.max_entries * 2:
+                    self._rewrite()
+                else:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.write(key + "\n")
+            except OSError as e:
+                logger.warning(f"[DigestIndex] 인덱스 기록 실패 (무시): {e}")
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if self._keys.pop(key, "missing") is None:
+                try:
+                    self._rewrite()
+                except OSError as e:
+                    logger.warning(f"[DigestIndex] 인덱스 기록 실패 (무시): {e}")
+
+    def _rewrite(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        partial = f"{self.path}.{os.getpid()}.tmp"
+        with open(partial, "w", encoding="utf-8") as f:
+            f.writelines(key + "\n" for key in self._keys)
+        os.replace(partial, self.path)
+        self._lines = len(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
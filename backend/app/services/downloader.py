@@ -0,0 +1,272 @@
+"""
+스트리밍 다운로드 (공용)
+
+httpx.get(...) 후 resp.content를 쓰면 100MB가 넘는 베이스 영상/클립도
+통째로 워커 메모리에 올라간다. 모든 미디어 다운로드를 이 모듈로 모아
+청크 단위로 디스크에 바로 기록한다 (워커 RSS가 파일 크기와 무관).
+
+- 커넥션 풀을 공유하는 httpx.Client (같은 호스트 재접속 비용 제거)
+- 임시 파일(.part)에 기록 후 원자적 rename
+- 연결이 끊기면 Range 요청으로 이어받기 (서버가 Range 미지원이면 처음부터)
+- Content-Length 대비 크기 검증 + 최소/최대 크기 검사
+- 조건부 요청 (ETag/Last-Modified → 304면 다운로드 생략, asset_cache 재검증용)
+
+Usage:
+    get_downloader().download(url, "/tmp/clip.mp4", min_size=1000)
+
+    # FastAPI (비동기 프록시/다운로드 응답)
+    response, body = await open_stream(url)
+    return StreamingResponse(body, media_type=response.headers.get("content-type"))
+"""
+import logging
+import os
+import time
+from typing import AsyncIterator, Optional, Tuple
+
+import httpx
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class DownloadError(Exception):
+    """다운로드 실패 (HTTP 오류, 재시도 초과, 크기 불일치)"""
+
+
+class _NotModified(Exception):
+    """조건부 요청 304 (내부용)"""
+
+
+def _total_size(response: httpx.Response, offset: int) -> Optional[int]:
+    """응답 헤더로 전체 파일 크기 계산 (모르면 None)"""
+    content_range = response.headers.get("content-range", "")
+    if response.status_code == 206 and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("content-length")
+    return int(length) + offset if length and length.isdigit() else None
+
+
+class MediaDownloader:
+    """커넥션 풀 공유 스트리밍 다운로더 (스레드 안전)"""
+
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        max_retries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            timeout: 읽기 타임아웃 (초, 청크 사이 대기 기준)
+            max_retries: 연결 끊김 시 이어받기 재시도 횟수
+            max_bytes: 다운로드 1건 최대 크기
+        """
+        self.max_retries = settings.DOWNLOAD_RETRIES if max_retries is None else max_retries
+        self.max_bytes = settings.DOWNLOAD_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+        self.client = httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            follow_redirects=True
+        )
+
+    def download(
+        self,
+        url: str,
+        dest: str,
+        min_size: int = 1,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        URL → 로컬 파일 (청크 단위 기록)
+
+        Args:
+            url: 다운로드 URL
+            dest: 저장 경로 (완료 후에만 생성됨)
+            min_size: 최소 바이트 수 (미만이면 손상/빈 파일로 간주)
+            timeout: 이 요청에만 적용할 읽기 타임아웃
+
+        Returns:
+            dest
+
+        Raises:
+            DownloadError: HTTP 오류, 재시도 초과, 크기 불일치
+        """
+        self._download(url, dest, min_size, timeout)
+        return dest
+
+    def download_if_modified(
+        self,
+        url: str,
+        dest: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Optional[dict]:
+        """
+        조건부 다운로드 (캐시 재검증)
+
+        Returns:
+            새 검증자 {"etag", "last_modified"} (dest에 새 내용 기록) 또는 None (304, 변경 없음)
+        """
+        conditions = {}
+        if etag:
+            conditions["If-None-Match"] = etag
+        if last_modified:
+            conditions["If-Modified-Since"] = last_modified
+        try:
+            headers = self._download(url, dest, 1, timeout, conditions)
+        except _NotModified:
+            return None
+        return {"etag": headers.get("etag"), "last_modified": headers.get("last-modified")}
+
+    def _download(
+        self,
+        url: str,
+        dest: str,
+        min_size: int,
+        timeout: Optional[float],
+        conditions: Optional[dict] = None
+    ) -> httpx.Headers:
+        """스트리밍 다운로드 본체 (처음부터 받은 응답의 헤더 반환)"""
+        partial = f"{dest}.part"
+        written = 0
+        expected = None
+        attempt = 0
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        response_headers = httpx.Headers()
+
+        try:
+            while True:
+                # 조건부 헤더는 첫 요청에만, 이어받기는 같은 내용일 때만 (If-Range)
+                if written:
+                    headers = {"Range": f"bytes={written}-"}
+                    if response_headers.get("etag"):
+                        headers["If-Range"] = response_headers["etag"]
+                else:
+                    headers = dict(conditions or {})
+                try:
+                    with self.client.stream("GET", url, headers=headers, timeout=request_timeout) as response:
+                        if response.status_code == 304:
+                            raise _NotModified()
+                        if response.status_code >= 400:
+                            raise DownloadError(f"HTTP {response.status_code}: {url}")
+                        if written and response.status_code != 206:
+                            logger.info("[Download] Range 미지원 → 처음부터 다시 받기")
+                            written = 0
+                        if not written:
+                            response_headers = response.headers
+                        expected = _total_size(response, written)
+                        if expected is not None and expected > self.max_bytes:
+                            raise DownloadError(f"파일이 너무 큼 ({expected} bytes): {url}")
+
+                        with open(partial, "ab" if written else "wb") as f:
+                            for chunk in response.iter_bytes(CHUNK_SIZE):
+                                f.write(chunk)
+                                written += len(chunk)
+                                if written > self.max_bytes:
+                                    raise DownloadError(f"파일이 너무 큼 (>{self.max_bytes} bytes): {url}")
+                    break
+
+                except httpx.TransportError as e:
+                    attempt += 1
+                    if attempt > self.max_retries:
+                        raise DownloadError(f"다운로드 재시도 초과 ({e}): {url}") from e
+                    logger.warning(f"[Download] 연결 끊김 ({e}) → {written} bytes부터 이어받기 ({attempt}/{self.max_retries})")
+                    time.sleep(min(2 ** attempt, 10))
+
+            if expected is not None and written != expected:
+                raise DownloadError(f"크기 불일치 ({written}/{expected} bytes): {url}")
+            if written < min_size:
+                raise DownloadError(f"파일이 비어있거나 손상됨 ({written} bytes): {url}")
+
+            os.replace(partial, dest)
+            logger.debug(f"[Download] {written / 1024 / 1024:.1f}MB → {dest}")
+            return response_headers
+
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+# 싱글톤 (워커 프로세스마다 하나, 첫 사용 시 생성 → prefork 이후 소켓 공유 없음)
+_downloader: MediaDownloader | None = None
+
+
+def get_downloader() -> MediaDownloader:
+    """MediaDownloader 싱글톤"""
+    global _downloader
+    if _downloader is None:
+        _downloader = MediaDownloader()
+    return _downloader
+
+
+# 비동기 (API 서버) - 이벤트 루프 하나에서 공유
+_async_client: httpx.AsyncClient | None = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+            follow_redirects=True
+        )
+    return _async_client
+
+
+async def open_stream(
+    url: str,
+    headers: Optional[dict] = None,
+    timeout: Optional[float] = None
+) -> Tuple[httpx.Response, AsyncIterator[bytes]]:
+    """
+    URL 스트리밍 열기 (본문을 메모리에 모으지 않고 StreamingResponse로 전달)
+
+    Returns:
+        (응답 - 상태/헤더 확인용, 본문 청크 async iterator - 끝나면 연결 반환)
+
+    Raises:
+        httpx.HTTPStatusError: 4xx/5xx 응답
+    """
+    client = _get_async_client()
+    request = client.build_request(
+        "GET", url, headers=headers, timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+    )
+    response = await client.send(request, stream=True)
+    if response.status_code >= 400:
+        await response.aclose()
+        response.raise_for_status()
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes(64 * 1024):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    return response, body()
+
+
+async def download_async(url: str, dest: str, timeout: Optional[float] = None) -> str:
+    """URL → 로컬 파일 (비동기, 청크 단위 기록)"""
+    response, body = await open_stream(url, timeout=timeout)
+    partial = f"{dest}.part"
+    try:
+        with open(partial, "wb") as f:
+            async for chunk in body:
+                f.write(chunk)
+        os.replace(partial, dest)
+        return dest
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
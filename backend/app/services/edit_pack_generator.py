@@ -31,7 +31,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
-import httpx
+from app.services.downloader import get_downloader
 
 logger = logging.getLogger(__name__)
 
@@ -111,15 +111,6 @@ class EditPackGenerator:
             download_timeout: HTTP 다운로드 타임아웃 (초)
         """
         self.download_timeout = download_timeout
-        self.http_client = httpx.Client(timeout=download_timeout)
-
-    def __del__(self):
-        """Cleanup HTTP client"""
-        try:
-            if hasattr(self, 'http_client') and self.http_client is not None:
-                self.http_client.close()
-        except Exception:
-            pass  # Ignore errors during interpreter shutdown
 
     def generate_edit_pack(
         self,
@@ -308,13 +299,7 @@ class EditPackGenerator:
 
         logger.debug(f"[EditPackGenerator] Downloading clip {index} from {url[:80]}...")
 
-        response = self.http_client.get(url)
-        response.raise_for_status()
-
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-
-        return str(output_path)
+        return get_downloader().download(url, str(output_path), timeout=self.download_timeout)
 
     def _trim_clip(self, input_path: str, output_path: str, duration: float) -> None:
         """
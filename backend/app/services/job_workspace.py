@@ -0,0 +1,103 @@
+"""
+작업별 격리 작업 디렉토리 (Job Workspace)
+
+한 워커(노드)에서 여러 영상 작업을 동시에 실행해도 중간 파일
+(seg{idx}_src.mp4, final_concat.txt 등)이 서로 덮어쓰지 않도록
+작업마다 고유 디렉토리를 만들고, 종료 시 (실패 포함) 통째로 삭제한다.
+
+프로세스가 강제 종료되어 남은 디렉토리는 워커 시작 시
+sweep_stale_workspaces()로 정리한다.
+
+Usage:
+    with JobWorkspace(video_id, label="compose") as workspace:
+        processor = get_clip_processor(temp_dir=str(workspace.path))
+        ...
+"""
+import logging
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+WORKSPACE_ROOT_NAME = "qt_jobs"
+
+
+def _workspace_root(base_dir: Optional[str] = None) -> Path:
+    return Path(base_dir or os.path.join(tempfile.gettempdir(), WORKSPACE_ROOT_NAME))
+
+
+class JobWorkspace:
+    """작업 단위 임시 디렉토리 (context manager)"""
+
+    def __init__(
+        self,
+        job_id: str,
+        label: str = "job",
+        base_dir: Optional[str] = None,
+        keep: bool = False
+    ):
+        """
+        Args:
+            job_id: 작업 식별자 (video_id 등, 디렉토리 이름에 포함)
+            label: 작업 종류 (compose, regenerate 등)
+            base_dir: 루트 디렉토리 (None이면 {tmp}/qt_jobs)
+            keep: True면 종료 시 삭제하지 않음 (디버깅용)
+        """
+        self.path = _workspace_root(base_dir) / f"{label}-{job_id}-{uuid.uuid4().hex[:8]}"
+        self.keep = keep
+
+    def __enter__(self) -> "JobWorkspace":
+        self.path.mkdir(parents=True, exist_ok=False)
+        logger.info(f"[Workspace] Created: {self.path}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cleanup()
+
+    def file(self, name: str) -> Path:
+        """작업 디렉토리 내 파일 경로"""
+        return self.path / name
+
+    def cleanup(self) -> None:
+        if self.keep:
+            logger.info(f"[Workspace] Kept for debugging: {self.path}")
+            return
+        shutil.rmtree(self.path, ignore_errors=True)
+        logger.info(f"[Workspace] Removed: {self.path}")
+
+
+def sweep_stale_workspaces(max_age_seconds: int, base_dir: Optional[str] = None) -> int:
+    """
+    오래된 작업 디렉토리 정리 (강제 종료된 작업의 잔여물)
+
+    Args:
+        max_age_seconds: 이 시간보다 오래 수정되지 않은 디렉토리 삭제
+            (작업 최대 실행 시간보다 길게 설정할 것)
+        base_dir: 루트 디렉토리 (None이면 {tmp}/qt_jobs)
+
+    Returns:
+        삭제한 디렉토리 수
+    """
+    root = _workspace_root(base_dir)
+    if not root.exists():
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for entry in root.iterdir():
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        except FileNotFoundError:
+            continue
+
+    if removed:
+        logger.info(f"[Workspace] Swept {removed} stale workspaces from {root}")
+    return removed
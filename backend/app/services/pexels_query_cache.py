@@ -0,0 +1,181 @@
+"""
+Pexels 검색 쿼리 정규화 + 응답 캐시
+
+Pexels 시간당 요청 한도가 전체 처리량의 상한이므로,
+같은 쿼리/페이지는 워커 간에 한 번만 요청한다.
+
+- canonicalize_query: 대소문자/공백/중복 단어 정리 (같은 의미 = 같은 키)
+- pick_keyword: 쿼리+톤 기반 결정적 키워드 선택 (random.choice 대체 → 같은 자막 = 같은 쿼리)
+- PexelsResponseCache: (query, page, orientation, per_page) 단위 응답 캐시
+  - Redis 공유 (TTL + 최대 항목 수 제한, 오래된 항목부터 제거)
+  - Redis 없이 생성하면 프로세스 내부 LRU (테스트/로컬)
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+# 캐시에 보관할 필드 (응답 전체 대비 크기 축소)
+_VIDEO_FIELDS = ("id", "url", "image", "duration", "width", "height")
+_VIDEO_FILE_FIELDS = ("quality", "width", "height", "link")
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    검색 쿼리 정규화
+
+    소문자화, 구두점/연속 공백 정리, 중복 단어 제거 (첫 등장 순서 유지).
+    Pexels는 단어 순서에 따라 결과가 달라지므로 정렬은 하지 않는다.
+    """
+    words = re.sub(r"[,;:.!?\"']+", " ", query.lower()).split()
+    seen = set()
+    unique = []
+    for word in words:
+        if word not in seen:
+            seen.add(word)
+            unique.append(word)
+    return " ".join(unique)
+
+
+def pick_keyword(options: Sequence[str], *seed_parts: str) -> str:
+    """
+    시드(쿼리, 톤 등) 기반 결정적 키워드 선택
+
+    같은 시드면 워커/재시도와 무관하게 항상 같은 키워드를 고른다.
+    """
+    seed = "|".join(seed_parts)
+    digest = hashlib.sha1(seed.encode("utf-8")).digest()
+    return options[int.from_bytes(digest[:4], "big") % len(options)]
+
+
+def slim_response(data: dict) -> dict:
+    """Pexels 검색 응답에서 사용하는 필드만 남김"""
+    videos = []
+    for video in data.get("videos", []):
+        slim = {key: video.get(key) for key in _VIDEO_FIELDS}
+        slim["video_files"] = [
+            {key: vf.get(key) for key in _VIDEO_FILE_FIELDS}
+            for vf in video.get("video_files", [])
+        ]
+        videos.append(slim)
+    return {"videos": videos}
+
+
+class PexelsResponseCache:
+    """
+    Pexels 검색 응답 캐시 (TTL + 크기 제한)
+
+    저장소 오류는 경고만 남기고 캐시 미스로 처리한다 (검색은 계속 진행).
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl_seconds: int = 24 * 60 * 60,
+        max_entries: int = 2000,
+        prefix: str = "qt:pexels"
+    ):
+        """
+        Args:
+            redis_client: Redis 클라이언트 (None이면 프로세스 내부 LRU)
+            ttl_seconds: 응답 보관 시간
+            max_entries: 최대 보관 항목 수 (초과 시 오래된 항목부터 제거)
+            prefix: Redis 키 접두사
+        """
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self._local: OrderedDict = OrderedDict()  # key → (expires_at, data)
+        self._lock = threading.Lock()
+
+    def make_key(self, query: str, page: int, orientation: str, per_page: int) -> str:
+        raw = f"{canonicalize_query(query)}|{page}|{orientation}|{per_page}"
+        return f"{self.prefix}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, query: str, page: int, orientation: str, per_page: int) -> Optional[dict]:
+        key = self.make_key(query, page, orientation, per_page)
+        try:
+            if self.redis is not None:
+                raw = self.redis.get(key)
+                return json.loads(raw) if raw else None
+            return self._local_get(key)
+        except Exception as e:
+            logger.warning(f"[PexelsCache] 조회 실패 (캐시 미스 처리): {e}")
+            return None
+
+    def put(self, query: str, page: int, orientation: str, per_page: int, data: dict) -> None:
+        key = self.make_key(query, page, orientation, per_page)
+        data = slim_response(data)
+        try:
+            if self.redis is not None:
+                self._redis_put(key, data)
+            else:
+                self._local_put(key, data)
+        except Exception as e:
+            logger.warning(f"[PexelsCache] 저장 실패 (무시): {e}")
+
+    def _redis_put(self, key: str, data: dict) -> None:
+        index_key = f"{self.prefix}:index"
+        pipe = self.redis.pipeline()
+        pipe.set(key, json.dumps(data), ex=self.ttl_seconds)
+        pipe.zadd(index_key, {key: time.time()})
+        pipe.zcard(index_key)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            oldest = [member for member, _ in self.redis.zpopmin(index_key, overflow)]
+            if oldest:
+                self.redis.delete(*oldest)
+
+    def _local_get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at < time.time():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return data
+
+    def _local_put(self, key: str, data: dict) -> None:
+        with self._lock:
+            self._local[key] = (time.time() + self.ttl_seconds, data)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+
+# 싱글톤
+_pexels_response_cache: PexelsResponseCache | None = None
+
+
+def get_pexels_response_cache() -> Optional[PexelsResponseCache]:
+    """PexelsResponseCache 싱글톤 (PEXELS_CACHE_ENABLED=False면 None)"""
+    global _pexels_response_cache
+    if _pexels_response_cache is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        if not settings.PEXELS_CACHE_ENABLED:
+            return None
+
+        from app.database import get_redis
+
+        _pexels_response_cache = PexelsResponseCache(
+            redis_client=get_redis(),
+            ttl_seconds=settings.PEXELS_CACHE_TTL_HOURS * 3600,
+            max_entries=settings.PEXELS_CACHE_MAX_ENTRIES
+        )
+        logger.info("[PexelsCache] Initialized (redis)")
+    return _pexels_response_cache
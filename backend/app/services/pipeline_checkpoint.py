@@ -0,0 +1,266 @@
+"""
+영상 생성 파이프라인 체크포인트 (Resumable Stage Pipeline)
+
+process_video_task를 단계(stage)별로 나누고, 각 단계가 끝날 때마다
+결과(JSON)와 산출물 파일 경로를 video_id 기준으로 기록한다.
+Celery 재시도나 워커 크래시 후 다시 실행되면 완료된 단계는 건너뛰고
+첫 번째 미완료 단계부터 재개한다.
+
+저장 위치:
+- 로컬: {tempdir}/qt_pipeline/{video_id}/checkpoint.json + 산출물 파일
+- R2 (미러): checkpoints/{video_id}/checkpoint.json
+  → 다른 워커에서 재시도되어도 STT/LLM/검색 결과는 재사용
+  (로컬 산출물 파일이 필요한 단계는 파일이 없으면 미완료로 간주)
+
+Usage:
+    checkpoint = PipelineCheckpoint(video_id, params={...})
+    if not checkpoint.is_complete("transcribe"):
+        checkpoint.save("transcribe", {...})
+    data = checkpoint.get("transcribe")
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# 파이프라인 단계 (실행 순서)
+PIPELINE_STAGES = (
+    "transcribe",   # Whisper STT
+    "correct",      # 사전 교정 + SRT 생성
+    "cut",          # 자막 기반 컷 생성
+    "describe",     # LLM Visual Description
+    "search",       # Pexels 검색 + 클립 선택
+    "compose",      # FFmpeg 합성 (+ Edit Pack)
+    "upload",       # R2 업로드
+    "persist",      # Supabase 메타데이터 저장
+)
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+class PipelineCheckpoint:
+    """video_id 단위 단계별 체크포인트 저장소"""
+
+    def __init__(
+        self,
+        video_id: str,
+        params: dict | None = None,
+        base_dir: str | None = None,
+        storage=None
+    ):
+        """
+        Args:
+            video_id: 영상 UUID (체크포인트 키)
+            params: 파이프라인 입력 파라미터 (바뀌면 기존 체크포인트 무효화)
+            base_dir: 로컬 체크포인트 루트 (기본: {tempdir}/qt_pipeline)
+            storage: R2Storage (None이면 로컬에만 저장)
+        """
+        self.video_id = video_id
+        self.storage = storage
+        root = Path(base_dir or os.path.join(tempfile.gettempdir(), "qt_pipeline"))
+        self.work_dir = root / video_id
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.work_dir / CHECKPOINT_FILE
+        self.remote_key = f"checkpoints/{video_id}/{CHECKPOINT_FILE}"
+        self.params_hash = self._hash_params(params or {})
+
+        self._manifest = self._load()
+
+    # ===================
+    # 조회
+    # ===================
+
+    def is_complete(self, stage: str) -> bool:
+        """단계 완료 여부 (기록된 산출물 파일이 모두 존재해야 완료)"""
+        record = self._manifest["stages"].get(stage)
+        if not record:
+            return False
+
+        for artifact in record.get("artifacts", []):
+            if not os.path.exists(artifact):
+                logger.info(f"[Checkpoint] {stage}: 산출물 없음 → 재실행 ({artifact})")
+                return False
+        return True
+
+    def get(self, stage: str) -> dict | None:
+        """완료된 단계의 결과 데이터"""
+        record = self._manifest["stages"].get(stage)
+        return record["data"] if record else None
+
+    def first_incomplete_stage(self) -> str | None:
+        """첫 번째 미완료 단계 (모두 완료면 None)"""
+        for stage in PIPELINE_STAGES:
+            if not self.is_complete(stage):
+                return stage
+        return None
+
+    def artifact_path(self, name: str) -> str:
+        """체크포인트 디렉토리 내 산출물 경로"""
+        return str(self.work_dir / name)
+
+    # ===================
+    # 기록
+    # ===================
+
+    def save(self, stage: str, data: dict, artifacts: list[str] | None = None) -> None:
+        """
+        단계 완료 기록
+
+        Args:
+            stage: 단계 이름 (PIPELINE_STAGES)
+            data: JSON 직렬화 가능한 결과
+            artifacts: 재개 시 존재해야 하는 로컬 산출물 경로
+        """
+        if stage not in PIPELINE_STAGES:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+
+        self._manifest["stages"][stage] = {
+            "data": data,
+            "artifacts": [str(a) for a in (artifacts or [])],
+            "completed_at": datetime.utcnow().isoformat()
+        }
+        self._write()
+        logger.info(f"[Checkpoint] {self.video_id} - {stage} 완료 기록")
+
+    def clear(self) -> None:
+        """체크포인트 및 산출물 전체 삭제 (성공 또는 최종 실패 시)"""
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        self._manifest = self._empty_manifest()
+
+        if self.storage:
+            try:
+                self.storage.delete_file(self.remote_key)
+            except Exception as e:
+                logger.warning(f"[Checkpoint] R2 체크포인트 삭제 실패: {e}")
+
+    # ===================
+    # 내부
+    # ===================
+
+    def _empty_manifest(self) -> dict:
+        return {"video_id": self.video_id, "params_hash": self.params_hash, "stages": {}}
+
+    def _load(self) -> dict:
+        """로컬 → R2 순서로 체크포인트 로드 (파라미터가 다르면 폐기)"""
+        manifest = None
+
+        if self.manifest_path.exists():
+            try:
+                manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.warning(f"[Checkpoint] 로컬 체크포인트 손상 (무시): {e}")
+
+        if manifest is None and self.storage:
+            content = self.storage.download_text(self.remote_key)
+            if content:
+                try:
+                    manifest = json.loads(content)
+                    logger.info(f"[Checkpoint] R2 체크포인트 로드: {self.video_id}")
+                except Exception as e:
+                    logger.warning(f"[Checkpoint] R2 체크포인트 손상 (무시): {e}")
+
+        if manifest is None:
+            return self._empty_manifest()
+
+        if manifest.get("params_hash") != self.params_hash:
+            logger.info(f"[Checkpoint] 입력 파라미터 변경 → 처음부터 실행: {self.video_id}")
+            return self._empty_manifest()
+
+        completed = list(manifest.get("stages", {}).keys())
+        if completed:
+            logger.info(f"[Checkpoint] {self.video_id} 재개 - 완료된 단계: {completed}")
+        return manifest
+
+    def _write(self) -> None:
+        """원자적 로컬 저장 + R2 미러"""
+        content = json.dumps(self._manifest, ensure_ascii=False, default=str)
+
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+        if self.storage:
+            try:
+                self.storage.upload_text(content, self.remote_key, content_type="application/json")
+            except Exception as e:
+                logger.warning(f"[Checkpoint] R2 미러 저장 실패 (로컬만 유지): {e}")
+
+    @staticmethod
+    def _hash_params(params: dict) -> str:
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+# ===================
+# 직렬화 헬퍼
+# ===================
+
+def serialize_transcription(transcription: Any) -> dict:
+    """Whisper verbose_json 응답 → dict"""
+    def _to_plain(items):
+        plain = []
+        for item in items or []:
+            if isinstance(item, dict):
+                plain.append(dict(item))
+            elif hasattr(item, "model_dump"):
+                plain.append(item.model_dump())
+            else:
+                plain.append(dict(vars(item)))
+        return plain
+
+    return {
+        "text": getattr(transcription, "text", "") or "",
+        "words": _to_plain(getattr(transcription, "words", None)),
+        "segments": _to_plain(getattr(transcription, "segments", None)),
+    }
+
+
+def deserialize_transcription(data: dict) -> SimpleNamespace:
+    """dict → transcription 호환 객체 (text/words/segments 속성)"""
+    return SimpleNamespace(
+        text=data.get("text", ""),
+        words=[dict(w) for w in data.get("words", [])],
+        segments=[dict(s) for s in data.get("segments", [])],
+    )
+
+
+def serialize_cut(cut) -> dict:
+    """SubtitleCut → dict"""
+    return {
+        "index": cut.index,
+        "start_time": cut.start_time,
+        "end_time": cut.end_time,
+        "subtitle_indices": list(cut.subtitle_indices),
+        "subtitle_texts": list(cut.subtitle_texts),
+    }
+
+
+def deserialize_cut(data: dict):
+    """dict → SubtitleCut"""
+    from app.services.subtitle_driven_cut_generator import SubtitleCut
+    return SubtitleCut(**data)
+
+
+def serialize_video(video) -> dict:
+    """PexelsVideo → dict"""
+    return asdict(video)
+
+
+def deserialize_video(data: dict):
+    """dict → PexelsVideo (vision_score 포함)"""
+    from app.services.background_video_search import PexelsVideo, VisionScore
+
+    data = dict(data)
+    if data.get("vision_score"):
+        data["vision_score"] = VisionScore(**data["vision_score"])
+    return PexelsVideo(**data)
@@ -0,0 +1,191 @@
+"""
+재생성용 합성 중간 산출물 캐시 (Render Artifact Cache)
+
+regenerate_video_task는 자막/BGM만 바뀌어도 클립을 모두 다시 받아 처음부터 합성했다.
+합성 중간 산출물을 입력 내용 해시로 키를 매겨 R2에 보관하고,
+재생성 시 입력이 바뀐 단계만 다시 계산한다.
+
+산출물 종류 (입력 → 키):
+- base: 클립 목록 + 길이 → 색보정/자막/오디오 없는 베이스 영상
+- subtitled: base 키 + SRT 내용 + 자막 스타일 → 색보정 + 자막 합성 영상 (오디오 없음)
+- audio_mix: 음성 + BGM + 볼륨 + 길이 → 믹싱된 오디오
+- intro / outro: 썸네일 레이아웃 (또는 Canvas 이미지) → 인트로/아웃트로 이미지
+- final: 현재 최종 영상 (videos/ 에 업로드된 파일을 등록만 함) + 자막 부분 합성용 타임라인 정보
+
+저장 위치 (R2):
+    artifacts/{video_id}/manifest.json
+    artifacts/{video_id}/{kind}-{key 앞 16자}{ext}
+
+manifest.json:
+    {"version": 1, "artifacts": {"base": {"key": "...", "url": "...", "created_at": "..."}, ...}}
+
+Usage:
+    artifacts = RenderArtifactCache(video_id, storage=get_r2_storage())
+    key = artifact_key("base", clips=[...], duration=120)
+    base_path = artifacts.fetch("base", key, "/tmp/base.mp4")
+    if base_path is None:
+        base_path = render_base(...)
+        artifacts.store("base", key, base_path)
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+ARTIFACT_KINDS = ("base", "subtitled", "audio_mix", "intro", "outro", "final")
+
+# 합성 방식이 바뀌면 올려서 기존 산출물 전체 무효화
+ARTIFACT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def artifact_key(kind: str, **inputs: Any) -> str:
+    """
+    산출물 키 (입력 내용 해시)
+
+    inputs는 JSON 직렬화 가능한 값 (파일은 hash_file 결과를 넘길 것).
+    """
+    if kind not in ARTIFACT_KINDS:
+        raise ValueError(f"Unknown artifact kind: {kind}")
+    payload = json.dumps(
+        {"kind": kind, "version": ARTIFACT_VERSION, "inputs": inputs},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderArtifactCache:
+    """video_id 단위 합성 산출물 캐시 (R2 + manifest)"""
+
+    def __init__(self, video_id: str, storage):
+        """
+        Args:
+            video_id: 영상 UUID
+            storage: R2Storage (upload_file/download_file/download_text/upload_text/delete_file)
+        """
+        self.video_id = video_id
+        self.storage = storage
+        self.prefix = f"artifacts/{video_id}"
+        self.manifest_key = f"{self.prefix}/{MANIFEST_FILE}"
+        self._manifest = self._load()
+
+    def _load(self) -> dict:
+        raw = self.storage.download_text(self.manifest_key)
+        if raw:
+            try:
+                manifest = json.loads(raw)
+                if manifest.get("version") == ARTIFACT_VERSION:
+                    return manifest
+                logger.info(f"[Artifacts] {self.video_id}: manifest 버전 변경 → 초기화")
+            except json.JSONDecodeError:
+                logger.warning(f"[Artifacts] {self.video_id}: manifest 손상 → 초기화")
+        return {"version": ARTIFACT_VERSION, "artifacts": {}}
+
+    def _write(self) -> None:
+        self.storage.upload_text(
+            json.dumps(self._manifest, ensure_ascii=False, indent=2),
+            self.manifest_key,
+            content_type="application/json"
+        )
+
+    def is_empty(self) -> bool:
+        return not self._manifest["artifacts"]
+
+    def record(self, kind: str) -> Optional[dict]:
+        """현재 등록된 산출물 레코드 (키와 무관, 없으면 None)"""
+        return self._manifest["artifacts"].get(kind)
+
+    def lookup(self, kind: str, key: str) -> Optional[str]:
+        """키가 일치하는 산출물 URL (없거나 입력이 바뀌었으면 None)"""
+        record = self._manifest["artifacts"].get(kind)
+        if record and record.get("key") == key:
+            return record["url"]
+        return None
+
+    def fetch(self, kind: str, key: str, dest: str) -> Optional[str]:
+        """
+        산출물을 dest로 다운로드
+
+        Returns:
+            dest (캐시 히트) 또는 None (미스/다운로드 실패 → 다시 계산)
+        """
+        url = self.lookup(kind, key)
+        if url is None:
+            logger.info(f"[Artifacts] {kind} MISS")
+            return None
+
+        if not self.storage.download_file(url, dest):
+            logger.warning(f"[Artifacts] {kind} 다운로드 실패 → 다시 계산")
+            return None
+
+        logger.info(f"[Artifacts] {kind} HIT ({key[:12]})")
+        return dest
+
+    def store(self, kind: str, key: str, path: str, content_type: Optional[str] = None) -> Optional[str]:
+        """
+        산출물 업로드 + manifest 갱신 (같은 종류의 이전 산출물은 삭제)
+
+        업로드 실패는 경고만 남긴다 (다음 재생성에서 다시 계산).
+
+        Returns:
+            R2 URL 또는 None (실패)
+        """
+        ext = os.path.splitext(path)[1]
+        try:
+            url = self.storage.upload_file(
+                path,
+                content_type=content_type,
+                key=f"{self.prefix}/{kind}-{key[:16]}{ext}"
+            )
+            self._record(kind, key, url)
+            return url
+        except Exception as e:
+            logger.warning(f"[Artifacts] {kind} 저장 실패 (무시): {e}")
+            return None
+
+    def adopt(self, kind: str, key: str, url: str, **meta: Any) -> None:
+        """
+        이미 업로드된 파일을 산출물로 등록 (예: 최초 생성 시의 base_video_path, 최종 영상)
+
+        meta는 레코드에 함께 저장된다 (JSON 직렬화 가능한 값).
+        """
+        self._record(kind, key, url, delete_previous=False, meta=meta)
+
+    def _record(
+        self,
+        kind: str,
+        key: str,
+        url: str,
+        delete_previous: bool = True,
+        meta: Optional[dict] = None
+    ) -> None:
+        previous = self._manifest["artifacts"].get(kind)
+        if delete_previous and previous and previous["url"] != url and self.prefix in previous["url"]:
+            # 이 캐시가 올린 파일만 삭제 (adopt한 원본 base_video_path 등은 유지)
+            self.storage.delete_file(previous["url"])
+
+        self._manifest["artifacts"][kind] = {
+            "key": key,
+            "url": url,
+            "created_at": datetime.utcnow().isoformat(),
+            **(meta or {})
+        }
+        self._write()
+        logger.info(f"[Artifacts] {kind} 저장 ({key[:12]})")
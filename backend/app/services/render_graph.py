@@ -0,0 +1,269 @@
+"""
+단일 패스 렌더 그래프 (Single-pass Render Graph)
+
+기존 합성은 같은 영상을 libx264로 4~5번 재인코딩했다
+(구간 처리 → concat/crossfade → 자막 → 인트로 → 아웃트로).
+이 모듈은 클립 trim/loop, 색보정(eq), crossfade, 자막 overlay,
+인트로/아웃트로 xfade, 음성+BGM 믹싱을 하나의 filter_complex로 구성해
+FFmpeg 한 번 실행으로 최종 영상을 인코딩한다.
+
+그래프 구조:
+    클립 입력들 → 정규화(fps/scale/pad) → concat 또는 xfade → trim(오디오 길이)
+        ├─ (옵션) split → 베이스 영상 출력 (색보정/자막 전, 재생성용)
+        └─ eq → 자막 overlay (ffconcat 트랙 1개) → [인트로 xfade] → [아웃트로 xfade] → 최종 출력
+    음성 (+ BGM loop) → amix → atrim → [adelay] → [afade out]
+
+FFmpeg 실행은 호출자(VideoComposer.render_single_pass)가 담당하고,
+여기서는 명령어만 만든다 (순수 함수 → 단위 테스트 가능).
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from app.services.subtitle_track import overlay_track_input
+
+
+@dataclass
+class RenderClip:
+    """렌더 그래프 입력 클립"""
+    path: str
+    duration: float          # 사용할 길이 (초)
+    start: float = 0.0       # 원본 내 시작 위치 (초)
+    loop: bool = False       # 원본이 duration보다 짧으면 반복
+
+
+@dataclass
+class RenderPlan:
+    """단일 패스 렌더 계획"""
+    clips: List[RenderClip]
+    voice_path: str
+    duration: float                          # 본 영상 길이 (= 오디오 길이)
+    output_path: str
+    bgm_path: Optional[str] = None
+    bgm_volume: float = 0.12
+    subtitle_track: Optional[str] = None     # 자막 오버레이 트랙 (ffconcat, 본 영상 기준)
+    subtitle_position: Tuple[int, int] = (0, 0)  # 트랙 프레임 배치 좌표 (크롭된 자막 영역)
+    intro_image: Optional[str] = None
+    intro_duration: float = 2.0
+    outro_image: Optional[str] = None
+    outro_duration: float = 3.0
+    fade_duration: float = 1.0
+    crossfade_duration: float = 0.0          # 0이면 hard cut (concat)
+    color_filter: str = ""                   # eq=... (빈 문자열이면 생략)
+    base_output_path: Optional[str] = None   # 베이스 영상 (색보정/자막/오디오 없음)
+    width: int = 1920
+    height: int = 1080
+    fps: int = 30
+    preset: str = "faster"
+    crf: int = 23
+    base_crf: int = 18
+
+
+def fit_clips_to_duration(clips: List[RenderClip], duration: float, crossfade: float = 0.0) -> List[RenderClip]:
+    """
+    클립 길이 합계를 본 영상 길이에 맞춤
+
+    - 부족하면 마지막 클립을 반복(loop)으로 연장
+    - 넘치면 뒤쪽 클립을 잘라냄 (trim은 그래프에서도 한 번 더 적용)
+    """
+    if not clips:
+        raise ValueError("No clips provided")
+
+    fitted = []
+    remaining = duration
+    for idx, clip in enumerate(clips):
+        overlap = crossfade if idx < len(clips) - 1 else 0.0
+        if remaining <= 0:
+            break
+        use = min(clip.duration, remaining + overlap)
+        fitted.append(RenderClip(clip.path, use, clip.start, clip.loop))
+        remaining -= use - overlap
+
+    if remaining > 0:
+        last = fitted[-1]
+        fitted[-1] = RenderClip(last.path, last.duration + remaining, last.start, loop=True)
+
+    return fitted
+
+
+def _normalize_filter(plan: RenderPlan) -> str:
+    return (
+        f"fps={plan.fps},"
+        f"scale={plan.width}:{plan.height}:force_original_aspect_ratio=decrease,"
+        f"pad={plan.width}:{plan.height}:(ow-iw)/2:(oh-ih)/2,"
+        f"format=yuv420p,setsar=1"
+    )
+
+
+def _join_clips(plan: RenderPlan, inputs: List[str], filters: List[str]) -> int:
+    """
+    클립 입력 → 정규화 → concat/xfade → 본 영상 길이 trim ([base] 라벨)
+
+    Returns:
+        다음 입력 인덱스
+    """
+    clips = fit_clips_to_duration(plan.clips, plan.duration, plan.crossfade_duration)
+    input_idx = 0
+
+    # 1. 클립 입력 (입력 단계에서 -ss/-t로 필요한 구간만 읽음)
+    clip_labels = []
+    for clip in clips:
+        if clip.loop:
+            inputs += ["-stream_loop", "-1"]
+        if clip.start > 0:
+            inputs += ["-ss", f"{clip.start:.3f}"]
+        inputs += ["-t", f"{clip.duration:.3f}", "-i", clip.path]
+
+        label = f"c{input_idx}"
+        filters.append(f"[{input_idx}:v]{_normalize_filter(plan)},setpts=PTS-STARTPTS[{label}]")
+        clip_labels.append((label, clip.duration))
+        input_idx += 1
+
+    # 2. 클립 연결 (crossfade 또는 concat) + 본 영상 길이로 trim
+    if len(clip_labels) == 1:
+        joined = clip_labels[0][0]
+    elif plan.crossfade_duration > 0:
+        joined, offset = clip_labels[0][0], clip_labels[0][1]
+        for n, (label, duration) in enumerate(clip_labels[1:], start=1):
+            offset -= plan.crossfade_duration
+            out = f"x{n}"
+            filters.append(
+                f"[{joined}][{label}]xfade=transition=fade:"
+                f"duration={plan.crossfade_duration}:offset={offset:.3f}[{out}]"
+            )
+            joined = out
+            offset += duration
+    else:
+        filters.append(
+            "".join(f"[{label}]" for label, _ in clip_labels)
+            + f"concat=n={len(clip_labels)}:v=1:a=0[joined]"
+        )
+        joined = "joined"
+
+    filters.append(f"[{joined}]trim=duration={plan.duration:.3f},setpts=PTS-STARTPTS[base]")
+    return input_idx
+
+
+def build_base_command(plan: RenderPlan) -> List[str]:
+    """
+    RenderPlan → 베이스 영상만 인코딩하는 FFmpeg 명령어 (색보정/자막/오디오 없음)
+
+    plan.output_path에 base_crf로 저장한다 (재생성 시 클립 다운로드 없이 재사용).
+    """
+    inputs: List[str] = []
+    filters: List[str] = []
+    _join_clips(plan, inputs, filters)
+
+    return ["ffmpeg", "-y"] + inputs + [
+        "-filter_complex", ";".join(filters),
+        "-map", "[base]",
+        "-c:v", "libx264",
+        "-preset", plan.preset,
+        "-crf", str(plan.base_crf),
+        "-an",
+        "-movflags", "+faststart",
+        plan.output_path,
+    ]
+
+
+def build_render_command(plan: RenderPlan) -> List[str]:
+    """
+    RenderPlan → FFmpeg 명령어 (한 번의 인코딩)
+
+    Returns:
+        ["ffmpeg", "-y", ...]
+    """
+    inputs: List[str] = []
+    filters: List[str] = []
+    input_idx = _join_clips(plan, inputs, filters)
+    main = "base"
+
+    # 2-1. 베이스 영상 분기 (재생성 시 재사용, 색보정/자막 전)
+    if plan.base_output_path:
+        filters.append("[base]split=2[base_out][base_main]")
+        main = "base_main"
+
+    # 3. 색보정
+    if plan.color_filter:
+        filters.append(f"[{main}]{plan.color_filter}[graded]")
+        main = "graded"
+
+    # 4. 자막 overlay (투명 트랙 하나, 트랙 종료 후에는 마지막 투명 프레임 유지)
+    if plan.subtitle_track:
+        inputs += overlay_track_input(plan.subtitle_track)
+        x, y = plan.subtitle_position
+        filters.append(f"[{main}][{input_idx}:v]overlay={x}:{y}:format=auto:eof_action=repeat[subbed]")
+        main = "subbed"
+        input_idx += 1
+
+    # 5. 음성 + BGM 믹싱 (본 영상 길이)
+    voice_idx = input_idx
+    inputs += ["-i", plan.voice_path]
+    input_idx += 1
+    if plan.bgm_path:
+        inputs += ["-stream_loop", "-1", "-i", plan.bgm_path]
+        filters.append(f"[{voice_idx}:a]volume=1.0[voice]")
+        filters.append(f"[{input_idx}:a]volume={plan.bgm_volume}[bgm]")
+        filters.append(
+            f"[voice][bgm]amix=inputs=2:duration=first:dropout_transition=3,"
+            f"atrim=duration={plan.duration:.3f}[mix]"
+        )
+        input_idx += 1
+    else:
+        filters.append(f"[{voice_idx}:a]atrim=duration={plan.duration:.3f}[mix]")
+    audio = "mix"
+    total = plan.duration
+
+    # 6. 인트로 (썸네일 → 본 영상 xfade, 오디오는 썸네일 길이만큼 지연)
+    if plan.intro_image:
+        inputs += ["-loop", "1", "-t", f"{plan.intro_duration + plan.fade_duration:.3f}", "-i", plan.intro_image]
+        filters.append(f"[{input_idx}:v]{_normalize_filter(plan)}[intro]")
+        filters.append(
+            f"[intro][{main}]xfade=transition=fade:duration={plan.fade_duration}:"
+            f"offset={plan.intro_duration:.3f}[with_intro]"
+        )
+        delay_ms = int(plan.intro_duration * 1000)
+        filters.append(f"[{audio}]adelay={delay_ms}:all=1[a_intro]")
+        main, audio = "with_intro", "a_intro"
+        total += plan.intro_duration
+        input_idx += 1
+
+    # 7. 아웃트로 (마지막 fade 구간에서 xfade, 오디오 fade out)
+    if plan.outro_image:
+        offset = total - plan.fade_duration
+        inputs += ["-loop", "1", "-t", f"{plan.fade_duration + plan.outro_duration:.3f}", "-i", plan.outro_image]
+        filters.append(f"[{input_idx}:v]{_normalize_filter(plan)}[outro]")
+        filters.append(
+            f"[{main}][outro]xfade=transition=fade:duration={plan.fade_duration}:"
+            f"offset={offset:.3f}[with_outro]"
+        )
+        filters.append(f"[{audio}]afade=t=out:st={offset:.3f}:d={plan.fade_duration}[a_outro]")
+        main, audio = "with_outro", "a_outro"
+        input_idx += 1
+
+    cmd = ["ffmpeg", "-y"] + inputs + [
+        "-filter_complex", ";".join(filters),
+        "-map", f"[{main}]",
+        "-map", f"[{audio}]",
+        "-c:v", "libx264",
+        "-preset", plan.preset,
+        "-crf", str(plan.crf),
+        "-c:a", "aac",
+        "-b:a", "192k",
+        "-ac", "2",
+        "-movflags", "+faststart",
+        plan.output_path,
+    ]
+
+    # 베이스 영상: 같은 디코딩 결과를 두 번째 출력으로 인코딩 (별도 FFmpeg 실행 없음)
+    if plan.base_output_path:
+        cmd += [
+            "-map", "[base_out]",
+            "-c:v", "libx264",
+            "-preset", plan.preset,
+            "-crf", str(plan.base_crf),
+            "-an",
+            "-movflags", "+faststart",
+            plan.base_output_path,
+        ]
+
+    return cmd
@@ -0,0 +1,159 @@
+"""
+치환 사전 다중 패턴 매처 (Aho–Corasick)
+
+기존 apply_replacement_dictionary는 호출마다 사전을 정렬하고 항목마다
+`original in text` + `str.replace`를 수행했다 (항목 수 × 텍스트 길이, 적중마다 문자열 복사).
+5천 개 규모의 통합 사전을 자막 줄마다 반복하면 교정 단계가 사전 크기에 비례해 느려진다.
+
+사전을 한 번 오토마톤으로 컴파일해 두고, 텍스트를 한 번만 훑어 모든 후보 위치를 찾는다.
+
+겹치는 후보 선택 규칙 (기존 정렬 순서와 동일):
+    1. 우선순위(use_count/priority/frequency) 높은 항목
+    2. 같으면 긴 패턴
+    3. 같으면 앞쪽 위치
+이미 선택된 구간과 겹치는 후보는 버린다.
+
+기존 방식과 달리 치환 결과를 같은 사전으로 다시 치환하지 않는다 (연쇄 치환 없음).
+통합 사전 → 교회 사전처럼 사전 단위로 나눠 적용하는 것은 그대로 가능하다.
+
+Usage:
+    matcher = ReplacementMatcher.from_entries(entries)
+    text, applied = matcher.replace("요한 복음 3장")
+    texts, applied = matcher.replace_many(["...", "..."])
+"""
+from collections import deque
+from typing import Iterable, List, Sequence, Tuple
+
+
+class ReplacementMatcher:
+    """컴파일된 치환 사전 (불변, 스레드 안전)"""
+
+    def __init__(self, rules: Iterable[Tuple[str, str, float]]):
+        """
+        Args:
+            rules: (원본, 치환, 우선순위) 목록 - 같은 원본이 여러 번이면 우선순위 높은 것 사용
+        """
+        best = {}
+        for original, replacement, priority in rules:
+            if not original:
+                continue
+            current = best.get(original)
+            if current is None or priority > current[1]:
+                best[original] = (replacement, priority)
+
+        # 패턴 순위: 정렬 순서 = 선택 순서 (우선순위 → 길이)
+        ordered = sorted(best.items(), key=lambda item: (-item[1][1], -len(item[0])))
+        self.patterns: List[str] = [original for original, _ in ordered]
+        self.replacements: List[str] = [replacement for _, (replacement, _) in ordered]
+
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._build()
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[dict],
+        source_key: str = "original",
+        target_key: str = "replacement",
+        priority_key: str = "use_count"
+    ) -> "ReplacementMatcher":
+        """사전 행(dict) 목록 → 매처"""
+        return cls(
+            (e.get(source_key) or "", e.get(target_key) or "", e.get(priority_key) or 0)
+            for e in entries
+        )
+
+    def _build(self) -> None:
+        goto, fail, out = self._goto, self._fail, self._out
+        for pattern_id, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                nxt = goto[node].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][char] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append([])
+                node = nxt
+            out[node].append(pattern_id)
+
+        # BFS로 실패 링크 계산, 출력은 실패 링크 쪽 것을 이어붙여 한 번에 조회
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                link = fail[node]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                target = goto[link].get(char, 0)
+                fail[child] = target if target != child else 0
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        겹치지 않는 치환 위치
+
+        Returns:
+            [(시작, 끝, 패턴 id)] (시작 위치 순)
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        candidates = []
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern_id in out[node]:
+                candidates.append((pattern_id, end - len(patterns[pattern_id]), end))
+
+        if not candidates:
+            return []
+
+        # 패턴 id = 순위 → (순위, 위치) 순으로 겹치지 않게 선택
+        candidates.sort()
+        taken = bytearray(len(text))
+        selected = []
+        for pattern_id, start, end in candidates:
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            selected.append((start, end, pattern_id))
+        selected.sort()
+        return selected
+
+    def replace(self, text: str) -> Tuple[str, List[int]]:
+        """
+        한 번 훑어서 치환
+
+        Returns:
+            (치환된 텍스트, 적용된 패턴 id 목록 - 순위 순, 중복 없음)
+        """
+        matches = self.find(text) if text and self.patterns else []
+        if not matches:
+            return text, []
+
+        pieces = []
+        cursor = 0
+        for start, end, pattern_id in matches:
+            pieces.append(text[cursor:start])
+            pieces.append(self.replacements[pattern_id])
+            cursor = end
+        pieces.append(text[cursor:])
+        return "".join(pieces), sorted({pattern_id for _, _, pattern_id in matches})
+
+    def replace_many(self, texts: Sequence[str]) -> Tuple[List[str], List[List[int]]]:
+        """여러 줄 치환 (자막 목록 - 같은 오토마톤 재사용)"""
+        replaced, applied = [], []
+        for text in texts:
+            new_text, pattern_ids = self.replace(text)
+            replaced.append(new_text)
+            applied.append(pattern_ids)
+        return replaced, applied
@@ -0,0 +1,120 @@
+"""
+STT 입력 음성 정규화 (16kHz 모노 Opus)
+
+업로드 오디오는 휴대폰 녹음 그대로(320kbps 스테레오 MP3, 무압축 WAV 등) 들어와
+Groq에 원본 바이트가 전부 전송된다. Whisper는 내부적으로 16kHz 모노만 쓰므로
+작업당 한 번 16kHz 모노 Opus(32kbps)로 변환해 인식/길이 측정에 사용한다
+(40분 녹음 기준 수십 MB → 약 10MB).
+
+- 선택: 라우드니스 정규화 (작게 녹음된 파일 인식률 개선)
+- 선택: 끝부분 무음 제거 (앞부분은 자르지 않음 → 자막 타임스탬프가 원본과 그대로 일치)
+- 변환 실패 또는 결과가 원본보다 크면 원본 사용
+
+영상 합성(믹스)에는 원본 오디오를 그대로 쓴다.
+
+Usage:
+    speech_path = normalize_speech_audio("/tmp/job/audio.m4a", "/tmp/job/speech.ogg")
+    preprocess = speech_audio_settings()  # 인식 결과 캐시 키 (원본 해시와 함께)
+"""
+import logging
+import os
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+
+SPEECH_SAMPLE_RATE = 16000
+
+
+def speech_filter_chain(loudnorm: bool = False, trim_trailing_silence: bool = False) -> str:
+    """
+    정규화 오디오 필터 체인
+
+    Args:
+        loudnorm: EBU R128 라우드니스 정규화 (-16 LUFS)
+        trim_trailing_silence: 끝부분 무음 제거 (뒤집어서 앞쪽 무음 제거 후 다시 뒤집기)
+    """
+    filters = [f"aformat=sample_fmts=fltp:sample_rates={SPEECH_SAMPLE_RATE}:channel_layouts=mono"]
+    if loudnorm:
+        # loudnorm은 내부적으로 192kHz로 출력하므로 다시 16kHz로
+        filters += ["loudnorm=I=-16:TP=-1.5:LRA=11", f"aresample={SPEECH_SAMPLE_RATE}"]
+    if trim_trailing_silence:
+        filters += [
+            "areverse",
+            "silenceremove=start_periods=1:start_duration=0.5:start_threshold=-50dB",
+            "areverse",
+        ]
+    return ",".join(filters)
+
+
+def speech_audio_settings(
+    bitrate: str = "32k",
+    loudnorm: bool = False,
+    trim_trailing_silence: bool = False
+) -> dict:
+    """
+    정규화 설정 (인식 결과 캐시 키용 - 원본 해시 + 이 설정 = STT 입력)
+
+    설정이 바뀌면 STT 입력이 달라지므로 이전 인식 결과를 쓰지 않는다.
+    """
+    return {
+        "codec": "libopus",
+        "sample_rate": SPEECH_SAMPLE_RATE,
+        "bitrate": bitrate,
+        "filters": speech_filter_chain(loudnorm, trim_trailing_silence),
+    }
+
+
+def normalize_speech_audio(
+    source_path: str,
+    output_path: str,
+    bitrate: str = "32k",
+    loudnorm: bool = False,
+    trim_trailing_silence: bool = False
+) -> str:
+    """
+    원본 오디오 → STT용 16kHz 모노 Opus
+
+    Args:
+        source_path: 원본 오디오
+        output_path: 출력 경로 (.ogg)
+        bitrate: Opus 비트레이트
+        loudnorm: 라우드니스 정규화
+        trim_trailing_silence: 끝부분 무음 제거
+
+    Returns:
+        사용할 오디오 경로 (output_path, 실패/이득 없음이면 source_path)
+    """
+    partial = f"{output_path}.part.ogg"
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-i", source_path,
+        "-vn",
+        "-af", speech_filter_chain(loudnorm, trim_trailing_silence),
+        "-ac", "1", "-ar", str(SPEECH_SAMPLE_RATE),
+        "-c:a", "libopus", "-b:a", bitrate, "-application", "voip",
+        # Ogg 스트림 시리얼/인코더 태그 고정 → 같은 원본이면 항상 같은 바이트 (인식 캐시/산출물 해시 안정)
+        "-fflags", "+bitexact", "-flags:a", "+bitexact",
+        partial
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0 or not os.path.exists(partial):
+            logger.warning(f"[SpeechAudio] 변환 실패 → 원본 사용: {result.stderr[-300:]}")
+            return source_path
+
+        source_size = os.path.getsize(source_path)
+        output_size = os.path.getsize(partial)
+        if output_size >= source_size:
+            logger.info("[SpeechAudio] 원본이 더 작음 → 원본 사용")
+            return source_path
+
+        os.replace(partial, output_path)
+        logger.info(
+            f"[SpeechAudio] {source_size / 1024 / 1024:.1f}MB → {output_size / 1024 / 1024:.1f}MB "
+            f"({output_path})"
+        )
+        return output_path
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
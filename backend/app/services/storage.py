@@ -1,14 +1,35 @@
 """
 Cloudflare R2 스토리지 서비스
+
+큰 파일(R2_MULTIPART_THRESHOLD_MB 이상)은 멀티파트 업로드:
+파트(R2_MULTIPART_PART_MB)를 R2_UPLOAD_CONCURRENCY개 스레드로 동시 전송하고,
+파트마다 Content-MD5로 무결성을 검증받으며 실패한 파트만 재시도한다.
+
+다운로드(download_bytes/download_text/download_file)는 워커 로컬 자산 캐시를 거친다
+(ETag 조건부 요청으로 매번 재검증 → 바뀌지 않았으면 본문 전송 없음).
+
+콘텐츠 주소 업로드(content_addressed=True)는 키를 파일 내용 SHA-256으로 정해
+같은 내용이 이미 있으면 업로드를 건너뛴다 (로컬 인덱스 → HEAD 순으로 확인).
 """
+import base64
+import hashlib
 import logging
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import uuid4
 
 import boto3
 from botocore.client import Config
+from botocore.exceptions import ClientError
 
 from app.config import get_settings
+from app.services.asset_cache import get_asset_cache
+from app.services.clip_cache import link_or_copy
+from app.services.digest_index import DigestIndex
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -25,17 +46,25 @@ class R2Storage:
             aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
             config=Config(
                 signature_version="s3v4",
-                s3={"addressing_style": "path"}
+                s3={"addressing_style": "path"},
+                # 멀티파트 파트 동시 전송 + 여러 파일 동시 업로드
+                max_pool_connections=max(10, settings.R2_UPLOAD_CONCURRENCY * 4)
             ),
             region_name="auto"  # R2는 region 불필요
         )
         self.bucket = settings.R2_BUCKET_NAME
+        self.digest_index = DigestIndex(
+            settings.R2_DEDUPE_INDEX_PATH or os.path.join(tempfile.gettempdir(), "qt_r2_digests.txt"),
+            max_entries=settings.R2_DEDUPE_INDEX_MAX
+        )
 
     def upload_file(
         self,
         file_path: str,
         folder: str = "videos",
-        content_type: str | None = None
+        content_type: str | None = None,
+        key: str | None = None,
+        content_addressed: bool = False
     ) -> str:
         """
         파일 업로드
@@ -44,13 +73,21 @@ class R2Storage:
             file_path: 로컬 파일 경로
             folder: R2 폴더 (videos, audio, srt)
             content_type: MIME 타입
+            key: R2 객체 키 (지정 시 folder 무시, 같은 키면 덮어씀)
+            content_addressed: True면 키 = {folder}/sha256/{내용 해시}{확장자},
+                같은 내용이 이미 있으면 업로드 생략 (삭제하지 않는 파일에만 사용)
 
         Returns:
             R2 URL
         """
         try:
-            file_name = Path(file_path).name
-            key = f"{folder}/{uuid4()}_{file_name}"
+            if key is None and content_addressed:
+                key = f"{folder}/sha256/{self._file_digest(file_path)}{Path(file_path).suffix.lower()}"
+                if self._content_exists(key):
+                    logger.info(f"R2 dedupe hit (upload skipped): {key}")
+                    return self._object_url(key)
+            elif key is None:
+                key = f"{folder}/{uuid4()}_{Path(file_path).name}"
 
             # Content-Type 자동 감지
             if content_type is None:
@@ -58,21 +95,21 @@ class R2Storage:
 
             logger.info(f"Uploading to R2: {key}")
 
-            with open(file_path, "rb") as f:
-                self.client.put_object(
-                    Bucket=self.bucket,
-                    Key=key,
-                    Body=f,
-                    ContentType=content_type
-                )
-
-            # Public URL 반환
-            # R2_PUBLIC_URL이 설정되면 Public URL 사용, 아니면 Presigned URL 생성
-            if settings.R2_PUBLIC_URL:
-                url = f"{settings.R2_PUBLIC_URL}/{key}"
+            if os.path.getsize(file_path) >= settings.R2_MULTIPART_THRESHOLD_MB * 1024 * 1024:
+                self._upload_multipart(file_path, key, content_type)
             else:
-                # Presigned URL 사용 (7일 유효 - R2 최대)
-                url = self.generate_presigned_url(key, expires_in=604800)
+                with open(file_path, "rb") as f:
+                    self.client.put_object(
+                        Bucket=self.bucket,
+                        Key=key,
+                        Body=f,
+                        ContentType=content_type
+                    )
+
+            if content_addressed:
+                self.digest_index.add(key)
+
+            url = self._object_url(key)
             logger.info(f"Upload complete: {url}")
 
             return url
@@ -81,6 +118,95 @@ class R2Storage:
             logger.exception(f"R2 upload failed: {e}")
             raise
 
+    def _upload_multipart(self, file_path: str, key: str, content_type: str) -> None:
+        """
+        멀티파트 업로드 (파트 동시 전송, 파트별 MD5 검증 + 재시도)
+
+        실패하면 업로드를 abort해 R2에 미완성 파트가 남지 않게 한다.
+        """
+        size = os.path.getsize(file_path)
+        part_size = max(settings.R2_MULTIPART_PART_MB, 5) * 1024 * 1024  # S3 최소 파트 5MB
+        part_count = math.ceil(size / part_size)
+
+        upload_id = self.client.create_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            ContentType=content_type
+        )["UploadId"]
+
+        def upload_part(number: int) -> dict:
+            with open(file_path, "rb") as f:
+                f.seek((number - 1) * part_size)
+                data = f.read(part_size)
+            checksum = base64.b64encode(hashlib.md5(data).digest()).decode()
+
+            for attempt in range(1, settings.R2_PART_RETRIES + 1):
+                try:
+                    response = self.client.upload_part(
+                        Bucket=self.bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                        PartNumber=number,
+                        Body=data,
+                        ContentMD5=checksum
+                    )
+                    return {"PartNumber": number, "ETag": response["ETag"]}
+                except Exception as e:
+                    if attempt == settings.R2_PART_RETRIES:
+                        raise
+                    logger.warning(f"R2 part {number}/{part_count} 재시도 ({attempt}): {e}")
+                    time.sleep(min(2 ** attempt, 10))
+
+        try:
+            workers = max(1, min(settings.R2_UPLOAD_CONCURRENCY, part_count))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(upload_part, range(1, part_count + 1)))
+
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
+            logger.info(f"Multipart upload: {part_count} parts x {part_size // 1024 // 1024}MB ({workers} threads)")
+
+        except Exception:
+            try:
+                self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            except Exception as e:
+                logger.warning(f"R2 multipart abort failed: {e}")
+            raise
+
+    @staticmethod
+    def _file_digest(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """파일 내용 SHA-256 (청크 단위로 읽어 메모리 사용 일정)"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _content_exists(self, key: str) -> bool:
+        """콘텐츠 주소 키 존재 여부 (로컬 인덱스 → HEAD)"""
+        if self.digest_index.contains(key):
+            return True
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+        except Exception:
+            return False
+        self.digest_index.add(key)
+        return True
+
+    def _object_url(self, key: str) -> str:
+        """
+        업로드된 객체 URL
+
+        R2_PUBLIC_URL이 설정되면 Public URL 사용, 아니면 Presigned URL 생성 (7일 유효 - R2 최대)
+        """
+        if settings.R2_PUBLIC_URL:
+            return f"{settings.R2_PUBLIC_URL}/{key}"
+        return self.generate_presigned_url(key, expires_in=604800)
+
     def generate_presigned_url(
         self,
         key: str,
@@ -145,9 +271,11 @@ class R2Storage:
             raise
 
     def delete_file(self, key: str) -> None:
-        """파일 삭제"""
+        """파일 삭제 (객체 키 또는 R2 URL)"""
         try:
+            key = self._extract_key_from_url(key)
             self.client.delete_object(Bucket=self.bucket, Key=key)
+            self.digest_index.discard(key)
             logger.info(f"Deleted from R2: {key}")
 
         except Exception as e:
@@ -180,12 +308,7 @@ class R2Storage:
                 ContentType=content_type
             )
 
-            # Public URL 반환
-            if settings.R2_PUBLIC_URL:
-                url = f"{settings.R2_PUBLIC_URL}/{key}"
-            else:
-                url = self.generate_presigned_url(key, expires_in=604800)
-
+            url = self._object_url(key)
             logger.info(f"Bytes upload complete: {url}")
             return url
 
@@ -225,10 +348,7 @@ class R2Storage:
         try:
             # URL에서 키 추출
             key = self._extract_key_from_url(url_or_key)
-
-            response = self.client.get_object(Bucket=self.bucket, Key=key)
-            content = response["Body"].read().decode("utf-8")
-            return content
+            return self._cached_object(key).read_text(encoding="utf-8")
 
         except Exception as e:
             logger.warning(f"R2 download failed: {e}")
@@ -246,15 +366,60 @@ class R2Storage:
         """
         try:
             key = self._extract_key_from_url(url_or_key)
-
-            response = self.client.get_object(Bucket=self.bucket, Key=key)
-            content = response["Body"].read()
-            return content
+            return self._cached_object(key).read_bytes()
 
         except Exception as e:
             logger.warning(f"R2 download failed: {e}")
             return None
 
+    def download_file(self, url_or_key: str, dest: str) -> bool:
+        """
+        R2 객체를 로컬 파일로 다운로드 (자산 캐시 경유, 메모리에 올리지 않고 스트리밍)
+
+        Args:
+            url_or_key: R2 URL 또는 객체 키
+            dest: 저장할 로컬 경로
+
+        Returns:
+            성공 여부
+        """
+        try:
+            key = self._extract_key_from_url(url_or_key)
+            link_or_copy(self._cached_object(key), Path(dest))
+            return True
+
+        except Exception as e:
+            logger.warning(f"R2 download failed: {e}")
+            return False
+
+    def _cached_object(self, key: str) -> Path:
+        """R2 객체 → 자산 캐시 파일 (항상 ETag 재검증, 변경 없으면 로컬 파일 사용)"""
+        return get_asset_cache().get(
+            f"r2://{self.bucket}/{key}",
+            lambda partial, validators: self._get_object_if_modified(key, partial, validators.get("etag")),
+            max_age=0
+        )
+
+    def _get_object_if_modified(self, key: str, dest: str, etag: str | None = None) -> dict | None:
+        """
+        조건부 GetObject → dest (청크 단위 기록)
+
+        Returns:
+            {"etag": ...} 또는 None (304, 변경 없음)
+        """
+        kwargs = {"IfNoneMatch": etag} if etag else {}
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key, **kwargs)
+        except ClientError as e:
+            if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304:
+                return None
+            raise
+
+        with open(dest, "wb") as f:
+            for chunk in response["Body"].iter_chunks(1024 * 1024):
+                f.write(chunk)
+        return {"etag": response.get("ETag")}
+
     def _extract_key_from_url(self, url_or_key: str) -> str:
         """URL에서 객체 키 추출"""
         if url_or_key.startswith("http"):
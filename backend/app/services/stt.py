@@ -3,10 +3,19 @@ Groq Whisper 음성 인식 서비스
 """
 import logging
 import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 from groq import Groq
 
 from app.config import get_settings
+from app.services.audio_chunker import parse_silences, plan_chunks, stitch
+from app.services.pipeline_checkpoint import deserialize_transcription, serialize_transcription
+from app.services.render_artifacts import hash_file
+from app.services.transcription_cache import get_transcription_cache, transcription_key
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -125,49 +134,104 @@ class WhisperService:
         '고 있',   # "하고 있다", "보고 있어"
     )
 
+    # 기본 프롬프트 (교회/설교 관련 용어 + 성경 비유)
+    DEFAULT_PROMPT = (
+        "묵상, 말씀, 은혜, 성경, 하나님, 예수님, 예수 그리스도, 성령, 기도, 찬양, 예배, 구원, 십자가, 부활, "
+        "겨자씨, 씨앗, 씨뿌리는 자, 포도원, 무화과나무, 감람산, 올리브, 빛과 소금, 양과 목자, 천국, 비유, "
+        "마가복음, 마태복음, 누가복음, 요한복음, 사도행전, 로마서, 고린도전서, 에베소서, 빌립보서, "
+        "아멘, 할렐루야, 호산나, 마라나타, 주님, 그리스도, 메시아, 구세주, 복음, 제자, 사도, "
+        "꽃동산, 교회, 성도, 형제, 자매, 목사님, 집사님, 권사님, 장로님"
+    )
+
+    def _cache_key(
+        self,
+        audio_path: str,
+        language: str,
+        initial_prompt: str | None,
+        cache_audio_path: str | None = None,
+        preprocess: dict | None = None
+    ) -> str:
+        """인식 결과 캐시 키 (원본 오디오 내용 + 모델 + 언어 + 프롬프트 + 전처리 설정)"""
+        return transcription_key(
+            hash_file(cache_audio_path or audio_path),
+            self.model,
+            language,
+            initial_prompt or self.DEFAULT_PROMPT,
+            preprocess
+        )
+
+    def get_cached_transcription(
+        self,
+        audio_path: str,
+        language: str = "ko",
+        initial_prompt: str | None = None,
+        cache_audio_path: str | None = None,
+        preprocess: dict | None = None
+    ):
+        """
+        캐시된 인식 결과만 조회 (Groq 호출 없음)
+
+        자막 길이 프리셋만 바꿔 SRT를 다시 만들 때 사용:
+            service = get_whisper_service(subtitle_length="long")
+            transcription = service.get_cached_transcription(audio_path)
+            if transcription is not None:
+                service.create_srt_from_transcription(transcription, audio_path)
+
+        Returns:
+            transcription 호환 객체 (text/words/segments) 또는 None
+        """
+        if not settings.TRANSCRIPTION_CACHE_ENABLED:
+            return None
+        data = get_transcription_cache().get(
+            self._cache_key(audio_path, language, initial_prompt, cache_audio_path, preprocess)
+        )
+        return deserialize_transcription(data) if data is not None else None
+
     def get_transcription(
         self,
         audio_path: str,
         language: str = "ko",
-        initial_prompt: str | None = None
+        initial_prompt: str | None = None,
+        cache_audio_path: str | None = None,
+        preprocess: dict | None = None
     ):
         """
         Whisper API 호출 → raw transcription 객체 반환
         (교정을 먼저 적용하기 위해 SRT 생성과 분리)
 
+        같은 오디오/모델/언어/프롬프트의 결과가 캐시에 있으면 Groq를 호출하지 않는다.
+        STT_LONG_AUDIO_SECONDS보다 긴 오디오는 무음 경계로 나눠 동시에 인식한다.
+
         Args:
             audio_path: 오디오 파일 경로
             language: 언어 코드 (ko, en, etc)
             initial_prompt: Whisper 힌트
+            cache_audio_path: 캐시 키에 쓸 원본 오디오 (audio_path가 전처리 결과일 때)
+            preprocess: audio_path를 만든 전처리 설정 (캐시 키에 포함)
 
         Returns:
-            transcription: Groq Whisper API 응답 객체 (verbose_json)
+            transcription: Groq Whisper API 응답 객체 (verbose_json) 또는 캐시에서 복원한 호환 객체
         """
         try:
+            cache_key = None
+            if settings.TRANSCRIPTION_CACHE_ENABLED:
+                cache_key = self._cache_key(audio_path, language, initial_prompt, cache_audio_path, preprocess)
+                cached = get_transcription_cache().get(cache_key)
+                if cached is not None:
+                    logger.info(f"Transcription cache hit: {audio_path}")
+                    return deserialize_transcription(cached)
+
             logger.info(f"Transcribing audio: {audio_path}")
+            prompt = initial_prompt if initial_prompt else self.DEFAULT_PROMPT
 
-            # 기본 프롬프트 (교회/설교 관련 용어 + 성경 비유)
-            default_prompt = (
-                "묵상, 말씀, 은혜, 성경, 하나님, 예수님, 예수 그리스도, 성령, 기도, 찬양, 예배, 구원, 십자가, 부활, "
-                "겨자씨, 씨앗, 씨뿌리는 자, 포도원, 무화과나무, 감람산, 올리브, 빛과 소금, 양과 목자, 천국, 비유, "
-                "마가복음, 마태복음, 누가복음, 요한복음, 사도행전, 로마서, 고린도전서, 에베소서, 빌립보서, "
-                "아멘, 할렐루야, 호산나, 마라나타, 주님, 그리스도, 메시아, 구세주, 복음, 제자, 사도, "
-                "꽃동산, 교회, 성도, 형제, 자매, 목사님, 집사님, 권사님, 장로님"
-            )
-            prompt = initial_prompt if initial_prompt else default_prompt
-
-            # 오디오 파일 읽기
-            with open(audio_path, "rb") as audio_file:
-                # Groq Whisper API 호출 (word 단위 타임스탬프)
-                transcription = self.client.audio.transcriptions.create(
-                    file=audio_file,
-                    model=self.model,
-                    language=language,  # 한국어 최적화
-                    response_format="verbose_json",  # 타임스탬프 포함
-                    timestamp_granularities=["word"],  # 단어 단위
-                    temperature=0.0,  # 일관성 최대화
-                    prompt=prompt  # 도메인 특화 힌트
-                )
+            duration = self._probe_duration(audio_path)
+            if settings.STT_LONG_AUDIO_SECONDS > 0 and duration > settings.STT_LONG_AUDIO_SECONDS:
+                transcription = self._transcribe_long(audio_path, duration, language, prompt)
+            else:
+                transcription = self._transcribe_file(audio_path, language, prompt)
+
+            if cache_key is not None:
+                get_transcription_cache().put(cache_key, serialize_transcription(transcription))
 
             return transcription
 
@@ -175,6 +239,106 @@ class WhisperService:
             logger.exception(f"Transcription failed: {e}")
             raise
 
+    def _transcribe_file(self, audio_path: str, language: str, prompt: str):
+        """Groq Whisper API 호출 1회 (word 단위 타임스탬프)"""
+        with open(audio_path, "rb") as audio_file:
+            return self.client.audio.transcriptions.create(
+                file=audio_file,
+                model=self.model,
+                language=language,  # 한국어 최적화
+                response_format="verbose_json",  # 타임스탬프 포함
+                timestamp_granularities=["word"],  # 단어 단위
+                temperature=0.0,  # 일관성 최대화
+                prompt=prompt  # 도메인 특화 힌트
+            )
+
+    def _transcribe_long(self, audio_path: str, duration: float, language: str, prompt: str):
+        """
+        긴 녹음 분할 인식
+
+        무음 경계로 겹치는 청크를 만들어 동시에 인식한 뒤 단어 타임스탬프를
+        원본 시간으로 되돌려 이어붙인다 (겹침 구간은 담당 청크의 단어만 사용).
+
+        Returns:
+            transcription 호환 객체 (text/words/segments)
+        """
+        chunks = plan_chunks(
+            duration,
+            self._detect_silences(audio_path),
+            target=settings.STT_CHUNK_SECONDS,
+            max_len=settings.STT_CHUNK_MAX_SECONDS,
+            overlap=settings.STT_CHUNK_OVERLAP_SECONDS
+        )
+        if len(chunks) == 1:
+            return self._transcribe_file(audio_path, language, prompt)
+
+        logger.info(f"Long audio ({duration:.0f}s) → {len(chunks)} chunks")
+        work_dir = tempfile.mkdtemp(prefix="stt_chunks_")
+        try:
+            def transcribe_chunk(chunk):
+                chunk_path = os.path.join(work_dir, f"chunk_{chunk.index:03d}.mp3")
+                self._extract_chunk(audio_path, chunk.start, chunk.duration, chunk_path)
+                result = self._transcribe_file(chunk_path, language, prompt)
+                logger.info(f"Chunk {chunk.index + 1}/{len(chunks)} transcribed "
+                            f"({chunk.start:.1f}s~{chunk.end:.1f}s)")
+                return chunk, result
+
+            workers = max(1, min(settings.STT_CHUNK_CONCURRENCY, len(chunks)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(transcribe_chunk, chunks))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        words, segments, text = stitch(results)
+        return SimpleNamespace(text=text, words=words, segments=segments, duration=duration)
+
+    @staticmethod
+    def _probe_duration(audio_path: str) -> float:
+        """오디오 길이 (초, 실패 시 0 → 분할하지 않음)"""
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                audio_path
+            ],
+            capture_output=True, text=True
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def _detect_silences(audio_path: str) -> list:
+        """FFmpeg silencedetect로 무음 구간 찾기 (-35dB 이하 0.4초 이상)"""
+        result = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-nostats",
+                "-i", audio_path,
+                "-af", "silencedetect=noise=-35dB:d=0.4",
+                "-f", "null", "-"
+            ],
+            capture_output=True, text=True
+        )
+        return parse_silences(result.stderr)
+
+    @staticmethod
+    def _extract_chunk(audio_path: str, start: float, duration: float, output_path: str) -> None:
+        """청크 추출 (16kHz 모노 - Whisper 입력 해상도, 업로드 크기 최소화)"""
+        result = subprocess.run(
+            [
+                "ffmpeg", "-y", "-v", "error",
+                "-ss", f"{start:.3f}", "-t", f"{duration:.3f}",
+                "-i", audio_path,
+                "-ac", "1", "-ar", "16000", "-b:a", "64k",
+                output_path
+            ],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Chunk extraction failed: {result.stderr[-500:]}")
+
     def create_srt_from_transcription(
         self,
         transcription,
@@ -184,13 +348,16 @@ class WhisperService:
         교정된 transcription 객체 → SRT 파일 생성
 
         Args:
-            transcription: Whisper API 응답 (교정 후)
+            transcription: Whisper API 응답 (교정 후) 또는 캐시된 dict (serialize_transcription 형식)
             audio_path: 오디오 파일 경로 (SRT 저장 경로 결정용)
 
         Returns:
             srt_path: 생성된 SRT 파일 경로
         """
         try:
+            if isinstance(transcription, dict):
+                transcription = deserialize_transcription(transcription)
+
             # SRT 형식으로 변환 (적절한 길이로 분할)
             srt_content = self._convert_to_srt(transcription)
 
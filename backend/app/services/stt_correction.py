@@ -5,11 +5,14 @@ Gemini 2.5 Flash를 활용한 자막 교정
 import logging
 import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import google.generativeai as genai
 
 from app.config import get_settings
+from app.services.replacement_matcher import ReplacementMatcher
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -22,6 +25,9 @@ class STTCorrectionService:
     DEFAULT_MODEL = "gemini-2.5-flash"      # 기본 (저비용)
     QUALITY_MODEL = "gemini-3-flash-preview"  # 품질 모드 (고정밀)
 
+    # 컴파일된 치환 사전 보관 개수 (통합 사전 + 교회별 사전 여러 개)
+    MATCHER_CACHE_SIZE = 16
+
     def __init__(self):
         if settings.GOOGLE_API_KEY:
             genai.configure(api_key=settings.GOOGLE_API_KEY)
@@ -32,6 +38,40 @@ class STTCorrectionService:
             self.model = None
             self.quality_model = None
 
+        # 컴파일된 치환 사전 (사전 내용 기준, 최근 사용 순)
+        self._matchers: "OrderedDict[tuple, ReplacementMatcher]" = OrderedDict()
+        self._matchers_lock = threading.Lock()
+
+    def get_matcher(
+        self,
+        entries: list[dict],
+        source_key: str = "original",
+        target_key: str = "replacement",
+        priority_key: str = "use_count"
+    ) -> ReplacementMatcher:
+        """
+        치환 사전 → 컴파일된 매처 (같은 내용의 사전은 한 번만 컴파일)
+
+        Args:
+            entries: 사전 행 목록
+            source_key / target_key / priority_key: 원본/치환/우선순위 필드명
+        """
+        fingerprint = (source_key, target_key, priority_key) + tuple(
+            (e.get(source_key), e.get(target_key), e.get(priority_key)) for e in entries
+        )
+        with self._matchers_lock:
+            matcher = self._matchers.get(fingerprint)
+            if matcher is not None:
+                self._matchers.move_to_end(fingerprint)
+                return matcher
+
+        matcher = ReplacementMatcher.from_entries(entries, source_key, target_key, priority_key)
+        with self._matchers_lock:
+            self._matchers[fingerprint] = matcher
+            while len(self._matchers) > self.MATCHER_CACHE_SIZE:
+                self._matchers.popitem(last=False)
+        return matcher
+
     async def correct_subtitles(
         self,
         subtitles: list[dict],
@@ -224,33 +264,24 @@ class STTCorrectionService:
         Returns:
             (교정된 텍스트, 적용된 교정 목록)
         """
-        corrected_text = text
-        applied_corrections = []
-
-        # 빈도 높은 순으로 정렬 (긴 패턴 우선)
-        sorted_dict = sorted(
-            church_dictionary,
-            key=lambda x: (-x.get('frequency', 0), -len(x.get('wrong_text', '')))
-        )
-
-        for entry in sorted_dict:
-            wrong = entry.get('wrong_text', '')
-            correct = entry.get('correct_text', '')
-
-            if wrong and wrong in corrected_text:
-                corrected_text = corrected_text.replace(wrong, correct)
-                applied_corrections.append({
-                    'wrong_text': wrong,
-                    'correct_text': correct,
-                    'source': 'dictionary'
-                })
-
+        # 빈도 높은 순 (긴 패턴 우선), 한 번 훑어서 치환
+        matcher = self.get_matcher(church_dictionary, "wrong_text", "correct_text", "frequency")
+        corrected_text, pattern_ids = matcher.replace(text)
+
+        applied_corrections = [
+            {
+                'wrong_text': matcher.patterns[i],
+                'correct_text': matcher.replacements[i],
+                'source': 'dictionary'
+            }
+            for i in pattern_ids
+        ]
         return corrected_text, applied_corrections
 
     def apply_replacement_dictionary(
         self,
         text: str,
-        replacement_dictionary: list[dict]
+        replacement_dictionary: list[dict] | ReplacementMatcher
     ) -> tuple[str, list[dict]]:
         """
         자동 치환 사전 기반 교정 (original/replacement 형식)
@@ -260,32 +291,29 @@ class STTCorrectionService:
         Args:
             text: 원본 텍스트
             replacement_dictionary: 치환 사전 [{"original": "...", "replacement": "...", "use_count": N}]
+                또는 컴파일된 매처 (DictionarySnapshot.matcher)
 
         Returns:
             (교정된 텍스트, 적용된 교정 목록)
         """
-        corrected_text = text
-        applied_corrections = []
-
-        # use_count 높은 순으로 정렬 (긴 패턴 우선)
-        sorted_dict = sorted(
-            replacement_dictionary,
-            key=lambda x: (-x.get('use_count', 0), -len(x.get('original', '')))
-        )
-
-        for entry in sorted_dict:
-            original = entry.get('original', '')
-            replacement = entry.get('replacement', '')
-
-            if original and original in corrected_text:
-                corrected_text = corrected_text.replace(original, replacement)
-                applied_corrections.append({
-                    'original': original,
-                    'replacement': replacement,
-                    'source': 'replacement_dictionary'
-                })
-
-        return corrected_text, applied_corrections
+        # use_count 높은 순 (긴 패턴 우선), 한 번 훑어서 치환
+        if isinstance(replacement_dictionary, ReplacementMatcher):
+            matcher = replacement_dictionary
+        else:
+            matcher = self.get_matcher(replacement_dictionary)
+        corrected_text, pattern_ids = matcher.replace(text)
+        return corrected_text, self._replacement_corrections(matcher, pattern_ids)
+
+    @staticmethod
+    def _replacement_corrections(matcher: ReplacementMatcher, pattern_ids: list[int]) -> list[dict]:
+        return [
+            {
+                'original': matcher.patterns[i],
+                'replacement': matcher.replacements[i],
+                'source': 'replacement_dictionary'
+            }
+            for i in pattern_ids
+        ]
 
     def apply_replacement_to_subtitles(
         self,
@@ -305,19 +333,19 @@ class STTCorrectionService:
         if not replacement_dictionary:
             return subtitles
 
+        # 사전은 한 번만 컴파일, 자막마다 한 번씩 훑음
+        matcher = self.get_matcher(replacement_dictionary)
+        original_texts = [subtitle.get('text', '') for subtitle in subtitles]
+        corrected_texts, applied = matcher.replace_many(original_texts)
+
         result = []
-        for subtitle in subtitles:
+        for subtitle, original_text, corrected_text, pattern_ids in zip(
+            subtitles, original_texts, corrected_texts, applied
+        ):
             new_subtitle = subtitle.copy()
-            original_text = subtitle.get('text', '')
-
-            corrected_text, corrections = self.apply_replacement_dictionary(
-                original_text, replacement_dictionary
-            )
-
             if corrected_text != original_text:
                 new_subtitle['text'] = corrected_text
-                new_subtitle['auto_corrections'] = corrections
-
+                new_subtitle['auto_corrections'] = self._replacement_corrections(matcher, pattern_ids)
             result.append(new_subtitle)
 
         return result
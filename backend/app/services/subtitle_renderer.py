@@ -8,11 +8,14 @@ import logging
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from PIL import Image, ImageDraw, ImageFont
 
+from app.services.subtitle_track import union_region, write_overlay_track
+
 logger = logging.getLogger(__name__)
 
 # 폰트 디렉토리
@@ -53,6 +56,48 @@ class SubtitleStyle:
                 self.font_path = str(default_font)
 
 
+@dataclass
+class SubtitleLayout:
+    """자막 배치 (프레임 좌표)"""
+    lines: List[Tuple[str, int, int]]     # (줄 텍스트, x, y)
+    box: Tuple[int, int, int, int]        # 배경 박스 (x1, y1, x2, y2)
+    region: Tuple[int, int, int, int]     # 크롭 영역 (x1, y1, x2, y2), 외곽선 포함
+
+
+@dataclass
+class SubtitleBitmap:
+    """크롭된 자막 PNG + 프레임 내 배치 좌표"""
+    path: str
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@lru_cache(maxsize=8)
+def _load_font(font_path: str, font_size: int):
+    """폰트 로드 (프로세스 단위 캐싱)"""
+    try:
+        return ImageFont.truetype(font_path, font_size)
+    except OSError as e:
+        logger.warning(f"Font load failed: {e}, using default")
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=4096)
+def _line_metrics(font, line: str) -> Tuple[int, int, int, int]:
+    """
+    줄 크기 (폰트, 크기, 텍스트 단위 캐싱)
+
+    폰트 객체는 _load_font에서 (경로, 크기)별로 하나만 만들어지므로 키로 충분하다.
+
+    Returns:
+        (width, height, bbox_top, bbox_left)
+    """
+    left, top, right, bottom = font.getbbox(line)
+    return right - left, bottom - top, top, left
+
+
 class SubtitleRenderer:
     """PIL 기반 자막 렌더링 서비스"""
 
@@ -60,20 +105,10 @@ class SubtitleRenderer:
         self.style = style or SubtitleStyle()
         self.temp_dir = Path(tempfile.gettempdir()) / "qt-subtitles"
         self.temp_dir.mkdir(exist_ok=True)
-        self._font = None
 
     def _get_font(self) -> ImageFont.FreeTypeFont:
         """폰트 로드 (캐싱)"""
-        if self._font is None:
-            try:
-                self._font = ImageFont.truetype(
-                    self.style.font_path,
-                    self.style.font_size
-                )
-            except OSError as e:
-                logger.warning(f"Font load failed: {e}, using default")
-                self._font = ImageFont.load_default()
-        return self._font
+        return _load_font(self.style.font_path, self.style.font_size)
 
     def parse_srt(self, srt_path: str) -> List[SubtitleEntry]:
         """
@@ -138,48 +173,31 @@ class SubtitleRenderer:
 
         return int(h) * 3600 + int(m) * 60 + s + ms / 1000
 
-    def render_subtitle_image(self, text: str, output_path: str) -> str:
+    def layout_subtitle(self, text: str) -> SubtitleLayout:
         """
-        단일 자막 텍스트 -> 투명 배경 PNG 이미지
+        자막 텍스트 -> 프레임 기준 배치 계산 (그리기 없음)
 
         자막은 화면 하단 중앙에 배치됩니다.
+        줄 크기는 (폰트, 크기, 텍스트) 단위로 캐싱합니다.
 
         Args:
             text: 자막 텍스트 (줄바꿈 포함 가능)
-            output_path: 출력 PNG 경로
 
         Returns:
-            출력 PNG 경로
+            SubtitleLayout (배경 박스, 줄 위치, 크롭 영역)
         """
         style = self.style
         font = self._get_font()
 
-        # 투명 배경 캔버스
-        img = Image.new('RGBA', (style.video_width, style.video_height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
         # 텍스트 크기 계산 (멀티라인 지원)
         lines = text.split('\n')
-        line_bboxes = []
-        total_height = 0
-        max_width = 0
-        first_bbox_top = None  # 첫 번째 bbox의 상단 오프셋 저장
-
-        for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
-
-            # 첫 번째 줄의 bbox 상단 오프셋 저장 (베이스라인 보정용)
-            if first_bbox_top is None:
-                first_bbox_top = bbox[1]  # bbox의 y1 값
-
-            line_bboxes.append((line_width, line_height, bbox[1]))  # y1도 저장
-            max_width = max(max_width, line_width)
-            total_height += line_height
+        line_metrics = [_line_metrics(font, line) for line in lines]
+        max_width = max(width for width, _, _, _ in line_metrics)
+        total_height = sum(height for _, height, _, _ in line_metrics)
+        first_bbox_top = line_metrics[0][2]  # 첫 번째 줄 bbox 상단 오프셋 (베이스라인 보정용)
 
         # 텍스트 실제 높이 (줄 간격 포함)
-        text_height_with_spacing = total_height + style.line_spacing * (len(lines) - 1) if len(lines) > 1 else total_height
+        text_height_with_spacing = total_height + style.line_spacing * (len(lines) - 1)
 
         # 배경 박스 높이 계산 (텍스트 + 위아래 패딩)
         # bg_padding이 외곽선 공간도 포함 (24px는 충분함)
@@ -191,67 +209,83 @@ class SubtitleRenderer:
         bg_x2 = (style.video_width + max_width) // 2 + style.bg_padding
         bg_y2 = style.video_height - style.margin_bottom
 
-        # 배경 박스 그리기 (라운드 코너)
-        self._draw_rounded_rectangle(
-            draw,
-            (bg_x1, bg_y1, bg_x2, bg_y2),
-            radius=style.bg_radius,
-            fill=style.bg_color
-        )
-
         # 텍스트 수직 중앙 정렬
-        # 박스 높이에서 텍스트 높이를 빼고 절반 = 상하 여백
-        vertical_padding = (box_height - text_height_with_spacing) // 2
         # bbox의 상단 오프셋(first_bbox_top)을 빼서 베이스라인 기준으로 보정
-        text_start_y = bg_y1 + vertical_padding - first_bbox_top
+        vertical_padding = (box_height - text_height_with_spacing) // 2
+        current_y = bg_y1 + vertical_padding - first_bbox_top
 
-        # 텍스트 그리기 (외곽선 + 본문)
-        current_y = text_start_y
-        for i, line in enumerate(lines):
-            line_width, line_height, bbox_y1 = line_bboxes[i]
+        placed = []
+        region = [bg_x1, bg_y1, bg_x2 + 1, bg_y2 + 1]  # rounded_rectangle은 끝 좌표 포함
+        for i, (line, (line_width, line_height, bbox_top, bbox_left)) in enumerate(zip(lines, line_metrics)):
             x = (style.video_width - line_width) // 2
+            placed.append((line, x, current_y))
 
-            # 외곽선 (8방향으로 그려서 두꺼운 효과)
-            self._draw_text_with_outline(
-                draw, (x, current_y), line, font,
-                style.text_color, style.outline_color, style.outline_width
-            )
+            # 외곽선까지 포함한 글자 영역이 박스를 벗어나면 크롭 영역 확장
+            stroke = style.outline_width
+            region[0] = min(region[0], x + bbox_left - stroke)
+            region[1] = min(region[1], current_y + bbox_top - stroke)
+            region[2] = max(region[2], x + bbox_left + line_width + stroke)
+            region[3] = max(region[3], current_y + bbox_top + line_height + stroke)
 
             # 마지막 줄이 아닐 때만 spacing 추가 (오버플로우 방지)
             current_y += line_height
             if i < len(lines) - 1:
                 current_y += style.line_spacing
 
-        # PNG 저장
-        img.save(output_path, 'PNG')
-        return output_path
+        return SubtitleLayout(
+            lines=placed,
+            box=(bg_x1, bg_y1, bg_x2, bg_y2),
+            region=(
+                max(0, region[0]), max(0, region[1]),
+                min(style.video_width, region[2]), min(style.video_height, region[3])
+            )
+        )
 
-    def _draw_text_with_outline(
+    def render_subtitle_image(
         self,
-        draw: ImageDraw.ImageDraw,
-        position: Tuple[int, int],
         text: str,
-        font: ImageFont.FreeTypeFont,
-        text_color: Tuple[int, int, int, int],
-        outline_color: Tuple[int, int, int, int],
-        outline_width: int
-    ):
+        output_path: str,
+        region: Optional[Tuple[int, int, int, int]] = None
+    ) -> SubtitleBitmap:
         """
-        외곽선이 있는 텍스트 그리기
+        단일 자막 텍스트 -> 자막 영역만 잘라낸 투명 배경 PNG 이미지
+
+        Args:
+            text: 자막 텍스트 (줄바꿈 포함 가능)
+            output_path: 출력 PNG 경로
+            region: 프레임 기준 크롭 영역 (x1, y1, x2, y2), None이면 자막 박스에 딱 맞게
 
-        8방향으로 외곽선을 그려서 두꺼운 효과를 만듭니다.
+        Returns:
+            SubtitleBitmap (PNG 경로 + 프레임 내 배치 좌표)
         """
-        x, y = position
+        style = self.style
+        font = self._get_font()
+        layout = self.layout_subtitle(text)
+        rx1, ry1, rx2, ry2 = region or layout.region
+
+        # 크롭 영역 크기의 투명 캔버스 (프레임 좌표 → 캔버스 좌표는 -rx1, -ry1)
+        img = Image.new('RGBA', (rx2 - rx1, ry2 - ry1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
 
-        # 외곽선 (8방향 + 추가 각도)
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                # 원형 마스크로 더 부드러운 외곽선
-                if dx * dx + dy * dy <= outline_width * outline_width:
-                    draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
+        # 배경 박스 그리기 (라운드 코너)
+        bg_x1, bg_y1, bg_x2, bg_y2 = layout.box
+        self._draw_rounded_rectangle(
+            draw,
+            (bg_x1 - rx1, bg_y1 - ry1, bg_x2 - rx1, bg_y2 - ry1),
+            radius=style.bg_radius,
+            fill=style.bg_color
+        )
+
+        # 텍스트 그리기 (Pillow 네이티브 stroke로 외곽선 + 본문 한 번에)
+        for line, x, y in layout.lines:
+            draw.text(
+                (x - rx1, y - ry1), line, font=font, fill=style.text_color,
+                stroke_width=style.outline_width, stroke_fill=style.outline_color
+            )
 
-        # 본문 텍스트
-        draw.text((x, y), text, font=font, fill=text_color)
+        # PNG 저장 (임시 파일이므로 압축보다 인코딩 속도 우선)
+        img.save(output_path, 'PNG', compress_level=1)
+        return SubtitleBitmap(output_path, rx1, ry1, rx2 - rx1, ry2 - ry1)
 
     def _draw_rounded_rectangle(
         self,
@@ -287,27 +321,97 @@ class SubtitleRenderer:
             draw.ellipse([x1, y2 - radius * 2, x1 + radius * 2, y2], fill=fill)
             draw.ellipse([x2 - radius * 2, y2 - radius * 2, x2, y2], fill=fill)
 
-    def render_all_subtitles(self, srt_path: str) -> List[Tuple[str, float, float]]:
+    def render_all_subtitles(
+        self,
+        srt_path: str,
+        region: Optional[Tuple[int, int, int, int]] = None
+    ) -> List[Tuple[SubtitleBitmap, float, float]]:
         """
         전체 SRT -> PNG 리스트 생성
 
         Args:
             srt_path: SRT 파일 경로
+            region: 공통 크롭 영역 (None이면 자막마다 딱 맞게)
+
+        Returns:
+            [(SubtitleBitmap, start_time, end_time), ...]
+        """
+        return self.render_entries(self.parse_srt(srt_path), region)
+
+    def render_entries(
+        self,
+        entries: List[SubtitleEntry],
+        region: Optional[Tuple[int, int, int, int]] = None
+    ) -> List[Tuple[SubtitleBitmap, float, float]]:
+        """
+        자막 엔트리 -> PNG 리스트 (같은 텍스트는 PNG 하나를 공유)
 
         Returns:
-            [(png_path, start_time, end_time), ...]
+            [(SubtitleBitmap, start_time, end_time), ...]
         """
-        entries = self.parse_srt(srt_path)
+        token = uuid4().hex[:8]
+        bitmaps: Dict[str, SubtitleBitmap] = {}
         results = []
 
         for entry in entries:
-            png_path = str(self.temp_dir / f"sub_{uuid4().hex[:8]}_{entry.index:04d}.png")
-            self.render_subtitle_image(entry.text, png_path)
-            results.append((png_path, entry.start, entry.end))
-
-        logger.info(f"Rendered {len(results)} subtitle images")
+            bitmap = bitmaps.get(entry.text)
+            if bitmap is None:
+                png_path = str(self.temp_dir / f"sub_{token}_{entry.index:04d}.png")
+                bitmap = self.render_subtitle_image(entry.text, png_path, region)
+                bitmaps[entry.text] = bitmap
+            results.append((bitmap, entry.start, entry.end))
+
+        logger.info(f"Rendered {len(bitmaps)} subtitle images for {len(results)} subtitles")
         return results
 
+    def render_blank_image(self, output_path: str, size: Tuple[int, int]) -> str:
+        """자막 없는 구간용 완전 투명 PNG (오버레이 트랙 간격 채움)"""
+        Image.new('RGBA', size, (0, 0, 0, 0)).save(output_path, 'PNG', compress_level=1)
+        return output_path
+
+    def render_track_frames(
+        self,
+        entries: List[SubtitleEntry]
+    ) -> Tuple[List[Tuple[str, float, float]], str, Tuple[int, int, int, int]]:
+        """
+        오버레이 트랙용 자막 PNG + 투명 PNG 생성
+
+        트랙 프레임은 크기가 모두 같아야 하므로 전체 자막 영역의 합집합으로
+        크롭한다 (하단 자막 띠만 합성 → 전체 프레임 대비 overlay 픽셀 수 감소).
+
+        Returns:
+            ([(png_path, start, end), ...], 투명 PNG 경로, 프레임 기준 영역 (x1, y1, x2, y2))
+        """
+        style = self.style
+        layouts = {entry.text: self.layout_subtitle(entry.text) for entry in entries}
+        region = union_region([layout.region for layout in layouts.values()]) or (
+            0, 0, style.video_width, style.video_height
+        )
+
+        rendered = self.render_entries(entries, region)
+        blank_png = self.render_blank_image(
+            str(self.temp_dir / f"blank_{uuid4().hex[:8]}.png"),
+            (region[2] - region[0], region[3] - region[1])
+        )
+        return [(bitmap.path, start, end) for bitmap, start, end in rendered], blank_png, region
+
+    def render_overlay_track(self, srt_path: str) -> Tuple[str, Tuple[int, int], List[str]]:
+        """
+        전체 SRT -> 단일 오버레이 트랙 (ffconcat)
+
+        Args:
+            srt_path: SRT 파일 경로
+
+        Returns:
+            (ffconcat 경로, overlay 좌표 (x, y), 정리할 임시 파일 리스트)
+        """
+        frames, blank_png, region = self.render_track_frames(self.parse_srt(srt_path))
+        track_path = write_overlay_track(
+            frames, blank_png, str(self.temp_dir / f"track_{uuid4().hex[:8]}.ffconcat")
+        )
+        temp_files = list({png for png, _, _ in frames}) + [blank_png, track_path]
+        return track_path, (region[0], region[1]), temp_files
+
     def cleanup(self, png_paths: List[str]) -> None:
         """
         임시 PNG 파일 정리
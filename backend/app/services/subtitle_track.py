@@ -0,0 +1,211 @@
+"""
+자막 오버레이 트랙 (단일 스트림)
+
+자막 PNG마다 -i 입력 + overlay=enable='between(...)' 체인을 만들면
+FFmpeg가 모든 프레임에서 N개의 overlay를 평가한다 (자막 수 × 프레임 수).
+
+대신 자막 PNG와 투명 PNG를 concat demuxer(ffconcat)로 시간순 나열해
+하나의 투명 오버레이 스트림을 만들고 overlay 한 번으로 합성한다.
+→ 비용이 영상 길이에만 비례 (자막 수와 무관)
+
+ffconcat 예시:
+    ffconcat version 1.0
+    file '/tmp/blank.png'
+    duration 1.200000
+    file '/tmp/sub_0001.png'
+    duration 2.500000
+    ...
+    file '/tmp/blank.png'      ← 마지막 항목의 duration이 적용되도록 한 번 더 (FFmpeg 규칙)
+
+FFmpeg 입력: -f concat -safe 0 -i track.ffconcat
+"""
+from typing import Iterable, List, Optional, Tuple
+
+# 이보다 짧은 간격은 무시 (프레임 1개 미만)
+MIN_GAP = 0.001
+
+
+# 청크가 이보다 짧아지면 분할하지 않음 (초)
+MIN_CHUNK = 1.0
+
+
+def _quote(path: str) -> str:
+    return "'" + str(path).replace("\\", "/").replace("'", "'\\''") + "'"
+
+
+def union_region(
+    regions: Iterable[Tuple[int, int, int, int]],
+    align: int = 2
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    자막 크롭 영역들의 합집합 (오버레이 트랙 프레임 크기)
+
+    yuv420 합성 시 색차 샘플 경계가 어긋나지 않도록 좌표를 align 배수로 맞춘다.
+
+    Returns:
+        (x1, y1, x2, y2) 또는 None (영역 없음)
+    """
+    regions = list(regions)
+    if not regions:
+        return None
+    x1 = min(r[0] for r in regions) // align * align
+    y1 = min(r[1] for r in regions) // align * align
+    x2 = -(-max(r[2] for r in regions) // align) * align
+    y2 = -(-max(r[3] for r in regions) // align) * align
+    return x1, y1, x2, y2
+
+
+def build_track_entries(
+    subtitles: Iterable[Tuple[str, float, float]],
+    blank_png: str,
+    offset: float = 0.0
+) -> List[Tuple[str, float]]:
+    """
+    (png, start, end) 리스트 → (png, duration) 타임라인
+
+    - 시작 시간 순 정렬, 자막 사이 간격은 투명 PNG
+    - 겹치는 자막은 다음 자막 시작 시점에 교체
+    - offset: 트랙 시작 시각 (청크 합성 시 청크 시작 시간)
+
+    Returns:
+        [(png_path, duration), ...] (합계 = 마지막 자막 종료 시각 - offset)
+    """
+    entries: List[Tuple[str, float]] = []
+    cursor = offset
+
+    ordered = sorted(subtitles, key=lambda s: s[1])
+    for i, (png_path, start, end) in enumerate(ordered):
+        start = max(start, cursor)
+        if i + 1 < len(ordered):
+            end = min(end, max(ordered[i + 1][1], start))
+        if end - start < MIN_GAP:
+            continue
+
+        if start - cursor >= MIN_GAP:
+            entries.append((blank_png, start - cursor))
+        entries.append((png_path, end - start))
+        cursor = end
+
+    return entries
+
+
+def write_overlay_track(
+    subtitles: Iterable[Tuple[str, float, float]],
+    blank_png: str,
+    track_path: str,
+    offset: float = 0.0
+) -> str:
+    """
+    자막 PNG 리스트 → ffconcat 파일 작성
+
+    Args:
+        subtitles: [(png_path, start, end), ...] (절대 시간)
+        blank_png: 투명 PNG (자막 없는 구간)
+        track_path: 저장할 ffconcat 파일 경로
+        offset: 트랙 시작 시각
+
+    Returns:
+        track_path
+    """
+    lines = ["ffconcat version 1.0"]
+    for png_path, duration in build_track_entries(subtitles, blank_png, offset):
+        lines.append(f"file {_quote(png_path)}")
+        lines.append(f"duration {duration:.6f}")
+
+    # 마지막 자막 이후는 투명 (마지막 duration 적용을 위해 항목 하나 더 필요)
+    lines.append(f"file {_quote(blank_png)}")
+
+    with open(track_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return track_path
+
+
+def overlay_track_input(track_path: str) -> List[str]:
+    """FFmpeg 입력 옵션 (ffconcat 오버레이 트랙)"""
+    return ["-f", "concat", "-safe", "0", "-i", track_path]
+
+
+def plan_chunks(
+    keyframes: Iterable[float],
+    total_duration: float,
+    chunk_duration: float
+) -> List[Tuple[float, float]]:
+    """
+    키프레임 기준 청크 경계 계산 (stream copy 분할용)
+
+    목표 길이(chunk_duration)를 넘긴 뒤 처음 나오는 키프레임에서 자른다.
+    키프레임에서만 자르므로 분할/이어붙이기에 재인코딩이 필요 없다.
+
+    Returns:
+        [(start, end), ...] (마지막 end = total_duration)
+    """
+    bounds = [0.0]
+    target = chunk_duration
+    for t in sorted(keyframes):
+        if t >= target and t - bounds[-1] >= MIN_CHUNK and total_duration - t >= MIN_CHUNK:
+            bounds.append(t)
+            target = t + chunk_duration
+    return list(zip(bounds, bounds[1:] + [total_duration]))
+
+
+def subtitles_in_range(
+    subtitles: Iterable[Tuple[str, float, float]],
+    start: float,
+    end: float
+) -> List[Tuple[str, float, float]]:
+    """[start, end) 구간에 걸친 자막 (절대 시간 유지)"""
+    return [s for s in subtitles if s[1] < end and s[2] > start]
+
+
+def changed_ranges(
+    old: Iterable[Tuple[float, float, str]],
+    new: Iterable[Tuple[float, float, str]]
+) -> List[Tuple[float, float]]:
+    """
+    두 자막 목록에서 화면이 달라지는 구간 (부분 재합성용)
+
+    시간/텍스트가 그대로인 자막은 제외하고, 사라진 자막(지워야 함)과
+    새로 생긴 자막(그려야 함)의 구간을 합친다.
+
+    Args:
+        old, new: [(start, end, text), ...]
+
+    Returns:
+        [(start, end), ...] (시간순, 겹치는 구간 병합)
+    """
+    old_set, new_set = set(old), set(new)
+    ranges = sorted((s, e) for s, e, _ in old_set ^ new_set if e > s)
+    return _merge(ranges)
+
+
+def align_to_keyframes(
+    ranges: Iterable[Tuple[float, float]],
+    keyframes: Iterable[float],
+    total_duration: float
+) -> List[Tuple[float, float]]:
+    """
+    구간을 GOP 경계로 확장 (앞: 직전 키프레임, 뒤: 다음 키프레임 또는 영상 끝)
+
+    키프레임에서 시작/끝나는 구간만 다시 인코딩하면
+    나머지는 stream copy로 그대로 이어붙일 수 있다.
+
+    Returns:
+        [(start, end), ...] (키프레임 경계, 겹치거나 맞닿는 구간 병합)
+    """
+    keyframes = sorted(keyframes)
+    aligned = []
+    for start, end in sorted(ranges):
+        start = max([k for k in keyframes if k <= start] or [0.0])
+        end = min([k for k in keyframes if k >= end and k - start >= MIN_CHUNK] or [total_duration])
+        aligned.append((start, min(end, total_duration)))
+    return _merge(aligned)
+
+
+def _merge(ranges: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    merged: List[Tuple[float, float]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
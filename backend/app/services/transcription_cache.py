@@ -0,0 +1,157 @@
+"""
+Whisper 인식 결과 캐시 (오디오 내용 해시 기준)
+
+WhisperService.get_transcription은 호출마다 오디오 전체를 Groq에 올린다.
+Celery 재시도, 같은 설교 MP3 재업로드, 배치 처리에서 같은 오디오가 반복되므로
+(오디오 SHA-256, 모델, 언어, 프롬프트 해시, 전처리 설정) 단위로 verbose_json(text/words/segments)을 보관한다.
+
+오디오 해시는 업로드 원본 기준이다. STT 입력(정규화 음성)은 인코더 버전 등에 따라
+바이트가 달라질 수 있으므로, 대신 전처리 설정을 키에 포함한다.
+
+- 1차: 워커 로컬 디스크 (JSON)
+- 2차: R2 transcriptions/{key}.json (다른 워커/노드와 공유, 로컬에 없으면 가져와 저장)
+
+저장 형식은 pipeline_checkpoint.serialize_transcription과 같다
+→ deserialize_transcription으로 복원해 자막 프리셋(short/long)만 바꿔 SRT를 다시 만들 수 있다.
+
+Usage:
+    cache = get_transcription_cache()
+    key = transcription_key(hash_file(source_path), model, "ko", prompt, preprocess)
+    data = cache.get(key)
+    if data is None:
+        data = serialize_transcription(call_groq(...))
+        cache.put(key, data)
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 저장 형식이 바뀌면 올려서 기존 캐시 무효화
+TRANSCRIPTION_CACHE_VERSION = 1
+
+
+def transcription_key(
+    audio_sha256: str,
+    model: str,
+    language: str,
+    prompt: str,
+    preprocess: Optional[dict] = None
+) -> str:
+    """
+    캐시 키 (오디오 해시 + 모델 + 언어 + 프롬프트 해시 + 전처리 설정)
+
+    Args:
+        audio_sha256: 원본 업로드 오디오 해시 (전처리 결과가 아닌 원본 기준 권장)
+        preprocess: STT 입력 전처리 설정 (None = 원본 그대로 인식)
+    """
+    payload = json.dumps(
+        {
+            "version": TRANSCRIPTION_CACHE_VERSION,
+            "audio": audio_sha256,
+            "model": model,
+            "language": language,
+            "prompt": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "preprocess": preprocess,
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TranscriptionCache:
+    """로컬 디스크 + R2 2단계 인식 결과 캐시"""
+
+    R2_PREFIX = "transcriptions"
+
+    def __init__(self, cache_dir: str, storage=None):
+        """
+        Args:
+            cache_dir: 로컬 캐시 디렉토리
+            storage: R2Storage (download_text/upload_text) - None이면 로컬만 사용
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.storage = storage
+
+    def _local_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        캐시된 인식 결과 (serialize_transcription 형식)
+
+        Returns:
+            dict 또는 None (미스)
+        """
+        path = self._local_path(key)
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                logger.info(f"[TranscriptionCache] HIT local ({key[:12]})")
+                return data
+            except (OSError, json.JSONDecodeError):
+                logger.warning(f"[TranscriptionCache] 손상된 로컬 캐시 무시: {path}")
+
+        if self.storage is not None:
+            raw = self.storage.download_text(f"{self.R2_PREFIX}/{key}.json")
+            if raw:
+                try:
+                    data = json.loads(raw)
+                except json.JSONDecodeError:
+                    logger.warning(f"[TranscriptionCache] 손상된 R2 캐시 무시 ({key[:12]})")
+                    return None
+                self._write_local(key, raw)
+                logger.info(f"[TranscriptionCache] HIT r2 ({key[:12]})")
+                return data
+
+        return None
+
+    def put(self, key: str, data: dict) -> None:
+        """인식 결과 저장 (로컬 + R2, 저장 실패는 경고만)"""
+        raw = json.dumps(data, ensure_ascii=False)
+        self._write_local(key, raw)
+        if self.storage is not None:
+            try:
+                self.storage.upload_text(raw, f"{self.R2_PREFIX}/{key}.json", content_type="application/json")
+            except Exception as e:
+                logger.warning(f"[TranscriptionCache] R2 저장 실패 (무시): {e}")
+
+    def _write_local(self, key: str, raw: str) -> None:
+        path = self._local_path(key)
+        partial = path.with_name(f".{uuid.uuid4().hex}.tmp")
+        try:
+            partial.write_text(raw, encoding="utf-8")
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning(f"[TranscriptionCache] 로컬 저장 실패 (무시): {e}")
+            partial.unlink(missing_ok=True)
+
+
+# 싱글톤
+_transcription_cache: TranscriptionCache | None = None
+
+
+def get_transcription_cache() -> TranscriptionCache:
+    """TranscriptionCache 싱글톤 (TRANSCRIPTION_CACHE_DIR / TRANSCRIPTION_CACHE_R2 설정)"""
+    global _transcription_cache
+    if _transcription_cache is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        cache_dir = settings.TRANSCRIPTION_CACHE_DIR or os.path.join(
+            tempfile.gettempdir(), "qt_transcription_cache"
+        )
+        storage = None
+        if settings.TRANSCRIPTION_CACHE_R2:
+            from app.services.storage import get_r2_storage
+            storage = get_r2_storage()
+        _transcription_cache = TranscriptionCache(cache_dir, storage=storage)
+    return _transcription_cache
@@ -6,15 +6,19 @@ FFmpeg 영상 합성 서비스
 - 클립 선택 시 duration 정보 함께 전달
 - 총 영상 길이가 오디오 길이 이상이 되도록 보장
 """
+import json
 import logging
 import os
 import random
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import uuid4
 
 from app.config import get_settings
+from app.services.render_graph import RenderClip, RenderPlan, build_base_command, build_render_command
 from app.services.subtitle_renderer import SubtitleRenderer, SubtitleStyle
 
 logger = logging.getLogger(__name__)
@@ -40,6 +44,12 @@ class VideoComposer:
     OUTPUT_CRF = 23  # 압축 레벨 (18=고품질, 23=표준, 28=저품질)
     FFMPEG_PRESET = "faster"  # 인코딩 속도 (ultrafast/superfast/veryfast/faster/fast/medium/slow/slower/veryslow)
 
+    # 미리보기(초안) 해상도 설정 - 최종 렌더 전에 먼저 보여주는 용도
+    DRAFT_WIDTH = 960
+    DRAFT_HEIGHT = 540
+    DRAFT_CRF = 28
+    DRAFT_PRESET = "ultrafast"
+
     # BGM 설정
     BGM_VOLUME = 0.12  # BGM 볼륨 (12% - 말씀이 잘 들리도록)
 
@@ -151,6 +161,17 @@ class VideoComposer:
         Returns:
             output_path: 생성된 MP4 경로
         """
+        if settings.SINGLE_PASS_RENDER:
+            return self.render_single_pass(
+                clips=self._render_clips(clip_paths, clip_durations),
+                audio_path=audio_path,
+                srt_path=srt_path,
+                audio_duration=audio_duration,
+                bgm_path=bgm_path,
+                bgm_volume=bgm_volume,
+                crossfade_duration=self.CROSSFADE_DURATION if len(clip_paths) == 2 else 0.0
+            )
+
         try:
             output_id = str(uuid4())
             output_path = str(self.temp_dir / f"{output_id}.mp4")
@@ -226,6 +247,22 @@ class VideoComposer:
         Returns:
             output_path: 생성된 MP4 경로
         """
+        if settings.SINGLE_PASS_RENDER:
+            return self.render_single_pass(
+                clips=self._render_clips(clip_paths, clip_durations),
+                audio_path=audio_path,
+                srt_path=srt_path,
+                audio_duration=audio_duration,
+                bgm_path=bgm_path,
+                bgm_volume=bgm_volume,
+                crossfade_duration=self.CROSSFADE_DURATION if len(clip_paths) == 2 else 0.0,
+                thumbnail_path=thumbnail_path,
+                thumbnail_duration=thumbnail_duration,
+                fade_duration=fade_duration,
+                outro_image_path=outro_image_path,
+                outro_duration=outro_duration
+            )
+
         try:
             # Step 1: 기본 영상 생성 (썸네일 없이)
             main_video = self.compose_video(
@@ -254,6 +291,453 @@ class VideoComposer:
             logger.exception(f"Video composition with thumbnail failed: {e}")
             raise
 
+    def render_single_pass(
+        self,
+        clips: list[RenderClip],
+        audio_path: str,
+        srt_path: str | None,
+        audio_duration: float,
+        bgm_path: str | None = None,
+        bgm_volume: float = 0.12,
+        crossfade_duration: float = 0.0,
+        thumbnail_path: str | None = None,
+        thumbnail_duration: float = 2.0,
+        fade_duration: float = 1.0,
+        outro_image_path: str | None = None,
+        outro_duration: float = 3.0,
+        base_output_path: str | None = None,
+        draft: bool = False,
+        nice: int = 0
+    ) -> str:
+        """
+        단일 패스 렌더링 (render_graph)
+
+        클립 trim/loop + 색보정 + crossfade + 자막 + 인트로/아웃트로 + 음성/BGM 믹싱을
+        filter_complex 하나로 구성해 libx264 인코딩을 한 번만 수행한다.
+
+        Args:
+            clips: 렌더 클립 리스트 (본 영상 순서대로)
+            audio_path: 음성 파일 경로
+            srt_path: SRT 자막 파일 경로 (None이면 자막 없음)
+            audio_duration: 본 영상 길이 (초)
+            bgm_path: BGM 파일 경로 (없으면 기본 BGM 탐색)
+            bgm_volume: BGM 볼륨 (0.0~1.0)
+            crossfade_duration: 클립 간 크로스페이드 (0이면 hard cut)
+            thumbnail_path: 인트로 썸네일 이미지 (옵션)
+            thumbnail_duration: 썸네일 표시 시간 (초)
+            fade_duration: 인트로/아웃트로 페이드 시간 (초)
+            outro_image_path: 아웃트로 이미지 (옵션)
+            outro_duration: 아웃트로 표시 시간 (초)
+            base_output_path: 베이스 영상 출력 경로 (옵션, 같은 실행에서 함께 출력)
+            draft: True면 미리보기 품질 (540p/ultrafast, 베이스 영상 없음)
+            nice: FFmpeg 프로세스 우선순위 (0보다 크면 낮춤, 미리보기 후 최종 렌더용)
+
+        Returns:
+            output_path: 생성된 MP4 경로
+        """
+        output_path = str(self.temp_dir / f"{'draft' if draft else 'single'}_{uuid4()}.mp4")
+        if draft:
+            width, height, preset, crf = self.DRAFT_WIDTH, self.DRAFT_HEIGHT, self.DRAFT_PRESET, self.DRAFT_CRF
+            base_output_path = None
+        else:
+            width, height, preset, crf = self.OUTPUT_WIDTH, self.OUTPUT_HEIGHT, self.FFMPEG_PRESET, self.OUTPUT_CRF
+
+        # BGM이 없으면 기본 BGM 탐색 (_add_audio_with_bgm과 동일)
+        if not bgm_path or not os.path.exists(bgm_path):
+            bgm_path = self._get_default_bgm()
+
+        renderer = SubtitleRenderer(self._pil_subtitle_style(width, height))
+        track_path, track_position, subtitle_files = (
+            renderer.render_overlay_track(srt_path) if srt_path else (None, (0, 0), [])
+        )
+
+        try:
+            plan = RenderPlan(
+                clips=clips,
+                voice_path=audio_path,
+                duration=float(audio_duration),
+                output_path=output_path,
+                bgm_path=bgm_path if bgm_path and os.path.exists(bgm_path) else None,
+                bgm_volume=bgm_volume,
+                subtitle_track=track_path,
+                subtitle_position=track_position,
+                intro_image=thumbnail_path,
+                intro_duration=thumbnail_duration,
+                outro_image=outro_image_path if outro_image_path and os.path.exists(outro_image_path) else None,
+                outro_duration=outro_duration,
+                fade_duration=fade_duration,
+                crossfade_duration=crossfade_duration,
+                color_filter=(
+                    f"eq=brightness={self.BRIGHTNESS}:contrast={self.CONTRAST}:"
+                    f"saturation={self.SATURATION}:gamma={self.GAMMA}"
+                ),
+                base_output_path=base_output_path,
+                width=width,
+                height=height,
+                preset=preset,
+                crf=crf
+            )
+
+            logger.info(
+                f"[SINGLE PASS] {len(clips)} clips, subtitles={bool(track_path)}, "
+                f"intro={bool(plan.intro_image)}, outro={bool(plan.outro_image)}, "
+                f"base={bool(base_output_path)}, draft={draft}"
+            )
+            self._run_ffmpeg(build_render_command(plan), nice=nice)
+
+        finally:
+            renderer.cleanup(subtitle_files)
+
+        logger.info(f"Video rendered in single pass: {output_path}")
+        return output_path
+
+    # ===================
+    # 재생성용 단계별 합성 (render_artifacts로 단계별 산출물 재사용)
+    # ===================
+
+    def render_base_video(
+        self,
+        clip_paths: list[str],
+        clip_durations: list[float] | None,
+        duration: float
+    ) -> str:
+        """클립 → 베이스 영상 (색보정/자막/오디오 없음, 본 영상 길이)"""
+        output_path = str(self.temp_dir / f"base_{uuid4()}.mp4")
+        plan = RenderPlan(
+            clips=[
+                RenderClip(c.path, c.duration, loop=True)
+                for c in self._render_clips(clip_paths, clip_durations)
+            ],
+            voice_path="",
+            duration=float(duration),
+            output_path=output_path,
+            crossfade_duration=self.CROSSFADE_DURATION if len(clip_paths) == 2 else 0.0,
+            width=self.OUTPUT_WIDTH,
+            height=self.OUTPUT_HEIGHT,
+            preset=self.FFMPEG_PRESET
+        )
+        logger.info(f"[Stage] Base video: {len(clip_paths)} clips, {duration}s")
+        self._run_ffmpeg(build_base_command(plan))
+        return output_path
+
+    def render_subtitled_video(self, base_video_path: str, srt_path: str, duration: float) -> str:
+        """베이스 영상 → 색보정 + 자막 합성 영상 (오디오 없음)"""
+        from app.services.subtitle_track import overlay_track_input
+
+        output_path = str(self.temp_dir / f"subtitled_{uuid4()}.mp4")
+        color_filter = self._color_filter()
+
+        renderer = SubtitleRenderer(self._pil_subtitle_style())
+        track_path, (x, y), subtitle_files = renderer.render_overlay_track(srt_path)
+        try:
+            # 베이스 영상이 오디오보다 짧으면 반복 (이전 버전 베이스 영상 호환)
+            cmd = ["ffmpeg", "-y", "-stream_loop", "-1", "-t", f"{duration:.3f}", "-i", base_video_path]
+            cmd += overlay_track_input(track_path) + [
+                "-filter_complex",
+                f"[0:v]{color_filter}[graded];"
+                f"[graded][1:v]overlay={x}:{y}:format=auto:eof_action=repeat,format=yuv420p[v]",
+                "-map", "[v]",
+                "-c:v", "libx264",
+                "-preset", self.FFMPEG_PRESET,
+                "-crf", str(self.OUTPUT_CRF),
+                "-an",
+                "-movflags", "+faststart",
+                output_path
+            ]
+            logger.info(f"[Stage] Subtitled video: {duration}s")
+            self._run_ffmpeg(cmd)
+        finally:
+            renderer.cleanup(subtitle_files)
+        return output_path
+
+    def mix_audio(
+        self,
+        audio_path: str,
+        bgm_path: str | None,
+        bgm_volume: float,
+        duration: float
+    ) -> str:
+        """음성 + BGM → 믹싱된 오디오 (AAC, 본 영상 길이)"""
+        output_path = str(self.temp_dir / f"mix_{uuid4()}.m4a")
+        if not bgm_path or not os.path.exists(bgm_path):
+            bgm_path = self._get_default_bgm()
+
+        cmd = ["ffmpeg", "-y", "-i", audio_path]
+        if bgm_path and os.path.exists(bgm_path):
+            cmd += [
+                "-stream_loop", "-1", "-i", bgm_path,
+                "-filter_complex",
+                f"[0:a]volume=1.0[voice];[1:a]volume={bgm_volume}[bgm];"
+                f"[voice][bgm]amix=inputs=2:duration=first:dropout_transition=3,"
+                f"atrim=duration={duration:.3f}[mix]",
+                "-map", "[mix]",
+            ]
+        else:
+            cmd += ["-af", f"atrim=duration={duration:.3f}"]
+        cmd += ["-c:a", "aac", "-b:a", "192k", "-ac", "2", output_path]
+
+        logger.info(f"[Stage] Audio mix: bgm={bool(bgm_path)}, volume={bgm_volume}")
+        self._run_ffmpeg(cmd)
+        return output_path
+
+    def assemble_final(
+        self,
+        video_path: str,
+        mixed_audio_path: str,
+        duration: float,
+        thumbnail_path: str | None = None,
+        thumbnail_duration: float = 2.0,
+        fade_duration: float = 1.0,
+        outro_image_path: str | None = None,
+        outro_duration: float = 3.0
+    ) -> str:
+        """
+        자막 합성 영상 + 믹싱된 오디오 (+ 인트로/아웃트로) → 최종 영상
+
+        인트로/아웃트로가 없으면 재인코딩 없이 mux만 수행한다.
+        """
+        output_path = str(self.temp_dir / f"final_{uuid4()}.mp4")
+
+        if not thumbnail_path and not outro_image_path:
+            self._run_ffmpeg([
+                "ffmpeg", "-y",
+                "-i", video_path,
+                "-i", mixed_audio_path,
+                "-map", "0:v", "-map", "1:a",
+                "-c", "copy",
+                "-t", f"{duration:.3f}",
+                "-movflags", "+faststart",
+                output_path
+            ])
+            logger.info(f"[Stage] Final muxed (no re-encode): {output_path}")
+            return output_path
+
+        plan = RenderPlan(
+            clips=[RenderClip(video_path, float(duration))],
+            voice_path=mixed_audio_path,
+            duration=float(duration),
+            output_path=output_path,
+            intro_image=thumbnail_path,
+            intro_duration=thumbnail_duration,
+            outro_image=outro_image_path,
+            outro_duration=outro_duration,
+            fade_duration=fade_duration,
+            width=self.OUTPUT_WIDTH,
+            height=self.OUTPUT_HEIGHT,
+            preset=self.FFMPEG_PRESET,
+            crf=self.OUTPUT_CRF
+        )
+        self._run_ffmpeg(build_render_command(plan))
+        logger.info(f"[Stage] Final with intro/outro: {output_path}")
+        return output_path
+
+    def patch_subtitles(
+        self,
+        final_video_path: str,
+        base_video_path: str,
+        old_srt_path: str,
+        new_srt_path: str,
+        offset: float = 0.0,
+        safe_start: float = 0.0,
+        safe_end: float | None = None
+    ) -> str | None:
+        """
+        최종 영상에서 자막이 바뀐 구간만 다시 합성 (나머지는 stream copy)
+
+        과정:
+        1. 이전/새 SRT 비교 → 화면이 달라지는 구간
+        2. 최종 영상 키프레임(GOP) 경계로 확장
+        3. 해당 구간만 베이스 영상 + 색보정 + 새 자막으로 재인코딩
+        4. 나머지 구간은 원본에서 stream copy로 잘라 concat, 오디오는 원본 그대로 mux
+
+        Args:
+            final_video_path: 기존 최종 영상
+            base_video_path: 베이스 영상 (자막/색보정 없음, 본 영상 기준)
+            old_srt_path: 최종 영상에 합성된 SRT
+            new_srt_path: 수정된 SRT
+            offset: 최종 영상에서 본 영상이 시작하는 시각 (인트로 길이)
+            safe_start / safe_end: 최종 영상 기준 본 영상만 보이는 구간 (인트로/아웃트로 페이드 제외)
+
+        Returns:
+            수정된 최종 영상 경로 또는 None (부분 합성 불가 → 전체 재생성 필요)
+        """
+        from app.services.subtitle_track import (
+            align_to_keyframes,
+            changed_ranges,
+            overlay_track_input,
+            subtitles_in_range,
+            write_overlay_track,
+        )
+
+        renderer = SubtitleRenderer(self._pil_subtitle_style())
+        new_entries = renderer.parse_srt(new_srt_path)
+        changed = changed_ranges(
+            [(e.start, e.end, e.text) for e in renderer.parse_srt(old_srt_path)],
+            [(e.start, e.end, e.text) for e in new_entries]
+        )
+
+        keyframes, total_duration = self._probe_keyframes(final_video_path)
+        if not keyframes or total_duration <= 0:
+            return None
+        safe_end = total_duration if safe_end is None else safe_end
+
+        segments = align_to_keyframes(
+            [(start + offset, end + offset) for start, end in changed], keyframes, total_duration
+        )
+        if any(start < safe_start or end > safe_end for start, end in segments):
+            logger.info("[Patch] 변경 구간이 인트로/아웃트로 전환과 겹침 → 전체 재생성")
+            return None
+
+        patched = sum(end - start for start, end in segments)
+        if patched > total_duration * settings.SUBTITLE_PATCH_MAX_RATIO:
+            logger.info(f"[Patch] 변경 구간 {patched:.1f}s / {total_duration:.1f}s → 전체 재생성")
+            return None
+
+        output_path = str(self.temp_dir / f"patched_{uuid4()}.mp4")
+        if not segments:
+            shutil.copy(final_video_path, output_path)
+            return output_path
+
+        boundaries = sorted({t for segment in segments for t in segment} - {0.0, total_duration})
+        pieces = list(zip([0.0] + boundaries, boundaries + [total_duration]))
+
+        work_dir = self.temp_dir / f"patch_{uuid4().hex[:8]}"
+        work_dir.mkdir()
+        frames, blank_png, region = renderer.render_track_frames(new_entries)
+        x, y = region[0], region[1]
+        color_filter = self._color_filter()
+
+        try:
+            # 1. 키프레임 분할 (경계 시각은 반올림 오차를 피해 1ms 앞당김)
+            self._run_ffmpeg([
+                "ffmpeg", "-y",
+                "-i", final_video_path,
+                "-map", "0:v:0",
+                "-c", "copy",
+                "-f", "segment",
+                "-segment_times", ",".join(f"{t - 0.001:.6f}" for t in boundaries),
+                "-segment_format", "mpegts",
+                "-reset_timestamps", "1",
+                str(work_dir / "piece_%04d.ts")
+            ])
+
+            # 2. 변경 구간만 베이스 영상에서 다시 합성
+            def render(index: int) -> str:
+                start, end = pieces[index]
+                piece_path = str(work_dir / f"piece_{index:04d}.ts")
+                if (start, end) not in segments:
+                    return piece_path
+
+                main_start = start - offset
+                track_path = write_overlay_track(
+                    subtitles_in_range(frames, main_start, end - offset),
+                    blank_png,
+                    str(work_dir / f"track_{index:04d}.ffconcat"),
+                    offset=main_start
+                )
+                patched_path = str(work_dir / f"patched_{index:04d}.ts")
+                self._run_ffmpeg([
+                    "ffmpeg", "-y",
+                    "-stream_loop", "-1",
+                    "-ss", f"{main_start:.3f}",
+                    "-t", f"{end - start:.3f}",
+                    "-i", base_video_path
+                ] + overlay_track_input(track_path) + [
+                    "-filter_complex",
+                    f"[0:v]{color_filter}[graded];"
+                    f"[graded][1:v]overlay={x}:{y}:format=auto:eof_action=repeat,format=yuv420p[v]",
+                    "-map", "[v]",
+                    "-c:v", "libx264",
+                    "-preset", self.FFMPEG_PRESET,
+                    "-crf", str(self.OUTPUT_CRF),
+                    "-f", "mpegts",
+                    patched_path
+                ])
+                return patched_path
+
+            workers = settings.SUBTITLE_CHUNK_WORKERS or max(1, (os.cpu_count() or 2) // 2)
+            with ThreadPoolExecutor(max_workers=min(workers, len(segments))) as pool:
+                piece_videos = list(pool.map(render, range(len(pieces))))
+
+            # 3. 무손실 연결 + 원본 오디오 mux
+            concat_list = work_dir / "concat.txt"
+            with open(concat_list, "w") as f:
+                for piece in piece_videos:
+                    escaped = piece.replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            self._run_ffmpeg([
+                "ffmpeg", "-y",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(concat_list),
+                "-i", final_video_path,
+                "-map", "0:v",
+                "-map", "1:a?",
+                "-c", "copy",
+                "-movflags", "+faststart",
+                output_path
+            ])
+            logger.info(
+                f"[Patch] 자막 {len(changed)}개 구간 → {len(segments)}개 GOP 구간 "
+                f"{patched:.1f}s / {total_duration:.1f}s 재인코딩"
+            )
+            return output_path
+
+        finally:
+            renderer.cleanup(list({png for png, _, _ in frames}) + [blank_png])
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _color_filter(self) -> str:
+        """밝기 통일 eq 필터"""
+        return (
+            f"eq=brightness={self.BRIGHTNESS}:contrast={self.CONTRAST}:"
+            f"saturation={self.SATURATION}:gamma={self.GAMMA}"
+        )
+
+    def subtitle_signature(self) -> dict:
+        """자막 합성 결과에 영향을 주는 설정 (산출물 키용)"""
+        style = self._pil_subtitle_style()
+        return {
+            "style": {k: v for k, v in vars(style).items() if k != "font_path"},
+            "font": os.path.basename(style.font_path),
+            "color": [self.BRIGHTNESS, self.CONTRAST, self.SATURATION, self.GAMMA],
+            "crf": self.OUTPUT_CRF,
+        }
+
+    def _render_clips(
+        self,
+        clip_paths: list[str],
+        clip_durations: list[int] | None
+    ) -> list[RenderClip]:
+        """기존 clip_paths/clip_durations 인자 → RenderClip 리스트"""
+        if clip_durations is None:
+            clip_durations = [self.DEFAULT_CLIP_DURATION] * len(clip_paths)
+        return [RenderClip(path=p, duration=float(d)) for p, d in zip(clip_paths, clip_durations)]
+
+    def _pil_subtitle_style(self, width: int | None = None, height: int | None = None) -> SubtitleStyle:
+        """
+        PIL 자막 스타일 (_add_subtitles_pil과 동일)
+
+        해상도를 지정하면 1080p 기준 크기를 높이 비율로 축소 (미리보기용)
+        """
+        width = width or self.OUTPUT_WIDTH
+        height = height or self.OUTPUT_HEIGHT
+        scale = height / self.OUTPUT_HEIGHT
+        font_path = Path(__file__).parent.parent / "fonts" / "NotoSansKR-Regular.ttf"
+        return SubtitleStyle(
+            font_path=str(font_path) if font_path.exists() else "",
+            font_size=round(96 * scale),          # 매우 큰 가독성 (1080p 기준)
+            outline_width=max(1, round(6 * scale)),
+            bg_padding=round(24 * scale),
+            bg_radius=round(12 * scale),
+            margin_bottom=round(150 * scale),     # 화면 하단 (약 14% 위치)
+            margin_horizontal=round(100 * scale),
+            line_spacing=round(12 * scale),
+            video_width=width,
+            video_height=height
+        )
+
     def _add_thumbnail_intro(
         self,
         video_path: str,
@@ -723,19 +1207,13 @@ class VideoComposer:
         """
         한글 자막 오버레이 - PIL 렌더링 방식
 
-        PIL로 자막 이미지를 생성하고 FFmpeg overlay로 합성합니다.
-        100개 이상 자막은 청크 기반으로 처리합니다.
+        PIL로 자막 이미지를 생성하고 단일 오버레이 트랙으로 합성합니다.
+        (자막 수와 무관하게 overlay 필터 한 번)
+        긴 영상은 키프레임 단위 청크로 나눠 병렬 합성합니다.
         """
-        from app.services.subtitle_renderer import SubtitleRenderer, SubtitleStyle
-
-        # SRT 파싱하여 자막 개수 확인
-        renderer = SubtitleRenderer()
-        entries = renderer.parse_srt(srt_path)
-
-        # 100개 이상이면 청크 기반 처리
-        if len(entries) >= 100:
-            logger.info(f"Large subtitle count ({len(entries)}), using chunked processing")
-            self._add_subtitles_pil_chunked(video_path, srt_path, output_path)
+        keyframes, total_duration = self._probe_keyframes(video_path)
+        if total_duration >= settings.SUBTITLE_CHUNK_SECONDS * 2 and keyframes:
+            self._add_subtitles_chunked(video_path, srt_path, output_path, keyframes, total_duration)
         else:
             self._add_subtitles_pil(video_path, srt_path, output_path)
 
@@ -750,27 +1228,16 @@ class VideoComposer:
 
         과정:
         1. SRT 파싱 -> 자막별 PNG 생성
-        2. FFmpeg filter_complex로 모든 PNG overlay
-        3. enable='between(t,start,end)'로 표시 시간 제어
+        2. 자막 PNG(하단 자막 영역만 크롭) + 투명 PNG를 시간순으로 나열한 ffconcat 트랙 생성
+        3. 트랙을 입력 하나로 읽어 자막 영역 좌표에 overlay 한 번으로 합성
         """
-        from app.services.subtitle_renderer import SubtitleRenderer, SubtitleStyle
+        from app.services.subtitle_renderer import SubtitleRenderer
+        from app.services.subtitle_track import overlay_track_input
 
         # 스타일 설정 (PIL 기본 스타일 사용)
-        font_path = Path(__file__).parent.parent / "fonts" / "NotoSansKR-Regular.ttf"
-        style = SubtitleStyle(
-            font_path=str(font_path) if font_path.exists() else "",
-            font_size=96,         # 매우 큰 가독성 (1080p 기준)
-            outline_width=6,
-            margin_bottom=150,    # 화면 하단 (약 14% 위치)
-            margin_horizontal=100,
-            video_width=self.OUTPUT_WIDTH,
-            video_height=self.OUTPUT_HEIGHT
-        )
-
-        renderer = SubtitleRenderer(style)
-        subtitle_pngs = renderer.render_all_subtitles(srt_path)
-
-        if not subtitle_pngs:
+        renderer = SubtitleRenderer(self._pil_subtitle_style())
+        entries = renderer.parse_srt(srt_path)
+        if not entries:
             # 자막이 없으면 그냥 복사
             cmd = [
                 "ffmpeg", "-y",
@@ -782,31 +1249,12 @@ class VideoComposer:
             self._run_ffmpeg(cmd)
             return
 
-        try:
-            # FFmpeg 입력 파일 목록 구성
-            inputs = ["-i", video_path]
-            for png_path, _, _ in subtitle_pngs:
-                inputs.extend(["-i", png_path])
-
-            # filter_complex 구성
-            filter_parts = []
-            overlay_chain = "[0:v]"
-
-            for i, (png_path, start, end) in enumerate(subtitle_pngs, start=1):
-                # enable 조건: 해당 시간 구간에만 표시
-                output_label = f"[v{i}]"
-                filter_parts.append(
-                    f"{overlay_chain}[{i}:v]overlay=0:0:enable='between(t,{start:.3f},{end:.3f})'{output_label}"
-                )
-                overlay_chain = output_label
-
-            # 전체 filter_complex 문자열
-            filter_complex = ";".join(filter_parts)
+        track_path, (x, y), subtitle_files = renderer.render_overlay_track(srt_path)
 
-            # FFmpeg 명령
-            cmd = ["ffmpeg", "-y"] + inputs + [
-                "-filter_complex", filter_complex,
-                "-map", overlay_chain,
+        try:
+            cmd = ["ffmpeg", "-y", "-i", video_path] + overlay_track_input(track_path) + [
+                "-filter_complex", f"[0:v][1:v]overlay={x}:{y}:format=auto:eof_action=repeat[v]",
+                "-map", "[v]",
                 "-map", "0:a",
                 "-c:v", "libx264",
                 "-preset", self.FFMPEG_PRESET,
@@ -816,174 +1264,151 @@ class VideoComposer:
                 output_path
             ]
 
-            logger.info(f"Adding {len(subtitle_pngs)} PIL subtitles with overlay")
+            logger.info(f"Adding {len(entries)} PIL subtitles with single overlay track")
             self._run_ffmpeg(cmd)
 
         finally:
-            # 임시 PNG 정리
-            renderer.cleanup([p for p, _, _ in subtitle_pngs])
+            # 임시 PNG/트랙 정리
+            renderer.cleanup(subtitle_files)
 
-    def _add_subtitles_pil_chunked(
+    def _add_subtitles_chunked(
         self,
         video_path: str,
         srt_path: str,
         output_path: str,
-        chunk_duration: float = 30.0
+        keyframes: list[float],
+        total_duration: float
     ) -> None:
         """
-        청크 기반 PIL 자막 합성 (대량 자막 최적화)
+        청크 병렬 PIL 자막 합성 (긴 영상)
 
-        자막이 100개 이상일 경우 overlay 체인이 너무 길어지는 문제 해결
-        - 영상을 30초 단위로 분할
-        - 각 청크에 해당하는 자막만 overlay
-        - 청크들을 concat으로 연결
+        과정:
+        1. 영상 스트림을 키프레임에서 stream copy로 분할 (재인코딩 없음)
+        2. 자막이 있는 청크만 오버레이 트랙 합성 (청크별 FFmpeg 프로세스 병렬 실행)
+        3. 자막 없는 청크는 그대로 두고 concat demuxer로 무손실 연결
+        4. 원본 오디오는 분할하지 않고 마지막에 그대로 mux
         """
-        from app.services.subtitle_renderer import SubtitleRenderer, SubtitleStyle
-
-        # 영상 전체 길이 확인
-        cmd_probe = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            video_path
-        ]
-        result = subprocess.run(cmd_probe, capture_output=True, text=True)
-        try:
-            total_duration = float(result.stdout.strip())
-        except ValueError:
-            total_duration = 300.0  # 기본값 5분
-
-        # 스타일 설정 (PIL 기본 스타일 사용)
-        font_path = Path(__file__).parent.parent / "fonts" / "NotoSansKR-Regular.ttf"
-        style = SubtitleStyle(
-            font_path=str(font_path) if font_path.exists() else "",
-            font_size=96,         # 매우 큰 가독성
-            outline_width=6,
-            margin_bottom=150,    # 화면 하단 (약 14% 위치)
-            video_width=self.OUTPUT_WIDTH,
-            video_height=self.OUTPUT_HEIGHT
+        from app.services.subtitle_renderer import SubtitleRenderer
+        from app.services.subtitle_track import (
+            overlay_track_input,
+            plan_chunks,
+            subtitles_in_range,
+            write_overlay_track,
         )
 
-        renderer = SubtitleRenderer(style)
-        all_entries = renderer.parse_srt(srt_path)
+        renderer = SubtitleRenderer(self._pil_subtitle_style())
+        entries = renderer.parse_srt(srt_path)
+        chunks = plan_chunks(keyframes, total_duration, settings.SUBTITLE_CHUNK_SECONDS)
+        if not entries or len(chunks) < 2:
+            self._add_subtitles_pil(video_path, srt_path, output_path)
+            return
 
-        # 청크별로 처리
-        chunk_videos = []
-        chunk_start = 0.0
+        work_dir = self.temp_dir / f"subchunks_{uuid4().hex[:8]}"
+        work_dir.mkdir()
+        frames, blank_png, region = renderer.render_track_frames(entries)
+        x, y = region[0], region[1]
 
-        while chunk_start < total_duration:
-            chunk_end = min(chunk_start + chunk_duration, total_duration)
-            chunk_id = str(uuid4())[:8]
+        workers = settings.SUBTITLE_CHUNK_WORKERS or max(1, (os.cpu_count() or 2) // 2)
+        threads = max(1, (os.cpu_count() or 1) // workers)
 
-            # 1. 청크 영상 추출
-            chunk_video = str(self.temp_dir / f"chunk_{chunk_id}.mp4")
-            cmd_extract = [
+        try:
+            # 1. 키프레임 분할 (경계 시각은 반올림 오차를 피해 1ms 앞당김)
+            split_times = ",".join(f"{start - 0.001:.6f}" for start, _ in chunks[1:])
+            self._run_ffmpeg([
                 "ffmpeg", "-y",
-                "-ss", str(chunk_start),
                 "-i", video_path,
-                "-t", str(chunk_end - chunk_start),
-                "-c:v", "libx264",
-                "-preset", self.FFMPEG_PRESET,
-                "-crf", "23",
-                "-c:a", "aac",
-                "-b:a", "192k",
-                chunk_video
-            ]
-            self._run_ffmpeg(cmd_extract)
+                "-map", "0:v:0",
+                "-c", "copy",
+                "-f", "segment",
+                "-segment_times", split_times,
+                "-segment_format", "mpegts",
+                "-reset_timestamps", "1",
+                str(work_dir / "chunk_%04d.ts")
+            ])
 
-            # 2. 이 청크에 해당하는 자막 필터링
-            chunk_entries = [
-                e for e in all_entries
-                if e.start < chunk_end and e.end > chunk_start
-            ]
+            # 2. 자막 있는 청크만 합성 (나머지는 원본 청크 사용)
+            def composite(index: int) -> str:
+                start, end = chunks[index]
+                chunk_path = str(work_dir / f"chunk_{index:04d}.ts")
+                chunk_frames = subtitles_in_range(frames, start, end)
+                if not chunk_frames:
+                    return chunk_path
 
-            # 3. 자막이 있으면 렌더링
-            if chunk_entries:
-                # 자막별 PNG 생성 (시간 오프셋 조정)
-                subtitle_pngs = []
-                for entry in chunk_entries:
-                    png_path = str(self.temp_dir / f"sub_{chunk_id}_{entry.index:04d}.png")
-                    renderer.render_subtitle_image(entry.text, png_path)
-
-                    # 청크 내 상대 시간으로 변환
-                    rel_start = max(0, entry.start - chunk_start)
-                    rel_end = min(chunk_end - chunk_start, entry.end - chunk_start)
-                    subtitle_pngs.append((png_path, rel_start, rel_end))
-
-                # overlay 합성
-                chunk_with_sub = str(self.temp_dir / f"chunk_sub_{chunk_id}.mp4")
-
-                inputs = ["-i", chunk_video]
-                for png_path, _, _ in subtitle_pngs:
-                    inputs.extend(["-i", png_path])
-
-                filter_parts = []
-                overlay_chain = "[0:v]"
-
-                for i, (png_path, start, end) in enumerate(subtitle_pngs, start=1):
-                    output_label = f"[v{i}]"
-                    filter_parts.append(
-                        f"{overlay_chain}[{i}:v]overlay=0:0:enable='between(t,{start:.3f},{end:.3f})'{output_label}"
-                    )
-                    overlay_chain = output_label
-
-                filter_complex = ";".join(filter_parts)
-
-                cmd_overlay = ["ffmpeg", "-y"] + inputs + [
-                    "-filter_complex", filter_complex,
-                    "-map", overlay_chain,
-                    "-map", "0:a",
+                track_path = write_overlay_track(
+                    chunk_frames, blank_png, str(work_dir / f"track_{index:04d}.ffconcat"), offset=start
+                )
+                subbed_path = str(work_dir / f"chunk_sub_{index:04d}.ts")
+                self._run_ffmpeg(["ffmpeg", "-y", "-i", chunk_path] + overlay_track_input(track_path) + [
+                    "-filter_complex", f"[0:v][1:v]overlay={x}:{y}:format=auto:eof_action=repeat,format=yuv420p[v]",
+                    "-map", "[v]",
                     "-c:v", "libx264",
                     "-preset", self.FFMPEG_PRESET,
                     "-crf", "23",
-                    "-c:a", "copy",
-                    chunk_with_sub
-                ]
-                self._run_ffmpeg(cmd_overlay)
-
-                # PNG 정리
-                renderer.cleanup([p for p, _, _ in subtitle_pngs])
-
-                # 원본 청크 삭제
-                self._cleanup_temp([chunk_video])
-                chunk_videos.append(chunk_with_sub)
-            else:
-                # 자막 없으면 그대로 사용
-                chunk_videos.append(chunk_video)
+                    "-threads", str(threads),
+                    "-f", "mpegts",
+                    subbed_path
+                ])
+                return subbed_path
 
-            chunk_start = chunk_end
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                chunk_videos = list(pool.map(composite, range(len(chunks))))
 
-        # 4. 모든 청크 concat
-        if len(chunk_videos) == 1:
-            # 청크가 1개면 그대로 사용
-            os.rename(chunk_videos[0], output_path)
-        else:
-            # concat 리스트 파일 생성
-            concat_list = str(self.temp_dir / f"concat_{uuid4()}.txt")
+            # 3. 무손실 연결 + 원본 오디오 mux
+            concat_list = work_dir / "concat.txt"
             with open(concat_list, "w") as f:
                 for chunk in chunk_videos:
                     escaped = chunk.replace("'", "'\\''")
                     f.write(f"file '{escaped}'\n")
 
-            cmd_concat = [
+            self._run_ffmpeg([
                 "ffmpeg", "-y",
                 "-f", "concat",
                 "-safe", "0",
-                "-i", concat_list,
-                "-c:v", "libx264",
-                "-preset", self.FFMPEG_PRESET,
-                "-crf", "23",
-                "-c:a", "aac",
-                "-b:a", "192k",
+                "-i", str(concat_list),
+                "-i", video_path,
+                "-map", "0:v",
+                "-map", "1:a?",
+                "-c", "copy",
                 "-movflags", "+faststart",
                 output_path
-            ]
-            self._run_ffmpeg(cmd_concat)
+            ])
 
-            # 정리
-            self._cleanup_temp(chunk_videos + [concat_list])
+            subbed = sum(1 for c in chunk_videos if "chunk_sub_" in c)
+            logger.info(
+                f"Chunked subtitle processing complete: {len(chunks)} chunks "
+                f"({subbed} composited, {workers} workers)"
+            )
+
+        finally:
+            renderer.cleanup(list({png for png, _, _ in frames}) + [blank_png])
+            shutil.rmtree(work_dir, ignore_errors=True)
 
-        logger.info(f"Chunked subtitle processing complete: {len(chunk_videos)} chunks")
+    def _probe_keyframes(self, video_path: str) -> tuple[list[float], float]:
+        """
+        영상 키프레임 시각 + 전체 길이 조회 (패킷 플래그만 읽음, 디코딩 없음)
+
+        Returns:
+            (키프레임 시각 리스트, 전체 길이 초) - 실패 시 ([], 0.0)
+        """
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "packet=pts_time,flags:format=duration",
+            "-of", "json",
+            video_path
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        try:
+            data = json.loads(result.stdout)
+            keyframes = [
+                float(packet["pts_time"])
+                for packet in data.get("packets", [])
+                if "K" in packet.get("flags", "") and packet.get("pts_time") not in (None, "N/A")
+            ]
+            return keyframes, float(data.get("format", {}).get("duration", 0))
+        except (json.JSONDecodeError, ValueError):
+            logger.warning(f"Keyframe probe failed for {video_path}")
+            return [], 0.0
 
     def _add_subtitles_ffmpeg(
         self,
@@ -1039,8 +1464,10 @@ class VideoComposer:
 
         self._run_ffmpeg(cmd)
 
-    def _run_ffmpeg(self, cmd: list[str]) -> None:
-        """FFmpeg 명령 실행"""
+    def _run_ffmpeg(self, cmd: list[str], nice: int = 0) -> None:
+        """FFmpeg 명령 실행 (nice > 0이면 낮은 CPU 우선순위로 실행)"""
+        if nice > 0 and shutil.which("nice"):
+            cmd = ["nice", "-n", str(nice)] + cmd
         logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
         try:
@@ -1103,7 +1530,6 @@ class VideoComposer:
                 "-print_format", "json"
             ]
             result = subprocess.run(cmd3, capture_output=True, text=True)
-            import json
             try:
                 data = json.loads(result.stdout)
                 duration_str = data.get("format", {}).get("duration", "0")
@@ -4,14 +4,16 @@
 선택된 클립들을 다운로드/전처리하여 베이스 영상 생성
 """
 import logging
+import os
 import subprocess
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
 
-import requests
-
+from app.services.clip_cache import get_clip_cache, link_or_copy
+from app.services.render_graph import RenderClip
 from app.services.video_clip_selector import SelectedClip
 from app.services.video import get_video_composer
 
@@ -33,26 +35,41 @@ class VideoClipProcessor:
     영상 클립 처리기
 
     처리 순서:
-    1. Pexels 영상 다운로드
-    2. 구간별 처리 (trim/loop/concat)
-    3. 모든 구간 합치기
+    1. Pexels 영상 다운로드 (I/O 풀, 구간 병렬)
+    2. 구간별 처리 (trim/loop/concat, 인코딩 풀 - 다운로드가 끝난 구간부터)
+    3. 모든 구간 합치기 (구간 순서 복원)
     4. 베이스 영상 반환 (자막/BGM은 VideoComposer에서 처리)
     """
 
-    def __init__(self, temp_dir: Optional[str] = None):
+    def __init__(
+        self,
+        temp_dir: Optional[str] = None,
+        download_workers: int = 4,
+        encode_workers: Optional[int] = None
+    ):
         """
         Args:
-            temp_dir: 임시 파일 저장 디렉토리 (None이면 시스템 기본)
+            temp_dir: 임시 파일 저장 디렉토리 (작업별 JobWorkspace 권장, None이면 인스턴스 전용 임시 디렉토리)
+            download_workers: 동시 다운로드 수
+            encode_workers: 동시 구간 인코딩 수 (None이면 CPU 코어 수 기준 자동)
         """
         if temp_dir:
             self.temp_dir = Path(temp_dir)
             self.temp_dir.mkdir(parents=True, exist_ok=True)
         else:
-            # 시스템 임시 디렉토리 사용
-            self.temp_dir = Path(tempfile.gettempdir()) / "qt_video_compositor"
-            self.temp_dir.mkdir(parents=True, exist_ok=True)
+            # 인스턴스 전용 임시 디렉토리 (고정 구간 파일명이 다른 작업과 충돌하지 않도록)
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="qt_video_compositor_"))
 
-        logger.info(f"VideoClipProcessor initialized with temp_dir: {self.temp_dir}")
+        # CPU 예산: 인코딩 N개 동시 실행 × FFmpeg 스레드 (코어 수 / N)
+        cpu_count = os.cpu_count() or 1
+        self.download_workers = max(1, download_workers)
+        self.encode_workers = max(1, encode_workers or max(1, cpu_count // 2))
+        self.encode_threads = max(1, cpu_count // self.encode_workers)
+
+        logger.info(
+            f"VideoClipProcessor initialized with temp_dir: {self.temp_dir} "
+            f"(download={self.download_workers}, encode={self.encode_workers}x{self.encode_threads} threads)"
+        )
 
         # FFmpeg 설치 확인
         self._check_ffmpeg()
@@ -92,7 +109,10 @@ class VideoClipProcessor:
         fade_duration: float = 1.0,
         outro_path: Optional[str] = None,
         outro_duration: float = 3.0,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        single_pass: bool = False,
+        preview_callback: Optional[callable] = None,
+        final_render_nice: int = 0
     ) -> CompositionResult:
         """
         선택된 클립들을 다운로드/처리 후 video.py에 위임
@@ -118,6 +138,11 @@ class VideoClipProcessor:
             outro_path: 아웃트로 이미지 경로 (선택)
             outro_duration: 아웃트로 표시 시간 (초)
             progress_callback: 진행률 콜백 (current_segment, total_segments)
+            single_pass: True면 구간 인코딩 없이 다운로드한 원본으로 단일 패스 렌더링
+                (render_graph, 베이스 영상도 같은 FFmpeg 실행에서 출력)
+            preview_callback: 미리보기 콜백 (draft_path) - 지정 시 최종 렌더 전에
+                같은 클립/컷으로 540p 초안을 먼저 렌더링해 전달 (single_pass 전용)
+            final_render_nice: 미리보기 이후 최종 렌더의 FFmpeg 우선순위 (nice 값)
 
         Returns:
             합성 결과
@@ -125,29 +150,32 @@ class VideoClipProcessor:
         output_path = Path(output_path)
         temp_files = []
 
+        if single_pass:
+            return self._compose_single_pass(
+                selected_clips, output_path, temp_files,
+                subtitle_path=subtitle_path,
+                audio_path=audio_path,
+                bgm_path=bgm_path,
+                bgm_volume=bgm_volume,
+                audio_duration=audio_duration,
+                thumbnail_path=thumbnail_path,
+                thumbnail_duration=thumbnail_duration,
+                fade_duration=fade_duration,
+                outro_path=outro_path,
+                outro_duration=outro_duration,
+                progress_callback=progress_callback,
+                preview_callback=preview_callback,
+                final_render_nice=final_render_nice
+            )
+
         try:
             logger.info(f"[VideoClipProcessor] Starting clip processing for {len(selected_clips)} segments")
 
-            # Step 1: 각 구간 처리 (VideoClipProcessor의 핵심 역할)
-            processed_segments = []
-            total_duration = 0.0
-
-            for idx, clip in enumerate(selected_clips, start=1):
-                segment_duration = clip.segment.end_time - clip.segment.start_time
-
-                # Progress callback 호출
-                if progress_callback:
-                    progress_callback(idx, len(selected_clips))
-
-                logger.info(
-                    f"Processing segment {idx}/{len(selected_clips)}: "
-                    f"{clip.segment.segment_type} ({segment_duration:.1f}s)"
-                )
-
-                # 구간별 영상 처리 (다운로드 + 트림)
-                segment_video = self._process_segment(clip, idx, temp_files)
-                processed_segments.append(segment_video)
-                total_duration += segment_duration
+            # Step 1: 각 구간 처리 (VideoClipProcessor의 핵심 역할, 구간 병렬)
+            processed_segments = self._prepare_segments(selected_clips, temp_files, progress_callback)
+            total_duration = sum(
+                clip.segment.end_time - clip.segment.start_time for clip in selected_clips
+            )
 
             # Step 2: 모든 구간 합치기 (concat만)
             logger.info("[VideoClipProcessor] Concatenating all segments")
@@ -205,6 +233,204 @@ class VideoClipProcessor:
         # 📝 Note: 성공 시 temp_files는 CompositionResult로 반환되어
         # 호출자(tasks.py)에서 output_path를 제외하고 정리함
 
+    def _compose_single_pass(
+        self,
+        selected_clips: List[SelectedClip],
+        output_path: Path,
+        temp_files: List[Path],
+        subtitle_path: Optional[str],
+        audio_path: Optional[str],
+        bgm_path: Optional[str],
+        bgm_volume: float,
+        audio_duration: Optional[int],
+        thumbnail_path: Optional[str],
+        thumbnail_duration: float,
+        fade_duration: float,
+        outro_path: Optional[str],
+        outro_duration: float,
+        progress_callback: Optional[callable] = None,
+        preview_callback: Optional[callable] = None,
+        final_render_nice: int = 0
+    ) -> CompositionResult:
+        """
+        단일 패스 합성: 원본 다운로드(병렬) → [미리보기 초안] → render_graph로 한 번에 인코딩
+
+        구간별 trim/loop는 입력 옵션(-t/-stream_loop)으로 처리하므로
+        구간 길이가 정확히 컷 길이와 일치한다 (자막 싱크 유지).
+        미리보기와 최종 렌더는 같은 다운로드 원본/렌더 클립을 사용한다.
+        """
+        try:
+            total_duration = sum(
+                clip.segment.end_time - clip.segment.start_time for clip in selected_clips
+            )
+
+            # Step 1: 원본 다운로드 (I/O 풀, 구간 순서대로 진행률 보고)
+            total = len(selected_clips)
+            with ThreadPoolExecutor(max_workers=max(1, min(self.download_workers, total))) as io_pool:
+                futures = [
+                    io_pool.submit(self._download_segment_sources, clip, idx, temp_files)
+                    for idx, clip in enumerate(selected_clips, start=1)
+                ]
+                sources = []
+                for idx, future in enumerate(futures, start=1):
+                    sources.append(future.result())
+                    if progress_callback:
+                        progress_callback(idx, total)
+
+            # Step 2: 구간 → 렌더 클립
+            render_clips = []
+            for clip, clip_sources in zip(selected_clips, sources):
+                render_clips.extend(self._render_clips_for_segment(clip, clip_sources))
+
+            video_composer = get_video_composer()
+            render_kwargs = dict(
+                clips=render_clips,
+                audio_path=audio_path,
+                srt_path=subtitle_path,
+                audio_duration=audio_duration or int(total_duration),
+                # 기본 BGM은 무작위 선택 → 미리보기와 최종 렌더가 같은 곡을 쓰도록 한 번만 결정
+                bgm_path=bgm_path or video_composer._get_default_bgm(),
+                bgm_volume=bgm_volume,
+                thumbnail_path=thumbnail_path,
+                thumbnail_duration=thumbnail_duration,
+                fade_duration=fade_duration,
+                outro_image_path=outro_path,
+                outro_duration=outro_duration
+            )
+
+            # Step 3: 미리보기 초안 (540p/ultrafast) → 콜백 (업로드 등)
+            if preview_callback:
+                draft_output = video_composer.render_single_pass(**render_kwargs, draft=True)
+                try:
+                    preview_callback(draft_output)
+                except Exception as e:
+                    logger.warning(f"[VideoClipProcessor] Preview callback failed (continuing): {e}")
+                finally:
+                    Path(draft_output).unlink(missing_ok=True)
+
+            # Step 4: 단일 패스 렌더링 (베이스 영상 동시 출력)
+            base_video = self.temp_dir / "final_video.mp4"
+            temp_files.append(base_video)
+
+            logger.info(f"[VideoClipProcessor] Single-pass render: {len(render_clips)} clips")
+            final_output = video_composer.render_single_pass(
+                **render_kwargs,
+                base_output_path=str(base_video),
+                nice=final_render_nice if preview_callback else 0
+            )
+
+            import shutil
+            shutil.move(final_output, output_path)
+            logger.info(f"[VideoClipProcessor] Final video saved to {output_path}")
+
+            return CompositionResult(
+                output_path=output_path,
+                total_duration=total_duration,
+                segments_count=len(selected_clips),
+                temp_files=temp_files,
+                base_video_path=base_video
+            )
+
+        except Exception as e:
+            logger.error(f"Single-pass composition failed: {e}")
+            self._cleanup_temp_files(temp_files)
+            raise
+
+    def _render_clips_for_segment(self, clip: SelectedClip, sources: List[Path]) -> List[RenderClip]:
+        """
+        구간 1개 → RenderClip 리스트 (합계 = 구간 길이)
+
+        다운로드 단계에서 정규화/로컬 클립으로 대체될 수 있어 원본 길이를 확신할 수 없으므로
+        항상 loop를 허용하고 -t로 필요한 길이만 읽는다.
+        """
+        segment_duration = clip.segment.end_time - clip.segment.start_time
+
+        if not clip.is_multi_video:
+            return [RenderClip(path=str(sources[0]), duration=segment_duration, loop=True)]
+
+        # 여러 영상: 앞에서부터 각 영상 길이만큼, 구간 길이를 넘지 않게
+        render_clips = []
+        remaining = segment_duration
+        for video, source in zip(clip.all_videos, sources):
+            if remaining <= 0:
+                break
+            use = min(float(getattr(video, 'duration', 0) or remaining), remaining)
+            render_clips.append(RenderClip(path=str(source), duration=use, loop=True))
+            remaining -= use
+        if remaining > 0:
+            last = render_clips[-1]
+            render_clips[-1] = RenderClip(path=last.path, duration=last.duration + remaining, loop=True)
+        return render_clips
+
+    def _prepare_segments(
+        self,
+        selected_clips: List[SelectedClip],
+        temp_files: List[Path],
+        progress_callback: Optional[callable] = None
+    ) -> List[Path]:
+        """
+        모든 구간 다운로드 + 인코딩 (병렬)
+
+        - 다운로드: I/O 풀 (download_workers)
+        - 인코딩: 다운로드가 끝난 구간부터 인코딩 풀 (encode_workers)에 투입
+          FFmpeg는 별도 프로세스이므로 스레드 풀로도 코어를 나눠 쓴다
+          (Celery prefork 워커는 daemon 프로세스라 ProcessPool 자식 생성 불가)
+        - progress_callback은 메인 스레드에서 구간 순서대로 호출
+
+        Returns:
+            구간 순서대로 처리된 영상 경로
+        """
+        total = len(selected_clips)
+        if total == 0:
+            return []
+
+        segment_temp_files = [[] for _ in range(total)]
+        processed: List[Optional[Path]] = [None] * total
+        next_to_report = 0
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.download_workers, total)) as io_pool, \
+                    ThreadPoolExecutor(max_workers=min(self.encode_workers, total)) as encode_pool:
+                pending = {
+                    io_pool.submit(self._download_segment_sources, clip, idx, segment_temp_files[idx - 1]):
+                        ("download", idx)
+                    for idx, clip in enumerate(selected_clips, start=1)
+                }
+
+                try:
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            stage, idx = pending.pop(future)
+                            result = future.result()  # 실패 시 예외 전파
+
+                            if stage == "download":
+                                encode_future = encode_pool.submit(
+                                    self._encode_segment,
+                                    selected_clips[idx - 1], idx, result, segment_temp_files[idx - 1]
+                                )
+                                pending[encode_future] = ("encode", idx)
+                                continue
+
+                            processed[idx - 1] = result
+
+                        # 완료된 구간을 순서대로 보고 (앞 구간이 끝나야 다음 구간 보고)
+                        while next_to_report < total and processed[next_to_report] is not None:
+                            next_to_report += 1
+                            if progress_callback:
+                                progress_callback(next_to_report, total)
+                except Exception:
+                    # 아직 시작 안 한 작업 취소 (실행 중인 작업은 풀 종료 시 대기)
+                    for future in pending:
+                        future.cancel()
+                    raise
+        finally:
+            # 풀 종료 후 (모든 작업이 끝난 뒤) 임시 파일 추적 목록 병합 → 실패 시에도 정리 가능
+            for files in segment_temp_files:
+                temp_files.extend(files)
+
+        return processed
+
     def _process_segment(
         self,
         clip: SelectedClip,
@@ -212,13 +438,66 @@ class VideoClipProcessor:
         temp_files: List[Path]
     ) -> Path:
         """
-        단일 구간 처리
+        단일 구간 처리 (다운로드 + 인코딩)
 
         Args:
             clip: 선택된 클립
             segment_idx: 구간 번호
             temp_files: 임시 파일 리스트 (추적용)
 
+        Returns:
+            처리된 영상 경로
+        """
+        sources = self._download_segment_sources(clip, segment_idx, temp_files)
+        return self._encode_segment(clip, segment_idx, sources, temp_files)
+
+    def _download_segment_sources(
+        self,
+        clip: SelectedClip,
+        segment_idx: int,
+        temp_files: List[Path]
+    ) -> List[Path]:
+        """
+        구간 원본 영상 다운로드
+
+        Returns:
+            다운로드된 영상 경로 리스트 (multi_video면 여러 개)
+        """
+        segment_duration = clip.segment.end_time - clip.segment.start_time
+        logger.info(
+            f"Downloading segment {segment_idx}: "
+            f"{clip.segment.segment_type} ({segment_duration:.1f}s)"
+        )
+
+        # 케이스 3: 여러 영상 (각 비디오 duration 기준 클립 선택)
+        if clip.is_multi_video:
+            downloaded_videos = []
+            for vid_idx, video in enumerate(clip.all_videos):
+                downloaded = self.temp_dir / f"seg{segment_idx}_vid{vid_idx}.mp4"
+                video_id = video.id if hasattr(video, 'id') else None
+                video_duration = video.duration if hasattr(video, 'duration') else 0
+                self._download_video(video.file_path, downloaded, video_id, min_duration=video_duration)
+                temp_files.append(downloaded)
+                downloaded_videos.append(downloaded)
+            return downloaded_videos
+
+        # 케이스 1, 2: 단일 영상 (segment_duration 기준 클립 선택)
+        downloaded = self.temp_dir / f"seg{segment_idx}_src.mp4"
+        video_id = clip.video.id if hasattr(clip.video, 'id') else None
+        self._download_video(clip.video.file_path, downloaded, video_id, min_duration=segment_duration)
+        temp_files.append(downloaded)
+        return [downloaded]
+
+    def _encode_segment(
+        self,
+        clip: SelectedClip,
+        segment_idx: int,
+        sources: List[Path],
+        temp_files: List[Path]
+    ) -> Path:
+        """
+        다운로드된 원본으로 구간 영상 인코딩
+
         Returns:
             처리된 영상 경로
         """
@@ -227,19 +506,19 @@ class VideoClipProcessor:
         # 케이스 1: 단일 영상 (trim 필요)
         if not clip.is_multi_video and clip.needs_trim:
             return self._process_single_trim(
-                clip, segment_idx, segment_duration, temp_files
+                clip, segment_idx, sources[0], temp_files
             )
 
         # 케이스 2: 단일 영상 (반복 재생)
         if not clip.is_multi_video and not clip.needs_trim:
             return self._process_single_loop(
-                clip, segment_idx, segment_duration, temp_files
+                clip, segment_idx, segment_duration, sources[0], temp_files
             )
 
         # 케이스 3: 2개 영상 조합 (human 폴백)
         if clip.is_multi_video:
             return self._process_multi_concat(
-                clip, segment_idx, temp_files
+                clip, segment_idx, sources, temp_files
             )
 
         raise ValueError(f"Unknown clip processing case: {clip}")
@@ -331,7 +610,7 @@ class VideoClipProcessor:
 
     def _download_video(self, url: str, output_path: Path, video_id: Optional[int] = None, min_duration: float = 0) -> Path:
         """
-        Pexels 영상 다운로드 (로컬 캐시 우선 사용)
+        Pexels 영상 다운로드 (로컬 캐시 우선 사용, 작업 디렉토리에는 하드링크)
 
         Args:
             url: 영상 URL
@@ -342,8 +621,6 @@ class VideoClipProcessor:
         Returns:
             다운로드된 파일 경로
         """
-        import shutil
-
         cache_dir = Path("/app/background_clips")
         normalized_dir = cache_dir / "normalized"
 
@@ -352,16 +629,14 @@ class VideoClipProcessor:
             selected_clip = self._select_clip_by_duration(min_duration, normalized_dir, "norm_")
             if selected_clip:
                 logger.info(f"[NORMALIZED] Using pre-encoded clip: {selected_clip.name} (fast concat enabled)")
-                shutil.copy(selected_clip, output_path)
-                return output_path
+                return link_or_copy(selected_clip, output_path)
 
         # Step 1: Pexels 캐시 확인 (Docker 빌드 시 사전 다운로드된 클립)
         if video_id:
             cached_file = cache_dir / f"pexels_{video_id}.mp4"
             if cached_file.exists():
                 logger.info(f"[CACHE HIT] Using cached Pexels clip: pexels_{video_id}.mp4")
-                shutil.copy(cached_file, output_path)
-                return output_path
+                return link_or_copy(cached_file, output_path)
 
         # Step 2: 로컬 클립 폴백 (bible_video_samples - 56개 자연 영상)
         # 여기도 duration 기준 선택 적용
@@ -379,18 +654,10 @@ class VideoClipProcessor:
                 else:
                     selected_clip = random.choice(local_clips)
                 logger.info(f"[LOCAL CLIP] Using local clip: {selected_clip.name}")
-                shutil.copy(selected_clip, output_path)
-                return output_path
-
-        # Step 3: 캐시 없으면 Pexels에서 다운로드
-        logger.info(f"[DOWNLOAD] Downloading from Pexels: {url[:50]}...")
-
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
+                return link_or_copy(selected_clip, output_path)
 
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Step 3: 런타임 클립 캐시 (없으면 Pexels에서 다운로드 후 캐시에 저장)
+        get_clip_cache().fetch(video_id, url, output_path)
 
         logger.info(f"Downloaded to {output_path}")
         return output_path
@@ -399,7 +666,7 @@ class VideoClipProcessor:
         self,
         clip: SelectedClip,
         segment_idx: int,
-        segment_duration: float,
+        downloaded: Path,
         temp_files: List[Path]
     ) -> Path:
         """
@@ -411,14 +678,7 @@ class VideoClipProcessor:
         """
         logger.info(f"Processing single video with trim: {clip.trim_duration:.1f}s")
 
-        # Step 1: 영상 다운로드 (segment_duration 기준 클립 선택)
-        video_url = clip.video.file_path
-        downloaded = self.temp_dir / f"seg{segment_idx}_src.mp4"
-        video_id = clip.video.id if hasattr(clip.video, 'id') else None
-        self._download_video(video_url, downloaded, video_id, min_duration=segment_duration)
-        temp_files.append(downloaded)
-
-        # Step 2: Trim
+        # Trim (다운로드는 _download_segment_sources에서 완료)
         trimmed = self.temp_dir / f"seg{segment_idx}_trimmed.mp4"
         temp_files.append(trimmed)
 
@@ -428,6 +688,7 @@ class VideoClipProcessor:
             "-t", str(clip.trim_duration),
             "-vf", "fps=30,format=yuv420p",  # ✅ 프레임레이트 통일 (프리징 방지)
             "-c:v", "libx264", "-preset", "fast", "-crf", "18",  # 고품질 (23→18)
+            "-threads", str(self.encode_threads),  # 병렬 인코딩 간 CPU 분배
             "-c:a", "aac", "-b:a", "192k",  # 오디오 품질 향상
             str(trimmed)
         ]
@@ -441,6 +702,7 @@ class VideoClipProcessor:
         clip: SelectedClip,
         segment_idx: int,
         segment_duration: float,
+        downloaded: Path,
         temp_files: List[Path]
     ) -> Path:
         """
@@ -459,14 +721,7 @@ class VideoClipProcessor:
             f"{video_duration:.1f}s × {repeat_times} times"
         )
 
-        # Step 1: 영상 다운로드 (segment_duration 기준 클립 선택)
-        video_url = clip.video.file_path
-        downloaded = self.temp_dir / f"seg{segment_idx}_src.mp4"
-        video_id = clip.video.id if hasattr(clip.video, 'id') else None
-        self._download_video(video_url, downloaded, video_id, min_duration=segment_duration)
-        temp_files.append(downloaded)
-
-        # Step 2: 반복 (stream_loop)
+        # 반복 (stream_loop, 다운로드는 _download_segment_sources에서 완료)
         looped = self.temp_dir / f"seg{segment_idx}_looped.mp4"
         temp_files.append(looped)
 
@@ -479,6 +734,7 @@ class VideoClipProcessor:
             "-i", str(downloaded),
             "-vf", "fps=30,format=yuv420p",  # ✅ 프레임레이트 통일 (프리징 방지)
             "-c:v", "libx264", "-preset", "fast", "-crf", "18",  # 고품질
+            "-threads", str(self.encode_threads),
             "-c:a", "aac", "-b:a", "192k",
             str(looped)
         ]
@@ -491,6 +747,7 @@ class VideoClipProcessor:
         self,
         clip: SelectedClip,
         segment_idx: int,
+        downloaded_videos: List[Path],
         temp_files: List[Path]
     ) -> Path:
         """
@@ -504,18 +761,7 @@ class VideoClipProcessor:
             f"{len(clip.all_videos)} videos"
         )
 
-        # Step 1: 모든 영상 다운로드 (각 비디오 duration 기준 클립 선택)
-        downloaded_videos = []
-        for vid_idx, video in enumerate(clip.all_videos):
-            video_url = video.file_path
-            downloaded = self.temp_dir / f"seg{segment_idx}_vid{vid_idx}.mp4"
-            video_id = video.id if hasattr(video, 'id') else None
-            video_duration = video.duration if hasattr(video, 'duration') else 0
-            self._download_video(video_url, downloaded, video_id, min_duration=video_duration)
-            temp_files.append(downloaded)
-            downloaded_videos.append(downloaded)
-
-        # Step 2: concat 리스트 파일 생성
+        # Step 1: concat 리스트 파일 생성 (다운로드는 _download_segment_sources에서 완료)
         concat_list = self.temp_dir / f"seg{segment_idx}_concat.txt"
         temp_files.append(concat_list)
 
@@ -525,7 +771,7 @@ class VideoClipProcessor:
                 unix_path = str(video_path).replace('\\', '/')
                 f.write(f"file '{unix_path}'\n")
 
-        # Step 3: concat
+        # Step 2: concat
         concatenated = self.temp_dir / f"seg{segment_idx}_concat.mp4"
         temp_files.append(concatenated)
 
@@ -536,6 +782,7 @@ class VideoClipProcessor:
             "-i", str(concat_list),
             "-vf", "fps=30,format=yuv420p",  # ✅ 프레임레이트 통일 (프리징 방지)
             "-c:v", "libx264", "-preset", "fast", "-crf", "18",  # 고품질
+            "-threads", str(self.encode_threads),
             "-c:a", "aac", "-b:a", "192k",
             str(concatenated)
         ]
@@ -655,6 +902,14 @@ class VideoClipProcessor:
         self._cleanup_temp_files(result.temp_files)
 
 
-def get_clip_processor(temp_dir: Optional[str] = None) -> VideoClipProcessor:
+def get_clip_processor(
+    temp_dir: Optional[str] = None,
+    download_workers: int = 4,
+    encode_workers: Optional[int] = None
+) -> VideoClipProcessor:
     """VideoClipProcessor 팩토리 함수"""
-    return VideoClipProcessor(temp_dir=temp_dir)
+    return VideoClipProcessor(
+        temp_dir=temp_dir,
+        download_workers=download_workers,
+        encode_workers=encode_workers
+    )
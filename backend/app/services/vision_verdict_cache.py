@@ -0,0 +1,320 @@
+"""
+Gemini Vision 판정 캐시 (Pexels 영상 ID 기준)
+
+같은 인기 Pexels 영상이 여러 교회 검색 결과에 반복 등장하므로,
+썸네일 다운로드 + Gemini Vision 호출 전에 이전 판정을 먼저 조회한다.
+
+- verdict: _verify_with_gemini_vision 결과 (accept/reject)
+- score: _score_with_gemini_vision 결과 (VisionScore 필드)
+- 프롬프트 버전이 다르면 이전 판정은 무시 (프롬프트 수정 시 자동 재검증)
+- blacklist_clips 테이블의 클립은 영구 REJECT (API 호출 없음)
+
+저장소 (VISION_CACHE_BACKEND):
+- "redis": 모든 워커 공유 (기본, TTL 적용)
+- "supabase": vision_verdicts 테이블 (영구 보관)
+- "sqlite": 로컬 파일 (테스트/개발용)
+- "none": 캐시 비활성화
+"""
+import json
+import logging
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 프롬프트 버전 (프롬프트를 수정하면 반드시 올릴 것 → 기존 판정 무효화)
+VERDICT_PROMPT_VERSION = "verify-2026-01-21"
+SCORE_PROMPT_VERSION = "score-v1.5"
+
+KIND_VERDICT = "verdict"
+KIND_SCORE = "score"
+
+
+@dataclass
+class VisionRecord:
+    """저장된 Vision 판정"""
+    video_id: int
+    kind: str                 # "verdict" / "score"
+    prompt_version: str
+    accepted: bool
+    checked_at: float = field(default_factory=time.time)
+    score: Optional[dict] = None  # kind == "score"일 때 VisionScore 필드
+
+    def to_json(self) -> str:
+        return json.dumps(self.__dict__, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "VisionRecord":
+        return cls(**json.loads(raw))
+
+
+# ===================
+# 저장소
+# ===================
+
+class VisionVerdictStore(ABC):
+    """판정 저장소 인터페이스"""
+
+    @abstractmethod
+    def get(self, video_id: int, kind: str) -> Optional[VisionRecord]:
+        """저장된 판정 (없으면 None)"""
+
+    @abstractmethod
+    def put(self, record: VisionRecord) -> None:
+        """판정 저장 (같은 영상/종류는 덮어씀)"""
+
+
+class RedisVerdictStore(VisionVerdictStore):
+    """Redis 저장소 (워커 간 공유)"""
+
+    def __init__(self, redis_client, ttl_seconds: int, prefix: str = "qt:vision"):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def _key(self, video_id: int, kind: str) -> str:
+        return f"{self.prefix}:{kind}:{video_id}"
+
+    def get(self, video_id: int, kind: str) -> Optional[VisionRecord]:
+        raw = self.redis.get(self._key(video_id, kind))
+        return VisionRecord.from_json(raw) if raw else None
+
+    def put(self, record: VisionRecord) -> None:
+        self.redis.set(
+            self._key(record.video_id, record.kind),
+            record.to_json(),
+            ex=self.ttl_seconds
+        )
+
+
+class SupabaseVerdictStore(VisionVerdictStore):
+    """Supabase vision_verdicts 테이블 저장소 (영구 보관)"""
+
+    TABLE = "vision_verdicts"
+
+    def __init__(self, supabase_client):
+        self.supabase = supabase_client
+
+    def get(self, video_id: int, kind: str) -> Optional[VisionRecord]:
+        result = self.supabase.table(self.TABLE) \
+            .select("video_id, kind, prompt_version, accepted, checked_at_epoch, score") \
+            .eq("video_id", video_id) \
+            .eq("kind", kind) \
+            .limit(1) \
+            .execute()
+
+        if not result.data:
+            return None
+        row = result.data[0]
+        return VisionRecord(
+            video_id=row["video_id"],
+            kind=row["kind"],
+            prompt_version=row["prompt_version"],
+            accepted=row["accepted"],
+            checked_at=row["checked_at_epoch"],
+            score=row.get("score")
+        )
+
+    def put(self, record: VisionRecord) -> None:
+        self.supabase.table(self.TABLE).upsert({
+            "video_id": record.video_id,
+            "kind": record.kind,
+            "prompt_version": record.prompt_version,
+            "accepted": record.accepted,
+            "checked_at_epoch": record.checked_at,
+            "score": record.score
+        }, on_conflict="video_id,kind").execute()
+
+
+class SQLiteVerdictStore(VisionVerdictStore):
+    """로컬 SQLite 저장소 (테스트/개발용)"""
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS vision_verdicts (
+                    video_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    record TEXT NOT NULL,
+                    PRIMARY KEY (video_id, kind)
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, video_id: int, kind: str) -> Optional[VisionRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM vision_verdicts WHERE video_id = ? AND kind = ?",
+                (video_id, kind)
+            ).fetchone()
+        return VisionRecord.from_json(row[0]) if row else None
+
+    def put(self, record: VisionRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO vision_verdicts (video_id, kind, record) VALUES (?, ?, ?)",
+                (record.video_id, record.kind, record.to_json())
+            )
+            self._conn.commit()
+
+
+# ===================
+# 캐시
+# ===================
+
+class VisionVerdictCache:
+    """
+    Vision 판정 캐시 (블랙리스트 병합)
+
+    저장소 오류는 경고만 남기고 캐시 미스로 처리한다 (검색은 계속 진행).
+    """
+
+    def __init__(
+        self,
+        store: Optional[VisionVerdictStore],
+        blacklist_loader: Optional[Callable[[], Iterable[int]]] = None,
+        blacklist_refresh_seconds: int = 600
+    ):
+        """
+        Args:
+            store: 판정 저장소 (None이면 블랙리스트만 적용)
+            blacklist_loader: 영구 REJECT 클립 ID 로더 (blacklist_clips)
+            blacklist_refresh_seconds: 블랙리스트 재조회 주기 (초)
+        """
+        self.store = store
+        self.blacklist_loader = blacklist_loader
+        self.blacklist_refresh_seconds = blacklist_refresh_seconds
+        self._blacklist: set = set()
+        self._blacklist_loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_blacklisted(self, video_id: int) -> bool:
+        """영구 블랙리스트 여부 (blacklist_clips)"""
+        self._refresh_blacklist()
+        return video_id in self._blacklist
+
+    def get_verdict(self, video_id: int) -> Optional[bool]:
+        """
+        이전 accept/reject 판정
+
+        Returns:
+            True/False (캐시 히트) 또는 None (판정 필요)
+        """
+        if self.is_blacklisted(video_id):
+            return False
+
+        record = self._get(video_id, KIND_VERDICT, VERDICT_PROMPT_VERSION)
+        return record.accepted if record else None
+
+    def put_verdict(self, video_id: int, accepted: bool) -> None:
+        self._put(VisionRecord(
+            video_id=video_id,
+            kind=KIND_VERDICT,
+            prompt_version=VERDICT_PROMPT_VERSION,
+            accepted=accepted
+        ))
+
+    def get_score(self, video_id: int) -> Optional[dict]:
+        """
+        이전 점수화 결과 (VisionScore 필드 dict)
+
+        블랙리스트 클립은 hard reject 점수를 반환한다.
+        """
+        if self.is_blacklisted(video_id):
+            return {"hard_reject": True, "reject_reason": "blacklisted"}
+
+        record = self._get(video_id, KIND_SCORE, SCORE_PROMPT_VERSION)
+        return record.score if record else None
+
+    def put_score(self, video_id: int, score: dict) -> None:
+        self._put(VisionRecord(
+            video_id=video_id,
+            kind=KIND_SCORE,
+            prompt_version=SCORE_PROMPT_VERSION,
+            accepted=not score.get("hard_reject", False),
+            score=score
+        ))
+
+    def _get(self, video_id: int, kind: str, prompt_version: str) -> Optional[VisionRecord]:
+        if self.store is None:
+            return None
+        try:
+            record = self.store.get(video_id, kind)
+        except Exception as e:
+            logger.warning(f"[VisionCache] 조회 실패 (캐시 미스 처리): {e}")
+            return None
+
+        if record and record.prompt_version != prompt_version:
+            return None  # 프롬프트 변경 → 재검증
+        return record
+
+    def _put(self, record: VisionRecord) -> None:
+        if self.store is None:
+            return
+        try:
+            self.store.put(record)
+        except Exception as e:
+            logger.warning(f"[VisionCache] 저장 실패 (무시): {e}")
+
+    def _refresh_blacklist(self) -> None:
+        if self.blacklist_loader is None:
+            return
+        now = time.time()
+        if now - self._blacklist_loaded_at < self.blacklist_refresh_seconds:
+            return
+
+        with self._lock:
+            if now - self._blacklist_loaded_at < self.blacklist_refresh_seconds:
+                return
+            try:
+                self._blacklist = set(self.blacklist_loader())
+                logger.info(f"[VisionCache] 블랙리스트 로드: {len(self._blacklist)}개")
+            except Exception as e:
+                logger.warning(f"[VisionCache] 블랙리스트 로드 실패 (이전 목록 유지): {e}")
+            self._blacklist_loaded_at = now
+
+
+def _load_blacklist_clip_ids() -> list[int]:
+    """blacklist_clips 테이블 → Pexels 영상 ID 리스트"""
+    from app.database import get_supabase
+
+    result = get_supabase().table("blacklist_clips").select("clip_id").execute()
+    return [row["clip_id"] for row in (result.data or [])]
+
+
+# 싱글톤
+_vision_verdict_cache: VisionVerdictCache | None = None
+
+
+def get_vision_verdict_cache() -> VisionVerdictCache:
+    """VisionVerdictCache 싱글톤 (VISION_CACHE_BACKEND 설정에 따라 저장소 선택)"""
+    global _vision_verdict_cache
+    if _vision_verdict_cache is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        backend = settings.VISION_CACHE_BACKEND
+
+        if backend == "redis":
+            from app.database import get_redis
+            store = RedisVerdictStore(get_redis(), ttl_seconds=settings.VISION_CACHE_TTL_DAYS * 86400)
+        elif backend == "supabase":
+            from app.database import get_supabase
+            store = SupabaseVerdictStore(get_supabase())
+        elif backend == "sqlite":
+            store = SQLiteVerdictStore(settings.VISION_CACHE_SQLITE_PATH)
+        else:
+            store = None
+
+        _vision_verdict_cache = VisionVerdictCache(store, blacklist_loader=_load_blacklist_clip_ids)
+        logger.info(f"[VisionCache] Initialized (backend={backend})")
+    return _vision_verdict_cache
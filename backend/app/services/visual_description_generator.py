@@ -8,8 +8,10 @@ Visual Description Generator (Stage 2: 감독 모드) - QT/성경 특화 버전
 - 얼굴이 나오지 않는 자연/추상 영상 위주
 - 성경 고유명사 → 적절한 시각 키워드 매핑
 """
+import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -168,6 +170,10 @@ class VisualDescriptionGenerator:
     MODE_STANDARD = "standard"  # Faceless people allowed (3-4 per 2-min video)
     MODE_SYMBOLIC = "symbolic"  # Symbolic images (praying hands, bible, cross)
 
+    # Batch settings (generate_batch)
+    BATCH_SIZE = 25               # Cuts per structured-JSON request
+    MAX_CONCURRENT_REQUESTS = 4   # Parallel requests (batch chunks / per-cut fallback)
+
     def __init__(
         self,
         gemini_api_key: str = None,
@@ -271,49 +277,9 @@ class VisualDescriptionGenerator:
             logger.info(f"[VisualDescGen] Bible hints found: {bible_hints[:60]}...")
 
         # Step 2: QT 특화 프롬프트
-        # prefer_symbolic일 경우 상징 이미지 우선
-        if self.prefer_symbolic:
-            style_instruction = "SYMBOLIC RELIGIOUS IMAGERY: praying hands, bible, cross, candles, worship hands"
-        elif self.allow_people:
-            style_instruction = "BIBLICAL SCENES with people when appropriate"
-        else:
-            style_instruction = "NATURE and ATMOSPHERIC imagery"
-        
-        if self.prefer_symbolic:
-            avoid_instruction = "Include symbolic religious objects (hands, cross, bible, candles). Avoid faces and cityscapes."
-        elif self.allow_people:
-            avoid_instruction = "Include people, biblical characters, worship scenes when relevant"
-        else:
-            avoid_instruction = "NEVER include human faces or specific people"
-            
         prompt = f'''You are a **Christian QT (Quiet Time) video specialist**. Generate Pexels search keywords for meditation/devotional background videos.
 
-**CRITICAL CONTEXT**: This is for Korean church QT videos - devotional content based on Bible verses.
-
-**STRICT RULES**:
-1. Output 5-8 keywords ONLY (not sentences)
-2. Focus on {style_instruction}
-3. {avoid_instruction}
-4. Match the EMOTIONAL/SPIRITUAL TONE, not literal illustrations
-5. {'Prefer: praying hands, open bible, cross silhouette, candles, worship hands raised' if self.prefer_symbolic else ('Prefer: landscapes, light effects, weather, abstract nature' if not self.allow_people else 'Prefer: biblical scenes, worship, prayer, people in devotion, nature')}
-
-**Content Matching Strategy**:
-
-1. 성경 인물/사건 (Biblical references):
-   - 세례요한, 광야, 선지자 → `wilderness desert ancient ruins dramatic sky`
-   - 예수님, 십자가 → `cross silhouette light rays sunrise hope redemption`
-   - 천국, 하나님나라 → `clouds golden light ethereal heavenly peaceful`
-   - 죄, 회개 → `rain dark storm contemplation cleansing renewal`
-
-2. 감정 톤 (Emotional tone):
-   - 희망/기쁨 → `sunrise golden hour light rays nature hope`
-   - 슬픔/회개 → `rain clouds moody contemplation solitude`
-   - 평화/안식 → `calm water lake reflection serene quiet`
-   - 경고/심판 → `storm lightning dramatic sky intense clouds`
-
-3. 인사/마무리 (Opening/Closing):
-   - 아침 인사 → `sunrise coffee cup peaceful morning devotion`
-   - 기도 권유 → `praying hands candle contemplation worship`
+{self._build_rules_section()}
 
 {f"**BIBLE CONTEXT HINTS**: {bible_hints}" if bible_hints else ""}
 
@@ -331,7 +297,6 @@ Output (JSON only):
             response_text = response.text.strip()
 
             # JSON 파싱
-            import json
             json_match = re.search(r'```json\s*(\{.*?\})\s*```', response_text, re.DOTALL)
             if json_match:
                 json_str = json_match.group(1)
@@ -352,24 +317,7 @@ Output (JSON only):
                     )
 
             parsed = json.loads(json_str)
-            visual_query = parsed.get("description", "")
-            
-            # Bible hints가 있고 LLM 결과에 없으면 추가
-            if bible_hints and visual_query:
-                # 핵심 키워드만 추가 (중복 제거)
-                llm_words = set(visual_query.lower().split())
-                hint_words = bible_hints.lower().split()[:4]  # 상위 4개만
-                new_words = [w for w in hint_words if w not in llm_words]
-                if new_words:
-                    visual_query = f"{visual_query} {' '.join(new_words)}"
-
-            result = VisualDescription(
-                original_text=combined_text,
-                visual_query=visual_query or (bible_hints if bible_hints else "peaceful nature"),
-                description_type=parsed.get("type", "abstract"),
-                confidence=float(parsed.get("confidence", 0.8)),
-                bible_hints=bible_hints
-            )
+            result = self._build_description(combined_text, parsed, bible_hints)
 
             logger.info(
                 f"[VisualDescGen] 자막: '{combined_text[:40]}...' → "
@@ -388,6 +336,77 @@ Output (JSON only):
                 bible_hints=bible_hints
             )
 
+    def _build_rules_section(self) -> str:
+        """모드별 규칙 + 콘텐츠 매칭 전략 (단건/배치 프롬프트 공용)"""
+        # prefer_symbolic일 경우 상징 이미지 우선
+        if self.prefer_symbolic:
+            style_instruction = "SYMBOLIC RELIGIOUS IMAGERY: praying hands, bible, cross, candles, worship hands"
+        elif self.allow_people:
+            style_instruction = "BIBLICAL SCENES with people when appropriate"
+        else:
+            style_instruction = "NATURE and ATMOSPHERIC imagery"
+        
+        if self.prefer_symbolic:
+            avoid_instruction = "Include symbolic religious objects (hands, cross, bible, candles). Avoid faces and cityscapes."
+        elif self.allow_people:
+            avoid_instruction = "Include people, biblical characters, worship scenes when relevant"
+        else:
+            avoid_instruction = "NEVER include human faces or specific people"
+
+        return f'''**CRITICAL CONTEXT**: This is for Korean church QT videos - devotional content based on Bible verses.
+
+**STRICT RULES**:
+1. Output 5-8 keywords ONLY (not sentences)
+2. Focus on {style_instruction}
+3. {avoid_instruction}
+4. Match the EMOTIONAL/SPIRITUAL TONE, not literal illustrations
+5. {'Prefer: praying hands, open bible, cross silhouette, candles, worship hands raised' if self.prefer_symbolic else ('Prefer: landscapes, light effects, weather, abstract nature' if not self.allow_people else 'Prefer: biblical scenes, worship, prayer, people in devotion, nature')}
+
+**Content Matching Strategy**:
+
+1. 성경 인물/사건 (Biblical references):
+   - 세례요한, 광야, 선지자 → `wilderness desert ancient ruins dramatic sky`
+   - 예수님, 십자가 → `cross silhouette light rays sunrise hope redemption`
+   - 천국, 하나님나라 → `clouds golden light ethereal heavenly peaceful`
+   - 죄, 회개 → `rain dark storm contemplation cleansing renewal`
+
+2. 감정 톤 (Emotional tone):
+   - 희망/기쁨 → `sunrise golden hour light rays nature hope`
+   - 슬픔/회개 → `rain clouds moody contemplation solitude`
+   - 평화/안식 → `calm water lake reflection serene quiet`
+   - 경고/심판 → `storm lightning dramatic sky intense clouds`
+
+3. 인사/마무리 (Opening/Closing):
+   - 아침 인사 → `sunrise coffee cup peaceful morning devotion`
+   - 기도 권유 → `praying hands candle contemplation worship`
+'''
+
+    def _build_description(
+        self,
+        combined_text: str,
+        parsed: dict,
+        bible_hints: Optional[str]
+    ) -> VisualDescription:
+        """LLM JSON 결과 → VisualDescription (성경 힌트 병합)"""
+        visual_query = parsed.get("description", "")
+        
+        # Bible hints가 있고 LLM 결과에 없으면 추가
+        if bible_hints and visual_query:
+            # 핵심 키워드만 추가 (중복 제거)
+            llm_words = set(visual_query.lower().split())
+            hint_words = bible_hints.lower().split()[:4]  # 상위 4개만
+            new_words = [w for w in hint_words if w not in llm_words]
+            if new_words:
+                visual_query = f"{visual_query} {' '.join(new_words)}"
+
+        return VisualDescription(
+            original_text=combined_text,
+            visual_query=visual_query or (bible_hints if bible_hints else "peaceful nature"),
+            description_type=parsed.get("type", "abstract"),
+            confidence=float(parsed.get("confidence", 0.8)),
+            bible_hints=bible_hints
+        )
+
     def _fallback_translation(self, text: str) -> str:
         """
         LLM 실패 시 폴백: 기본 QT 시각 키워드
@@ -403,30 +422,126 @@ Output (JSON only):
     def generate_batch(
         self,
         subtitle_groups: List[List[str]],
-        context: str = "qt_devotion"
+        context: str = "qt_devotion",
+        batch_size: int = None,
+        max_workers: int = None
     ) -> List[VisualDescription]:
         """
         여러 컷의 자막을 배치로 처리
 
+        컷 batch_size개씩 하나의 구조화 JSON 요청으로 묶어 보내고 (요청끼리는 병렬),
+        응답에서 빠졌거나 파싱에 실패한 컷만 generate_description으로
+        max_workers개까지 동시에 개별 재요청한다.
+
         Args:
             subtitle_groups: 컷별 자막 리스트
             context: 영상 컨텍스트
+            batch_size: 요청당 컷 수 (기본: BATCH_SIZE)
+            max_workers: 동시 요청 수 (기본: MAX_CONCURRENT_REQUESTS)
 
         Returns:
-            시각적 묘사 리스트
+            시각적 묘사 리스트 (입력 순서 유지)
         """
-        descriptions = []
-
-        for idx, subtitle_texts in enumerate(subtitle_groups):
-            logger.info(f"[VisualDescGen] Processing cut {idx+1}/{len(subtitle_groups)}")
-            desc = self.generate_description(subtitle_texts, context)
-            descriptions.append(desc)
-
-            logger.info(
-                f"  원본: {desc.original_text[:50]}...\n"
-                f"  검색어: {desc.visual_query}\n"
-                f"  타입: {desc.description_type} (conf: {desc.confidence:.2f})"
-                + (f"\n  성경힌트: {desc.bible_hints[:40]}..." if desc.bible_hints else "")
+        if not subtitle_groups:
+            return []
+
+        batch_size = batch_size or self.BATCH_SIZE
+        max_workers = max_workers or self.MAX_CONCURRENT_REQUESTS
+
+        chunks = [
+            list(range(start, min(start + batch_size, len(subtitle_groups))))
+            for start in range(0, len(subtitle_groups), batch_size)
+        ]
+
+        descriptions: List[Optional[VisualDescription]] = [None] * len(subtitle_groups)
+
+        # Step 1: 컷 묶음별 배치 요청 (묶음끼리 병렬)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            chunk_results = executor.map(
+                lambda indices: self._generate_chunk(
+                    [(idx, subtitle_groups[idx]) for idx in indices]
+                ),
+                chunks
             )
+            for result in chunk_results:
+                for idx, desc in result.items():
+                    descriptions[idx] = desc
+
+        # Step 2: 배치에서 빠진 컷만 개별 요청 (bounded 병렬)
+        missing = [idx for idx, desc in enumerate(descriptions) if desc is None]
+        if missing:
+            logger.warning(
+                f"[VisualDescGen] 배치 응답 누락 {len(missing)}개 컷 → 개별 요청 (동시 {max_workers}개)"
+            )
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                fallback_results = executor.map(
+                    lambda idx: self.generate_description(subtitle_groups[idx], context),
+                    missing
+                )
+                for idx, desc in zip(missing, fallback_results):
+                    descriptions[idx] = desc
 
+        logger.info(
+            f"[VisualDescGen] 배치 완료: {len(subtitle_groups)}개 컷, "
+            f"요청 {len(chunks)}회 + 개별 {len(missing)}회"
+        )
         return descriptions
+
+    def _generate_chunk(self, items: List[tuple]) -> dict:
+        """
+        컷 묶음 하나를 단일 구조화 JSON 요청으로 처리
+
+        Args:
+            items: [(컷 인덱스, 자막 리스트), ...]
+
+        Returns:
+            {컷 인덱스: VisualDescription} (실패/누락 컷은 제외)
+        """
+        cut_entries = []
+        cut_meta = {}
+        for idx, subtitle_texts in items:
+            combined_text = " ".join(subtitle_texts)
+            bible_hints = self._get_bible_visual_hints(combined_text)
+            cut_meta[idx] = (combined_text, bible_hints)
+
+            entry = {"id": idx, "subtitle": combined_text}
+            if bible_hints:
+                entry["bible_hints"] = bible_hints
+            cut_entries.append(entry)
+
+        prompt = f'''You are a **Christian QT (Quiet Time) video specialist**. Generate Pexels search keywords for meditation/devotional background videos.
+
+{self._build_rules_section()}
+
+**Cuts** (one Korean subtitle group per cut; use "bible_hints" when present):
+{json.dumps(cut_entries, ensure_ascii=False)}
+
+Output a JSON array with exactly one object per cut, same "id":
+[
+  {{"id": <cut id>, "type": "literal" or "abstract", "description": "your 5-8 keywords", "confidence": 0.0-1.0}}
+]'''
+
+        try:
+            response = self.model.generate_content(
+                prompt,
+                generation_config={"response_mime_type": "application/json"}
+            )
+            parsed_list = json.loads(response.text.strip())
+            if not isinstance(parsed_list, list):
+                raise ValueError("batch response is not a JSON array")
+        except Exception as e:
+            logger.warning(f"[VisualDescGen] 배치 요청 실패 ({len(items)}개 컷): {e}")
+            return {}
+
+        results = {}
+        for parsed in parsed_list:
+            try:
+                idx = int(parsed["id"])
+                if idx not in cut_meta or idx in results or not parsed.get("description"):
+                    continue
+                combined_text, bible_hints = cut_meta[idx]
+                results[idx] = self._build_description(combined_text, parsed, bible_hints)
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        return results
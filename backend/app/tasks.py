@@ -1,29 +1,48 @@
 """
 Celery 백그라운드 작업 - QT 영상 생성 파이프라인
 """
+import hashlib
 import logging
 import os
+import shutil
 import tempfile as tempfile_module
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
 import urllib.parse
-from uuid import uuid4
-
-import httpx as httpx_module
 
 from celery import Task
 
 from app.celery_app import celery_app
 from app.config import get_settings
+from app.services.asset_cache import get_asset_cache
 from app.services.clips import get_clip_selector
+from app.services.dictionary_cache import get_dictionary_cache
+from app.services.downloader import DownloadError, get_downloader
 from app.services.storage import get_r2_storage
+from app.services.speech_audio import normalize_speech_audio, speech_audio_settings
 from app.services.stt import get_whisper_service
 from app.services.stt_correction import get_correction_service
 from app.services.video import get_video_composer
 from app.services.thumbnail import get_thumbnail_generator
 from app.services.fixed_segment_analyzer import get_fixed_segment_analyzer
 from app.services.video_clip_selector import get_clip_selector as get_new_clip_selector
+from app.services.job_workspace import JobWorkspace
 from app.services.video_clip_processor import get_clip_processor
 from app.services.clip_history import get_clip_history_service
+from app.services.render_artifacts import RenderArtifactCache, artifact_key, hash_file
+from app.services.pipeline_checkpoint import (
+    PIPELINE_STAGES,
+    PipelineCheckpoint,
+    deserialize_cut,
+    deserialize_transcription,
+    deserialize_video,
+    serialize_cut,
+    serialize_transcription,
+    serialize_video,
+)
+from app.services.visual_description_generator import VisualDescription
+from app.services.cut_search_scheduler import ClipReservation, CutSearchScheduler
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -86,23 +105,33 @@ def process_video_task(
     generation_mode: str = "natural",  # "safe", "standard", "symbolic" (legacy: "default", "natural")
     subtitle_length: str = "short",  # "short"(8자) or "long"(16자/Netflix)
     generate_edit_pack: bool = False,  # True = CapCut Edit Pack (ZIP) 생성
-    video_tone: str = "bright"  # v2.2: 영상 톤 ("bright" 기본 / "dark" 묵상용)
+    video_tone: str = "bright",  # v2.2: 영상 톤 ("bright" 기본 / "dark" 묵상용)
+    shared_context: dict | None = None,  # 배치: 교회 단위 공유 컨텍스트 (_load_church_context)
+    raise_on_failure: bool = True  # False = 최종 실패 시 예외 대신 실패 결과 반환 (배치 chord용)
 ):
     """
     QT 영상 생성 메인 파이프라인
 
-    전체 흐름:
-    1. MP3 → SRT (Groq Whisper)
-    2. 배경 클립 선택 (Supabase)
-    3. 클립 + 오디오 + 자막 → MP4 (FFmpeg)
-    4. MP4 업로드 (Cloudflare R2)
-    5. 메타데이터 저장 (Supabase)
+    전체 흐름 (단계별 체크포인트):
+    1. transcribe: MP3 → Whisper raw transcription (Groq)
+    2. correct: 통합/교회 사전 교정 → SRT
+    3. cut: 자막 기반 컷 생성
+    4. describe: 컷별 Visual Description (Gemini)
+    5. search: 컷별 Pexels 영상 매칭
+    6. compose: 클립 + 오디오 + 자막 → MP4 (FFmpeg)
+    7. upload: MP4/SRT/오디오 업로드 (Cloudflare R2)
+    8. persist: 메타데이터 저장 (Supabase)
+
+    각 단계 결과는 video_id 기준 체크포인트로 기록되며,
+    재시도/워커 크래시 후에는 첫 번째 미완료 단계부터 재개한다.
 
     Args:
         audio_file_path: 업로드된 MP3 파일 경로
         church_id: 교회 UUID
         video_id: 영상 UUID (미리 생성됨)
         pack_id: 배경팩 ID
+        shared_context: 배치에서 한 번만 로드한 클립 이력/BGM 정보
+        raise_on_failure: 최종 실패 시 예외 전파 여부
 
     Returns:
         dict: {video_url, srt_url, duration, clips_used}
@@ -110,8 +139,26 @@ def process_video_task(
     from supabase import create_client
 
     supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-    temp_files = []  # 정리할 임시 파일들
-    local_audio_path = None  # R2에서 다운로드한 로컬 경로
+    temp_files = []  # 정리할 임시 파일들 (체크포인트 산출물 제외)
+    source_audio_path = audio_file_path
+
+    r2 = get_r2_storage()
+    checkpoint = PipelineCheckpoint(
+        video_id,
+        params={
+            "audio_file_path": audio_file_path,
+            "church_id": church_id,
+            "pack_id": pack_id,
+            "clip_ids": clip_ids,
+            "bgm_id": bgm_id,
+            "bgm_volume": bgm_volume,
+            "generation_mode": generation_mode,
+            "subtitle_length": subtitle_length,
+            "generate_edit_pack": generate_edit_pack,
+            "video_tone": video_tone,
+        },
+        storage=r2
+    )
 
     try:
         # ========================================
@@ -122,715 +169,954 @@ def process_video_task(
         }).eq("id", video_id).execute()
         logger.info(f"[Task] Video status updated to processing: {video_id}")
 
+        resume_stage = checkpoint.first_incomplete_stage()
+        if resume_stage != PIPELINE_STAGES[0]:
+            logger.info(f"[Checkpoint] 재개 지점: {resume_stage} (video_id: {video_id})")
+
         # ========================================
-        # Step 0-B: R2 URL인 경우 로컬로 다운로드
+        # Step 0-B: R2 URL인 경우 로컬로 다운로드 (체크포인트 디렉토리에 보관)
         # ========================================
-        if audio_file_path.startswith("http"):
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": 2, "step": "오디오 파일 다운로드 중..."}
-            )
+        if resume_stage not in (None, "persist"):
+            audio_file_path = _prepare_audio(self, audio_file_path, checkpoint)
 
-            # URL에서 확장자 추출
-            audio_url_parsed = urllib.parse.urlparse(audio_file_path)
-            ext = os.path.splitext(audio_url_parsed.path)[1] or ".m4a"
+        # Step 0-C: STT/길이 측정용 음성 정규화 (합성에는 원본 오디오 사용)
+        speech_audio_path = audio_file_path
+        if resume_stage in ("transcribe", "correct", "cut"):
+            speech_audio_path = _prepare_speech_audio(audio_file_path, checkpoint)
 
-            # 임시 파일로 다운로드
-            temp_dir = tempfile_module.gettempdir()
-            local_audio_path = os.path.join(temp_dir, f"{uuid4()}{ext}")
+        USE_SUBTITLE_BASED_CLIPS = True  # ✅ 자막 기반 3-Stage Pipeline (False = 레거시 Segment 방식)
 
-            with httpx_module.Client(timeout=60.0) as client:
-                response = client.get(audio_file_path)
-                response.raise_for_status()
-                with open(local_audio_path, "wb") as f:
-                    f.write(response.content)
+        # Step 1: 음성 → Whisper raw transcription
+        transcribe_data = _run_stage(
+            checkpoint, "transcribe",
+            _stage_transcribe, self, speech_audio_path, subtitle_length, audio_file_path
+        )
 
-            temp_files.append(local_audio_path)
-            logger.info(f"Audio downloaded from R2: {local_audio_path}")
-            audio_file_path = local_audio_path
+        # Step 1.5 ~ 1.6: 사전 교정 → SRT
+        srt_path = checkpoint.artifact_path("subtitles.srt")
+        correct_data = _run_stage(
+            checkpoint, "correct",
+            _stage_correct, self, supabase, church_id, transcribe_data,
+            subtitle_length, audio_file_path, srt_path
+        )
+        if not os.path.exists(srt_path):
+            # 다른 워커에서 재개된 경우: 체크포인트의 SRT 내용으로 복원
+            with open(srt_path, "w", encoding="utf-8") as f:
+                f.write(correct_data["srt_content"])
 
-        # ========================================
-        # Step 1: 음성 → Whisper raw transcription (10%)
-        # ========================================
         self.update_state(
             state="PROCESSING",
-            meta={"progress": 5, "step": "음성 인식 중..."}
+            meta={"progress": 20, "step": "자막 생성 완료"}
         )
 
-        whisper = get_whisper_service(subtitle_length=subtitle_length)
-        transcription = whisper.get_transcription(audio_file_path, language="ko")
+        # Step 2: 컷 생성 → Visual Description → Pexels 매칭
+        cut_data = _run_stage(
+            checkpoint, "cut",
+            _stage_cut, self, srt_path, speech_audio_path, USE_SUBTITLE_BASED_CLIPS
+        )
+        audio_duration = cut_data["audio_duration"]
+        cuts = [deserialize_cut(c) for c in cut_data.get("cuts", [])]
 
-        logger.info(f"[Step 1/5] Whisper 인식 완료")
+        describe_data = _run_stage(
+            checkpoint, "describe",
+            _stage_describe, self, cuts, generation_mode
+        )
+        visual_descriptions = [VisualDescription(**d) for d in describe_data["descriptions"]]
+
+        search_data = _run_stage(
+            checkpoint, "search",
+            _stage_search, self, church_id, cut_data, visual_descriptions, video_tone,
+            shared_context
+        )
+        selected_clips = _deserialize_selected_clips(search_data["selected_clips"])
+        subtitle_clips = [
+            {
+                "cut": deserialize_cut(c["cut"]),
+                "description": VisualDescription(**c["description"]),
+                "video": deserialize_video(c["video"]),
+            }
+            for c in search_data.get("subtitle_clips", [])
+        ]
+        used_clip_ids = search_data["used_clip_ids"]
+        clips_metadata = search_data["clips_metadata"]
 
-        # ========================================
-        # Step 1.5: 이중 사전 적용 (Whisper raw text에 먼저 적용!)
-        # ========================================
         self.update_state(
             state="PROCESSING",
-            meta={"progress": 15, "step": "자막 자동 교정 중..."}
+            meta={"progress": 35, "step": f"✅ 영상 준비가 완료되었습니다 ({len(selected_clips)}개 구간)"}
+        )
+
+        # Step 3: FFmpeg 영상 합성 (+ Edit Pack)
+        compose_data = _run_stage(
+            checkpoint, "compose",
+            _stage_compose, self, supabase, checkpoint, video_id,
+            selected_clips=selected_clips,
+            subtitle_clips=subtitle_clips if USE_SUBTITLE_BASED_CLIPS else None,
+            cuts=cuts,
+            srt_path=srt_path,
+            audio_file_path=audio_file_path,
+            audio_duration=audio_duration,
+            bgm_id=bgm_id,
+            bgm_volume=bgm_volume,
+            generate_edit_pack=generate_edit_pack,
+            temp_files=temp_files,
+            shared_context=shared_context
+        )
+
+        # Step 4: R2 업로드
+        upload_data = _run_stage(
+            checkpoint, "upload",
+            _stage_upload, self, r2, compose_data, srt_path, audio_file_path
         )
 
+        # Step 5: Supabase 메타데이터 저장
+        _run_stage(
+            checkpoint, "persist",
+            _stage_persist, self, supabase, church_id, video_id,
+            upload_data, audio_duration, used_clip_ids, clips_metadata,
+            timeline=compose_data.get("timeline"),
+            srt_path=srt_path
+        )
+
+        self.update_state(
+            state="SUCCESS",
+            meta={"progress": 100, "step": "완료!"}
+        )
+
+        result = {
+            "status": "completed",
+            "video_id": video_id,
+            "video_url": upload_data["video_url"],
+            "srt_url": upload_data["srt_url"],
+            "duration": audio_duration,
+            "clips_used": used_clip_ids
+        }
+
+        # Edit Pack URL 추가 (생성된 경우)
+        if upload_data.get("edit_pack_url"):
+            result["edit_pack_url"] = upload_data["edit_pack_url"]
+
+        # 완료 → 체크포인트/산출물 정리
+        checkpoint.clear()
+        if not source_audio_path.startswith("http"):
+            _cleanup_temp_files([source_audio_path])
+
+        return result
+
+    except Exception as e:
+        logger.exception(f"Video processing failed: {e}")
+
+        # 실패 상태 저장
         try:
-            correction_service = get_correction_service()
-
-            # Whisper raw text 추출
-            raw_text = transcription.text if hasattr(transcription, 'text') else ""
-
-            total_applied = []
-
-            # ----------------------------------------
-            # 1단계: 통합 사전 적용 (성경 고유명사 등)
-            # ----------------------------------------
-            global_dict_result = supabase.table("global_dictionary") \
-                .select("original, replacement, category, priority") \
-                .eq("is_active", True) \
-                .order("priority", desc=True) \
-                .order("category") \
-                .execute()
-
-            if global_dict_result.data:
-                # 통합 사전 형식 맞추기 (use_count 필드 추가)
-                global_entries = [
-                    {"original": e["original"], "replacement": e["replacement"], "use_count": e.get("priority", 0)}
-                    for e in global_dict_result.data
-                ]
-
-                # 🔴 DEBUG: 실제로 받은 데이터 확인
-                logger.info(f"[DEBUG] 통합 사전 데이터 개수: {len(global_entries)}")
-                logger.info(f"[DEBUG] 통합 사전 항목: {[e['original'] for e in global_entries]}")
-
-                # ✅ 핵심: raw text에 먼저 교정 적용!
-                corrected_text, global_applied = correction_service.apply_replacement_dictionary(
-                    raw_text, global_entries
-                )
+            supabase.table("videos").update({
+                "status": "failed",
+                "error_message": str(e)[:500]
+            }).eq("id", video_id).execute()
+        except Exception:
+            pass
 
-                if global_applied:
-                    total_applied.extend([f"[통합]{a}" for a in global_applied])
-                    logger.info(f"[Step 1.5a] 통합 사전 적용: {len(global_applied)}개 교정")
-                    logger.info(f"[DEBUG] 교정 전: {raw_text[:100]}...")
-                    logger.info(f"[DEBUG] 교정 후: {corrected_text[:100]}...")
-
-                    # ✅ 핵심: transcription.text 뿐만 아니라 words도 업데이트!
-                    transcription.text = corrected_text
-
-                    # words 배열의 각 단어도 교정 적용
-                    if hasattr(transcription, 'words') and transcription.words:
-                        # 교정된 전체 텍스트로 words 재생성
-                        # 방법: 원본 words의 타임스탬프는 유지하되, text만 교정본으로 교체
-                        corrected_word_index = 0
-                        corrected_words_list = corrected_text.split()
-
-                        for i, word_data in enumerate(transcription.words):
-                            if corrected_word_index < len(corrected_words_list):
-                                # 교정된 단어로 교체 (타임스탬프는 유지)
-                                word_data['word'] = corrected_words_list[corrected_word_index]
-                                corrected_word_index += 1
-            else:
-                corrected_text = raw_text
-
-            # ----------------------------------------
-            # 2단계: 교회별 사전 적용 (우선 - 덮어쓰기)
-            # ----------------------------------------
-            church_dict_result = supabase.table("replacement_dictionary") \
-                .select("original, replacement, use_count") \
-                .eq("church_id", church_id) \
-                .order("use_count", desc=True) \
-                .limit(100) \
-                .execute()
-
-            if church_dict_result.data:
-                corrected_text, church_applied = correction_service.apply_replacement_dictionary(
-                    corrected_text, church_dict_result.data
-                )
+        # 마지막 재시도까지 실패 → 체크포인트 폐기 (그 전에는 재개용으로 유지)
+        if self.request.retries >= self.max_retries:
+            checkpoint.clear()
+            _discard_preview(supabase, video_id)
+            if not source_audio_path.startswith("http"):
+                _cleanup_temp_files([source_audio_path])
+
+            if not raise_on_failure:
+                return {
+                    "status": "failed",
+                    "video_id": video_id,
+                    "error": str(e)[:200]
+                }
 
-                if church_applied:
-                    total_applied.extend([f"[교회]{a}" for a in church_applied])
-                    logger.info(f"[Step 1.5b] 교회별 사전 적용: {len(church_applied)}개 교정")
+        # Celery 재시도 (최대 3회, 완료된 단계는 건너뜀)
+        raise self.retry(exc=e, countdown=60)
 
-                    # 교정된 텍스트를 transcription에 반영
-                    transcription.text = corrected_text
+    finally:
+        # 임시 파일 정리 (체크포인트 산출물은 유지)
+        _cleanup_temp_files(temp_files)
 
-                    # words 배열도 업데이트
-                    if hasattr(transcription, 'words') and transcription.words:
-                        corrected_word_index = 0
-                        corrected_words_list = corrected_text.split()
 
-                        for i, word_data in enumerate(transcription.words):
-                            if corrected_word_index < len(corrected_words_list):
-                                word_data['word'] = corrected_words_list[corrected_word_index]
-                                corrected_word_index += 1
+def _run_stage(checkpoint: PipelineCheckpoint, stage: str, func, *args, **kwargs) -> dict:
+    """
+    체크포인트가 있으면 재사용, 없으면 단계 실행 후 기록
 
-            if total_applied:
-                logger.info(f"[Step 1.5] 총 {len(total_applied)}개 교정 완료")
-            else:
-                logger.info(f"[Step 1.5] 교정 없음 (church_id: {church_id})")
+    Args:
+        checkpoint: PipelineCheckpoint
+        stage: 단계 이름
+        func: (data, artifacts) 튜플을 반환하는 단계 함수
 
-        except Exception as e:
-            logger.warning(f"치환 사전 적용 실패 (무시하고 진행): {e}")
+    Returns:
+        단계 결과 데이터
+    """
+    if checkpoint.is_complete(stage):
+        logger.info(f"[Checkpoint] {stage} 단계 건너뜀 (이전 결과 재사용)")
+        return checkpoint.get(stage)
 
-        # ========================================
-        # Step 1.6: 교정된 transcription → SRT 생성
-        # ========================================
-        srt_path = whisper.create_srt_from_transcription(transcription, audio_file_path)
-        temp_files.append(srt_path)
+    data, artifacts = func(*args, **kwargs)
+    checkpoint.save(stage, data, artifacts)
+    return data
 
-        logger.info(f"[Step 1.6] 교정 후 SRT 생성 완료: {srt_path}")
 
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 20, "step": "자막 생성 완료"}
-        )
+def _prepare_audio(task, audio_file_path: str, checkpoint: PipelineCheckpoint) -> str:
+    """
+    R2 URL 오디오를 체크포인트 디렉토리로 다운로드 (이미 있으면 재사용)
 
-        # ========================================
-        # Step 2: 구간 분석 + 영상 선택 (Segment-Based Strategy)
-        # ========================================
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 25, "step": "자막 구간 분석 중..."}
+    Returns:
+        로컬 오디오 경로
+    """
+    if not audio_file_path.startswith("http"):
+        return audio_file_path
+
+    # URL에서 확장자 추출
+    audio_url_parsed = urllib.parse.urlparse(audio_file_path)
+    ext = os.path.splitext(audio_url_parsed.path)[1] or ".m4a"
+    local_audio_path = checkpoint.artifact_path(f"audio{ext}")
+
+    if os.path.exists(local_audio_path):
+        logger.info(f"[Checkpoint] 오디오 재사용: {local_audio_path}")
+        return local_audio_path
+
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 2, "step": "오디오 파일 다운로드 중..."}
+    )
+
+    get_downloader().download(audio_file_path, local_audio_path)
+
+    logger.info(f"Audio downloaded from R2: {local_audio_path}")
+    return local_audio_path
+
+
+def _prepare_speech_audio(audio_file_path: str, checkpoint: PipelineCheckpoint) -> str:
+    """
+    STT 입력용 16kHz 모노 Opus 변환 (작업당 1회, 체크포인트 디렉토리에 보관)
+
+    Returns:
+        인식/길이 측정에 쓸 오디오 경로 (변환 안 함/실패 시 원본)
+    """
+    if not settings.STT_AUDIO_NORMALIZE:
+        return audio_file_path
+
+    speech_path = checkpoint.artifact_path("speech.ogg")
+    if os.path.exists(speech_path):
+        logger.info(f"[Checkpoint] 정규화 음성 재사용: {speech_path}")
+        return speech_path
+
+    return normalize_speech_audio(
+        audio_file_path,
+        speech_path,
+        bitrate=settings.STT_AUDIO_BITRATE,
+        loudnorm=settings.STT_AUDIO_LOUDNORM,
+        trim_trailing_silence=settings.STT_AUDIO_TRIM_TRAILING_SILENCE
+    )
+
+
+def _stage_transcribe(
+    task,
+    audio_file_path: str,
+    subtitle_length: str,
+    source_audio_path: str | None = None
+) -> tuple[dict, list]:
+    """
+    Stage transcribe: 음성 → Whisper raw transcription
+
+    audio_file_path가 정규화 음성이면 인식 결과 캐시는 원본(source_audio_path) 해시 +
+    정규화 설정으로 조회한다 (정규화 결과 바이트가 달라도 같은 업로드면 적중).
+    """
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 5, "step": "음성 인식 중..."}
+    )
+
+    cache_audio_path = None
+    preprocess = None
+    if source_audio_path and source_audio_path != audio_file_path:
+        cache_audio_path = source_audio_path
+        preprocess = speech_audio_settings(
+            bitrate=settings.STT_AUDIO_BITRATE,
+            loudnorm=settings.STT_AUDIO_LOUDNORM,
+            trim_trailing_silence=settings.STT_AUDIO_TRIM_TRAILING_SILENCE
         )
 
-        # 오디오 길이 계산
-        video_composer = get_video_composer()
-        audio_duration = video_composer.get_audio_duration(audio_file_path)
+    whisper = get_whisper_service(subtitle_length=subtitle_length)
+    transcription = whisper.get_transcription(
+        audio_file_path,
+        language="ko",
+        cache_audio_path=cache_audio_path,
+        preprocess=preprocess
+    )
 
-        # BGM 다운로드 (옵션)
-        bgm_file_path = None
-        if bgm_id:
-            bgm_res = supabase.table("bgms").select("file_path").eq("id", bgm_id).single().execute()
-            if bgm_res.data:
-                bgm_url = bgm_res.data["file_path"]
-                if not bgm_url.startswith("http"):
-                    bgm_url = f"{settings.R2_PUBLIC_URL}/{bgm_url}"
+    logger.info(f"[Step 1/5] Whisper 인식 완료")
+    return {"transcription": serialize_transcription(transcription)}, []
 
-                import httpx
-                import tempfile as tf
-                with tf.NamedTemporaryFile(delete=False, suffix=".mp3") as f:
-                    resp = httpx.get(bgm_url, timeout=30.0)
-                    f.write(resp.content)
-                    bgm_file_path = f.name
-                    temp_files.append(bgm_file_path)
-                logger.info(f"[Step 2.0] BGM 다운로드 완료: {bgm_id}")
-
-        # Step 2.1: SRT에서 자막 추출
-        logger.info("[Step 2.1] SRT 파싱 시작")
-        subtitles, subtitle_timings = parse_srt_for_segments(srt_path)
-        logger.info(f"[Step 2.1] 자막 파싱 완료: {len(subtitles)}개")
 
-        # ========================================
-        # Step 2.2: 영상 클립 선택 전략 분기
-        # ========================================
-        # USE_SUBTITLE_BASED_CLIPS = True로 설정 시:
-        #   → 자막 기반 (3-Stage Pipeline: Cut → Visual Desc → Pexels)
-        # False 시:
-        #   → 기존 Segment 기반 (도입/중간/마무리)
-        # ========================================
-        USE_SUBTITLE_BASED_CLIPS = True  # ✅ 새로운 방식 활성화
+def _load_church_context(supabase, church_id: str, bgm_id: str | None) -> dict:
+    """
+    배치 공유 컨텍스트 로드 (교회 단위로 한 번만 조회)
+
+    Returns:
+        dict: recently_used_clips, bgm_url (치환 사전은 워커별 DictionaryCache 사용)
+    """
+    bgm_url = None
+    if bgm_id:
+        bgm_res = supabase.table("bgms").select("file_path").eq("id", bgm_id).single().execute()
+        if bgm_res.data:
+            bgm_url = _resolve_bgm_url(bgm_res.data["file_path"])
+
+    context = {
+        "recently_used_clips": sorted(
+            get_clip_history_service().get_recently_used_clips(church_id, limit=10)
+        ),
+        "bgm_url": bgm_url,
+    }
 
-        if USE_SUBTITLE_BASED_CLIPS:
-            # ============ 새로운 방식: Subtitle-Based Clips ============
-            logger.info("[Step 2.2] 🎬 3-Stage Pipeline: Subtitle-Based Clip Matching")
+    logger.info(
+        f"[Batch] 공유 컨텍스트 로드: 최근 클립 {len(context['recently_used_clips'])}개, BGM: {bool(bgm_url)}"
+    )
+    return context
 
-            # Stage 1: 컷 리스트 생성 (자막 시작 = 클립 시작 동기화)
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": 28, "step": "Analyzing the flow of the message..."}
-            )
 
-            # 새로운 SubtitleDrivenCutGenerator 사용 (자막 start_time = 컷 start_time)
-            from app.services.subtitle_driven_cut_generator import SubtitleDrivenCutGenerator
-            cut_generator = SubtitleDrivenCutGenerator(
-                min_cut_duration=4.0,
-                max_cut_duration=12.0,
-                prefer_sentence_end=True,
-                target_cut_duration=8.0
-            )
-            cuts = cut_generator.generate_cuts(
-                subtitles=subtitles,
-                subtitle_timings=subtitle_timings,
-                audio_duration=audio_duration
+def _resolve_bgm_url(file_path: str) -> str:
+    """bgms.file_path → 다운로드 URL (상대 경로면 R2 Public URL 사용)"""
+    if not file_path.startswith("http"):
+        return f"{settings.R2_PUBLIC_URL}/{file_path}"
+    return file_path
+
+
+def _apply_corrected_text(transcription, corrected_text: str) -> None:
+    """교정된 텍스트를 transcription.text 및 words에 반영 (타임스탬프 유지)"""
+    transcription.text = corrected_text
+
+    # words 배열의 각 단어도 교정 적용
+    if hasattr(transcription, 'words') and transcription.words:
+        # 원본 words의 타임스탬프는 유지하되, text만 교정본으로 교체
+        corrected_word_index = 0
+        corrected_words_list = corrected_text.split()
+
+        for word_data in transcription.words:
+            if corrected_word_index < len(corrected_words_list):
+                word_data['word'] = corrected_words_list[corrected_word_index]
+                corrected_word_index += 1
+
+
+def _stage_correct(
+    task,
+    supabase,
+    church_id: str,
+    transcribe_data: dict,
+    subtitle_length: str,
+    audio_file_path: str,
+    srt_path: str
+) -> tuple[dict, list]:
+    """
+    Stage correct: 이중 사전 적용 (Whisper raw text에 먼저 적용!) → SRT 생성
+
+    사전은 워커별 DictionaryCache에서 가져온다 (버전이 같으면 DB 조회/컴파일 없음).
+    """
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 15, "step": "자막 자동 교정 중..."}
+    )
+
+    transcription = deserialize_transcription(transcribe_data["transcription"])
+    total_applied = []
+
+    try:
+        correction_service = get_correction_service()
+
+        # Whisper raw text 추출
+        raw_text = transcription.text or ""
+
+        dictionary_cache = get_dictionary_cache()
+        global_dictionary = dictionary_cache.global_dictionary(supabase)
+        church_dictionary = dictionary_cache.church_dictionary(supabase, church_id)
+
+        # ----------------------------------------
+        # 1단계: 통합 사전 적용 (성경 고유명사 등)
+        # ----------------------------------------
+        if global_dictionary.entries:
+            logger.debug(f"통합 사전 v{global_dictionary.version}: {len(global_dictionary)}개")
+
+            # ✅ 핵심: raw text에 먼저 교정 적용!
+            corrected_text, global_applied = correction_service.apply_replacement_dictionary(
+                raw_text, global_dictionary.matcher
             )
 
-            logger.info(f"[Stage 1/3] Cut generation complete: {len(cuts)} cuts")
-            for cut in cuts:
-                logger.info(
-                    f"  Cut {cut.index+1}: {cut.start_time:.2f}s-{cut.end_time:.2f}s "
-                    f"({cut.duration:.2f}s) - subtitles {cut.subtitle_indices[0]}-{cut.subtitle_indices[-1]}"
-                )
+            if global_applied:
+                total_applied.extend([f"[통합]{a}" for a in global_applied])
+                logger.info(f"[Step 1.5a] 통합 사전 적용: {len(global_applied)}개 교정")
+                logger.info(f"[DEBUG] 교정 전: {raw_text[:100]}...")
+                logger.info(f"[DEBUG] 교정 후: {corrected_text[:100]}...")
 
-            # Stage 2: LLM 감독 - Visual Description 생성
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": 30, "step": f"🎨 {len(cuts)}개 구간에 어울리는 영상을 구상하고 있습니다..."}
+                # ✅ 핵심: transcription.text 뿐만 아니라 words도 업데이트!
+                _apply_corrected_text(transcription, corrected_text)
+        else:
+            corrected_text = raw_text
+
+        # ----------------------------------------
+        # 2단계: 교회별 사전 적용 (우선 - 덮어쓰기)
+        # ----------------------------------------
+        if church_dictionary.entries:
+            corrected_text, church_applied = correction_service.apply_replacement_dictionary(
+                corrected_text, church_dictionary.matcher
             )
 
-            from app.services.visual_description_generator import VisualDescriptionGenerator
-            # generation_mode를 VisualDescriptionGenerator mode로 매핑
-            # "safe" = 자연만 (인물 없음)
-            # "standard" = 얼굴 없는 인물 허용 (뒷모습, 실루엣, 기도손)
-            # "symbolic" = 상징 이미지 (기도손, 성경책, 십자가) 우선
-            # "default" = 레거시 - standard로 매핑
-            # "natural" = 레거시 - safe로 매핑
-            mode_mapping = {
-                "safe": VisualDescriptionGenerator.MODE_SAFE,
-                "standard": VisualDescriptionGenerator.MODE_STANDARD,
-                "symbolic": VisualDescriptionGenerator.MODE_SYMBOLIC,
-                "default": VisualDescriptionGenerator.MODE_STANDARD,  # Legacy
-                "natural": VisualDescriptionGenerator.MODE_SAFE,      # Legacy
-            }
-            visual_mode = mode_mapping.get(generation_mode, VisualDescriptionGenerator.MODE_SAFE)
-            logger.info(f"[Stage 2/3] Visual mode: {generation_mode} -> {visual_mode}")
+            if church_applied:
+                total_applied.extend([f"[교회]{a}" for a in church_applied])
+                logger.info(f"[Step 1.5b] 교회별 사전 적용: {len(church_applied)}개 교정")
 
-            desc_generator = VisualDescriptionGenerator(mode=visual_mode)
+                # 교정된 텍스트를 transcription에 반영
+                _apply_corrected_text(transcription, corrected_text)
 
-            visual_descriptions = []
-            for cut in cuts:
-                desc = desc_generator.generate_description(
-                    subtitle_texts=cut.subtitle_texts,
-                    context="documentary"
-                )
-                visual_descriptions.append(desc)
+        if total_applied:
+            logger.info(f"[Step 1.5] 총 {len(total_applied)}개 교정 완료")
+        else:
+            logger.info(f"[Step 1.5] 교정 없음 (church_id: {church_id})")
 
-                logger.info(
-                    f"  Cut {cut.index+1} Visual Query: {desc.visual_query[:80]}... "
-                    f"(type: {desc.description_type}, confidence: {desc.confidence:.2f})"
-                )
+    except Exception as e:
+        logger.warning(f"치환 사전 적용 실패 (무시하고 진행): {e}")
 
-            # Stage 3: Pexels 검색
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": 32, "step": f"🔍 은혜로운 영상을 찾고 있습니다... ({len(cuts)}개 구간)"}
+    # ========================================
+    # Step 1.6: 교정된 transcription → SRT 생성
+    # ========================================
+    whisper = get_whisper_service(subtitle_length=subtitle_length)
+    created_srt_path = whisper.create_srt_from_transcription(transcription, audio_file_path)
+    if os.path.abspath(created_srt_path) != os.path.abspath(srt_path):
+        shutil.move(created_srt_path, srt_path)
+
+    with open(srt_path, "r", encoding="utf-8") as f:
+        srt_content = f.read()
+
+    logger.info(f"[Step 1.6] 교정 후 SRT 생성 완료: {srt_path}")
+
+    return {"srt_content": srt_content, "corrections": len(total_applied)}, []
+
+
+def _stage_cut(
+    task,
+    srt_path: str,
+    audio_file_path: str,
+    use_subtitle_based_clips: bool
+) -> tuple[dict, list]:
+    """
+    Stage cut: 오디오 길이 계산 + 자막 파싱 + 컷/구간 생성
+
+    USE_SUBTITLE_BASED_CLIPS = True:
+        → 자막 기반 컷 (SubtitleDrivenCutGenerator)
+    False:
+        → 기존 Segment 기반 (도입/중간/마무리)
+    """
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 25, "step": "자막 구간 분석 중..."}
+    )
+
+    # 오디오 길이 계산
+    audio_duration = get_video_composer().get_audio_duration(audio_file_path)
+
+    # Step 2.1: SRT에서 자막 추출
+    logger.info("[Step 2.1] SRT 파싱 시작")
+    subtitles, subtitle_timings = parse_srt_for_segments(srt_path)
+    logger.info(f"[Step 2.1] 자막 파싱 완료: {len(subtitles)}개")
+
+    if not use_subtitle_based_clips:
+        # ============ 기존 방식: Segment-Based Clips ============
+        logger.info("[Step 2.2] 📊 Legacy: Segment-Based Clip Selection")
+        task.update_state(
+            state="PROCESSING",
+            meta={"progress": 28, "step": "도입/중간/마무리 구간 분석 중..."}
+        )
+
+        segment_analyzer = get_fixed_segment_analyzer()
+        segments = segment_analyzer.analyze_segments(
+            subtitles=subtitles,
+            subtitle_timings=subtitle_timings
+        )
+
+        logger.info(f"[Step 2.2] 구간 분석 완료: {len(segments)}개 구간")
+        for i, seg in enumerate(segments):
+            logger.info(
+                f"  구간 {i+1}: {seg.segment_type} ({seg.start_time:.1f}s ~ {seg.end_time:.1f}s) "
+                f"- {seg.strategy}, confidence={seg.confidence:.2f}"
             )
 
-            from app.services.background_video_search import PexelsVideoSearch
-            pexels_search = PexelsVideoSearch(video_tone=video_tone)
-
-            # 전역 클립 이력 서비스
-            clip_history = get_clip_history_service()
-
-            # 최근 10개 영상에서 사용된 클립 ID 가져오기 (전역 중복 방지)
-            recently_used_global = clip_history.get_recently_used_clips(church_id, limit=10)
-            logger.info(f"[ClipHistory] 최근 10개 영상에서 사용된 클립: {len(recently_used_global)}개")
-
-            subtitle_clips = []  # 자막 기반 클립 리스트
-            used_video_ids = recently_used_global.copy()  # 전역 중복 + 현재 영상 중복 방지
-
-            # 대체 쿼리 목록 (중복 발생 시 사용)
-            alternative_queries = [
-                "peaceful mountain landscape nature cinematic",
-                "calm ocean waves sunset serene",
-                "forest trees morning light peaceful",
-                "clouds sky sunset golden hour",
-                "river water flowing nature calm",
-                "desert wilderness ancient landscape",
-                "rain drops window contemplation",
-                "sunrise horizon hope new day"
-            ]
-            alt_query_idx = 0
-
-            for idx, (cut, desc) in enumerate(zip(cuts, visual_descriptions)):
-                videos = pexels_search.search_by_visual_description(
-                    visual_query=desc.visual_query,
-                    duration_needed=int(cut.duration) + 1,
-                    max_results=8,  # 5→8로 증가 (중복 제외 후 선택지 확보)
-                    exclude_ids=used_video_ids  # Pexels 검색 단계에서 이미 사용된 영상 제외
-                )
+        return {
+            "audio_duration": audio_duration,
+            "cuts": [],
+            "segments": [asdict(seg) for seg in segments]
+        }, []
+
+    # ============ 새로운 방식: Subtitle-Based Clips ============
+    logger.info("[Step 2.2] 🎬 3-Stage Pipeline: Subtitle-Based Clip Matching")
+
+    # Stage 1: 컷 리스트 생성 (자막 시작 = 클립 시작 동기화)
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 28, "step": "Analyzing the flow of the message..."}
+    )
+
+    # 새로운 SubtitleDrivenCutGenerator 사용 (자막 start_time = 컷 start_time)
+    from app.services.subtitle_driven_cut_generator import SubtitleDrivenCutGenerator
+    cut_generator = SubtitleDrivenCutGenerator(
+        min_cut_duration=4.0,
+        max_cut_duration=12.0,
+        prefer_sentence_end=True,
+        target_cut_duration=8.0
+    )
+    cuts = cut_generator.generate_cuts(
+        subtitles=subtitles,
+        subtitle_timings=subtitle_timings,
+        audio_duration=audio_duration
+    )
+
+    logger.info(f"[Stage 1/3] Cut generation complete: {len(cuts)} cuts")
+    for cut in cuts:
+        logger.info(
+            f"  Cut {cut.index+1}: {cut.start_time:.2f}s-{cut.end_time:.2f}s "
+            f"({cut.duration:.2f}s) - subtitles {cut.subtitle_indices[0]}-{cut.subtitle_indices[-1]}"
+        )
 
-                if videos:
-                    # 중복되지 않은 첫 번째 영상 선택
-                    selected_video = None
-                    for video in videos:
-                        if video.id not in used_video_ids:
-                            selected_video = video
-                            used_video_ids.add(video.id)
-                            break
-
-                    # 모든 영상이 이미 사용됨 → 대체 쿼리로 재검색
-                    if selected_video is None:
-                        logger.warning(
-                            f"  Cut {cut.index+1}: All videos from main query used, trying alternative query"
-                        )
-                        # 대체 쿼리로 다시 검색
-                        alt_query = alternative_queries[alt_query_idx % len(alternative_queries)]
-                        alt_query_idx += 1
-
-                        alt_videos = pexels_search.search_by_visual_description(
-                            visual_query=alt_query,
-                            duration_needed=int(cut.duration) + 1,
-                            max_results=8,
-                            exclude_ids=used_video_ids
-                        )
+    return {
+        "audio_duration": audio_duration,
+        "cuts": [serialize_cut(cut) for cut in cuts]
+    }, []
+
+
+def _stage_describe(task, cuts: list, generation_mode: str) -> tuple[dict, list]:
+    """Stage describe: LLM 감독 - 컷별 Visual Description 생성"""
+    if not cuts:
+        # 레거시 Segment 방식은 Visual Description 단계 없음
+        return {"descriptions": []}, []
+
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 30, "step": f"🎨 {len(cuts)}개 구간에 어울리는 영상을 구상하고 있습니다..."}
+    )
+
+    from app.services.visual_description_generator import VisualDescriptionGenerator
+    # generation_mode를 VisualDescriptionGenerator mode로 매핑
+    # "safe" = 자연만 (인물 없음)
+    # "standard" = 얼굴 없는 인물 허용 (뒷모습, 실루엣, 기도손)
+    # "symbolic" = 상징 이미지 (기도손, 성경책, 십자가) 우선
+    # "default" = 레거시 - standard로 매핑
+    # "natural" = 레거시 - safe로 매핑
+    mode_mapping = {
+        "safe": VisualDescriptionGenerator.MODE_SAFE,
+        "standard": VisualDescriptionGenerator.MODE_STANDARD,
+        "symbolic": VisualDescriptionGenerator.MODE_SYMBOLIC,
+        "default": VisualDescriptionGenerator.MODE_STANDARD,  # Legacy
+        "natural": VisualDescriptionGenerator.MODE_SAFE,      # Legacy
+    }
+    visual_mode = mode_mapping.get(generation_mode, VisualDescriptionGenerator.MODE_SAFE)
+    logger.info(f"[Stage 2/3] Visual mode: {generation_mode} -> {visual_mode}")
 
-                        if alt_videos:
-                            for video in alt_videos:
-                                if video.id not in used_video_ids:
-                                    selected_video = video
-                                    used_video_ids.add(video.id)
-                                    logger.info(f"  Cut {cut.index+1}: Found alternative video ID {video.id}")
-                                    break
-
-                        # 대체 쿼리도 모두 중복 → 최후의 수단: 첫 번째 재사용
-                        if selected_video is None:
-                            selected_video = videos[0]
-                            logger.warning(
-                                f"  Cut {cut.index+1}: No unique videos found, reusing ID {videos[0].id}"
-                            )
-
-                    subtitle_clips.append({
-                        'cut': cut,
-                        'description': desc,
-                        'video': selected_video
-                    })
-                    logger.info(
-                        f"  Cut {cut.index+1}: Video ID {selected_video.id} "
-                        f"({selected_video.duration}s, verified: {selected_video.vision_verified})"
-                    )
-                else:
-                    logger.warning(f"  Cut {cut.index+1}: No videos found (fallback to nature)")
-                    # Fallback 1: nature 영상 검색
-                    fallback = pexels_search.search_by_visual_description(
-                        visual_query="peaceful nature landscape calm serene cinematic",
-                        duration_needed=int(cut.duration) + 1,
-                        max_results=8,  # 5→8로 증가
-                        exclude_ids=used_video_ids  # 이미 사용된 영상 제외
-                    )
-                    if fallback:
-                        # 중복되지 않은 nature 영상 선택
-                        selected_fallback = None
-                        for video in fallback:
-                            if video.id not in used_video_ids:
-                                selected_fallback = video
-                                used_video_ids.add(video.id)
-                                break
-
-                        # 모든 nature 영상도 이미 사용됨 → 첫 번째 재사용
-                        if selected_fallback is None:
-                            selected_fallback = fallback[0]
-                            logger.warning(
-                                f"  Cut {cut.index+1}: Nature fallback also used, reusing ID {fallback[0].id}"
-                            )
-
-                        subtitle_clips.append({
-                            'cut': cut,
-                            'description': desc,
-                            'video': selected_fallback
-                        })
-                    else:
-                        # Fallback 2: 이전 cut의 영상 재사용 (최후의 수단)
-                        if subtitle_clips:
-                            prev_video = subtitle_clips[-1]['video']
-                            logger.warning(
-                                f"  Cut {cut.index+1}: Using previous video (ID {prev_video.id}) as final fallback"
-                            )
-                            subtitle_clips.append({
-                                'cut': cut,
-                                'description': desc,
-                                'video': prev_video
-                            })
-                            # 이전 영상 재사용은 used_video_ids에 추가 안 함 (의도적 중복)
-                        else:
-                            # 첫 번째 cut인데 실패 → 에러 (이건 거의 불가능)
-                            logger.error(f"  Cut {cut.index+1}: Failed to find any video (first cut)")
-                            raise ValueError(f"Failed to find video for first cut (index {cut.index})")
-
-            logger.info(f"[Stage 3/3] 영상 매칭 완료: {len(subtitle_clips)}개 컷")
-
-            # used_clip_ids 생성 (VideoCompositor에서 사용)
-            used_clip_ids = [f"pexels_{clip['video'].id}" for clip in subtitle_clips]
-
-            # 🆕 clips_metadata 생성 (재생성 시 Pexels URL 재사용)
-            clips_metadata = []
-            for clip_data in subtitle_clips:
-                video = clip_data['video']
-                cut = clip_data['cut']
-                trim_dur = cut.duration if video.duration > cut.duration + 2 else None
-                clips_metadata.append({
-                    "id": f"pexels_{video.id}",
-                    "url": video.file_path,  # Pexels 다운로드 URL
-                    "duration": video.duration,
-                    "trim_duration": trim_dur,
-                    "start_time": cut.start_time,
-                    "end_time": cut.end_time,
-                })
-            logger.info(f"[Stage 3/3] clips_metadata 생성 완료: {len(clips_metadata)}개")
-
-            # subtitle_clips → selected_clips 형식 변환 (VideoCompositor 호환성)
-            from app.services.video_clip_selector import SelectedClip
-            from app.services.fixed_segment_analyzer import SegmentStrategy
-            selected_clips = []
-
-            for clip_data in subtitle_clips:
-                cut = clip_data['cut']
-                video = clip_data['video']
-
-                # SegmentStrategy 객체 생성 (Cut → SegmentStrategy 변환)
-                segment = SegmentStrategy(
-                    segment_type="subtitle_based",  # 새로운 타입
-                    start_time=cut.start_time,
-                    end_time=cut.end_time,
-                    strategy="visual_description",  # LLM 감독 모드
-                    confidence=clip_data['description'].confidence
-                )
+    desc_generator = VisualDescriptionGenerator(mode=visual_mode)
 
-                # SelectedClip 객체 생성 (trim_duration만 지정, needs_trim은 property)
-                trim_dur = cut.duration if video.duration > cut.duration + 2 else None
-                selected_clip = SelectedClip(
-                    segment=segment,
-                    video=video,
-                    trim_duration=trim_dur,
-                    additional_videos=[]  # 단일 영상
-                )
+    # 전체 컷을 구조화 JSON 배치 요청으로 생성 (실패 컷만 개별 병렬 요청)
+    visual_descriptions = desc_generator.generate_batch(
+        subtitle_groups=[cut.subtitle_texts for cut in cuts],
+        context="documentary"
+    )
 
-                selected_clips.append(selected_clip)
+    for cut, desc in zip(cuts, visual_descriptions):
+        logger.info(
+            f"  Cut {cut.index+1} Visual Query: {desc.visual_query[:80]}... "
+            f"(type: {desc.description_type}, confidence: {desc.confidence:.2f})"
+        )
 
-            logger.info(f"[Stage 3/3] subtitle_clips → selected_clips 변환 완료")
+    return {"descriptions": [asdict(d) for d in visual_descriptions]}, []
 
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": 35, "step": f"✅ 영상 준비가 완료되었습니다 ({len(subtitle_clips)}개 구간)"}
+
+def _stage_search(
+    task,
+    church_id: str,
+    cut_data: dict,
+    visual_descriptions: list,
+    video_tone: str,
+    shared_context: dict | None = None
+) -> tuple[dict, list]:
+    """
+    Stage search: 컷별 Pexels 영상 매칭 → selected_clips / clips_metadata
+
+    컷 검색은 CutSearchScheduler로 병렬 실행된다. 배치(shared_context)에서는
+    같은 배치의 다른 영상과 클립이 겹치지 않도록 Redis 집합(clip_reservation_key)으로
+    Pexels ID를 선점한다.
+    """
+    from app.services.video_clip_selector import SelectedClip
+    from app.services.fixed_segment_analyzer import SegmentStrategy
+
+    if cut_data.get("segments"):
+        # ============ 기존 방식: Segment-Based Clips ============
+        # Step 2.3: 구간별 영상 선택 (Pexels API)
+        task.update_state(
+            state="PROCESSING",
+            meta={"progress": 32, "step": "구간별 배경 영상 검색 중..."}
+        )
+
+        segments = [SegmentStrategy(**seg) for seg in cut_data["segments"]]
+        clip_selector_new = get_new_clip_selector()
+        selected_clips = clip_selector_new.select_clips(segments)
+
+        logger.info(f"[Step 2.3] 영상 선택 완료: {len(selected_clips)}개")
+        for i, clip in enumerate(selected_clips):
+            trim_info = f"trim to {clip.trim_duration:.1f}s" if clip.needs_trim else "no trim"
+            multi_info = f"+ {len(clip.additional_videos)} more" if clip.is_multi_video else ""
+            logger.info(
+                f"  클립 {i+1}: {clip.segment.segment_type} - {clip.segment.strategy} "
+                f"({trim_info}) {multi_info}"
             )
 
+        # used_clip_ids 생성 (VideoCompositor에서 사용할 video ID 리스트)
+        used_clip_ids = []
+        clips_metadata = []  # 🆕 재생성용 메타데이터
+
+        for clip in selected_clips:
+            used_clip_ids.append(f"pexels_{clip.video.id}")
+            clips_metadata.append({
+                "id": f"pexels_{clip.video.id}",
+                "url": clip.video.file_path,
+                "duration": clip.video.duration,
+                "trim_duration": clip.trim_duration,
+                "start_time": clip.segment.start_time,
+                "end_time": clip.segment.end_time,
+            })
+            if clip.additional_videos:
+                for vid in clip.additional_videos:
+                    used_clip_ids.append(f"pexels_{vid.id}")
+                    clips_metadata.append({
+                        "id": f"pexels_{vid.id}",
+                        "url": vid.file_path,
+                        "duration": vid.duration,
+                        "trim_duration": None,
+                        "start_time": clip.segment.start_time,
+                        "end_time": clip.segment.end_time,
+                    })
+
+        logger.info(f"[Step 2.3] clips_metadata 생성 완료: {len(clips_metadata)}개")
+
+        return {
+            "selected_clips": _serialize_selected_clips(selected_clips),
+            "subtitle_clips": [],
+            "used_clip_ids": used_clip_ids,
+            "clips_metadata": clips_metadata
+        }, []
+
+    # ============ 새로운 방식: Subtitle-Based Clips ============
+    cuts = [deserialize_cut(c) for c in cut_data["cuts"]]
+
+    # Stage 3: Pexels 검색
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 32, "step": f"🔍 은혜로운 영상을 찾고 있습니다... ({len(cuts)}개 구간)"}
+    )
+
+    from app.services.background_video_search import PexelsVideoSearch
+    pexels_search = PexelsVideoSearch(video_tone=video_tone)
+
+    # 최근 10개 영상에서 사용된 클립 ID 가져오기 (전역 중복 방지)
+    if shared_context is not None:
+        recently_used_global = set(shared_context["recently_used_clips"])
+    else:
+        recently_used_global = get_clip_history_service().get_recently_used_clips(church_id, limit=10)
+    logger.info(f"[ClipHistory] 최근 10개 영상에서 사용된 클립: {len(recently_used_global)}개")
+
+    # 전역 중복 + 현재 영상 중복 방지 (배치: Redis 집합으로 다른 영상과도 선점 공유)
+    reservation = ClipReservation(
+        initial_ids=recently_used_global,
+        redis_key=(shared_context or {}).get("clip_reservation_key")
+    )
+
+    # 컷별 검색 병렬 실행 (대체 쿼리 / nature / 이전 컷 Fallback 포함)
+    scheduler = CutSearchScheduler(
+        pexels_search,
+        reservation,
+        max_workers=settings.CUT_SEARCH_CONCURRENCY
+    )
+    subtitle_clips = scheduler.search_all(cuts, visual_descriptions)
+
+    logger.info(f"[Stage 3/3] 영상 매칭 완료: {len(subtitle_clips)}개 컷")
+
+    # used_clip_ids 생성 (VideoCompositor에서 사용)
+    used_clip_ids = [f"pexels_{clip['video'].id}" for clip in subtitle_clips]
+
+    # 🆕 clips_metadata 생성 (재생성 시 Pexels URL 재사용)
+    clips_metadata = []
+    for clip_data in subtitle_clips:
+        video = clip_data['video']
+        cut = clip_data['cut']
+        trim_dur = cut.duration if video.duration > cut.duration + 2 else None
+        clips_metadata.append({
+            "id": f"pexels_{video.id}",
+            "url": video.file_path,  # Pexels 다운로드 URL
+            "duration": video.duration,
+            "trim_duration": trim_dur,
+            "start_time": cut.start_time,
+            "end_time": cut.end_time,
+        })
+    logger.info(f"[Stage 3/3] clips_metadata 생성 완료: {len(clips_metadata)}개")
+
+    # subtitle_clips → selected_clips 형식 변환 (VideoCompositor 호환성)
+    selected_clips = []
+    for clip_data in subtitle_clips:
+        cut = clip_data['cut']
+        video = clip_data['video']
+
+        # SegmentStrategy 객체 생성 (Cut → SegmentStrategy 변환)
+        segment = SegmentStrategy(
+            segment_type="subtitle_based",  # 새로운 타입
+            start_time=cut.start_time,
+            end_time=cut.end_time,
+            strategy="visual_description",  # LLM 감독 모드
+            confidence=clip_data['description'].confidence
+        )
+
+        # SelectedClip 객체 생성 (trim_duration만 지정, needs_trim은 property)
+        trim_dur = cut.duration if video.duration > cut.duration + 2 else None
+        selected_clip = SelectedClip(
+            segment=segment,
+            video=video,
+            trim_duration=trim_dur,
+            additional_videos=[]  # 단일 영상
+        )
+
+        selected_clips.append(selected_clip)
+
+    logger.info(f"[Stage 3/3] subtitle_clips → selected_clips 변환 완료")
+
+    return {
+        "selected_clips": _serialize_selected_clips(selected_clips),
+        "subtitle_clips": [
+            {
+                "cut": serialize_cut(c['cut']),
+                "description": asdict(c['description']),
+                "video": serialize_video(c['video']),
+            }
+            for c in subtitle_clips
+        ],
+        "used_clip_ids": used_clip_ids,
+        "clips_metadata": clips_metadata
+    }, []
+
+
+def _serialize_selected_clips(selected_clips: list) -> list[dict]:
+    """SelectedClip 리스트 → 체크포인트용 dict"""
+    return [
+        {
+            "video": serialize_video(clip.video),
+            "segment": asdict(clip.segment),
+            "trim_duration": clip.trim_duration,
+            "additional_videos": [serialize_video(v) for v in clip.additional_videos],
+        }
+        for clip in selected_clips
+    ]
+
+
+def _deserialize_selected_clips(data: list[dict]) -> list:
+    """체크포인트 dict → SelectedClip 리스트"""
+    from app.services.video_clip_selector import SelectedClip
+    from app.services.fixed_segment_analyzer import SegmentStrategy
+
+    return [
+        SelectedClip(
+            video=deserialize_video(item["video"]),
+            segment=SegmentStrategy(**item["segment"]),
+            trim_duration=item["trim_duration"],
+            additional_videos=[deserialize_video(v) for v in item["additional_videos"]],
+        )
+        for item in data
+    ]
+
+
+def _stage_compose(
+    task,
+    supabase,
+    checkpoint: PipelineCheckpoint,
+    video_id: str,
+    selected_clips: list,
+    subtitle_clips: list | None,
+    cuts: list,
+    srt_path: str,
+    audio_file_path: str,
+    audio_duration: float,
+    bgm_id: str | None,
+    bgm_volume: float,
+    generate_edit_pack: bool,
+    temp_files: list,
+    shared_context: dict | None = None
+) -> tuple[dict, list]:
+    """
+    Stage compose: BGM/인트로/아웃트로 준비 → FFmpeg 합성 → Edit Pack (옵션)
+
+    최종 영상/베이스 영상/Edit Pack은 체크포인트 디렉토리로 옮겨
+    업로드 단계가 실패해도 재합성 없이 재개할 수 있게 한다.
+    """
+    # ========================================
+    # Step 3: FFmpeg 영상 합성 (70%)
+    # ========================================
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 35, "step": "영상 합성 중... (시간 소요)"}
+    )
+
+    # BGM 다운로드 (옵션)
+    bgm_file_path = None
+    if bgm_id:
+        bgm_url = None
+        if shared_context is not None:
+            bgm_url = shared_context.get("bgm_url")
         else:
-            # ============ 기존 방식: Segment-Based Clips ============
-            logger.info("[Step 2.2] 📊 Legacy: Segment-Based Clip Selection")
+            bgm_res = supabase.table("bgms").select("file_path").eq("id", bgm_id).single().execute()
+            if bgm_res.data:
+                bgm_url = _resolve_bgm_url(bgm_res.data["file_path"])
+
+        if bgm_url:
+            bgm_file_path = get_asset_cache().fetch_url(bgm_url, _reserve_temp_file(".mp3", temp_files))
+            logger.info(f"[Step 2.0] BGM 다운로드 완료: {bgm_id}")
+
+    # 썸네일 레이아웃 조회 (인트로/아웃트로 사용 여부 확인)
+    # generation_mode 무관하게 항상 인트로/아웃트로 사용 가능
+    thumbnail_layout = None
+    use_thumbnail_intro = False
+    intro_duration = 2.0
+    use_outro = False
+    outro_duration = 3.0
+    thumbnail_image_path = None
+    outro_image_path = None
+    local_bg_path = None
 
-            # Step 2.2: 구간 분석 (도입/중간/마무리)
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": 28, "step": "도입/중간/마무리 구간 분석 중..."}
-            )
+    try:
+        video_record = supabase.table("videos").select(
+            "thumbnail_layout, title"
+        ).eq("id", video_id).single().execute()
 
-            segment_analyzer = get_fixed_segment_analyzer()
-            segments = segment_analyzer.analyze_segments(
-                subtitles=subtitles,
-                subtitle_timings=subtitle_timings
-            )
+        if video_record.data and video_record.data.get("thumbnail_layout"):
+            thumbnail_layout = video_record.data["thumbnail_layout"]
+            intro_settings = thumbnail_layout.get("intro_settings", {})
+            use_thumbnail_intro = intro_settings.get("useAsIntro", False)
+            intro_duration = intro_settings.get("introDuration", 2.0)
+            # 아웃트로 사용 여부
+            use_outro = intro_settings.get("useAsOutro", False)
+            outro_duration = intro_settings.get("outroDuration", 3.0)
 
-            logger.info(f"[Step 2.2] 구간 분석 완료: {len(segments)}개 구간")
-            for i, seg in enumerate(segments):
-                logger.info(
-                    f"  구간 {i+1}: {seg.segment_type} ({seg.start_time:.1f}s ~ {seg.end_time:.1f}s) "
-                    f"- {seg.strategy}, confidence={seg.confidence:.2f}"
-                )
+            logger.info(f"[Step 3] 썸네일 레이아웃 발견 - 인트로: {use_thumbnail_intro}, 아웃트로: {use_outro}")
+    except Exception as e:
+        logger.warning(f"썸네일 레이아웃 조회 실패 (무시하고 진행): {e}")
 
-            # Step 2.3: 구간별 영상 선택 (Pexels API)
-            self.update_state(
+    # 썸네일 인트로 사용 시 이미지 생성
+    if use_thumbnail_intro and thumbnail_layout:
+        try:
+            task.update_state(
                 state="PROCESSING",
-                meta={"progress": 32, "step": "구간별 배경 영상 검색 중..."}
+                meta={"progress": 38, "step": "인트로 썸네일 생성 중..."}
             )
 
-            clip_selector_new = get_new_clip_selector()
-            selected_clips = clip_selector_new.select_clips(segments)
+            thumbnail_gen = get_thumbnail_generator()
+            text_boxes = thumbnail_layout.get("text_boxes", [])
+
+            # 배경 이미지 URL 가져오기
+            background_url = thumbnail_layout.get("background_image_url", "")
+
+            if background_url:
+                local_bg_path = _download_background_image(background_url, temp_files)
 
-            logger.info(f"[Step 2.3] 영상 선택 완료: {len(selected_clips)}개")
-            for i, clip in enumerate(selected_clips):
-                trim_info = f"trim to {clip.trim_duration:.1f}s" if clip.needs_trim else "no trim"
-                multi_info = f"+ {len(clip.additional_videos)} more" if clip.is_multi_video else ""
-                logger.info(
-                    f"  클립 {i+1}: {clip.segment.segment_type} - {clip.segment.strategy} "
-                    f"({trim_info}) {multi_info}"
+                # 범용 텍스트박스 기반 썸네일 생성 (ID 무관하게 위치/색상으로 렌더링)
+                thumbnail_image_path = thumbnail_gen.generate_thumbnail_with_textboxes(
+                    background_image_path=local_bg_path,
+                    text_boxes=text_boxes,
+                    overlay_opacity=0.3,
+                    output_size=(1920, 1080)
                 )
+                temp_files.append(thumbnail_image_path)
+                logger.info(f"[Step 3] 인트로 썸네일 이미지 생성 완료: {thumbnail_image_path}")
+            else:
+                logger.warning("[Step 3] 배경 이미지 URL 없음 - 인트로 생략")
+                use_thumbnail_intro = False
 
-            # used_clip_ids 생성 (VideoCompositor에서 사용할 video ID 리스트)
-            used_clip_ids = []
-            clips_metadata = []  # 🆕 재생성용 메타데이터
-
-            for clip in selected_clips:
-                used_clip_ids.append(f"pexels_{clip.video.id}")
-                clips_metadata.append({
-                    "id": f"pexels_{clip.video.id}",
-                    "url": clip.video.file_path,
-                    "duration": clip.video.duration,
-                    "trim_duration": clip.trim_duration,
-                    "start_time": clip.segment.start_time,
-                    "end_time": clip.segment.end_time,
-                })
-                if clip.additional_videos:
-                    for vid in clip.additional_videos:
-                        used_clip_ids.append(f"pexels_{vid.id}")
-                        clips_metadata.append({
-                            "id": f"pexels_{vid.id}",
-                            "url": vid.file_path,
-                            "duration": vid.duration,
-                            "trim_duration": None,
-                            "start_time": clip.segment.start_time,
-                            "end_time": clip.segment.end_time,
-                        })
-
-            logger.info(f"[Step 2.3] clips_metadata 생성 완료: {len(clips_metadata)}개")
+        except Exception as e:
+            logger.warning(f"인트로 썸네일 생성 실패 (인트로 없이 진행): {e}")
+            use_thumbnail_intro = False
+            thumbnail_image_path = None
 
-            self.update_state(
+    # 아웃트로 이미지 생성 (인트로와 같은 배경, 텍스트 없이)
+    if use_outro and thumbnail_layout:
+        try:
+            task.update_state(
                 state="PROCESSING",
-                meta={"progress": 35, "step": f"{len(selected_clips)}개 구간별 클립 선택됨"}
+                meta={"progress": 42, "step": "아웃트로 이미지 생성 중..."}
             )
 
-        # ========================================
-        # Step 3: FFmpeg 영상 합성 (70%)
-        # ========================================
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 35, "step": "영상 합성 중... (시간 소요)"}
-        )
+            # 배경 이미지 다운로드 (인트로와 동일한 배경 사용)
+            background_url = thumbnail_layout.get("background_image_url", "")
 
-        # 썸네일 레이아웃 조회 (인트로/아웃트로 사용 여부 확인)
-        # generation_mode 무관하게 항상 인트로/아웃트로 사용 가능
-        thumbnail_layout = None
-        use_thumbnail_intro = False
-        intro_duration = 2.0
-        use_outro = False
-        outro_duration = 3.0
-        thumbnail_image_path = None
-        outro_image_path = None
+            if background_url:
+                # 이미 다운로드한 로컬 파일이 있으면 재사용
+                if local_bg_path is None:
+                    local_bg_path = _download_background_image(background_url, temp_files)
 
-        # 썸네일 레이아웃이 있으면 항상 사용
-        if True:  # generation_mode와 무관
-            try:
-                video_record = supabase.table("videos").select(
-                    "thumbnail_layout, title"
-                ).eq("id", video_id).single().execute()
-    
-                if video_record.data and video_record.data.get("thumbnail_layout"):
-                    thumbnail_layout = video_record.data["thumbnail_layout"]
-                    intro_settings = thumbnail_layout.get("intro_settings", {})
-                    use_thumbnail_intro = intro_settings.get("useAsIntro", False)
-                    intro_duration = intro_settings.get("introDuration", 2.0)
-                    # 아웃트로 사용 여부
-                    use_outro = intro_settings.get("useAsOutro", False)
-                    outro_duration = intro_settings.get("outroDuration", 3.0)
-    
-                    logger.info(f"[Step 3] 썸네일 레이아웃 발견 - 인트로: {use_thumbnail_intro}, 아웃트로: {use_outro}")
-            except Exception as e:
-                logger.warning(f"썸네일 레이아웃 조회 실패 (무시하고 진행): {e}")
-    
-            # 썸네일 인트로 사용 시 이미지 생성
-            thumbnail_image_path = None
-            if use_thumbnail_intro and thumbnail_layout:
-                try:
-                    self.update_state(
-                        state="PROCESSING",
-                        meta={"progress": 38, "step": "인트로 썸네일 생성 중..."}
-                    )
-    
-                    thumbnail_gen = get_thumbnail_generator()
-                    text_boxes = thumbnail_layout.get("text_boxes", [])
-    
-                    # 배경 이미지 URL 가져오기
-                    background_url = thumbnail_layout.get("background_image_url", "")
-    
-                    if background_url:
-                        # 원격 URL인 경우 임시 다운로드
-                        import httpx
-                        import tempfile as tf
-    
-                        if background_url.startswith("http"):
-                            # URL 공백 인코딩
-                            from urllib.parse import quote, urlparse, urlunparse
-                            parsed = urlparse(background_url)
-                            encoded_path = quote(parsed.path, safe='/')
-                            background_url = urlunparse(parsed._replace(path=encoded_path))
-    
-                            response = httpx.get(background_url, timeout=30.0)
-                            response.raise_for_status()
-    
-                            # 임시 파일로 저장
-                            with tf.NamedTemporaryFile(delete=False, suffix=".jpg") as f:
-                                f.write(response.content)
-                                local_bg_path = f.name
-                            temp_files.append(local_bg_path)
-                        else:
-                            local_bg_path = background_url
-    
-                        # 범용 텍스트박스 기반 썸네일 생성 (ID 무관하게 위치/색상으로 렌더링)
-                        thumbnail_image_path = thumbnail_gen.generate_thumbnail_with_textboxes(
-                            background_image_path=local_bg_path,
-                            text_boxes=text_boxes,
-                            overlay_opacity=0.3,
-                            output_size=(1920, 1080)
-                        )
-                        temp_files.append(thumbnail_image_path)
-                        logger.info(f"[Step 3] 인트로 썸네일 이미지 생성 완료: {thumbnail_image_path}")
-                    else:
-                        logger.warning("[Step 3] 배경 이미지 URL 없음 - 인트로 생략")
-                        use_thumbnail_intro = False
-    
-                except Exception as e:
-                    logger.warning(f"인트로 썸네일 생성 실패 (인트로 없이 진행): {e}")
-                    use_thumbnail_intro = False
-                    thumbnail_image_path = None
-    
-            # 아웃트로 이미지 생성 (인트로와 같은 배경, 텍스트 없이)
-            outro_image_path = None
-            if use_outro and thumbnail_layout:
-                try:
-                    self.update_state(
-                        state="PROCESSING",
-                        meta={"progress": 42, "step": "아웃트로 이미지 생성 중..."}
-                    )
-    
-                    # 배경 이미지 다운로드 (인트로와 동일한 배경 사용)
-                    background_url = thumbnail_layout.get("background_image_url", "")
-    
-                    if background_url:
-                        import httpx
-                        import tempfile as tf
-    
-                        # 이미 다운로드한 로컬 파일이 있으면 재사용
-                        if 'local_bg_path' not in locals():
-                            if background_url.startswith("http"):
-                                from urllib.parse import quote, urlparse, urlunparse
-                                parsed = urlparse(background_url)
-                                encoded_path = quote(parsed.path, safe='/')
-                                background_url = urlunparse(parsed._replace(path=encoded_path))
-    
-                                response = httpx.get(background_url, timeout=30.0)
-                                response.raise_for_status()
-    
-                                with tf.NamedTemporaryFile(delete=False, suffix=".jpg") as f:
-                                    f.write(response.content)
-                                    local_bg_path = f.name
-                                temp_files.append(local_bg_path)
-                            else:
-                                local_bg_path = background_url
-    
-                        # 아웃트로 이미지 생성 (텍스트 없이 배경만)
-                        thumbnail_gen = get_thumbnail_generator()
-                        outro_image_path = thumbnail_gen.generate_outro_image(
-                            background_image_path=local_bg_path,
-                            overlay_opacity=0.3,
-                            output_size=(1920, 1080)
-                        )
-                        temp_files.append(outro_image_path)
-                        logger.info(f"[Step 3] 아웃트로 이미지 생성 완료: {outro_image_path}")
-                    else:
-                        logger.warning("[Step 3] 배경 이미지 URL 없음 - 아웃트로 생략")
-                        use_outro = False
-    
-                except Exception as e:
-                    logger.warning(f"아웃트로 이미지 생성 실패 (아웃트로 없이 진행): {e}")
-                    use_outro = False
-                    outro_image_path = None
-    
-        # VideoClipProcessor로 클립 전처리 (다운로드 + 구간별 처리)
-        logger.info("[Step 3] VideoClipProcessor로 클립 전처리 시작")
-        clip_processor = get_clip_processor()
-
-        # 임시 출력 경로
-        temp_output_path = os.path.join(
-            tempfile_module.gettempdir(),
-            f"qt_composed_{video_id}.mp4"
+                # 아웃트로 이미지 생성 (텍스트 없이 배경만)
+                thumbnail_gen = get_thumbnail_generator()
+                outro_image_path = thumbnail_gen.generate_outro_image(
+                    background_image_path=local_bg_path,
+                    overlay_opacity=0.3,
+                    output_size=(1920, 1080)
+                )
+                temp_files.append(outro_image_path)
+                logger.info(f"[Step 3] 아웃트로 이미지 생성 완료: {outro_image_path}")
+            else:
+                logger.warning("[Step 3] 배경 이미지 URL 없음 - 아웃트로 생략")
+                use_outro = False
+
+        except Exception as e:
+            logger.warning(f"아웃트로 이미지 생성 실패 (아웃트로 없이 진행): {e}")
+            use_outro = False
+            outro_image_path = None
+
+    # 출력 경로 (체크포인트 산출물)
+    output_video_path = checkpoint.artifact_path("composed.mp4")
+
+    # 구간별 progress 업데이트를 위한 콜백
+    def progress_callback(current_segment, total_segments):
+        progress = 35 + int((current_segment / total_segments) * 30)  # 35% ~ 65%
+        task.update_state(
+            state="PROCESSING",
+            meta={"progress": progress, "step": f"구간 {current_segment}/{total_segments} 합성 중..."}
         )
 
-        # 구간별 progress 업데이트를 위한 콜백
-        def progress_callback(current_segment, total_segments):
-            progress = 35 + int((current_segment / total_segments) * 30)  # 35% ~ 65%
-            self.update_state(
-                state="PROCESSING",
-                meta={"progress": progress, "step": f"구간 {current_segment}/{total_segments} 합성 중..."}
-            )
+    # 미리보기 초안: 최종 렌더 전에 540p 영상을 먼저 업로드 (같은 컷/클립 사용)
+    # 재시도로 다시 합성하면 이전 시도의 미리보기 객체는 새 미리보기로 교체 후 삭제
+    preview_urls = []
+
+    def preview_callback(draft_path):
+        previous_url = _current_preview_path(supabase, video_id)
+        r2 = get_r2_storage()
+        preview_url = r2.upload_file(draft_path, "previews", "video/mp4")
+        supabase.table("videos").update({"preview_video_path": preview_url}).eq("id", video_id).execute()
+        if previous_url and previous_url != preview_url:
+            r2.delete_file(previous_url)
+        preview_urls.append(preview_url)
+        logger.info(f"[Step 3] 미리보기 업로드 완료: {preview_url}")
+        task.update_state(
+            state="PROCESSING",
+            meta={"progress": 65, "step": "미리보기 준비 완료 (최종 영상 렌더링 중...)", "preview_url": preview_url}
+        )
+
+    use_preview = settings.PREVIEW_RENDER and settings.SINGLE_PASS_RENDER
+    fade_duration = 1.0
+
+    # VideoClipProcessor로 클립 전처리 (다운로드 + 구간별 처리)
+    # 작업별 격리 디렉토리 사용 → 같은 노드의 동시 작업과 구간 파일 충돌 없음, 종료 시 통째로 삭제
+    logger.info("[Step 3] VideoClipProcessor로 클립 전처리 시작")
+    with JobWorkspace(video_id, label="compose") as workspace:
+        clip_processor = get_clip_processor(
+            temp_dir=str(workspace.path),
+            download_workers=settings.SEGMENT_DOWNLOAD_CONCURRENCY,
+            encode_workers=settings.SEGMENT_ENCODE_CONCURRENCY or None
+        )
 
         # 클립 처리 실행 (다운로드 + 전처리 + 베이스 영상 생성)
         composition_result = clip_processor.compose_video(
             selected_clips=selected_clips,
-            output_path=temp_output_path,
+            output_path=output_video_path,
             subtitle_path=srt_path,
             audio_path=audio_file_path,
             bgm_path=bgm_file_path,
@@ -838,226 +1124,359 @@ def process_video_task(
             audio_duration=audio_duration,
             thumbnail_path=thumbnail_image_path if use_thumbnail_intro else None,
             thumbnail_duration=intro_duration,
-            fade_duration=1.0,
+            fade_duration=fade_duration,
             outro_path=outro_image_path if use_outro else None,
             outro_duration=outro_duration,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            single_pass=settings.SINGLE_PASS_RENDER,
+            preview_callback=preview_callback if use_preview else None,
+            final_render_nice=settings.FINAL_RENDER_NICE
         )
 
-        output_video_path = composition_result.output_path
-
         logger.info(
             f"[Step 3] VideoCompositor 합성 완료: {composition_result.segments_count}개 구간, "
             f"총 {composition_result.total_duration:.1f}초"
         )
 
-        # 임시 파일 정리 (output_path 제외)
-        for temp_file in composition_result.temp_files:
-            if temp_file != composition_result.output_path:
-                try:
-                    os.unlink(temp_file)
-                except Exception as e:
-                    logger.warning(f"임시 파일 삭제 실패: {temp_file} - {e}")
+        # 베이스 영상은 업로드 단계에서 필요 → 작업 디렉토리 삭제 전에 체크포인트 디렉토리로 이동
+        base_video_path = None
+        if composition_result.base_video_path and os.path.exists(composition_result.base_video_path):
+            base_video_path = checkpoint.artifact_path("base_video.mp4")
+            shutil.move(str(composition_result.base_video_path), base_video_path)
+
+    logger.info(f"[Step 3/5] 영상 합성 완료: {output_video_path}")
+    preview_meta = _preview_meta(preview_urls[0] if preview_urls else None)
+
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 70, "step": "Video composition complete", **preview_meta}
+    )
+
+    # ========================================
+    # Step 3.5: Edit Pack 생성 (옵션)
+    # ========================================
+    edit_pack_path = None
+    logger.info(f"[DEBUG Edit Pack] generate_edit_pack={generate_edit_pack}, subtitle_based={subtitle_clips is not None}")
+    if generate_edit_pack and subtitle_clips is not None:
+        try:
+            task.update_state(
+                state="PROCESSING",
+                meta={"progress": 72, "step": "Creating CapCut Edit Pack...", **preview_meta}
+            )
 
-        temp_files.append(output_video_path)
+            from app.services.edit_pack_generator import get_edit_pack_generator
+            edit_pack_gen = get_edit_pack_generator()
 
-        logger.info(f"[Step 3/5] 영상 합성 완료: {output_video_path}")
+            edit_pack_result = edit_pack_gen.generate_edit_pack(
+                video_id=video_id,
+                cuts=cuts,
+                clip_data=subtitle_clips,
+                srt_path=srt_path,
+                audio_path=audio_file_path,
+                audio_duration=audio_duration
+            )
 
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 70, "step": "Video composition complete"}
-        )
+            temp_files.extend(edit_pack_result.temp_files)
 
-        # ========================================
-        # Step 3.5: Edit Pack 생성 (옵션)
-        # ========================================
-        edit_pack_url = None
-        logger.info(f"[DEBUG Edit Pack] generate_edit_pack={generate_edit_pack}, USE_SUBTITLE_BASED_CLIPS={USE_SUBTITLE_BASED_CLIPS}")
-        if generate_edit_pack and USE_SUBTITLE_BASED_CLIPS:
-            try:
-                self.update_state(
-                    state="PROCESSING",
-                    meta={"progress": 72, "step": "Creating CapCut Edit Pack..."}
-                )
+            edit_pack_path = checkpoint.artifact_path("edit_pack.zip")
+            shutil.move(edit_pack_result.zip_path, edit_pack_path)
 
-                from app.services.edit_pack_generator import get_edit_pack_generator
-                edit_pack_gen = get_edit_pack_generator()
+            logger.info(
+                f"[Step 3.5] Edit Pack created: {edit_pack_result.clips_count} clips, "
+                f"{edit_pack_result.total_duration:.1f}s"
+            )
 
-                edit_pack_result = edit_pack_gen.generate_edit_pack(
-                    video_id=video_id,
-                    cuts=cuts,
-                    clip_data=subtitle_clips,
-                    srt_path=srt_path,
-                    audio_path=audio_file_path,
-                    audio_duration=audio_duration
-                )
+        except Exception as e:
+            logger.warning(f"[Step 3.5] Edit Pack generation failed (continuing): {e}")
+            edit_pack_path = None
+
+    # 최종 영상 타임라인 (persist 단계에서 산출물 캐시에 등록 → 첫 자막 수정부터 부분 합성)
+    # 베이스 키 길이는 regenerate_video_task와 같게 원본 오디오 기준 (정규화 음성과 ms 단위로 다를 수 있음)
+    timeline = {
+        "single_pass": settings.SINGLE_PASS_RENDER,
+        "source_duration": get_video_composer().get_audio_duration(audio_file_path),
+        "offset": intro_duration if use_thumbnail_intro else 0.0,
+        "fade": fade_duration,
+        "intro": bool(use_thumbnail_intro),
+        "outro": bool(use_outro),
+    }
 
-                temp_files.append(edit_pack_result.zip_path)
-                temp_files.extend(edit_pack_result.temp_files)
+    artifacts = [p for p in (output_video_path, base_video_path, edit_pack_path) if p]
+    return {
+        "output_path": output_video_path,
+        "base_video_path": base_video_path,
+        "edit_pack_path": edit_pack_path,
+        "preview_video_url": preview_urls[0] if preview_urls else None,
+        "timeline": timeline
+    }, artifacts
+
+
+def _download_background_image(background_url: str, temp_files: list) -> str:
+    """썸네일 배경 이미지 준비 (원격 URL이면 임시 다운로드)"""
+    if not background_url.startswith("http"):
+        return background_url
+
+    from urllib.parse import quote, urlparse, urlunparse
+
+    # URL 공백 인코딩
+    parsed = urlparse(background_url)
+    encoded_path = quote(parsed.path, safe='/')
+    background_url = urlunparse(parsed._replace(path=encoded_path))
+
+    # 임시 파일로 저장 (자주 쓰는 배경은 워커 로컬 캐시에서)
+    return get_asset_cache().fetch_url(background_url, _reserve_temp_file(".jpg", temp_files))
+
+
+def _stage_upload(
+    task,
+    r2,
+    compose_data: dict,
+    srt_path: str,
+    audio_file_path: str
+) -> tuple[dict, list]:
+    """Stage upload: 영상/자막/오디오/베이스 영상/Edit Pack → R2"""
+    # ========================================
+    # Step 4: R2 업로드 (90%)
+    # ========================================
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 75, "step": "Uploading to cloud...", **_preview_meta(compose_data.get("preview_video_url"))}
+    )
+
+    # 업로드 목록 (이름 → upload_file 인자, 마지막 값 = 콘텐츠 주소 업로드 여부)
+    # 자막/오디오/베이스 영상은 같은 내용이면 기존 객체 재사용 (삭제하지 않는 파일)
+    audio_ext = os.path.splitext(audio_file_path)[1].lower()
+    uploads = {
+        "video": (compose_data["output_path"], "videos", "video/mp4", False),
+        "srt": (srt_path, "srt", "text/plain", True),
+        # 오디오 파일 (재생성 시 필요)
+        "audio": (audio_file_path, "audio", "audio/mpeg" if audio_ext == ".mp3" else "audio/mp4", True),
+    }
+    # ✅ 베이스 영상 (재생성 시 클립 재처리 스킵용)
+    if compose_data.get("base_video_path"):
+        uploads["base_video"] = (compose_data["base_video_path"], "base-videos", "video/mp4", True)
+    # ✅ Edit Pack (옵션)
+    if compose_data.get("edit_pack_path"):
+        uploads["edit_pack"] = (compose_data["edit_pack_path"], "edit-packs", "application/zip", False)
+
+    # 모든 산출물 동시 업로드 (큰 파일은 upload_file 내부에서 멀티파트 병렬 전송)
+    with ThreadPoolExecutor(max_workers=len(uploads)) as pool:
+        futures = {
+            name: pool.submit(
+                r2.upload_file,
+                file_path=path,
+                folder=folder,
+                content_type=content_type,
+                content_addressed=content_addressed
+            )
+            for name, (path, folder, content_type, content_addressed) in uploads.items()
+        }
+        urls = {name: future.result() for name, future in futures.items()}
 
-                logger.info(
-                    f"[Step 3.5] Edit Pack created: {edit_pack_result.clips_count} clips, "
-                    f"{edit_pack_result.total_duration:.1f}s"
-                )
+    video_url, srt_url, audio_url = urls["video"], urls["srt"], urls["audio"]
+    base_video_url = urls.get("base_video")
+    edit_pack_url = urls.get("edit_pack")
+    if base_video_url:
+        logger.info(f"[Step 4/5] Base video uploaded: {base_video_url}")
+    if edit_pack_url:
+        logger.info(f"[Step 4/5] Edit Pack uploaded: {edit_pack_url}")
 
-            except Exception as e:
-                logger.warning(f"[Step 3.5] Edit Pack generation failed (continuing): {e}")
-                edit_pack_url = None
+    logger.info(f"[Step 4/5] R2 upload complete (video, srt, audio, base_video, edit_pack)")
 
-        # ========================================
-        # Step 4: R2 업로드 (90%)
-        # ========================================
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 75, "step": "Uploading to cloud..."}
-        )
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 90, "step": "업로드 완료", **_preview_meta(compose_data.get("preview_video_url"))}
+    )
 
-        r2 = get_r2_storage()
+    return {
+        "video_url": video_url,
+        "srt_url": srt_url,
+        "audio_url": audio_url,
+        "base_video_url": base_video_url,
+        "edit_pack_url": edit_pack_url,
+        "preview_video_url": compose_data.get("preview_video_url")
+    }, []
+
+
+def _stage_persist(
+    task,
+    supabase,
+    church_id: str,
+    video_id: str,
+    upload_data: dict,
+    audio_duration: float,
+    used_clip_ids: list,
+    clips_metadata: list,
+    timeline: dict | None = None,
+    srt_path: str | None = None
+) -> tuple[dict, list]:
+    """Stage persist: Supabase 메타데이터 저장 + 산출물 캐시 등록 + 클립 사용 이력 기록"""
+    # ========================================
+    # Step 5: Supabase 메타데이터 저장 (100%)
+    # ========================================
+    task.update_state(
+        state="PROCESSING",
+        meta={"progress": 95, "step": "메타데이터 저장 중...", **_preview_meta(upload_data.get("preview_video_url"))}
+    )
+
+    # videos 테이블 업데이트 (필수 필드)
+    update_data = {
+        "video_file_path": upload_data["video_url"],
+        "srt_file_path": upload_data["srt_url"],
+        "audio_file_path": upload_data["audio_url"],  # R2 URL로 업데이트 (재생성 시 필요)
+        "duration": audio_duration,
+        "status": "completed",
+        "clips_used": used_clip_ids,
+        "clips_metadata": clips_metadata,  # Pexels URL 메타데이터 (재생성 시 사용)
+        "completed_at": datetime.utcnow().isoformat()
+    }
 
-        # 영상 업로드
-        video_url = r2.upload_file(
-            file_path=output_video_path,
-            folder="videos",
-            content_type="video/mp4"
-        )
+    # 베이스 영상 URL 저장 (재생성 시 클립 재처리 스킵)
+    if upload_data.get("base_video_url"):
+        update_data["base_video_path"] = upload_data["base_video_url"]
 
-        # 자막 업로드
-        srt_url = r2.upload_file(
-            file_path=srt_path,
-            folder="srt",
-            content_type="text/plain"
-        )
+    # 최종 영상이 미리보기를 대체 → 미리보기 경로 비우고 R2 객체 삭제
+    if upload_data.get("preview_video_url"):
+        update_data["preview_video_path"] = None
 
-        # 오디오 파일 업로드 (재생성 시 필요)
-        audio_ext = os.path.splitext(audio_file_path)[1].lower()
-        audio_content_type = "audio/mpeg" if audio_ext == ".mp3" else "audio/mp4"
-        audio_url = r2.upload_file(
-            file_path=audio_file_path,
-            folder="audio",
-            content_type=audio_content_type
-        )
+    supabase.table("videos").update(update_data).eq("id", video_id).execute()
 
-        # ✅ 베이스 영상 업로드 (재생성 시 클립 재처리 스킵용)
-        base_video_url = None
-        if composition_result.base_video_path and os.path.exists(composition_result.base_video_path):
-            base_video_url = r2.upload_file(
-                file_path=str(composition_result.base_video_path),
-                folder="base-videos",
-                content_type="video/mp4"
-            )
-            logger.info(f"[Step 4/5] Base video uploaded: {base_video_url}")
-
-        # ✅ Edit Pack 업로드 (옵션)
-        if generate_edit_pack and 'edit_pack_result' in locals() and edit_pack_result:
-            edit_pack_url = r2.upload_file(
-                file_path=edit_pack_result.zip_path,
-                folder="edit-packs",
-                content_type="application/zip"
-            )
-            logger.info(f"[Step 4/5] Edit Pack uploaded: {edit_pack_url}")
+    if upload_data.get("preview_video_url"):
+        get_r2_storage().delete_file(upload_data["preview_video_url"])
 
-        logger.info(f"[Step 4/5] R2 upload complete (video, srt, audio, base_video, edit_pack)")
+    # 베이스/최종 영상을 산출물로 등록 (첫 자막 수정부터 patch_subtitles_task 사용 가능)
+    if timeline and srt_path:
+        try:
+            _adopt_render_artifacts(
+                video_id, upload_data, timeline, srt_path,
+                audio_duration, used_clip_ids, clips_metadata
+            )
+        except Exception as e:
+            logger.warning(f"[Artifacts] 산출물 등록 실패 (자막 수정 시 전체 재생성): {e}")
 
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 90, "step": "업로드 완료"}
-        )
+    # Edit Pack URL 저장 (옵션 - 컬럼이 없어도 에러 무시)
+    if upload_data.get("edit_pack_url"):
+        try:
+            supabase.table("videos").update(
+                {"edit_pack_url": upload_data["edit_pack_url"]}
+            ).eq("id", video_id).execute()
+        except Exception as e:
+            logger.warning(f"edit_pack_url 저장 실패 (컬럼 없음?): {e}")
 
-        # ========================================
-        # Step 5: Supabase 메타데이터 저장 (100%)
-        # ========================================
-        self.update_state(
-            state="PROCESSING",
-            meta={"progress": 95, "step": "메타데이터 저장 중..."}
-        )
+    # 클립 사용 횟수 증가
+    for cid in used_clip_ids:
+        supabase.rpc("increment_clip_used_count", {"clip_id": cid}).execute()
 
-        # videos 테이블 업데이트 (필수 필드)
-        update_data = {
-            "video_file_path": video_url,
-            "srt_file_path": srt_url,
-            "audio_file_path": audio_url,  # R2 URL로 업데이트 (재생성 시 필요)
-            "duration": audio_duration,
-            "status": "completed",
-            "clips_used": used_clip_ids,
-            "clips_metadata": clips_metadata,  # Pexels URL 메타데이터 (재생성 시 사용)
-            "completed_at": datetime.utcnow().isoformat()
-        }
+    # 🆕 전역 클립 사용 이력 기록 (중복 방지용)
+    try:
+        clip_ids_with_urls = []
+        for clip_meta in clips_metadata:
+            # "pexels_12345" → 12345 추출
+            clip_id_str = clip_meta["id"].replace("pexels_", "")
+            if clip_id_str.isdigit():
+                clip_ids_with_urls.append((int(clip_id_str), clip_meta["url"]))
+
+        if clip_ids_with_urls:
+            get_clip_history_service().record_used_clips(church_id, video_id, clip_ids_with_urls)
+            logger.info(f"[ClipHistory] 사용된 클립 {len(clip_ids_with_urls)}개 기록 완료")
+    except Exception as e:
+        logger.exception(f"[ClipHistory] 클립 기록 실패 (무시): {e}")
 
-        # 베이스 영상 URL 저장 (재생성 시 클립 재처리 스킵)
-        if base_video_url:
-            update_data["base_video_path"] = base_video_url
+    logger.info(f"[Step 5/5] 메타데이터 저장 완료")
+    return {"completed_at": update_data["completed_at"]}, []
 
-        supabase.table("videos").update(update_data).eq("id", video_id).execute()
 
-        # Edit Pack URL 저장 (옵션 - 컬럼이 없어도 에러 무시)
-        if edit_pack_url:
-            try:
-                supabase.table("videos").update(
-                    {"edit_pack_url": edit_pack_url}
-                ).eq("id", video_id).execute()
-            except Exception as e:
-                logger.warning(f"edit_pack_url 저장 실패 (컬럼 없음?): {e}")
+def _adopt_render_artifacts(
+    video_id: str,
+    upload_data: dict,
+    timeline: dict,
+    srt_path: str,
+    audio_duration: float,
+    used_clip_ids: list,
+    clips_metadata: list
+) -> None:
+    """
+    영상 생성 결과를 산출물 캐시에 등록 (regenerate_video_task가 남기는 것과 같은 메타데이터)
 
-        # 클립 사용 횟수 증가
-        for cid in used_clip_ids:
-            supabase.rpc("increment_clip_used_count", {"clip_id": cid}).execute()
+    단일 패스 렌더만 최종 영상 = 베이스 영상 + 색보정 + 자막 타임라인이 보장되므로
+    레거시 합성 경로는 베이스 영상만 등록한다.
+    """
+    base_video_url = upload_data.get("base_video_url")
+    if not base_video_url:
+        return
+
+    artifacts = RenderArtifactCache(video_id, storage=get_r2_storage())
+    base_key = _base_artifact_key(
+        clips_metadata, used_clip_ids, timeline.get("source_duration") or audio_duration
+    )
+    artifacts.adopt("base", base_key, base_video_url)
+
+    if not timeline.get("single_pass"):
+        return
+
+    video_url = upload_data["video_url"]
+    artifacts.adopt(
+        "final",
+        artifact_key("final", video=video_url),
+        video_url,
+        base=base_key,
+        srt=hash_file(srt_path),
+        render=get_video_composer().subtitle_signature(),
+        duration=audio_duration,
+        offset=timeline["offset"],
+        fade=timeline["fade"],
+        intro=timeline["intro"],
+        outro=timeline["outro"]
+    )
+    logger.info(f"[Artifacts] 베이스/최종 영상 산출물 등록: {video_id}")
+
+
+def _base_artifact_key(clips_metadata: list, clip_ids: list, audio_duration: float) -> str:
+    """
+    베이스 영상 산출물 키 (실제 합성 입력 기준)
 
-        # 🆕 전역 클립 사용 이력 기록 (중복 방지용)
-        try:
-            clip_ids_with_urls = []
-            for clip_meta in clips_metadata:
-                # "pexels_12345" → 12345 추출
-                clip_id_str = clip_meta["id"].replace("pexels_", "")
-                if clip_id_str.isdigit():
-                    clip_ids_with_urls.append((int(clip_id_str), clip_meta["url"]))
-
-            if clip_ids_with_urls:
-                clip_history.record_used_clips(church_id, video_id, clip_ids_with_urls)
-                logger.info(f"[ClipHistory] 사용된 클립 {len(clip_ids_with_urls)}개 기록 완료")
-        except Exception as e:
-            logger.exception(f"[ClipHistory] 클립 기록 실패 (무시): {e}")
+    clips_metadata가 있으면 그 클립(URL/트림 길이)으로 합성하므로 메타데이터로,
+    없으면 clips 테이블에서 조회하는 클립 ID로 키를 만든다.
+    """
+    clip_inputs = [
+        [m.get("url") or m.get("video_url"), m.get("trim_duration") or m.get("duration")]
+        for m in clips_metadata or []
+    ]
+    return artifact_key("base", clips=clip_inputs or list(clip_ids or []), duration=audio_duration)
 
-        logger.info(f"[Step 5/5] 메타데이터 저장 완료")
 
-        self.update_state(
-            state="SUCCESS",
-            meta={"progress": 100, "step": "완료!"}
-        )
+def _preview_meta(preview_url: str | None) -> dict:
+    """진행 상태 meta에 미리보기 URL 유지 (최종 영상 완료 전까지 /status로 전달)"""
+    return {"preview_url": preview_url} if preview_url else {}
 
-        result = {
-            "status": "completed",
-            "video_id": video_id,
-            "video_url": video_url,
-            "srt_url": srt_url,
-            "duration": audio_duration,
-            "clips_used": used_clip_ids
-        }
 
-        # Edit Pack URL 추가 (생성된 경우)
-        if edit_pack_url:
-            result["edit_pack_url"] = edit_pack_url
+def _current_preview_path(supabase, video_id: str) -> str | None:
+    """현재 저장된 미리보기 경로 (조회 실패 시 None)"""
+    try:
+        res = supabase.table("videos").select("preview_video_path").eq("id", video_id).single().execute()
+        return (res.data or {}).get("preview_video_path")
+    except Exception as e:
+        logger.warning(f"[Preview] 미리보기 경로 조회 실패: {e}")
+        return None
 
-        return result
 
+def _discard_preview(supabase, video_id: str) -> None:
+    """최종 실패 시 미리보기 정리 (preview_video_path 비우고 R2 객체 삭제, _stage_persist와 동일)"""
+    preview_url = _current_preview_path(supabase, video_id)
+    if not preview_url:
+        return
+    try:
+        supabase.table("videos").update({"preview_video_path": None}).eq("id", video_id).execute()
+        get_r2_storage().delete_file(preview_url)
     except Exception as e:
-        logger.exception(f"Video processing failed: {e}")
-
-        # 실패 상태 저장
-        try:
-            supabase.table("videos").update({
-                "status": "failed",
-                "error_message": str(e)[:500]
-            }).eq("id", video_id).execute()
-        except Exception:
-            pass
+        logger.warning(f"[Preview] 미리보기 정리 실패 (무시): {e}")
 
-        # Celery 재시도 (최대 3회)
-        raise self.retry(exc=e, countdown=60)
 
-    finally:
-        # 임시 파일 정리
-        _cleanup_temp_files(temp_files)
-        _cleanup_temp_files([audio_file_path])
+def _reserve_temp_file(suffix: str, temp_files: list) -> str:
+    """빈 임시 파일 경로 예약 (정리 목록에 등록)"""
+    with tempfile_module.NamedTemporaryFile(delete=False, suffix=suffix) as f:
+        temp_files.append(f.name)
+        return f.name
 
 
 def _cleanup_temp_files(paths: list) -> None:
@@ -1083,11 +1502,22 @@ def batch_process_videos_task(
     generation_mode: str = "natural",
     subtitle_length: str = "short",
     generate_edit_pack: bool = False,
-    video_tone: str = "bright"  # v2.2: 영상 톤
+    video_tone: str = "bright",  # v2.2: 영상 톤
+    video_ids: list[str] | None = None
 ):
     """
     주간 영상 일괄 처리 (7개 파일)
 
+    BATCH_FANOUT_ENABLED = True (기본):
+        파일별 process_video_task를 group으로 모든 워커에 분산하고,
+        chord 콜백(aggregate_batch_results_task)에서 결과를 집계한다.
+        → 배치 전체 시간 ≈ 가장 오래 걸리는 영상 1개
+    False:
+        기존 방식 (한 워커에서 순차 처리)
+
+    클립 이력/BGM 등 교회 단위 정보는 한 번만 로드해 모든 영상이 공유한다.
+    (치환 사전은 워커별 DictionaryCache 사용)
+
     Args:
         audio_file_paths: MP3 파일 경로 리스트
         church_id: 교회 UUID
@@ -1097,17 +1527,62 @@ def batch_process_videos_task(
         bgm_volume: BGM 볼륨
         generate_edit_pack: Edit Pack 생성 여부
         video_tone: 영상 톤 ("bright" / "dark")
+        video_ids: 업로드 시 미리 생성된 videos 레코드 ID (없으면 여기서 생성)
 
     Returns:
-        list: 각 영상의 처리 결과
+        dict: {total, success, failed, results}
     """
+    from celery import chord
     from supabase import create_client
 
     supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-    results = []
     total = len(audio_file_paths)
 
-    for idx, audio_path in enumerate(audio_file_paths, 1):
+    # videos 레코드 준비 (업로드 API에서 만든 레코드가 있으면 재사용)
+    if not video_ids or len(video_ids) != total:
+        video_ids = []
+        for audio_path in audio_file_paths:
+            video_record = supabase.table("videos").insert({
+                "church_id": church_id,
+                "audio_file_path": audio_path,
+                "status": "processing"
+            }).execute()
+            video_ids.append(video_record.data[0]["id"])
+
+    # 교회 단위 공유 컨텍스트 (한 번만 조회)
+    shared_context = _load_church_context(supabase, church_id, bgm_id)
+    shared_context["clip_reservation_key"] = f"qt:batch:{self.request.id}:clips"
+
+    item_args = [
+        [
+            audio_path, church_id, video_id, pack_id,
+            clip_ids, bgm_id, bgm_volume, generation_mode,
+            subtitle_length, generate_edit_pack, video_tone
+        ]
+        for audio_path, video_id in zip(audio_file_paths, video_ids)
+    ]
+
+    if settings.BATCH_FANOUT_ENABLED:
+        self.update_state(
+            state="PROCESSING",
+            meta={"progress": 5, "step": f"영상 {total}개 병렬 처리 중..."}
+        )
+        logger.info(f"[Batch] {total}개 영상 fan-out (church_id: {church_id})")
+
+        header = [
+            process_video_task.s(
+                *args,
+                shared_context=shared_context,
+                raise_on_failure=False
+            )
+            for args in item_args
+        ]
+        # 현재 태스크를 chord로 교체 → 콜백 결과가 이 task_id의 결과가 됨
+        raise self.replace(chord(header, aggregate_batch_results_task.s(video_ids)))
+
+    # ============ 순차 처리 (fan-out 비활성화 시) ============
+    results = []
+    for idx, args in enumerate(item_args, 1):
         try:
             self.update_state(
                 state="PROCESSING",
@@ -1117,48 +1592,59 @@ def batch_process_videos_task(
                 }
             )
 
-            # videos 테이블에 레코드 생성
-            video_record = supabase.table("videos").insert({
-                "church_id": church_id,
-                "audio_file_path": audio_path,
-                "status": "processing"
-            }).execute()
-
-            video_id = video_record.data[0]["id"]
-
             # 개별 영상 처리 (동기 호출)
             result = process_video_task.apply(
-                args=[
-                    audio_path, church_id, video_id, pack_id,
-                    clip_ids, bgm_id, bgm_volume, generation_mode,
-                    subtitle_length, generate_edit_pack, video_tone
-                ]
+                args=args,
+                kwargs={"shared_context": shared_context}
             ).get(timeout=600)  # 10분 타임아웃
+            results.append(result)
 
+        except Exception as e:
+            logger.error(f"Batch item {idx} failed: {e}")
             results.append({
+                "status": "failed",
+                "video_id": args[2],
+                "error": str(e)[:200]
+            })
+
+    return _aggregate_batch_results(results, video_ids)
+
+
+@celery_app.task(base=CallbackTask)
+def aggregate_batch_results_task(results: list, video_ids: list[str]):
+    """배치 chord 콜백: 영상별 결과 집계"""
+    summary = _aggregate_batch_results(results, video_ids)
+    logger.info(f"[Batch] 완료: 성공 {summary['success']}개 / 실패 {summary['failed']}개")
+    return summary
+
+
+def _aggregate_batch_results(results: list, video_ids: list[str]) -> dict:
+    """process_video_task 결과 리스트 → 배치 응답 형식"""
+    items = []
+    for idx, (video_id, result) in enumerate(zip(video_ids, results), 1):
+        if result and result.get("status") == "completed":
+            items.append({
                 "index": idx,
                 "status": "success",
                 "video_id": video_id,
                 "video_url": result.get("video_url")
             })
-
-        except Exception as e:
-            logger.error(f"Batch item {idx} failed: {e}")
-            results.append({
+        else:
+            items.append({
                 "index": idx,
                 "status": "failed",
-                "error": str(e)[:200]
+                "video_id": video_id,
+                "error": (result or {}).get("error", "unknown error")
             })
 
     return {
-        "total": total,
-        "success": sum(1 for r in results if r["status"] == "success"),
-        "failed": sum(1 for r in results if r["status"] == "failed"),
-        "results": results
+        "total": len(items),
+        "success": sum(1 for r in items if r["status"] == "success"),
+        "failed": sum(1 for r in items if r["status"] == "failed"),
+        "results": items
     }
 
 
-
 @celery_app.task(base=CallbackTask, bind=True, max_retries=3)
 def regenerate_video_task(
     self,
@@ -1177,9 +1663,7 @@ def regenerate_video_task(
     → 프론트엔드 Canvas 미리보기와 100% 일치 보장
     """
     from supabase import create_client
-    import httpx
-    import tempfile
-    
+
     supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
     temp_files = []
     
@@ -1205,25 +1689,19 @@ def regenerate_video_task(
         # 2. 리소스 다운로드 (Audio, SRT)
         self.update_state(state="PROCESSING", meta={"progress": 10, "step": "리소스 다운로드 중..."})
 
-        # Audio 다운로드
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as f:
-            resp = httpx.get(audio_url, timeout=60.0)
-            if resp.status_code != 200:
-                raise ValueError(f"오디오 파일 다운로드 실패 (HTTP {resp.status_code}): {audio_url}")
-            if len(resp.content) < 1000:  # 1KB 미만이면 유효하지 않음
-                raise ValueError(f"오디오 파일이 비어있거나 손상됨: {audio_url}")
-            f.write(resp.content)
-            audio_path = f.name
-            temp_files.append(audio_path)
+        downloader = get_downloader()
+
+        # Audio 다운로드 (1KB 미만이면 유효하지 않음)
+        try:
+            audio_path = downloader.download(audio_url, _reserve_temp_file(".mp3", temp_files), min_size=1000)
+        except DownloadError as e:
+            raise ValueError(f"오디오 파일 다운로드 실패: {e}") from e
 
         # SRT 다운로드
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".srt") as f:
-            resp = httpx.get(srt_url, timeout=60.0)
-            if resp.status_code != 200:
-                raise ValueError(f"자막 파일 다운로드 실패 (HTTP {resp.status_code}): {srt_url}")
-            f.write(resp.content)
-            srt_path = f.name
-            temp_files.append(srt_path)
+        try:
+            srt_path = downloader.download(srt_url, _reserve_temp_file(".srt", temp_files), min_size=0)
+        except DownloadError as e:
+            raise ValueError(f"자막 파일 다운로드 실패: {e}") from e
             
         # BGM 다운로드 (옵션)
         bgm_path = None
@@ -1234,75 +1712,33 @@ def regenerate_video_task(
                 if not bgm_url.startswith("http"):
                     bgm_url = f"{settings.R2_PUBLIC_URL}/{bgm_url}"
                 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as f:
-                    resp = httpx.get(bgm_url, timeout=30.0)
-                    f.write(resp.content)
-                    bgm_path = f.name
-                    temp_files.append(bgm_path)
+                bgm_path = get_asset_cache().fetch_url(bgm_url, _reserve_temp_file(".mp3", temp_files))
 
-        # 3. 클립 선택 또는 베이스 영상 재사용
+        # 3. 베이스 영상 (산출물 캐시 → 없으면 클립 다운로드 + 합성)
         self.update_state(state="PROCESSING", meta={"progress": 30, "step": "클립 구성 중..."})
 
         video_composer = get_video_composer()
         audio_duration = video_composer.get_audio_duration(audio_path)
-
-        # 🚨 썸네일 인트로/아웃트로 설정 확인 (베이스 영상 재사용 판단용)
         thumbnail_layout = video_data.get("thumbnail_layout")
-        has_intro_outro_settings = False
-        if thumbnail_layout:
-            intro_settings = thumbnail_layout.get("intro_settings", {})
-            has_intro_outro_settings = (
-                intro_settings.get("useAsIntro", False) or
-                intro_settings.get("useAsOutro", False)
-            )
 
-        # ✅ 베이스 영상 재사용 (단, 인트로/아웃트로 설정 없을 때만!)
-        base_video_url = video_data.get("base_video_path")
-        clip_paths = []
-        clip_durations = []
         used_clip_ids = video_data.get("clips_used", [])
         clips_metadata = video_data.get("clips_metadata", [])  # 🆕 Pexels 클립 메타데이터
+        clips_changed = bool(clip_ids) and list(clip_ids) != list(used_clip_ids)
 
-        if base_video_url and not has_intro_outro_settings:
-            logger.info("[Regenerate] 베이스 영상 재사용 - 클립 처리 스킵 (인트로/아웃트로 없음)")
-
-            # 베이스 영상 다운로드
-            if not base_video_url.startswith("http"):
-                base_video_url = f"{settings.R2_PUBLIC_URL}/{base_video_url}"
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as f:
-                resp = httpx.get(base_video_url, timeout=120.0)
-                if resp.status_code != 200:
-                    raise ValueError(f"베이스 영상 다운로드 실패 (HTTP {resp.status_code}): {base_video_url}")
-                f.write(resp.content)
-                base_video_path = f.name
-                temp_files.append(base_video_path)
-
-            # ✅ 베이스 영상의 실제 길이 측정 (FFprobe)
-            import subprocess
-            cmd_probe = [
-                "ffprobe", "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                base_video_path
-            ]
-            result = subprocess.run(cmd_probe, capture_output=True, text=True)
-            try:
-                base_video_duration = float(result.stdout.strip())
-                logger.info(f"[Regenerate] 베이스 영상 실제 길이: {base_video_duration}s (오디오: {audio_duration}s)")
-            except ValueError:
-                logger.warning("[Regenerate] 베이스 영상 길이 측정 실패 - 오디오 길이 사용")
-                base_video_duration = audio_duration
-
-            clip_paths = [base_video_path]
-            clip_durations = [base_video_duration]  # ✅ 실제 측정값 사용
-            logger.info(f"[Regenerate] 베이스 영상 다운로드 완료: {base_video_path}")
-        else:
-            # ❌ 베이스 영상 없거나 인트로/아웃트로 설정 있으면 → 클립 재처리
-            if has_intro_outro_settings:
-                logger.info("[Regenerate] 인트로/아웃트로 설정 발견 - 베이스 영상 재사용 스킵, 새로 합성")
-            else:
-                logger.warning("[Regenerate] 베이스 영상 없음 - 클립 재처리")
+        # 합성 중간 산출물 캐시: 입력이 바뀐 단계만 다시 계산 (자막만 수정 → 클립 다운로드/연결 생략)
+        artifacts = RenderArtifactCache(video_id, storage=get_r2_storage())
+        base_key = _base_artifact_key(clips_metadata, clip_ids or used_clip_ids, audio_duration)
+
+        # 최초 재생성: 영상 생성 때 업로드한 베이스 영상을 base 산출물로 등록
+        # (clips_metadata가 있으면 clip_ids와 무관하게 같은 클립으로 합성됨)
+        base_video_url = video_data.get("base_video_path")
+        if base_video_url and (clips_metadata or not clips_changed) and artifacts.is_empty():
+            artifacts.adopt("base", base_key, base_video_url)
+
+        base_video_path = artifacts.fetch("base", base_key, _reserve_temp_file(".mp4", temp_files))
+        if base_video_path is None:
+            logger.info("[Regenerate] 베이스 영상 산출물 없음 - 클립 재처리")
+            rendered_as_keyed = True  # 키와 다른 클립으로 합성(fallback)하면 산출물로 저장하지 않음
 
             # 🆕 clips_metadata가 있으면 Pexels URL 직접 사용 (장기 해결책)
             if clips_metadata and len(clips_metadata) > 0:
@@ -1322,18 +1758,19 @@ def regenerate_video_task(
 
                     # Pexels URL에서 영상 다운로드
                     logger.info(f"[Regenerate] 클립 {idx+1} 다운로드: {clip_url[:80]}...")
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as f:
-                        resp = httpx.get(clip_url, timeout=120.0)
-                        if resp.status_code != 200:
-                            logger.warning(f"[Regenerate] 클립 {idx+1} 다운로드 실패 (HTTP {resp.status_code})")
-                            continue
-                        f.write(resp.content)
-                        clip_paths.append(f.name)
-                        temp_clip_files.append(f.name)
-                        # 트림된 길이가 있으면 사용, 없으면 원본 길이
-                        clip_durations.append(trim_duration if trim_duration else clip_duration)
-                        temp_files.append(f.name)
+                    try:
+                        clip_path = downloader.download(
+                            clip_url, _reserve_temp_file(".mp4", temp_files), timeout=120.0
+                        )
+                    except DownloadError as e:
+                        logger.warning(f"[Regenerate] 클립 {idx+1} 다운로드 실패 ({e})")
+                        continue
+                    clip_paths.append(clip_path)
+                    temp_clip_files.append(clip_path)
+                    # 트림된 길이가 있으면 사용, 없으면 원본 길이
+                    clip_durations.append(trim_duration if trim_duration else clip_duration)
 
+                rendered_as_keyed = len(clip_paths) == len(clips_metadata)
                 if clip_paths:
                     logger.info(f"[Regenerate] Pexels 클립 다운로드 완료: {len(clip_paths)}개")
                 else:
@@ -1353,11 +1790,17 @@ def regenerate_video_task(
                 else:
                     # Fallback
                     selected_clips = clip_selector.select_clips(audio_duration, pack_id="pack-free")
+                    rendered_as_keyed = False
 
                 clip_paths = [c["file_path"] for c in selected_clips]
                 used_clip_ids = [c["id"] for c in selected_clips]
                 clip_durations = [c.get("duration", 30) for c in selected_clips]
-        
+
+            base_video_path = video_composer.render_base_video(clip_paths, clip_durations, audio_duration)
+            temp_files.append(base_video_path)
+            if rendered_as_keyed:
+                artifacts.store("base", base_key, base_video_path, "video/mp4")
+
         # Note: video_composer.BGM_VOLUME can be overridden if needed,
         # but for now we set it globally or need to refactor VideoComposer to accept volume per call.
         # Currently VideoComposer uses a class constant BGM_VOLUME = 0.12.
@@ -1383,7 +1826,22 @@ def regenerate_video_task(
             use_outro = intro_settings.get("useAsOutro", False)
             outro_duration = intro_settings.get("outroDuration", 3.0)
 
+        # 인트로/아웃트로 이미지 산출물 (레이아웃/Canvas 이미지가 같으면 재사용)
+        bg_url_for_key = thumbnail_layout and (
+            thumbnail_layout.get("background_image_url") or thumbnail_layout.get("backgroundImageUrl")
+        )
+        intro_key = artifact_key(
+            "intro",
+            canvas=hashlib.sha256(canvas_image_data.encode("utf-8")).hexdigest() if canvas_image_data else None,
+            layout=None if canvas_image_data else thumbnail_layout
+        )
+        outro_key = artifact_key("outro", background=bg_url_for_key)
         if use_intro:
+            thumbnail_image_path = artifacts.fetch("intro", intro_key, _reserve_temp_file(".jpg", temp_files))
+        if use_outro:
+            outro_image_path = artifacts.fetch("outro", outro_key, _reserve_temp_file(".jpg", temp_files))
+
+        if use_intro and thumbnail_image_path is None:
             try:
                 self.update_state(state="PROCESSING", meta={"progress": 40, "step": "인트로 썸네일 생성 중..."})
 
@@ -1413,7 +1871,6 @@ def regenerate_video_task(
                 else:
                     # Canvas 이미지 없으면 기존 FFmpeg 방식으로 생성
                     logger.info("[Regenerate] Canvas 이미지 없음 - FFmpeg로 썸네일 생성")
-                    import httpx
 
                     # 배경 이미지 다운로드 (snake_case 또는 camelCase 둘 다 지원)
                     bg_url = thumbnail_layout.get("background_image_url") or thumbnail_layout.get("backgroundImageUrl")
@@ -1431,12 +1888,7 @@ def regenerate_video_task(
                     bg_url = urlunparse(parsed._replace(path=encoded_path))
 
                     # 이미지 다운로드
-                    resp = httpx.get(bg_url, timeout=30.0)
-                    resp.raise_for_status()
-                    with tf.NamedTemporaryFile(delete=False, suffix=".jpg") as f:
-                        f.write(resp.content)
-                        local_bg_path = f.name
-                    temp_files.append(local_bg_path)
+                    local_bg_path = get_asset_cache().fetch_url(bg_url, _reserve_temp_file(".jpg", temp_files))
 
                     # 텍스트 박스 준비 (snake_case 또는 camelCase 둘 다 지원)
                     text_boxes = thumbnail_layout.get("text_boxes") or thumbnail_layout.get("textBoxes") or []
@@ -1458,13 +1910,10 @@ def regenerate_video_task(
                 thumbnail_image_path = None
 
         # 아웃트로 이미지 생성 (인트로와 같은 배경, 텍스트 없이)
-        if use_outro and thumbnail_layout:
+        if use_outro and thumbnail_layout and outro_image_path is None:
             try:
                 self.update_state(state="PROCESSING", meta={"progress": 45, "step": "아웃트로 이미지 생성 중..."})
 
-                import httpx
-                import tempfile as tf
-
                 # 배경 이미지 다운로드 (인트로와 동일한 배경 사용)
                 bg_url = thumbnail_layout.get("background_image_url") or thumbnail_layout.get("backgroundImageUrl")
                 if not bg_url:
@@ -1481,12 +1930,7 @@ def regenerate_video_task(
 
                 # 이미지 다운로드 (인트로에서 이미 다운로드했으면 재사용)
                 if 'local_bg_path' not in locals() or not os.path.exists(local_bg_path):
-                    resp = httpx.get(bg_url, timeout=30.0)
-                    resp.raise_for_status()
-                    with tf.NamedTemporaryFile(delete=False, suffix=".jpg") as f:
-                        f.write(resp.content)
-                        local_bg_path = f.name
-                    temp_files.append(local_bg_path)
+                    local_bg_path = get_asset_cache().fetch_url(bg_url, _reserve_temp_file(".jpg", temp_files))
 
                 # 아웃트로 이미지 생성 (텍스트 없이 배경만)
                 thumbnail_gen = get_thumbnail_generator()
@@ -1503,42 +1947,86 @@ def regenerate_video_task(
                 use_outro = False
                 outro_image_path = None
 
-        # 5. 영상 합성
+        # 새로 만든 인트로/아웃트로 이미지 저장 (다음 재생성에서 재사용)
+        if use_intro and thumbnail_image_path and artifacts.lookup("intro", intro_key) is None:
+            artifacts.store("intro", intro_key, thumbnail_image_path, "image/jpeg")
+        if use_outro and outro_image_path and artifacts.lookup("outro", outro_key) is None:
+            artifacts.store("outro", outro_key, outro_image_path, "image/jpeg")
+
+        # 5. 영상 합성 (자막 합성 영상 / 오디오 믹스도 입력이 같으면 재사용)
         self.update_state(state="PROCESSING", meta={"progress": 50, "step": "영상 합성 중..."})
 
-        if use_intro and thumbnail_image_path:
-            output_video_path = video_composer.compose_video_with_thumbnail(
-                clip_paths=clip_paths,
-                audio_path=audio_path,
-                srt_path=srt_path,
-                audio_duration=audio_duration,
-                thumbnail_path=thumbnail_image_path,
-                thumbnail_duration=intro_duration,
-                bgm_path=bgm_path,
-                clip_durations=clip_durations,
-                bgm_volume=bgm_volume,
-                # 아웃트로 옵션
-                outro_image_path=outro_image_path if use_outro else None,
-                outro_duration=outro_duration
-            )
-        else:
-            output_video_path = video_composer.compose_video(
-                clip_paths=clip_paths,
-                audio_path=audio_path,
-                srt_path=srt_path,
-                audio_duration=audio_duration,
-                bgm_path=bgm_path,
-                clip_durations=clip_durations,
-                bgm_volume=bgm_volume
-            )
+        srt_hash = hash_file(srt_path)
+        subtitle_signature = video_composer.subtitle_signature()
+        subtitled_key = artifact_key(
+            "subtitled",
+            base=base_key,
+            srt=srt_hash,
+            render=subtitle_signature
+        )
+        subtitled_path = artifacts.fetch("subtitled", subtitled_key, _reserve_temp_file(".mp4", temp_files))
+        if subtitled_path is None:
+            subtitled_path = video_composer.render_subtitled_video(base_video_path, srt_path, audio_duration)
+            temp_files.append(subtitled_path)
+            artifacts.store("subtitled", subtitled_key, subtitled_path, "video/mp4")
+
+        self.update_state(state="PROCESSING", meta={"progress": 65, "step": "오디오 믹싱 중..."})
+
+        mix_key = artifact_key(
+            "audio_mix",
+            voice=hash_file(audio_path),
+            bgm=hash_file(bgm_path) if bgm_path else None,
+            volume=bgm_volume,
+            duration=audio_duration
+        )
+        mixed_audio_path = artifacts.fetch("audio_mix", mix_key, _reserve_temp_file(".m4a", temp_files))
+        if mixed_audio_path is None:
+            mixed_audio_path = video_composer.mix_audio(audio_path, bgm_path, bgm_volume, audio_duration)
+            temp_files.append(mixed_audio_path)
+            artifacts.store("audio_mix", mix_key, mixed_audio_path, "audio/mp4")
+
+        # 인트로/아웃트로가 없으면 재인코딩 없이 mux만
+        fade_duration = 1.0
+        output_video_path = video_composer.assemble_final(
+            subtitled_path,
+            mixed_audio_path,
+            audio_duration,
+            thumbnail_path=thumbnail_image_path if use_intro else None,
+            thumbnail_duration=intro_duration,
+            fade_duration=fade_duration,
+            outro_image_path=outro_image_path if use_outro else None,
+            outro_duration=outro_duration
+        )
         temp_files.append(output_video_path)
-        
+
         # 6. 업로드 및 저장
         self.update_state(state="PROCESSING", meta={"progress": 80, "step": "업로드 중..."})
         
         r2 = get_r2_storage()
-        video_url = r2.upload_file(output_video_path, "videos", "video/mp4")
-        
+        # 입력이 같아 결과가 같으면 기존 객체 재사용
+        video_url = r2.upload_file(output_video_path, "videos", "video/mp4", content_addressed=True)
+
+        # 최종 영상 타임라인 기록 (자막만 수정하면 patch_subtitles_task가 바뀐 구간만 재합성)
+        artifacts.adopt(
+            "final",
+            artifact_key(
+                "final",
+                subtitled=subtitled_key,
+                audio_mix=mix_key,
+                intro=intro_key if use_intro else None,
+                outro=outro_key if use_outro else None
+            ),
+            video_url,
+            base=base_key,
+            srt=srt_hash,
+            render=subtitle_signature,
+            duration=audio_duration,
+            offset=intro_duration if use_intro else 0.0,
+            fade=fade_duration,
+            intro=bool(use_intro),
+            outro=bool(use_outro)
+        )
+
         from datetime import datetime, timezone
 
         supabase.table("videos").update({
@@ -1596,3 +2084,133 @@ def regenerate_video_task(
                 try: os.remove(p)
                 except: pass
         raise e
+
+
+@celery_app.task(base=CallbackTask, bind=True)
+def patch_subtitles_task(
+    self,
+    video_id: str,
+    church_id: str,
+    previous_srt: str
+):
+    """
+    자막 부분 수정 반영 (바뀐 자막이 있는 GOP 구간만 재인코딩)
+
+    오타 몇 개를 고치려고 영상 전체를 다시 합성하지 않도록
+    이전/새 SRT를 비교해 달라진 구간만 베이스 영상에서 다시 합성하고
+    나머지는 기존 최종 영상에서 stream copy로 이어붙인다.
+
+    최종 영상 타임라인 정보(산출물 캐시의 final)가 없거나 이전 SRT가 최종 영상과 다르면,
+    또는 변경 구간이 크거나 인트로/아웃트로 전환에 걸치면 regenerate_video_task로 넘긴다.
+
+    Args:
+        previous_srt: 수정 전 SRT 내용 (현재 최종 영상에 합성된 자막)
+    """
+    from supabase import create_client
+
+    supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+    r2 = get_r2_storage()
+    temp_files = []
+
+    try:
+        video_res = supabase.table("videos").select("*").eq("id", video_id).single().execute()
+        if not video_res.data:
+            raise ValueError(f"Video not found: {video_id}")
+
+        video_data = video_res.data
+        if video_data["church_id"] != church_id:
+            raise ValueError("Permission denied")
+
+        def fallback(reason: str) -> dict:
+            logger.info(f"[Patch] {video_id}: {reason} → 전체 재생성")
+            task = regenerate_video_task.delay(
+                video_id=video_id,
+                church_id=church_id,
+                bgm_id=video_data.get("bgm_id"),
+                bgm_volume=video_data.get("bgm_volume") or 0.12
+            )
+            return {"patched": False, "task_id": str(task.id)}
+
+        self.update_state(state="PROCESSING", meta={"progress": 10, "step": "변경된 자막 확인 중..."})
+
+        video_composer = get_video_composer()
+        artifacts = RenderArtifactCache(video_id, storage=r2)
+        final = artifacts.record("final")
+        base = artifacts.record("base")
+
+        old_srt_path = _reserve_temp_file(".srt", temp_files)
+        with open(old_srt_path, "w", encoding="utf-8") as f:
+            f.write(previous_srt)
+
+        if not final or final["url"] != video_data.get("video_file_path"):
+            return fallback("최종 영상 타임라인 정보 없음")
+        if not base or base["key"] != final.get("base"):
+            return fallback("베이스 영상 산출물 없음")
+        if hash_file(old_srt_path) != final.get("srt"):
+            return fallback("이전 자막이 최종 영상과 다름")
+        if final.get("render") != video_composer.subtitle_signature():
+            return fallback("자막 스타일 변경")
+
+        # 리소스 다운로드 (최종 영상, 베이스 영상, 새 SRT)
+        self.update_state(state="PROCESSING", meta={"progress": 25, "step": "리소스 다운로드 중..."})
+
+        final_path = _reserve_temp_file(".mp4", temp_files)
+        new_srt_path = _reserve_temp_file(".srt", temp_files)
+        base_path = artifacts.fetch("base", base["key"], _reserve_temp_file(".mp4", temp_files))
+        if (
+            base_path is None
+            or not r2.download_file(final["url"], final_path)
+            or not r2.download_file(video_data["srt_file_path"], new_srt_path)
+        ):
+            return fallback("리소스 다운로드 실패")
+
+        # 변경 구간만 재합성
+        self.update_state(state="PROCESSING", meta={"progress": 50, "step": "수정된 자막 합성 중..."})
+
+        offset = final.get("offset", 0.0)
+        fade = final.get("fade", 1.0)
+        patched_path = video_composer.patch_subtitles(
+            final_path,
+            base_path,
+            old_srt_path,
+            new_srt_path,
+            offset=offset,
+            safe_start=offset + fade if final.get("intro") else 0.0,
+            safe_end=offset + final["duration"] - fade if final.get("outro") else None
+        )
+        if patched_path is None:
+            return fallback("부분 합성 불가")
+        temp_files.append(patched_path)
+
+        # 업로드 및 저장
+        self.update_state(state="PROCESSING", meta={"progress": 80, "step": "업로드 중..."})
+
+        video_url = r2.upload_file(patched_path, "videos", "video/mp4")
+        srt_hash = hash_file(new_srt_path)
+        meta = {k: v for k, v in final.items() if k not in ("key", "url", "created_at")}
+        meta["srt"] = srt_hash
+        artifacts.adopt("final", artifact_key("final", patched=final["key"], srt=srt_hash), video_url, **meta)
+
+        from datetime import datetime, timezone
+
+        supabase.table("videos").update({
+            "video_file_path": video_url,
+            "status": "completed",
+            "completed_at": datetime.now(timezone.utc).isoformat()
+        }).eq("id", video_id).execute()
+
+        return {"patched": True, "video_url": video_url}
+
+    except Exception as e:
+        logger.exception(f"Patch subtitles task failed: {e}")
+        try:
+            supabase.table("videos").update({
+                "status": "failed",
+                "error_message": "subtitle: 자막 수정 반영 실패 - 다시 시도해주세요"
+            }).eq("id", video_id).execute()
+        except Exception:
+            pass
+        raise
+
+    finally:
+        _cleanup_temp_files(temp_files)
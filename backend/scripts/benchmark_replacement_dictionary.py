@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+치환 사전 적용 벤치마크 (항목별 str.replace vs Aho–Corasick 한 번 훑기)
+
+_stage_correct / apply_replacement_to_subtitles와 같은 형태로 비교:
+- legacy: 호출마다 정렬 + 항목마다 `in` / str.replace (기존 방식)
+- matcher: ReplacementMatcher 한 번 컴파일 후 텍스트/자막 줄마다 한 번 훑기
+
+네트워크/DB 없이 합성 사전 사용:
+    python scripts/benchmark_replacement_dictionary.py --entries 5000 --subtitles 300
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.replacement_matcher import ReplacementMatcher  # noqa: E402
+
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호"
+
+
+def make_dictionary(size: int, rng: random.Random) -> list[dict]:
+    """합성 통합 사전 (2~6음절 원본, 우선순위 0~9)"""
+    entries = {}
+    while len(entries) < size:
+        original = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6)))
+        entries[original] = {
+            "original": original,
+            "replacement": original[::-1],
+            "use_count": rng.randint(0, 9),
+        }
+    return list(entries.values())
+
+
+def make_subtitles(count: int, entries: list[dict], rng: random.Random) -> list[str]:
+    """자막 줄 (약 20자, 줄마다 사전 항목 0~2개 포함)"""
+    lines = []
+    for _ in range(count):
+        words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(5)]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randint(0, len(words)), rng.choice(entries)["original"])
+        lines.append(" ".join(words))
+    return lines
+
+
+def legacy_apply(text: str, entries: list[dict]) -> str:
+    sorted_dict = sorted(entries, key=lambda x: (-x.get("use_count", 0), -len(x.get("original", ""))))
+    for entry in sorted_dict:
+        original = entry.get("original", "")
+        if original and original in text:
+            text = text.replace(original, entry.get("replacement", ""))
+    return text
+
+
+def run(label: str, func) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {elapsed * 1000:10.1f}ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="치환 사전 legacy vs Aho–Corasick 벤치마크")
+    parser.add_argument("--entries", type=int, default=5000, help="사전 항목 수 (기본: 5000)")
+    parser.add_argument("--subtitles", type=int, default=300, help="자막 줄 수 (기본: 300 ≈ 20분 QT)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = make_dictionary(args.entries, rng)
+    subtitles = make_subtitles(args.subtitles, entries, rng)
+    full_text = " ".join(subtitles)
+    print(f"사전 {len(entries)}개, 자막 {len(subtitles)}줄 ({len(full_text)}자)")
+
+    matcher = None
+
+    def compile_matcher():
+        nonlocal matcher
+        matcher = ReplacementMatcher.from_entries(entries)
+
+    run("compile (1회)", compile_matcher)
+
+    legacy_text = run("legacy  full text", lambda: legacy_apply(full_text, entries))
+    matcher_text = run("matcher full text", lambda: matcher.replace(full_text))
+    legacy_lines = run("legacy  per subtitle", lambda: [legacy_apply(line, entries) for line in subtitles])
+    matcher_lines = run("matcher per subtitle", lambda: matcher.replace_many(subtitles))
+
+    print(f"speedup full text        {legacy_text / matcher_text:8.1f}x")
+    print(f"speedup per subtitle     {legacy_lines / matcher_lines:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
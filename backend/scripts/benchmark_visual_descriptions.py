@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Visual Description 생성 벤치마크 (컷별 순차 호출 vs 배치 호출)
+
+process_video_task Stage 2의 두 경로를 같은 컷 목록으로 비교:
+- sequential: 컷마다 generate_description (기존 방식, 컷 수만큼 왕복)
+- batch: generate_batch (컷 BATCH_SIZE개씩 구조화 JSON 요청 + 누락 컷 병렬 재요청)
+
+실제 Gemini 호출 (GEMINI_API_KEY 필요):
+    python scripts/benchmark_visual_descriptions.py --srt sample.srt
+
+네트워크 없이 왕복 구조만 비교 (요청당 지연 시뮬레이션):
+    python scripts/benchmark_visual_descriptions.py --cuts 70 --simulate-latency 0.8
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s [%(levelname)s] %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+class SimulatedModel:
+    """Gemini 모델 대체: 요청당 고정 지연 후 유효한 JSON 반환"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, generation_config=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+        # 배치 프롬프트: 컷 목록(JSON 배열)의 id마다 결과 생성
+        match = re.search(r'^\[\{"id".*\}\]$', prompt, re.MULTILINE)
+        if match:
+            cuts = json.loads(match.group(0))
+            body = [
+                {"id": c["id"], "type": "abstract", "description": "sunrise calm lake light", "confidence": 0.8}
+                for c in cuts
+            ]
+        else:
+            body = {"type": "abstract", "description": "sunrise calm lake light", "confidence": 0.8}
+        return SimpleNamespace(text=json.dumps(body))
+
+
+def load_cut_groups(srt_path: str | None, cut_count: int) -> list[list[str]]:
+    """SRT → 컷별 자막 그룹 (실제 파이프라인과 같은 컷 생성기 사용)"""
+    if not srt_path:
+        return [[f"오늘 말씀 {i}번째 구간입니다", "하나님의 평안이 함께하시길"] for i in range(cut_count)]
+
+    from app.services.subtitle_driven_cut_generator import SubtitleDrivenCutGenerator
+    from app.tasks import parse_srt_for_segments
+
+    subtitles, timings = parse_srt_for_segments(srt_path)
+    cuts = SubtitleDrivenCutGenerator(
+        min_cut_duration=4.0,
+        max_cut_duration=12.0,
+        prefer_sentence_end=True,
+        target_cut_duration=8.0
+    ).generate_cuts(subtitles, timings, timings[-1][1] if timings else 0)
+    return [cut.subtitle_texts for cut in cuts]
+
+
+def run(label: str, func, model) -> float:
+    calls_before = getattr(model, "calls", 0)
+    started = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - started
+    calls = getattr(model, "calls", 0) - calls_before
+    call_info = f", 요청 {calls}회" if isinstance(model, SimulatedModel) else ""
+    print(f"{label:<12} {elapsed:8.2f}s  ({len(results)}개 컷{call_info})")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Visual Description 순차 vs 배치 벤치마크")
+    parser.add_argument("--srt", help="실제 SRT 파일 (없으면 합성 컷 사용)")
+    parser.add_argument("--cuts", type=int, default=70, help="합성 컷 수 (기본: 70 ≈ 10분 QT)")
+    parser.add_argument("--simulate-latency", type=float, default=None,
+                        help="Gemini 대신 요청당 지연(초)을 시뮬레이션")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.simulate_latency is not None:
+        os.environ.setdefault("GEMINI_API_KEY", "simulated")
+
+    from app.services.visual_description_generator import VisualDescriptionGenerator
+
+    generator = VisualDescriptionGenerator(mode=VisualDescriptionGenerator.MODE_SAFE)
+    if args.simulate_latency is not None:
+        generator.model = SimulatedModel(args.simulate_latency)
+
+    groups = load_cut_groups(args.srt, args.cuts)
+    print(f"컷 {len(groups)}개 (batch_size={args.batch_size or generator.BATCH_SIZE}, "
+          f"max_workers={args.max_workers or generator.MAX_CONCURRENT_REQUESTS})")
+
+    sequential = run(
+        "sequential",
+        lambda: [generator.generate_description(g, "documentary") for g in groups],
+        generator.model
+    )
+    batch = run(
+        "batch",
+        lambda: generator.generate_batch(
+            groups, "documentary",
+            batch_size=args.batch_size,
+            max_workers=args.max_workers
+        ),
+        generator.model
+    )
+    print(f"speedup      {sequential / batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
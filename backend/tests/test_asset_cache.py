@@ -0,0 +1,95 @@
+"""
+R2/정적 자산 read-through 캐시 테스트
+"""
+import os
+import threading
+import time
+
+from app.services.asset_cache import AssetCache
+
+
+class _Origin:
+    """조건부 요청을 흉내 내는 원본 (ETag = 내용 버전)"""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.version = 1
+        self.transfers = 0
+        self.requests = 0
+
+    def loader(self, partial: str, validators: dict):
+        self.requests += 1
+        if validators.get("etag") == f'"v{self.version}"':
+            return None
+        time.sleep(0.05)  # 다운로드 시간 (동시 요청 합치기 확인용)
+        with open(partial, "wb") as f:
+            f.write(self.payload)
+        self.transfers += 1
+        return {"etag": f'"v{self.version}"'}
+
+
+class TestAssetCache:
+    """재검증 / 동시 요청 합치기 / LRU 제거 테스트"""
+
+    def test_revalidates_with_etag(self, tmp_path):
+        """max_age가 지나면 조건부 요청, 변경 없으면 본문 전송 없이 재사용"""
+        # Given
+        cache = AssetCache(str(tmp_path), max_bytes=10_000)
+        origin = _Origin(b"bgm")
+        cache.get("https://r2/bgm/a.mp3", origin.loader, max_age=0)
+
+        # When: 변경 없음 → 304
+        path = cache.get("https://r2/bgm/a.mp3", origin.loader, max_age=0)
+
+        # Then
+        assert path.read_bytes() == b"bgm"
+        assert (origin.requests, origin.transfers) == (2, 1)
+
+        # When: 원본이 바뀜 → 새로 받음
+        origin.payload, origin.version = b"bgm-v2", 2
+        assert cache.get("https://r2/bgm/a.mp3", origin.loader, max_age=0).read_bytes() == b"bgm-v2"
+        assert origin.transfers == 2
+
+    def test_fresh_entry_skips_request(self, tmp_path):
+        """max_age 이내면 원본에 요청하지 않음"""
+        cache = AssetCache(str(tmp_path), max_bytes=10_000, max_age=60)
+        origin = _Origin(b"bg")
+
+        cache.get("https://r2/bg.jpg", origin.loader)
+        cache.get("https://r2/bg.jpg", origin.loader)
+
+        assert origin.requests == 1
+
+    def test_concurrent_fetches_coalesced(self, tmp_path):
+        """같은 항목 동시 요청은 한 번만 다운로드"""
+        # Given
+        cache = AssetCache(str(tmp_path), max_bytes=10_000, max_age=60)
+        origin = _Origin(b"base")
+
+        # When
+        threads = [
+            threading.Thread(target=cache.get, args=("r2://bucket/base.mp4", origin.loader))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Then
+        assert origin.transfers == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """예산 초과 시 가장 오래 사용하지 않은 항목(+메타)부터 제거"""
+        # Given
+        cache = AssetCache(str(tmp_path), max_bytes=20)
+        old = cache.get("https://r2/old.mp3", _Origin(b"x" * 15).loader)
+        past = time.time() - 100
+        os.utime(old, (past, past))
+
+        # When
+        recent = cache.get("https://r2/new.mp3", _Origin(b"y" * 15).loader)
+
+        # Then
+        assert not old.exists() and recent.exists()
+        assert not (tmp_path / f"{old.name}.meta").exists()
@@ -0,0 +1,62 @@
+"""
+긴 녹음 분할 인식 (청크 계획 / 이어붙이기) 테스트
+"""
+from app.services.audio_chunker import AudioChunk, parse_silences, plan_chunks, stitch
+
+
+class TestPlanChunks:
+    """무음 경계 분할 테스트"""
+
+    def test_parse_silencedetect_log(self):
+        """silencedetect 로그에서 무음 구간 추출"""
+        stderr = (
+            "[silencedetect @ 0x1] silence_start: 12.5\n"
+            "[silencedetect @ 0x1] silence_end: 13.1 | silence_duration: 0.6\n"
+            "[silencedetect @ 0x1] silence_start: -0.01\n"
+            "[silencedetect @ 0x1] silence_end: 0.4 | silence_duration: 0.41\n"
+        )
+        assert parse_silences(stderr) == [(12.5, 13.1), (0.0, 0.4)]
+
+    def test_cuts_at_first_silence_after_target(self):
+        """목표 길이 이후 첫 무음 중앙에서 자르고, 앞뒤로 겹침"""
+        # Given: 20분 녹음, 250초/310초/640초/700초 부근 무음
+        silences = [(249, 251), (309, 311), (639, 641), (699, 701)]
+
+        # When
+        chunks = plan_chunks(1200, silences, target=300, max_len=420, overlap=2)
+
+        # Then
+        assert [(c.own_start, c.own_end) for c in chunks] == [(0, 310), (310, 640), (640, 1060), (1060, 1200)]
+        assert chunks[1].start == 308 and chunks[1].end == 642
+        assert chunks[0].start == 0 and chunks[-1].end == 1200
+
+    def test_forced_split_without_silence(self):
+        """무음이 없으면 최대 길이에서 강제 분할, 짧으면 분할 없음"""
+        assert [c.own_end for c in plan_chunks(1000, [], target=300, max_len=420, overlap=2)] == [420, 840, 1000]
+        assert len(plan_chunks(400, [(100, 101)], target=300, max_len=420, overlap=2)) == 1
+
+
+class TestStitch:
+    """청크 결과 이어붙이기 테스트"""
+
+    def test_offsets_and_dedupes_overlap(self):
+        """청크 오프셋 보정 + 겹침 구간 단어는 담당 청크 것만 사용"""
+        # Given: 경계 10초, 겹침 2초 → 청크1 [0, 12], 청크2 [8, 20]
+        first = AudioChunk(index=0, start=0, end=12, own_start=0, own_end=10)
+        second = AudioChunk(index=1, start=8, end=20, own_start=10, own_end=20)
+        first_result = {"words": [
+            {"word": "은혜의", "start": 8.5, "end": 9.0},
+            {"word": "말씀", "start": 10.2, "end": 10.8},  # 겹침 (청크2 담당)
+        ]}
+        second_result = {"words": [
+            {"word": "은혜의", "start": 0.5, "end": 1.0},  # 겹침 (청크1 담당)
+            {"word": "말씀", "start": 2.2, "end": 2.8},
+            {"word": "아멘", "start": 5.0, "end": 5.5},
+        ]}
+
+        # When: 순서 없이 전달
+        words, _, text = stitch([(second, second_result), (first, first_result)])
+
+        # Then
+        assert [(w["word"], w["start"]) for w in words] == [("은혜의", 8.5), ("말씀", 10.2), ("아멘", 13.0)]
+        assert text == "은혜의 말씀 아멘"
@@ -0,0 +1,67 @@
+"""
+Pexels 클립 디스크 캐시 테스트
+"""
+import os
+import time
+from unittest.mock import Mock, patch
+
+from app.services.clip_cache import ClipCache
+
+
+def _fake_downloader(payload: bytes):
+    def download(url, dest, **kwargs):
+        with open(dest, "wb") as f:
+            f.write(payload)
+        return dest
+
+    downloader = Mock()
+    downloader.download.side_effect = download
+    return downloader
+
+
+class TestClipCache:
+    """다운로드 캐시 / 하드링크 / LRU 제거 테스트"""
+
+    def test_second_fetch_is_hardlinked_without_download(self, tmp_path):
+        """두 번째 요청은 다운로드 없이 같은 inode로 링크"""
+        # Given
+        cache = ClipCache(str(tmp_path / "cache"), max_bytes=10_000)
+        url = "https://videos.pexels.com/video-files/1/1-hd_1920_1080_25fps.mp4"
+
+        downloader = _fake_downloader(b"mp4")
+        with patch("app.services.clip_cache.get_downloader", return_value=downloader):
+            # When
+            first = cache.fetch(1, url, tmp_path / "job-a.mp4")
+            second = cache.fetch(1, url, tmp_path / "job-b.mp4")
+
+        # Then
+        assert downloader.download.call_count == 1
+        assert second.read_bytes() == b"mp4"
+        assert os.stat(first).st_ino == os.stat(second).st_ino
+
+    def test_rendition_is_part_of_key(self, tmp_path):
+        """같은 영상이라도 렌디션이 다르면 다른 항목 (쿼리스트링은 무시)"""
+        cache = ClipCache(str(tmp_path), max_bytes=10_000)
+
+        sd = cache.key_for(1, "https://x/1-sd_960_540.mp4?token=a")
+        hd = cache.key_for(1, "https://x/1-hd_1920_1080.mp4?token=a")
+
+        assert sd != hd
+        assert cache.key_for(1, "https://x/1-sd_960_540.mp4?token=b") == sd
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """예산 초과 시 가장 오래 사용하지 않은 클립부터 제거"""
+        # Given
+        cache = ClipCache(str(tmp_path), max_bytes=20)
+        old, recent = tmp_path / "pexels_1_a.mp4", tmp_path / "pexels_2_b.mp4"
+        old.write_bytes(b"x" * 15)
+        recent.write_bytes(b"x" * 15)
+        past = time.time() - 100
+        os.utime(old, (past, past))
+
+        # When
+        removed = cache.evict()
+
+        # Then
+        assert removed == 1
+        assert not old.exists() and recent.exists()
@@ -0,0 +1,109 @@
+"""
+컷별 Pexels 검색 스케줄러 테스트
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.cut_search_scheduler import ClipReservation, CutSearchScheduler
+
+
+def _cut(index, duration=6.0):
+    return SimpleNamespace(index=index, duration=duration)
+
+
+def _desc(query):
+    return SimpleNamespace(visual_query=query, confidence=0.8)
+
+
+def _video(video_id):
+    return SimpleNamespace(id=video_id, duration=15, vision_verified=True)
+
+
+class FakePexelsSearch:
+    """쿼리별 고정 결과 + 호출 지연 (병렬 경쟁 상황 재현)"""
+
+    def __init__(self, results, delay=0.01, honor_exclude=True):
+        self.results = results
+        self.delay = delay
+        self.honor_exclude = honor_exclude
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def search_by_visual_description(self, visual_query, duration_needed, max_results, exclude_ids):
+        with self._lock:
+            self.queries.append(visual_query)
+        time.sleep(self.delay)
+        videos = self.results.get(visual_query, [])
+        if self.honor_exclude:
+            videos = [v for v in videos if v.id not in exclude_ids]
+        return videos
+
+
+class TestClipReservation:
+    """Pexels ID 선점 테스트"""
+
+    def test_claim_only_once(self):
+        """같은 ID는 한 번만 선점 가능"""
+        reservation = ClipReservation(initial_ids={1})
+
+        assert not reservation.claim(1)
+        assert reservation.claim(2)
+        assert not reservation.claim(2)
+        assert reservation.snapshot() == {1, 2}
+
+
+class TestCutSearchScheduler:
+    """병렬 컷 검색 테스트"""
+
+    def test_parallel_cuts_never_share_video(self):
+        """모든 컷이 같은 결과를 받아도 서로 다른 영상 선택"""
+        # Given
+        shared = [_video(i) for i in range(100, 110)]
+        search = FakePexelsSearch({"sky": shared})
+        scheduler = CutSearchScheduler(search, ClipReservation(), max_workers=8)
+        cuts = [_cut(i) for i in range(8)]
+
+        # When
+        clips = scheduler.search_all(cuts, [_desc("sky")] * 8)
+
+        # Then
+        ids = [c["video"].id for c in clips]
+        assert len(set(ids)) == 8
+        assert [c["cut"].index for c in clips] == list(range(8))
+
+    def test_alternative_query_when_main_results_taken(self):
+        """메인 결과가 모두 사용됨 → 대체 쿼리 영상 선택"""
+        # Given
+        alt_query = CutSearchScheduler.ALTERNATIVE_QUERIES[0]
+        search = FakePexelsSearch({"sky": [_video(1)], alt_query: [_video(2)]}, honor_exclude=False)
+        scheduler = CutSearchScheduler(search, ClipReservation(), max_workers=1)
+
+        # When
+        clips = scheduler.search_all([_cut(0), _cut(1)], [_desc("sky"), _desc("sky")])
+
+        # Then
+        assert [c["video"].id for c in clips] == [1, 2]
+        assert alt_query in search.queries
+
+    def test_nature_fallback_and_previous_video(self):
+        """결과 없음 → nature 쿼리, 그것도 없으면 이전 컷 영상 재사용"""
+        # Given
+        nature = CutSearchScheduler.NATURE_FALLBACK_QUERY
+        search = FakePexelsSearch({"sky": [_video(1)], nature: [_video(5)]})
+        scheduler = CutSearchScheduler(search, ClipReservation(), max_workers=2)
+
+        # When
+        clips = scheduler.search_all([_cut(0), _cut(1)], [_desc("sky"), _desc("unknown")])
+
+        # Then
+        assert [c["video"].id for c in clips] == [1, 5]
+
+    def test_first_cut_without_video_raises(self):
+        """첫 컷에 영상이 전혀 없으면 ValueError"""
+        scheduler = CutSearchScheduler(FakePexelsSearch({}), ClipReservation(), max_workers=2)
+
+        with pytest.raises(ValueError):
+            scheduler.search_all([_cut(0)], [_desc("nothing")])
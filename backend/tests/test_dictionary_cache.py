@@ -0,0 +1,86 @@
+"""
+치환 사전 워커 캐시 테스트
+"""
+from app.services.dictionary_cache import GLOBAL_SCOPE, DictionaryCache, church_scope
+
+
+class _FakeRedis:
+    """버전 키 흉내 (GET/INCR)"""
+
+    def __init__(self):
+        self.values = {}
+        self.fail = False
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key) or 0) + 1)
+
+
+class _CountingLoader:
+    """DB 조회 횟수 기록"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.entries)
+
+
+class TestDictionaryCache:
+    """버전 기준 재사용 / 무효화 테스트"""
+
+    def test_same_version_skips_database(self):
+        """버전이 같으면 DB 조회 없이 같은 매처 재사용"""
+        # Given
+        cache = DictionaryCache(_FakeRedis())
+        loader = _CountingLoader([{"original": "하나 님", "replacement": "하나님", "use_count": 1}])
+
+        # When
+        first = cache.get(GLOBAL_SCOPE, loader)
+        second = cache.get(GLOBAL_SCOPE, loader)
+
+        # Then
+        assert loader.calls == 1
+        assert second.matcher is first.matcher
+        assert first.matcher.replace("하나 님")[0] == "하나님"
+
+    def test_bump_from_other_process_reloads(self):
+        """다른 프로세스(API)가 버전을 올리면 다음 조회에서 다시 로드, 다른 교회는 그대로"""
+        # Given: 워커 캐시 + API 프로세스 캐시 (같은 Redis)
+        redis = _FakeRedis()
+        worker = DictionaryCache(redis)
+        church_a = _CountingLoader([{"original": "아맨", "replacement": "아멘", "use_count": 1}])
+        church_b = _CountingLoader([])
+        worker.get(church_scope("a"), church_a)
+        worker.get(church_scope("b"), church_b)
+
+        # When
+        DictionaryCache(redis).bump(church_scope("a"))
+        church_a.entries.append({"original": "할렐루야아", "replacement": "할렐루야", "use_count": 1})
+        snapshot = worker.get(church_scope("a"), church_a)
+        worker.get(church_scope("b"), church_b)
+
+        # Then
+        assert church_a.calls == 2 and church_b.calls == 1
+        assert snapshot.version == "1" and len(snapshot) == 2
+
+    def test_redis_failure_falls_back_to_max_age(self):
+        """Redis 장애 시 max_age 동안은 보관본 사용"""
+        redis = _FakeRedis()
+        cache = DictionaryCache(redis, max_age=600)
+        loader = _CountingLoader([])
+        cache.get(GLOBAL_SCOPE, loader)
+
+        redis.fail = True
+        cache.get(GLOBAL_SCOPE, loader)
+        assert loader.calls == 1
+
+        cache.max_age = 0.000001
+        cache.get(GLOBAL_SCOPE, loader)
+        assert loader.calls == 2
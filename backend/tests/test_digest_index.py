@@ -0,0 +1,44 @@
+"""
+R2 콘텐츠 주소 객체 로컬 인덱스 테스트
+"""
+from app.services.digest_index import DigestIndex
+
+
+class TestDigestIndex:
+    """키 기록 / 재시작 후 복원 / 용량 제한 테스트"""
+
+    def test_persists_across_instances(self, tmp_path):
+        """다른 프로세스(인스턴스)에서도 기록한 키를 HEAD 없이 확인"""
+        # Given
+        path = str(tmp_path / "digests.txt")
+        DigestIndex(path).add("audio/sha256/abc.mp3")
+
+        # When
+        index = DigestIndex(path)
+
+        # Then
+        assert index.contains("audio/sha256/abc.mp3")
+        assert not index.contains("audio/sha256/def.mp3")
+
+    def test_keeps_most_recent_entries(self, tmp_path):
+        """최대 개수를 넘으면 오래된 키부터 제거하고 파일도 압축"""
+        path = tmp_path / "digests.txt"
+        index = DigestIndex(str(path), max_entries=3)
+
+        for i in range(8):
+            index.add(f"k{i}")
+
+        assert len(index) == 3
+        assert not index.contains("k4") and index.contains("k7")
+        assert len(path.read_text().split()) <= 6
+        assert DigestIndex(str(path), max_entries=3).contains("k5")
+
+    def test_discard(self, tmp_path):
+        """R2에서 지운 키는 인덱스에서도 제거"""
+        path = str(tmp_path / "digests.txt")
+        index = DigestIndex(path)
+        index.add("srt/sha256/a.srt")
+
+        index.discard("srt/sha256/a.srt")
+
+        assert not DigestIndex(path).contains("srt/sha256/a.srt")
@@ -0,0 +1,48 @@
+"""
+작업별 격리 디렉토리 테스트
+"""
+import os
+import time
+
+import pytest
+
+from app.services.job_workspace import JobWorkspace, sweep_stale_workspaces
+
+
+class TestJobWorkspace:
+    """작업 디렉토리 격리 / 정리 테스트"""
+
+    def test_concurrent_jobs_get_separate_dirs(self, tmp_path):
+        """같은 영상 ID라도 작업마다 다른 디렉토리"""
+        with JobWorkspace("video-1", base_dir=str(tmp_path)) as a, \
+                JobWorkspace("video-1", base_dir=str(tmp_path)) as b:
+            a.file("seg1_src.mp4").write_bytes(b"a")
+            b.file("seg1_src.mp4").write_bytes(b"b")
+
+            assert a.path != b.path
+            assert a.file("seg1_src.mp4").read_bytes() == b"a"
+
+    def test_removed_even_on_failure(self, tmp_path):
+        """작업 실패 시에도 디렉토리 삭제"""
+        with pytest.raises(RuntimeError):
+            with JobWorkspace("video-1", base_dir=str(tmp_path)) as workspace:
+                workspace.file("seg1_src.mp4").write_bytes(b"a")
+                raise RuntimeError("ffmpeg failed")
+
+        assert not workspace.path.exists()
+
+    def test_sweep_removes_only_stale(self, tmp_path):
+        """오래된 디렉토리만 정리"""
+        # Given
+        stale, fresh = tmp_path / "compose-old", tmp_path / "compose-new"
+        stale.mkdir()
+        fresh.mkdir()
+        past = time.time() - 7200
+        os.utime(stale, (past, past))
+
+        # When
+        removed = sweep_stale_workspaces(3600, base_dir=str(tmp_path))
+
+        # Then
+        assert removed == 1
+        assert not stale.exists() and fresh.exists()
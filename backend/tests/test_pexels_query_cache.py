@@ -0,0 +1,66 @@
+"""
+Pexels 쿼리 정규화 + 응답 캐시 테스트
+"""
+from app.services.pexels_query_cache import PexelsResponseCache, canonicalize_query, pick_keyword
+
+
+def _response(*ids):
+    return {
+        "page": 1,
+        "total_results": 999,
+        "videos": [
+            {"id": i, "url": "u", "image": "i", "duration": 10, "width": 1920, "height": 1080,
+             "user": {"name": "someone"},
+             "video_files": [{"quality": "hd", "width": 1920, "height": 1080, "link": "l", "fps": 25}]}
+            for i in ids
+        ]
+    }
+
+
+class TestQueryCanonicalization:
+    """쿼리 정규화 / 결정적 키워드 선택 테스트"""
+
+    def test_canonicalize_whitespace_case_duplicates(self):
+        """대소문자, 구두점, 공백, 중복 단어 차이는 같은 쿼리"""
+        assert canonicalize_query("Desert,  Sunset  calm calm ") == "desert sunset calm"
+
+    def test_pick_keyword_is_deterministic(self):
+        """같은 시드는 항상 같은 키워드"""
+        options = ["golden hour", "warm light", "soft light"]
+
+        picks = {pick_keyword(options, "desert sunset", "bright") for _ in range(20)}
+
+        assert len(picks) == 1
+
+
+class TestPexelsResponseCache:
+    """로컬 LRU 응답 캐시 테스트"""
+
+    def test_hit_for_equivalent_query(self):
+        """정규화 후 같은 쿼리는 캐시 적중, 다른 페이지는 미스"""
+        # Given
+        cache = PexelsResponseCache()
+        cache.put("Desert sunset", 1, "landscape", 20, _response(1, 2))
+
+        # When
+        hit = cache.get("desert  SUNSET", 1, "landscape", 20)
+
+        # Then
+        assert [v["id"] for v in hit["videos"]] == [1, 2]
+        assert "user" not in hit["videos"][0]
+        assert cache.get("desert sunset", 2, "landscape", 20) is None
+
+    def test_size_bound_and_ttl(self):
+        """최대 항목 수 초과 시 오래된 항목 제거, TTL 지나면 미스"""
+        # Given
+        cache = PexelsResponseCache(max_entries=2)
+        for page in (1, 2, 3):
+            cache.put("sky", page, "landscape", 20, _response(page))
+
+        # Then
+        assert cache.get("sky", 1, "landscape", 20) is None
+        assert cache.get("sky", 3, "landscape", 20) is not None
+
+        expired = PexelsResponseCache(ttl_seconds=-1)
+        expired.put("sky", 1, "landscape", 20, _response(1))
+        assert expired.get("sky", 1, "landscape", 20) is None
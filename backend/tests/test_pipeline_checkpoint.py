@@ -0,0 +1,109 @@
+"""
+파이프라인 체크포인트 테스트
+"""
+import os
+from unittest.mock import Mock
+
+from app.services.pipeline_checkpoint import (
+    PipelineCheckpoint,
+    deserialize_transcription,
+    serialize_transcription,
+)
+
+
+class TestPipelineCheckpoint:
+    """단계별 체크포인트 저장/재개 테스트"""
+
+    def test_resume_from_first_incomplete_stage(self, tmp_path):
+        """완료된 단계는 새 인스턴스에서도 유지되고 다음 단계부터 재개"""
+        # Given
+        checkpoint = PipelineCheckpoint("video-1", params={"a": 1}, base_dir=str(tmp_path))
+        checkpoint.save("transcribe", {"transcription": {"text": "안녕하세요"}})
+        checkpoint.save("correct", {"srt_content": "1\n"})
+
+        # When
+        resumed = PipelineCheckpoint("video-1", params={"a": 1}, base_dir=str(tmp_path))
+
+        # Then
+        assert resumed.is_complete("transcribe")
+        assert resumed.get("transcribe")["transcription"]["text"] == "안녕하세요"
+        assert resumed.first_incomplete_stage() == "cut"
+
+    def test_params_change_invalidates_checkpoint(self, tmp_path):
+        """입력 파라미터가 바뀌면 처음부터 실행"""
+        # Given
+        PipelineCheckpoint("video-1", params={"a": 1}, base_dir=str(tmp_path)).save("transcribe", {})
+
+        # When
+        resumed = PipelineCheckpoint("video-1", params={"a": 2}, base_dir=str(tmp_path))
+
+        # Then
+        assert resumed.first_incomplete_stage() == "transcribe"
+
+    def test_missing_artifact_marks_stage_incomplete(self, tmp_path):
+        """산출물 파일이 사라지면 해당 단계는 재실행 대상"""
+        # Given
+        checkpoint = PipelineCheckpoint("video-1", base_dir=str(tmp_path))
+        output = checkpoint.artifact_path("composed.mp4")
+        with open(output, "wb") as f:
+            f.write(b"mp4")
+        checkpoint.save("compose", {"output_path": output}, artifacts=[output])
+        assert checkpoint.is_complete("compose")
+
+        # When
+        os.remove(output)
+
+        # Then
+        assert not checkpoint.is_complete("compose")
+
+    def test_remote_mirror_used_when_local_missing(self, tmp_path):
+        """로컬 체크포인트가 없으면 R2 미러에서 로드 (다른 워커 재시도)"""
+        # Given
+        uploaded = {}
+        storage = Mock()
+        storage.upload_text.side_effect = lambda text, key, content_type: uploaded.setdefault(key, text)
+        storage.download_text.side_effect = lambda key: uploaded.get(key)
+
+        PipelineCheckpoint("video-1", base_dir=str(tmp_path / "worker-a"), storage=storage) \
+            .save("transcribe", {"transcription": {"text": "말씀"}})
+
+        # When
+        other_worker = PipelineCheckpoint("video-1", base_dir=str(tmp_path / "worker-b"), storage=storage)
+
+        # Then
+        assert other_worker.is_complete("transcribe")
+
+    def test_clear_removes_work_dir(self, tmp_path):
+        """clear() 후에는 모든 단계가 미완료"""
+        # Given
+        checkpoint = PipelineCheckpoint("video-1", base_dir=str(tmp_path))
+        checkpoint.save("transcribe", {})
+
+        # When
+        checkpoint.clear()
+
+        # Then
+        assert not os.path.exists(checkpoint.work_dir)
+        assert checkpoint.first_incomplete_stage() == "transcribe"
+
+
+class TestTranscriptionSerialization:
+    """Whisper 응답 직렬화 테스트"""
+
+    def test_roundtrip_keeps_word_timestamps(self):
+        """words 타임스탬프가 유지되고 교정 시 dict로 수정 가능"""
+        # Given
+        transcription = Mock(
+            text="오늘 말씀",
+            words=[{"word": "오늘", "start": 0.0, "end": 0.4}, {"word": "말씀", "start": 0.5, "end": 0.9}],
+            segments=[]
+        )
+
+        # When
+        restored = deserialize_transcription(serialize_transcription(transcription))
+        restored.words[0]["word"] = "어제"
+
+        # Then
+        assert restored.text == "오늘 말씀"
+        assert restored.words[1] == {"word": "말씀", "start": 0.5, "end": 0.9}
+        assert transcription.words[0]["word"] == "오늘"
@@ -0,0 +1,90 @@
+"""
+재생성 합성 산출물 캐시 테스트
+"""
+import shutil
+
+from app.services.render_artifacts import RenderArtifactCache, artifact_key
+
+
+class FakeStorage:
+    """R2Storage 대역 (로컬 디렉토리)"""
+
+    def __init__(self, root):
+        self.root = root
+        self.deleted = []
+
+    def upload_file(self, file_path, content_type=None, key=None):
+        dest = self.root / key
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(file_path, dest)
+        return f"https://r2.test/{key}"
+
+    def download_file(self, url_or_key, dest):
+        src = self.root / url_or_key.replace("https://r2.test/", "")
+        if not src.exists():
+            return False
+        shutil.copy(src, dest)
+        return True
+
+    def upload_text(self, text, key, content_type="text/plain"):
+        dest = self.root / key
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(text, encoding="utf-8")
+
+    def download_text(self, url_or_key):
+        src = self.root / url_or_key
+        return src.read_text(encoding="utf-8") if src.exists() else None
+
+    def delete_file(self, key):
+        self.deleted.append(key)
+
+
+class TestRenderArtifactCache:
+    """입력 해시 기반 산출물 재사용 테스트"""
+
+    def test_hit_after_store_across_instances(self, tmp_path):
+        """저장한 산출물은 manifest를 통해 다음 재생성(새 인스턴스)에서 재사용"""
+        # Given
+        storage = FakeStorage(tmp_path / "r2")
+        artifact = tmp_path / "base.mp4"
+        artifact.write_bytes(b"video")
+        key = artifact_key("base", clips=[["https://pexels/1.mp4", 10]], duration=60)
+        RenderArtifactCache("v1", storage).store("base", key, str(artifact), "video/mp4")
+
+        # When
+        fetched = RenderArtifactCache("v1", storage).fetch("base", key, str(tmp_path / "out.mp4"))
+
+        # Then
+        assert fetched is not None
+        assert (tmp_path / "out.mp4").read_bytes() == b"video"
+
+    def test_changed_inputs_miss_and_replace_previous(self, tmp_path):
+        """입력이 바뀌면 미스, 새 산출물 저장 시 이전 파일 삭제"""
+        # Given
+        storage = FakeStorage(tmp_path / "r2")
+        artifact = tmp_path / "mix.m4a"
+        artifact.write_bytes(b"audio")
+        cache = RenderArtifactCache("v1", storage)
+        old_key = artifact_key("audio_mix", voice="abc", bgm=None, volume=0.12, duration=60)
+        new_key = artifact_key("audio_mix", voice="abc", bgm=None, volume=0.3, duration=60)
+        old_url = cache.store("audio_mix", old_key, str(artifact))
+
+        # When
+        missed = cache.fetch("audio_mix", new_key, str(tmp_path / "out.m4a"))
+        cache.store("audio_mix", new_key, str(artifact))
+
+        # Then
+        assert missed is None
+        assert storage.deleted == [old_url]
+
+    def test_adopted_file_is_not_deleted(self, tmp_path):
+        """adopt한 원본 베이스 영상은 교체되어도 삭제하지 않음"""
+        storage = FakeStorage(tmp_path / "r2")
+        artifact = tmp_path / "base.mp4"
+        artifact.write_bytes(b"video")
+        cache = RenderArtifactCache("v1", storage)
+        cache.adopt("base", "k1", "https://r2.test/base-videos/original.mp4")
+
+        cache.store("base", "k2", str(artifact))
+
+        assert storage.deleted == []
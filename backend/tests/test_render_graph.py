@@ -0,0 +1,105 @@
+"""
+단일 패스 렌더 그래프 테스트
+"""
+import pytest
+
+from app.services.render_graph import (
+    RenderClip,
+    RenderPlan,
+    build_base_command,
+    build_render_command,
+    fit_clips_to_duration,
+)
+
+
+def _filter_graph(cmd):
+    return cmd[cmd.index("-filter_complex") + 1]
+
+
+class TestFitClipsToDuration:
+    """클립 길이 맞춤 테스트"""
+
+    def test_short_clips_loop_last(self):
+        """합계가 부족하면 마지막 클립을 반복으로 연장"""
+        fitted = fit_clips_to_duration([RenderClip("a.mp4", 10), RenderClip("b.mp4", 10)], 30)
+
+        assert [c.duration for c in fitted] == [10, 20]
+        assert fitted[-1].loop
+
+    def test_long_clips_trimmed(self):
+        """합계가 넘치면 뒤쪽 클립 제거/트림"""
+        fitted = fit_clips_to_duration([RenderClip("a.mp4", 20), RenderClip("b.mp4", 20), RenderClip("c.mp4", 20)], 25)
+
+        assert [c.duration for c in fitted] == [20, 5]
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            fit_clips_to_duration([], 10)
+
+
+class TestBuildRenderCommand:
+    """FFmpeg 명령어 구성 테스트"""
+
+    def test_single_encode_with_all_stages(self):
+        """자막/인트로/아웃트로/BGM/베이스 출력이 있어도 libx264 최종 출력은 한 번"""
+        # Given
+        plan = RenderPlan(
+            clips=[RenderClip("a.mp4", 30), RenderClip("b.mp4", 30)],
+            voice_path="voice.mp3",
+            duration=60,
+            output_path="out.mp4",
+            bgm_path="bgm.mp3",
+            subtitle_track="subs.ffconcat",
+            intro_image="intro.jpg",
+            outro_image="outro.jpg",
+            color_filter="eq=brightness=0.05",
+            base_output_path="base.mp4",
+        )
+
+        # When
+        cmd = build_render_command(plan)
+        graph = _filter_graph(cmd)
+
+        # Then
+        assert cmd.count("-filter_complex") == 1
+        assert cmd.count("libx264") == 2  # 최종 + 베이스 (같은 실행)
+        assert cmd.index("out.mp4") < cmd.index("base.mp4")
+        assert "concat=n=2" in graph
+        assert graph.count("overlay=") == 1  # 자막 수와 무관하게 overlay 한 번
+        assert cmd[cmd.index("subs.ffconcat") - 5:cmd.index("subs.ffconcat")] == ["-f", "concat", "-safe", "0", "-i"]
+        assert "offset=2.000[with_intro]" in graph
+        assert "offset=61.000[with_outro]" in graph  # 인트로 2초 + 본 영상 60초 - 페이드 1초
+        assert "adelay=2000" in graph
+        assert "[base]split=2[base_out][base_main]" in graph
+
+    def test_crossfade_offsets(self):
+        """crossfade 사용 시 xfade offset은 누적 길이 - 페이드"""
+        plan = RenderPlan(
+            clips=[RenderClip("a.mp4", 10), RenderClip("b.mp4", 10), RenderClip("c.mp4", 10)],
+            voice_path="voice.mp3",
+            duration=28,
+            output_path="out.mp4",
+            crossfade_duration=1.0,
+        )
+
+        graph = _filter_graph(build_render_command(plan))
+
+        assert "offset=9.000[x1]" in graph
+        assert "offset=18.000[x2]" in graph
+        assert "amix" not in graph
+
+    def test_base_command_video_only(self):
+        """베이스 영상 명령은 색보정/오디오 없이 base_crf로 인코딩"""
+        plan = RenderPlan(
+            clips=[RenderClip("a.mp4", 30, loop=True)],
+            voice_path="",
+            duration=45,
+            output_path="base.mp4",
+            color_filter="eq=brightness=0.05",
+        )
+
+        cmd = build_base_command(plan)
+
+        assert "eq=" not in _filter_graph(cmd)
+        assert cmd[cmd.index("-crf") + 1] == "18"
+        assert "-an" in cmd and cmd[-1] == "base.mp4"
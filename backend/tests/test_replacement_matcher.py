@@ -0,0 +1,53 @@
+"""
+치환 사전 다중 패턴 매처 (Aho–Corasick) 테스트
+"""
+from app.services.replacement_matcher import ReplacementMatcher
+
+
+def _naive(text, entries):
+    """기존 방식 (정렬 후 항목마다 str.replace)"""
+    for e in sorted(entries, key=lambda x: (-x.get("use_count", 0), -len(x["original"]))):
+        if e["original"] in text:
+            text = text.replace(e["original"], e["replacement"])
+    return text
+
+
+class TestReplacementMatcher:
+    """한 번 훑기 치환 / 겹침 선택 규칙 테스트"""
+
+    def test_matches_legacy_on_disjoint_patterns(self):
+        """겹치지 않는 패턴은 기존 순차 치환과 같은 결과"""
+        # Given
+        entries = [
+            {"original": "요한 복음", "replacement": "요한복음", "use_count": 3},
+            {"original": "하나 님", "replacement": "하나님", "use_count": 5},
+            {"original": "아맨", "replacement": "아멘", "use_count": 1},
+        ]
+        text = "하나 님의 말씀 요한 복음 3장 16절 아맨. 하나 님께 감사"
+
+        # When
+        replaced, applied = ReplacementMatcher.from_entries(entries).replace(text)
+
+        # Then
+        assert replaced == _naive(text, entries) == "하나님의 말씀 요한복음 3장 16절 아멘. 하나님께 감사"
+        assert len(applied) == 3
+
+    def test_overlap_prefers_priority_then_length(self):
+        """겹치는 후보: 우선순위 → 길이 순으로 선택, 나머지는 버림"""
+        matcher = ReplacementMatcher([
+            ("예수", "JESUS", 1),
+            ("예수님", "예수 그리스도", 1),   # 같은 우선순위 → 긴 패턴
+            ("님께서", "께서", 5),            # 우선순위 높음 → 먼저 선택
+        ])
+
+        assert matcher.replace("예수님 말씀")[0] == "예수 그리스도 말씀"
+        assert matcher.replace("예수님께서")[0] == "JESUS께서"
+
+    def test_no_cascading_and_suffix_patterns(self):
+        """치환 결과를 다시 치환하지 않음 + 접미 패턴(실패 링크) 검출"""
+        matcher = ReplacementMatcher([("가", "나", 2), ("나", "다", 1), ("abcd", "X", 1), ("bc", "Y", 0)])
+
+        assert matcher.replace("가나")[0] == "나다"
+        assert matcher.replace("abcbcd")[0] == "aYYd"
+        assert matcher.replace("xabcd bc")[0] == "xX Y"
+        assert matcher.replace("변화 없음") == ("변화 없음", [])
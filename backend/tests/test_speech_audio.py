@@ -0,0 +1,65 @@
+"""
+STT 입력 음성 정규화 테스트
+"""
+import shutil
+import subprocess
+
+import pytest
+
+from app.services.render_artifacts import hash_file
+from app.services.speech_audio import normalize_speech_audio, speech_audio_settings, speech_filter_chain
+from app.services.transcription_cache import transcription_key
+
+
+class TestSpeechFilterChain:
+    """필터 체인 구성 테스트"""
+
+    def test_default_is_resample_only(self):
+        """기본값: 16kHz 모노 변환만 (타임스탬프 변화 없음)"""
+        assert speech_filter_chain() == "aformat=sample_fmts=fltp:sample_rates=16000:channel_layouts=mono"
+
+    def test_optional_stages(self):
+        """라우드니스 정규화 후 다시 16kHz, 무음 제거는 끝부분만"""
+        chain = speech_filter_chain(loudnorm=True, trim_trailing_silence=True).split(",")
+
+        assert chain[1].startswith("loudnorm") and chain[2] == "aresample=16000"
+        assert chain[3] == "areverse" and chain[-1] == "areverse"
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg 필요")
+class TestNormalizeSpeechAudio:
+    """실제 변환 테스트 (ffmpeg)"""
+
+    def test_falls_back_to_source_on_failure(self, tmp_path):
+        """변환 실패 시 원본 경로 반환, 임시 파일 남기지 않음"""
+        # Given: 오디오가 아닌 파일
+        source = tmp_path / "audio.mp3"
+        source.write_bytes(b"not audio")
+
+        # When
+        result = normalize_speech_audio(str(source), str(tmp_path / "speech.ogg"))
+
+        # Then
+        assert result == str(source)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["audio.mp3"]
+
+    def test_same_source_gives_same_cache_key(self, tmp_path):
+        """같은 원본을 두 번 정규화해도 같은 바이트 → 같은 인식 캐시 키"""
+        # Given: 2초 사인파 WAV (정규화 결과보다 큼)
+        source = tmp_path / "audio.wav"
+        subprocess.run(
+            ["ffmpeg", "-y", "-v", "error", "-f", "lavfi", "-i", "sine=frequency=440:duration=2", str(source)],
+            check=True
+        )
+
+        # When: 서로 다른 작업에서 각각 정규화
+        first = normalize_speech_audio(str(source), str(tmp_path / "a.ogg"))
+        second = normalize_speech_audio(str(source), str(tmp_path / "b.ogg"))
+
+        # Then
+        assert first != str(source) and second != str(source)
+        keys = {
+            transcription_key(hash_file(path), "whisper-large-v3-turbo", "ko", "묵상", speech_audio_settings())
+            for path in (first, second)
+        }
+        assert len(keys) == 1
@@ -0,0 +1,117 @@
+"""
+자막 오버레이 트랙 (ffconcat) 테스트
+"""
+from app.services.subtitle_track import (
+    align_to_keyframes,
+    build_track_entries,
+    changed_ranges,
+    plan_chunks,
+    subtitles_in_range,
+    union_region,
+    write_overlay_track,
+)
+
+
+class TestUnionRegion:
+    """오버레이 트랙 프레임 영역 테스트"""
+
+    def test_union_aligned_to_even(self):
+        """자막 영역 합집합을 짝수 좌표로 확장 (yuv420 합성)"""
+        assert union_region([(101, 851, 900, 931), (300, 800, 1621, 930)]) == (100, 800, 1622, 932)
+
+    def test_empty(self):
+        assert union_region([]) is None
+
+
+class TestBuildTrackEntries:
+    """타임라인 구성 테스트"""
+
+    def test_gaps_filled_with_blank(self):
+        """자막 사이 간격은 투명 PNG로 채우고 길이 합은 마지막 종료 시각"""
+        # Given
+        subtitles = [("b.png", 5.0, 7.0), ("a.png", 1.0, 3.0)]
+
+        # When
+        entries = build_track_entries(subtitles, "blank.png")
+
+        # Then
+        assert [p for p, _ in entries] == ["blank.png", "a.png", "blank.png", "b.png"]
+        assert abs(sum(d for _, d in entries) - 7.0) < 1e-9
+
+    def test_overlap_clipped_to_next_start(self):
+        """겹치는 자막은 다음 자막 시작 시점에 교체"""
+        entries = build_track_entries([("a.png", 0.0, 4.0), ("b.png", 3.0, 5.0)], "blank.png")
+
+        assert entries == [("a.png", 3.0), ("b.png", 2.0)]
+
+
+class TestWriteOverlayTrack:
+    """ffconcat 파일 작성 테스트"""
+
+    def test_trailing_entry_without_duration(self, tmp_path):
+        """마지막 duration 적용을 위해 투명 PNG 항목이 한 번 더 붙음"""
+        # Given
+        track = tmp_path / "track.ffconcat"
+
+        # When
+        write_overlay_track([("/tmp/it's.png", 0.5, 1.5)], "/tmp/blank.png", str(track))
+
+        # Then
+        lines = track.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "ffconcat version 1.0"
+        assert lines[3] == "file '/tmp/it'\\''s.png'"
+        assert lines[4] == "duration 1.000000"
+        assert lines[-1] == "file '/tmp/blank.png'"
+
+
+class TestPlanChunks:
+    """키프레임 기준 청크 분할 테스트"""
+
+    def test_split_at_first_keyframe_after_target(self):
+        """목표 길이를 넘긴 첫 키프레임에서 자르고, 끝에 너무 짧은 청크는 만들지 않음"""
+        # Given: 2초 간격 키프레임 (GOP 2초), 75초 영상
+        keyframes = [float(t) for t in range(0, 76, 2)]
+
+        # When
+        chunks = plan_chunks(keyframes, 74.5, 30.0)
+
+        # Then
+        assert chunks == [(0.0, 30.0), (30.0, 60.0), (60.0, 74.5)]
+
+    def test_subtitles_in_range_keeps_boundary_overlap(self):
+        """청크 경계에 걸친 자막은 양쪽 청크에 모두 포함"""
+        subs = [("a.png", 25.0, 31.0), ("b.png", 31.0, 33.0), ("c.png", 60.0, 62.0)]
+
+        assert [s[0] for s in subtitles_in_range(subs, 0.0, 30.0)] == ["a.png"]
+        assert [s[0] for s in subtitles_in_range(subs, 30.0, 60.0)] == ["a.png", "b.png"]
+
+
+class TestPatchRanges:
+    """자막 부분 재합성 구간 테스트"""
+
+    def test_only_edited_subtitles_changed(self):
+        """텍스트/시간이 바뀐 자막만 (이전 구간 + 새 구간 병합)"""
+        # Given: 두 번째 자막 오타 수정, 네 번째 자막 시간 이동
+        old = [(0.0, 2.0, "첫째"), (2.0, 4.0, "오타"), (10.0, 12.0, "셋째"), (20.0, 22.0, "넷째")]
+        new = [(0.0, 2.0, "첫째"), (2.0, 4.0, "수정"), (10.0, 12.0, "셋째"), (21.0, 23.0, "넷째")]
+
+        # When
+        ranges = changed_ranges(old, new)
+
+        # Then
+        assert ranges == [(2.0, 4.0), (20.0, 23.0)]
+
+    def test_no_change(self):
+        subs = [(0.0, 2.0, "같음")]
+        assert changed_ranges(subs, list(subs)) == []
+
+    def test_align_to_gop_and_merge(self):
+        """구간을 키프레임 경계로 넓히고, 같은 GOP에 걸친 구간은 하나로 합침"""
+        # Given: 2초 간격 키프레임, 60초 영상
+        keyframes = [float(t) for t in range(0, 60, 2)]
+
+        # When
+        aligned = align_to_keyframes([(3.5, 4.5), (5.0, 5.5), (58.5, 59.0)], keyframes, 60.0)
+
+        # Then
+        assert aligned == [(2.0, 6.0), (58.0, 60.0)]
@@ -0,0 +1,81 @@
+"""
+Whisper 인식 결과 캐시 테스트
+"""
+from app.services.speech_audio import speech_audio_settings
+from app.services.transcription_cache import TranscriptionCache, transcription_key
+
+
+class _FakeStorage:
+    """R2 텍스트 객체 흉내 (download_text/upload_text)"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def upload_text(self, text, key, content_type="text/plain"):
+        self.objects[key] = text
+        return key
+
+    def download_text(self, key):
+        return self.objects.get(key)
+
+
+RESULT = {
+    "text": "은혜의 말씀",
+    "words": [{"word": "은혜의", "start": 0.0, "end": 0.5}, {"word": "말씀", "start": 0.5, "end": 1.0}],
+    "segments": [{"text": "은혜의 말씀", "start": 0.0, "end": 1.0}],
+}
+
+
+class TestTranscriptionCache:
+    """키 구성 / 로컬·R2 2단계 조회 테스트"""
+
+    def test_key_depends_on_every_input(self):
+        """오디오/모델/언어/프롬프트 중 하나만 달라도 다른 키"""
+        base = transcription_key("a" * 64, "whisper-large-v3", "ko", "묵상")
+
+        assert base == transcription_key("a" * 64, "whisper-large-v3", "ko", "묵상")
+        assert base != transcription_key("b" * 64, "whisper-large-v3", "ko", "묵상")
+        assert base != transcription_key("a" * 64, "whisper-large-v3-turbo", "ko", "묵상")
+        assert base != transcription_key("a" * 64, "whisper-large-v3", "en", "묵상")
+        assert base != transcription_key("a" * 64, "whisper-large-v3", "ko", "말씀")
+
+    def test_key_depends_on_preprocess_settings(self):
+        """같은 원본이라도 STT 입력 전처리 설정이 다르면 다른 키"""
+        opus = speech_audio_settings(bitrate="32k")
+
+        key = transcription_key("a" * 64, "whisper-large-v3", "ko", "묵상", opus)
+
+        assert key == transcription_key("a" * 64, "whisper-large-v3", "ko", "묵상", speech_audio_settings())
+        assert key != transcription_key("a" * 64, "whisper-large-v3", "ko", "묵상")
+        assert key != transcription_key(
+            "a" * 64, "whisper-large-v3", "ko", "묵상", speech_audio_settings(bitrate="24k")
+        )
+        assert key != transcription_key(
+            "a" * 64, "whisper-large-v3", "ko", "묵상", speech_audio_settings(loudnorm=True)
+        )
+        assert key != transcription_key(
+            "a" * 64, "whisper-large-v3", "ko", "묵상", speech_audio_settings(trim_trailing_silence=True)
+        )
+
+    def test_other_worker_reads_from_r2(self, tmp_path):
+        """다른 워커가 저장한 결과를 R2에서 가져와 로컬에도 보관"""
+        # Given: 워커 A가 인식 결과 저장
+        storage = _FakeStorage()
+        TranscriptionCache(str(tmp_path / "a"), storage=storage).put("k1", RESULT)
+
+        # When: 로컬 캐시가 빈 워커 B가 조회
+        worker_b = TranscriptionCache(str(tmp_path / "b"), storage=storage)
+        data = worker_b.get("k1")
+
+        # Then: R2에서 복원 + 이후에는 R2 없이도 로컬 적중
+        assert data == RESULT
+        storage.objects.clear()
+        assert worker_b.get("k1") == RESULT
+
+    def test_miss_and_corrupt_local(self, tmp_path):
+        """없는 키는 None, 손상된 로컬 파일은 무시"""
+        cache = TranscriptionCache(str(tmp_path))
+        assert cache.get("missing") is None
+
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+        assert cache.get("broken") is None
@@ -0,0 +1,58 @@
+"""
+Gemini Vision 판정 캐시 테스트
+"""
+from app.services.vision_verdict_cache import (
+    SQLiteVerdictStore,
+    VisionRecord,
+    VisionVerdictCache,
+    KIND_VERDICT,
+)
+
+
+class TestVisionVerdictCache:
+    """판정 저장/조회 + 블랙리스트 병합 테스트"""
+
+    def test_verdict_roundtrip(self):
+        """저장한 판정은 다시 조회되고, 미판정 영상은 None"""
+        # Given
+        cache = VisionVerdictCache(SQLiteVerdictStore())
+
+        # When
+        cache.put_verdict(101, True)
+        cache.put_verdict(102, False)
+
+        # Then
+        assert cache.get_verdict(101) is True
+        assert cache.get_verdict(102) is False
+        assert cache.get_verdict(103) is None
+
+    def test_prompt_version_change_ignores_old_verdict(self):
+        """다른 프롬프트 버전으로 저장된 판정은 재검증 대상"""
+        # Given
+        store = SQLiteVerdictStore()
+        store.put(VisionRecord(video_id=101, kind=KIND_VERDICT, prompt_version="old", accepted=True))
+
+        # When / Then
+        assert VisionVerdictCache(store).get_verdict(101) is None
+
+    def test_blacklist_is_permanent_reject(self):
+        """blacklist_clips 영상은 캐시된 ACCEPT보다 우선해 REJECT"""
+        # Given
+        cache = VisionVerdictCache(SQLiteVerdictStore(), blacklist_loader=lambda: [101])
+        cache.put_verdict(101, True)
+
+        # When / Then
+        assert cache.get_verdict(101) is False
+        assert cache.get_score(101)["hard_reject"] is True
+
+    def test_score_roundtrip(self):
+        """VisionScore 필드가 그대로 복원"""
+        # Given
+        cache = VisionVerdictCache(SQLiteVerdictStore())
+        fields = {"has_cityscape": False, "scene_tags": ["desert", "sunset"], "biblical_vibe": 80}
+
+        # When
+        cache.put_score(101, fields)
+
+        # Then
+        assert cache.get_score(101) == fields
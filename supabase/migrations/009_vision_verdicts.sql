@@ -0,0 +1,16 @@
+-- 009: vision_verdicts 테이블 (Gemini Vision 판정 캐시)
+-- 같은 Pexels 영상을 교회마다 다시 검증하지 않도록 판정을 영상 ID 기준으로 보관
+-- (VISION_CACHE_BACKEND=supabase 일 때 사용)
+
+CREATE TABLE IF NOT EXISTS vision_verdicts (
+    video_id BIGINT NOT NULL,              -- Pexels 영상 ID
+    kind TEXT NOT NULL,                    -- 'verdict' (accept/reject) / 'score' (VisionScore)
+    prompt_version TEXT NOT NULL,          -- 프롬프트 버전 (다르면 재검증)
+    accepted BOOLEAN NOT NULL,
+    checked_at_epoch DOUBLE PRECISION NOT NULL,
+    score JSONB,                           -- kind = 'score'일 때 VisionScore 필드
+    PRIMARY KEY (video_id, kind)
+);
+
+COMMENT ON TABLE vision_verdicts IS 'Pexels 영상별 Gemini Vision 판정 캐시 (blacklist_clips는 별도로 영구 REJECT)';
+COMMENT ON COLUMN vision_verdicts.prompt_version IS '판정 당시 프롬프트 버전 (코드의 버전과 다르면 무시)';
@@ -0,0 +1,7 @@
+-- 010: 미리보기(초안) 영상 경로
+-- 최종 렌더 전에 540p 초안을 먼저 업로드해 사용자가 바로 확인할 수 있게 한다.
+-- 최종 영상 저장 시 NULL로 비우고 R2 객체는 삭제한다.
+
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS preview_video_path TEXT;
+
+COMMENT ON COLUMN videos.preview_video_path IS '미리보기 초안 영상 R2 URL (540p, 최종 영상 완료 시 NULL)';